@@ -1,2 +1,3 @@
+from .benchmark import *
 from .ci import *
 from .dev import *
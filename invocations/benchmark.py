@@ -0,0 +1,116 @@
+"""
+Micro-benchmarks for performance-sensitive code paths.
+"""
+
+__all__ = ["benchmark_imports", "benchmark_templates"]
+
+import subprocess
+import sys
+import timeit
+
+from invoke.context import Context
+from invoke.exceptions import Exit
+from invoke.tasks import task
+
+# File name, directory and flavor of the templated functions, if any
+TEMPLATES = [
+    *(
+        ("project_profiling_query.sql", f"flavors/{flavor}/profiling", flavor)
+        for flavor in ("postgresql", "snowflake", "databricks", "mssql", "bigquery", "oracle")
+    ),
+    ("update_history_calc_thresholds.sql", "execution", None),
+    ("get_active_test_definitions.sql", "execution", None),
+]
+
+# Modules imported by the lightweight CLI commands (e.g. `testgen list-projects`) and by the
+# scheduler's `testgen exec-job` before it dispatches to a job handler
+LIGHTWEIGHT_IMPORTS = ["testgen.__main__", "testgen.commands.exec_job"]
+# Heavy dependencies that only the commands or jobs needing them should import
+DEFERRED_MODULES = ["pandas", "streamlit", "scipy", "statsmodels", "holidays", "pybars", "reportlab"]
+
+
+@task(name="benchmark-templates")
+def benchmark_templates(ctx: Context, iterations: int = 2000) -> None:
+    """Compares compiled SQL template rendering with the original line-by-line, per-parameter and per-function rendering."""
+    from testgen.common.database.database_service import (
+        TEMPLATE_CONDITIONAL_PATTERN,
+        TEMPLATE_SLOT_PATTERN,
+        _replace_params_in_order,
+        compile_template_file,
+        process_conditionals,
+    )
+    from testgen.common.read_file import read_template_sql_file, replace_templated_functions
+
+    print(f"{'Template':<55} {'Original':>12} {'Compiled':>12} {'Speedup':>8}")
+    for template_file_name, sub_directory, flavor in TEMPLATES:
+        template = read_template_sql_file(template_file_name, sub_directory)
+
+        # Similar in size to the parameters of a profiling or test execution query
+        params: dict = {f"UNUSED_PARAM_{index}": index for index in range(40)}
+        params.update({name: f"value_{name.lower()}" for name in TEMPLATE_SLOT_PATTERN.findall(template)})
+        conditions = {
+            match.group(2): True
+            for line in template.splitlines()
+            if (match := TEMPLATE_CONDITIONAL_PATTERN.match(line)) and match.group(2)
+        }
+
+        def render_original(template=template, params=params, conditions=conditions, flavor=flavor) -> str:
+            query = _replace_params_in_order(process_conditionals(template, conditions), params)
+            return replace_templated_functions(query, flavor) if flavor else query
+
+        def render_compiled(
+            file_name=template_file_name, directory=sub_directory, params=params, conditions=conditions, flavor=flavor,
+        ) -> str:
+            return compile_template_file(file_name, directory).render(params, conditions=conditions, flavor=flavor)
+
+        if render_original() != render_compiled():
+            raise AssertionError(f"Rendered output differs for {sub_directory}/{template_file_name}")
+
+        original = timeit.timeit(render_original, number=iterations) / iterations
+        compiled = timeit.timeit(render_compiled, number=iterations) / iterations
+        print(
+            f"{sub_directory + '/' + template_file_name:<55} "
+            f"{original * 1e6:>10.1f}us {compiled * 1e6:>10.1f}us {original / compiled:>7.1f}x"
+        )
+
+
+@task(name="benchmark-imports")
+def benchmark_imports(ctx: Context, budget_ms: int = 1500, runs: int = 3, top: int = 10) -> None:
+    """Measures the import time of the lightweight CLI entry points, failing when they exceed the budget."""
+    failures = []
+    for module in LIGHTWEIGHT_IMPORTS:
+        timings = [_get_import_times(module) for _ in range(runs)]
+        # The fastest run is the least affected by the noise of other processes
+        times = min(timings, key=lambda item: item[module])
+        total_ms = times[module] / 1000
+
+        print(f"{module}: {total_ms:.0f}ms (budget: {budget_ms}ms)")
+        for name, cumulative in sorted(times.items(), key=lambda item: -item[1])[1:top + 1]:
+            print(f"    {cumulative / 1000:>8.1f}ms  {name}")
+
+        if total_ms > budget_ms:
+            failures.append(f"{module} takes {total_ms:.0f}ms to import, over the budget of {budget_ms}ms")
+        if deferred := [name for name in DEFERRED_MODULES if name in times]:
+            failures.append(f"{module} imports {', '.join(deferred)}")
+
+    if failures:
+        raise Exit("\n".join(failures), code=1)
+
+
+def _get_import_times(module: str) -> dict[str, int]:
+    """Returns the cumulative import time, in microseconds, of each module imported by a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],  # noqa: S603
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # Lines look like: "import time:  <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
@@ -4,32 +4,57 @@
 # and any import that touches @st.cache_data). Must run before the first
 # streamlit-using import, so it sits at the top of the module.
 #
+# Importing streamlit is slow and most commands never need it, so instead of
+# importing it here, an import hook applies the cap as soon as streamlit's
+# logger module is loaded.
+#
 # We replace ``set_log_level`` itself, after seeding it to "error". Streamlit's
 # own ``_update_logger`` callback fires on config parse and would otherwise
 # downgrade us back to "info"; the cap floors any later call at ERROR.
 def _silence_streamlit_logs() -> None:
+    import importlib.abc as _importlib_abc
+    import importlib.util as _importlib_util
     import logging as _logging
+    import sys as _sys
 
-    try:
-        from streamlit import logger as _st_logger
-    except ImportError:
+    def _cap_log_level(_st_logger) -> None:
+        _original = _st_logger.set_log_level
+        _original("error")
+
+        def _capped(level):
+            if isinstance(level, str):
+                try:
+                    level_num = getattr(_logging, level.upper())
+                except AttributeError:
+                    _original(level)
+                    return
+            else:
+                level_num = level
+            _original(max(level_num, _logging.ERROR))
+
+        _st_logger.set_log_level = _capped
+
+    if "streamlit.logger" in _sys.modules:
+        _cap_log_level(_sys.modules["streamlit.logger"])
         return
 
-    _original = _st_logger.set_log_level
-    _original("error")
+    class _StreamlitLoggerFinder(_importlib_abc.MetaPathFinder):
+        def find_spec(self, fullname, _path, _target=None):
+            if fullname != "streamlit.logger":
+                return None
+            _sys.meta_path.remove(self)
+            spec = _importlib_util.find_spec(fullname)
+            if spec and spec.loader:
+                _exec_module = spec.loader.exec_module
 
-    def _capped(level):
-        if isinstance(level, str):
-            try:
-                level_num = getattr(_logging, level.upper())
-            except AttributeError:
-                _original(level)
-                return
-        else:
-            level_num = level
-        _original(max(level_num, _logging.ERROR))
+                def exec_module(module):
+                    _exec_module(module)
+                    _cap_log_level(module)
+
+                spec.loader.exec_module = exec_module
+            return spec
 
-    _st_logger.set_log_level = _capped
+    _sys.meta_path.insert(0, _StreamlitLoggerFinder())
 
 
 _silence_streamlit_logs()
@@ -71,16 +96,8 @@ from testgen.commands.run_get_entities import (
     run_test_info,
 )
 from testgen.commands.run_launch_db_config import run_launch_db_config
-from testgen.commands.run_observability_exporter import run_observability_exporter
-from testgen.commands.run_quick_start import (
-    run_monitor_increment,
-    run_quick_start,
-    run_quick_start_increment,
-    run_with_job_execution,
-)
 from testgen.commands.run_test_metadata_exporter import run_test_metadata_exporter
 from testgen.commands.run_upgrade_db_config import get_schema_revision, is_db_revision_up_to_date, run_upgrade_db_config
-from testgen.commands.test_generation import run_monitor_generation, run_test_generation
 from testgen.common import (
     configure_logging,
     display_service,
@@ -107,13 +124,10 @@ from testgen.common.standalone_postgres import (
 from testgen.common.standalone_postgres import (
     start_server as start_standalone_postgres,
 )
-from testgen.scheduler import run_scheduler
-from testgen.utils import plugins
 
 LOG = logging.getLogger("testgen")
 
 APP_MODULES = ["ui", "scheduler", "server"]
-VERSION_DATA = version_service.get_version()
 CHILDREN_POLL_INTERVAL = 10
 
 
@@ -184,15 +198,18 @@ class CliGroup(click.Group):
         formatter.write_paragraph()
         formatter.write_text(f"Schema revision: {get_schema_revision()}")
 
+    def format_help_text(self, _ctx: Context, formatter: click.HelpFormatter) -> None:
+        # Checking for the latest version is a network round-trip; also deferred until `--help`
+        version = version_service.get_version()
+        formatter.write_paragraph()
+        with formatter.indentation():
+            formatter.write_text(f"{version.edition} {version.current or ''}")
+            if version.latest != version.current:
+                formatter.write_paragraph()
+                formatter.write_text(f"New version available! {version.latest}")
 
-@click.group(
-    cls=CliGroup,
-    help=f"""
-    {VERSION_DATA.edition} {VERSION_DATA.current or ""}
 
-    {f"New version available! {VERSION_DATA.latest}" if VERSION_DATA.latest != VERSION_DATA.current else ""}
-    """
-)
+@click.group(cls=CliGroup)
 @click.option(
     "-v",
     "--verbose",
@@ -304,6 +321,8 @@ def run_generation(test_suite_id: str | None = None, table_group_id: str | None
 )
 @with_database_session
 def generate_monitors(test_suite_id: str):
+    from testgen.commands.test_generation import run_monitor_generation
+
     click.echo(f"run-monitor-generation for suite: {test_suite_id}")
     run_monitor_generation(test_suite_id, ["Freshness_Trend", "Volume_Trend", "Schema_Drift"])
 
@@ -539,6 +558,14 @@ def quick_start(
     observability_api_url: str,
     observability_api_key: str,
 ):
+    from testgen.commands.run_quick_start import (
+        run_monitor_increment,
+        run_quick_start,
+        run_quick_start_increment,
+        run_with_job_execution,
+    )
+    from testgen.commands.test_generation import run_test_generation
+
     if observability_api_url:
         settings.OBSERVABILITY_API_URL = observability_api_url
     if observability_api_key:
@@ -817,6 +844,8 @@ def get_results(configuration: Configuration, test_run_id: str, fails_only: bool
 )
 @pass_configuration
 def export_data(configuration: Configuration, project_key: str, test_suite_key: str):
+    from testgen.commands.run_observability_exporter import run_observability_exporter
+
     click.echo(f"export-observability for test suite: {test_suite_key}")
     LOG.info("CurrentStep: Main Program - Observability Export")
     run_observability_exporter(project_key, test_suite_key)
@@ -941,6 +970,8 @@ def ui(): ...
 
 @ui.command("plugins", help="List installed application plugins")
 def list_ui_plugins():
+    from testgen.utils import plugins
+
     installed_plugins = list(plugins.discover())
 
     click.echo(click.style(len(installed_plugins), fg="bright_magenta") + click.style(" plugins installed", bold=True))
@@ -1016,6 +1047,7 @@ def run_app(module):
             run_ui()
 
         case "scheduler":
+            from testgen.scheduler import run_scheduler
             run_scheduler()
 
         case "server":
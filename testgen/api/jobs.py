@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter, Depends, Query, status
 
+from testgen import settings
 from testgen.api.deps import (
     api_error,
     db_session,
@@ -10,8 +11,16 @@ from testgen.api.deps import (
     resolve_table_group,
     resolve_test_suite,
 )
-from testgen.api.schemas import ErrorResponse, JobKey, JobListResponse, JobResponse, JobSource, JobSubmittedResponse
-from testgen.common.models.job_execution import JobExecution, JobStatus
+from testgen.api.schemas import (
+    ErrorResponse,
+    JobKey,
+    JobListResponse,
+    JobQueueState,
+    JobResponse,
+    JobSource,
+    JobSubmittedResponse,
+)
+from testgen.common.models.job_execution import FINAL_STATUSES, JobExecution, JobStatus, wait_for_job_status
 from testgen.common.models.table_group import TableGroup
 from testgen.common.models.test_suite import TestSuite
 
@@ -74,8 +83,16 @@ def submit_test_generation(test_suite: TestSuite = resolve_test_suite("edit")):
     "/jobs/{job_id}",
     response_model=JobResponse,
 )
-def get_job_status(job: JobExecution = resolve_job("view")):  # noqa: B008
-    """Poll the status of a job execution."""
+def get_job_status(
+    job: JobExecution = resolve_job("view"),  # noqa: B008
+    wait: int = Query(default=0, ge=0, le=30),
+):
+    """Poll the status of a job execution.
+
+    With `wait`, the response is delayed until the job reaches a final status, for at most that many seconds.
+    """
+    if wait and job.status not in FINAL_STATUSES:
+        job = wait_for_job_status(job.id, FINAL_STATUSES, timeout=wait) or job
     return JobResponse.model_validate(job, from_attributes=True)
 
 
@@ -102,7 +119,7 @@ def list_jobs(
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=20, ge=1, le=100),
 ):
-    """List job executions for a project, with optional filters and pagination."""
+    """List job executions for a project, with optional filters and pagination, and the state of its queue."""
     items, total = JobExecution.list_for_project(
         project_code,
         JobExecution.source != "system",
@@ -116,4 +133,16 @@ def list_jobs(
         page=page,
         limit=limit,
         total=total,
+        queue=_get_queue_state(project_code),
+    )
+
+
+def _get_queue_state(project_code: str) -> JobQueueState:
+    pending, running = JobExecution.get_queue_state(project_code)
+    return JobQueueState(
+        pending=pending,
+        running=running,
+        max_running=settings.JOB_MAX_RUNNING or None,
+        max_running_per_project=settings.JOB_MAX_RUNNING_PER_PROJECT or None,
+        max_running_per_connection=settings.JOB_MAX_RUNNING_PER_CONNECTION or None,
     )
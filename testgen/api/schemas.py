@@ -52,6 +52,16 @@ class JobResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class JobQueueState(BaseModel):
+    """Jobs of the project waiting in the queue and running, with the limits of concurrent jobs (null if unlimited)."""
+
+    pending: int
+    running: int
+    max_running: int | None = None
+    max_running_per_project: int | None = None
+    max_running_per_connection: int | None = None
+
+
 class JobListResponse(BaseModel):
     """Paginated list of job executions."""
 
@@ -59,6 +69,7 @@ class JobListResponse(BaseModel):
     page: int
     limit: int
     total: int
+    queue: JobQueueState
 
 
 # --- Test Runs ---
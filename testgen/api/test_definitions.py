@@ -14,6 +14,7 @@ from testgen.api.schemas import (
     ImportStrictError,
     Origin,
 )
+from testgen.common.cache_invalidation import cache_tag, notify_cache_invalidation
 from testgen.common.models.test_suite import TestSuite
 
 _error_responses = {
@@ -69,4 +70,6 @@ def import_test_definitions(
             ).model_dump(mode="json"),
         )
 
+    if body.config.mode != ImportMode.preview:
+        notify_cache_invalidation(cache_tag("test_suite", test_suite.id))
     return result
@@ -13,14 +13,11 @@ from uuid import UUID
 from testgen.commands.job_registry import JOB_DISPATCH, run_final_callbacks
 from testgen.common.job_context import JobContext, job_context
 from testgen.common.models import database_session
-from testgen.common.models.job_execution import JobExecution, JobStatus
+from testgen.common.models.job_execution import JobExecution
 from testgen.utils import get_exception_message
 
 LOG = logging.getLogger("testgen")
 
-FINAL_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.ERROR, JobStatus.CANCELED})
-POLL_INTERVAL = 2
-
 
 def exec_job(job_execution_id: UUID) -> None:
     """Execute a queued job. Called as a subprocess by the scheduler.
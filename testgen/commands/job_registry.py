@@ -8,37 +8,50 @@ Two registries keyed by `job_key`:
 `run_final_callbacks` is invoked wherever a JE reaches a terminal status:
 `exec_job` after mark_completed/mark_interrupted, `_proc_wrapper`'s nonzero-exit
 safety net, and `_handle_cancellation`'s no-subprocess branch.
+
+Notification callbacks are handed to the background notification dispatcher,
+so they never hold up the remaining callbacks.
+
+Handlers and notifications are imported when they first run: they pull in the
+profiling, test execution and prediction stacks, which most CLI commands and
+the scheduler itself never need.
 """
 
+import functools
+import importlib
 import logging
 from collections.abc import Callable
 
 from sqlalchemy import select
 
-from testgen.commands.run_profiling import run_profiling
-from testgen.commands.run_recalculate_project_scores import run_recalculate_project_scores
-from testgen.commands.run_score_update import run_score_update
-from testgen.commands.run_test_execution import run_test_execution
-from testgen.commands.test_generation import run_test_generation
 from testgen.common.models import database_session
 from testgen.common.models.job_execution import JobExecution, JobStatus
 from testgen.common.models.profiling_run import ProfilingRun
 from testgen.common.models.test_run import TestRun
-from testgen.common.notifications.monitor_run import send_monitor_notifications
-from testgen.common.notifications.profiling_run import send_profiling_run_notifications
-from testgen.common.notifications.test_run import send_test_run_notifications
 
 LOG = logging.getLogger("testgen")
 
 FinalCallback = Callable[[JobExecution], None]
 
+
+def _lazy_handler(module_name: str, function_name: str) -> Callable:
+    def handler(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), function_name)(*args, **kwargs)
+
+    handler.__name__ = handler.__qualname__ = function_name
+    handler.__module__ = module_name
+    return handler
+
+
 JOB_DISPATCH: dict[str, Callable] = {
-    "run-profile": run_profiling,
-    "run-tests": run_test_execution,
-    "run-monitors": run_test_execution,
-    "run-test-generation": run_test_generation,
-    "run-score-update": run_score_update,
-    "recalculate-project-scores": run_recalculate_project_scores,
+    "run-profile": _lazy_handler("testgen.commands.run_profiling", "run_profiling"),
+    "run-tests": _lazy_handler("testgen.commands.run_test_execution", "run_test_execution"),
+    "run-monitors": _lazy_handler("testgen.commands.run_test_execution", "run_test_execution"),
+    "run-test-generation": _lazy_handler("testgen.commands.test_generation", "run_test_generation"),
+    "run-score-update": _lazy_handler("testgen.commands.run_score_update", "run_score_update"),
+    "recalculate-project-scores": _lazy_handler(
+        "testgen.commands.run_recalculate_project_scores", "run_recalculate_project_scores"
+    ),
 }
 
 
@@ -55,7 +68,18 @@ def run_final_callbacks(job_exec: JobExecution) -> None:
             LOG.exception("Callback %s failed for job %s", callback.__name__, job_exec.id)
 
 
+def _in_background(callback: FinalCallback) -> FinalCallback:
+    @functools.wraps(callback)
+    def wrapper(job_exec: JobExecution) -> None:
+        from testgen.common.notifications.dispatcher import notification_dispatcher
+
+        notification_dispatcher.submit(callback, job_exec)
+    return wrapper
+
+
 def _notify_profiling_run(job_exec: JobExecution) -> None:
+    from testgen.common.notifications.profiling_run import send_profiling_run_notifications
+
     with database_session() as session:
         profiling_run = session.scalars(
             select(ProfilingRun).where(ProfilingRun.job_execution_id == job_exec.id)
@@ -67,6 +91,8 @@ def _notify_profiling_run(job_exec: JobExecution) -> None:
 
 
 def _notify_test_run(job_exec: JobExecution) -> None:
+    from testgen.common.notifications.test_run import send_test_run_notifications
+
     with database_session() as session:
         test_run = session.scalars(select(TestRun).where(TestRun.job_execution_id == job_exec.id)).first()
         if not test_run:
@@ -76,6 +102,8 @@ def _notify_test_run(job_exec: JobExecution) -> None:
 
 
 def _notify_monitor_run(job_exec: JobExecution) -> None:
+    from testgen.common.notifications.monitor_run import send_monitor_notifications
+
     with database_session() as session:
         test_run = session.scalars(select(TestRun).where(TestRun.job_execution_id == job_exec.id)).first()
         if not test_run:
@@ -102,7 +130,7 @@ def _enqueue_score_update(job_exec: JobExecution) -> None:
 
 
 JOB_FINAL_CALLBACKS: dict[str, list[FinalCallback]] = {
-    "run-profile": [_notify_profiling_run, _enqueue_score_update],
-    "run-tests": [_notify_test_run, _enqueue_score_update],
-    "run-monitors": [_notify_monitor_run],
+    "run-profile": [_in_background(_notify_profiling_run), _enqueue_score_update],
+    "run-tests": [_in_background(_notify_test_run), _enqueue_score_update],
+    "run-monitors": [_in_background(_notify_monitor_run)],
 }
@@ -1,18 +1,16 @@
 """CLI-facing job submission: `submit_and_wait` posts a job for the scheduler
-to execute and (optionally) polls until it reaches a terminal state.
+to execute and (optionally) waits until it reaches a terminal state.
 """
 
 import logging
 import sys
-import time
 from uuid import UUID
 
 import click
 from sqlalchemy import select
 
-from testgen.commands.exec_job import FINAL_STATUSES, POLL_INTERVAL
 from testgen.common.models import database_session, get_current_session
-from testgen.common.models.job_execution import JobExecution, JobStatus
+from testgen.common.models.job_execution import FINAL_STATUSES, JobExecution, JobStatus, wait_for_job_status
 from testgen.common.models.profiling_run import ProfilingRun
 from testgen.common.models.test_run import TestRun
 
@@ -45,12 +43,10 @@ def submit_and_wait(
         return
 
     click.echo("Waiting for completion...")
-    while True:
-        time.sleep(POLL_INTERVAL)
-        with database_session():
-            job_exec = JobExecution.get(job_id)
-            if job_exec and job_exec.status in FINAL_STATUSES:
-                break
+    job_exec = wait_for_job_status(job_id, FINAL_STATUSES)
+    if not job_exec:
+        click.echo(f"Job {job_id} was not found.", err=True)
+        sys.exit(1)
 
     match job_exec.status:
         case JobStatus.COMPLETED:
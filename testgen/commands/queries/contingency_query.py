@@ -1,10 +1,7 @@
-# UNUSED CODE - TO BE REVIVED LATER
-
 import dataclasses
 from uuid import UUID
 
-from testgen.common import read_template_sql_file
-from testgen.common.database.database_service import quote_csv_items, replace_params
+from testgen.common.database.database_service import compile_template_file, get_flavor_service, quote_csv_items
 
 
 @dataclasses.dataclass
@@ -18,14 +15,17 @@ class ContingencySQL:
 
     contingency_max_values = 6
 
+    def __init__(self, flavor: str):
+        self.flavor = flavor
+        self.flavor_service = get_flavor_service(flavor)
+
     def _get_query(
         self,
         template_file_name: str,
         sub_directory: str | None = "contingency",
         params: dict | None = None,
     ) -> tuple[str | None, dict]:
-        query = read_template_sql_file(template_file_name, sub_directory)
-        query = replace_params(query, params or {})
+        query = compile_template_file(template_file_name, sub_directory).render(params or {})
 
         return query, params
 
@@ -41,11 +41,13 @@ class ContingencySQL:
 
     def get_contingency_counts(self, contingency_table: ContingencyTable) -> tuple[str, dict]:
         # Runs on Target database
+        quote = self.flavor_service.quote_character
         return self._get_query(
             "contingency_counts.sql",
             params={
                 "DATA_SCHEMA": contingency_table.schema_name,
                 "DATA_TABLE": contingency_table.table_name,
-                "CONTINGENCY_COLUMNS": quote_csv_items(contingency_table.contingency_columns),
+                "CONTINGENCY_COLUMNS": quote_csv_items(contingency_table.contingency_columns, quote),
+                "QUOTE": quote,
             },
         )
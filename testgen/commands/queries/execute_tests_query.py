@@ -1,14 +1,21 @@
 import dataclasses
+import math
 from collections.abc import Iterable
 from datetime import date, datetime
-from typing import TypedDict
+from typing import Any, TypedDict
 from uuid import UUID
 
 import pandas as pd
+from sqlalchemy.engine import RowMapping
 
-from testgen.common import read_template_sql_file
 from testgen.common.clean_sql import concat_columns
-from testgen.common.database.database_service import get_flavor_service, get_tg_schema, replace_params
+from testgen.common.database.database_service import (
+    compile_template,
+    compile_template_file,
+    get_flavor_service,
+    get_tg_schema,
+    replace_params,
+)
 from testgen.common.freshness_service import (
     count_excluded_minutes,
     get_schedule_params,
@@ -21,7 +28,6 @@ from testgen.common.models.table_group import TableGroup
 from testgen.common.models.test_definition import TestRunType, TestScope
 from testgen.common.models.test_run import TestRun
 from testgen.common.models.test_suite import TestSuite
-from testgen.common.read_file import replace_templated_functions
 from testgen.utils import to_sql_timestamp
 
 
@@ -67,6 +73,14 @@ class TestExecutionDef(InputParameters):
     measure: str
     test_operator: str
     test_condition: str
+    # Result attributes, resolved from the test definition, test suite and test type
+    severity: str | None = None
+    test_description: str | None = None
+    export_to_observability: str | None = None
+    measure_uom: str | None = None
+    impact_dimension: str | None = None
+    table_groups_id: UUID | None = None
+    auto_gen: bool = False
     # Runtime attributes
     column_type: str = None
     measure_expression: str = None
@@ -173,6 +187,110 @@ def group_cat_tests(
     return groups
 
 
+RESULT_COLUMNS = (
+    "test_run_id",
+    "test_suite_id",
+    "test_time",
+    "test_definition_id",
+    "test_type",
+    "schema_name",
+    "table_name",
+    "column_names",
+    "skip_errors",
+    "input_parameters",
+    "result_code",
+    "result_status",
+    "result_message",
+    "result_measure",
+    "result_signal",
+    "threshold_value",
+    "severity",
+    "test_description",
+    "observability_status",
+    "table_groups_id",
+    "auto_gen",
+    "impact_dimension",
+)
+
+
+def _to_text(value: Any) -> str | None:
+    # Text of a value as stored by COPY, where empty strings and NaN become NULL
+    if value is None or value == "" or (isinstance(value, float) and math.isnan(value)):
+        return None
+    return str(value)
+
+
+def get_result_status(result_status: str | None, result_code: int | None, severity: str | None) -> str | None:
+    if result_status == "Error":
+        return "Error"
+    if severity == "Log" or result_code == -1:
+        return "Log"
+    if result_code == 1:
+        return "Passed"
+    if result_code == 0:
+        return "Failed" if severity == "Fail" else "Warning"
+    return None
+
+
+def build_test_result(td: TestExecutionDef, result: dict[str, Any]) -> list:
+    """Complete the result of a test with the columns derived from its definition.
+
+    Args:
+        td: Test definition of the result.
+        result: Values returned by the test query, keyed by test_results column.
+
+    Returns:
+        Result row, with the values of RESULT_COLUMNS.
+    """
+    result_code = _to_text(result.get("result_code"))
+    result_code = int(result_code) if result_code is not None else None
+    skip_errors = result.get("skip_errors")
+    result_measure = _to_text(result.get("result_measure"))
+
+    result_message = _to_text(result.get("result_message"))
+    if result_message is None and td.measure_uom is not None and result_measure is not None:
+        result_message = f"{td.measure_uom}: {result_measure}"
+        if td.threshold_value is not None:
+            result_message += f", Threshold: {td.threshold_value}"
+        if td.lower_tolerance is not None:
+            result_message += f", Lower Bound: {td.lower_tolerance}"
+        if td.upper_tolerance is not None:
+            result_message += f", Upper Bound: {td.upper_tolerance}"
+        if skip_errors is not None and int(skip_errors) > 0:
+            result_message += f"Errors Ignored: {skip_errors}"
+
+    observability_status = None
+    if td.export_to_observability == "Y":
+        observability_status = "Queued"
+    elif td.export_to_observability == "N":
+        observability_status = "Ignore"
+
+    return [
+        result.get("test_run_id"),
+        result.get("test_suite_id"),
+        result.get("test_time"),
+        result.get("test_definition_id"),
+        result.get("test_type"),
+        result.get("schema_name"),
+        result.get("table_name"),
+        result.get("column_names"),
+        skip_errors,
+        result.get("input_parameters"),
+        result.get("result_code"),
+        get_result_status(result.get("result_status"), result_code, td.severity),
+        result_message,
+        result.get("result_measure"),
+        result.get("result_signal") if _to_text(result.get("result_signal")) is not None else result_measure,
+        result.get("threshold_value") if _to_text(result.get("threshold_value")) is not None else td.threshold_value,
+        td.severity,
+        td.test_description,
+        observability_status,
+        td.table_groups_id,
+        td.auto_gen,
+        td.impact_dimension,
+    ]
+
+
 def parse_cat_results(
     aggregate_results: list[AggregateResult],
     aggregate_test_defs: list[list[TestExecutionDef]],
@@ -194,7 +312,7 @@ def parse_cat_results(
         null_value: Sentinel string for NULL values.
 
     Returns:
-        List of result rows (each row is a list of values).
+        List of result rows (each row is a list of the values of RESULT_COLUMNS).
     """
     test_results: list[list] = []
     for result in aggregate_results:
@@ -203,22 +321,20 @@ def parse_cat_results(
         result_codes = result["result_codes"].split(",")
 
         for index, td in enumerate(test_defs):
-            test_results.append([
-                test_run_id,
-                test_suite_id,
-                test_starttime,
-                td.id,
-                td.test_type,
-                td.schema_name,
-                td.table_name,
-                td.column_name,
-                td.skip_errors or 0,
-                input_parameters_fn(td),
-                result_codes[index],
-                None,  # result_status will be calculated later
-                None,  # No result_message
-                result_measures[index] if result_measures[index] != null_value else None,
-            ])
+            test_results.append(build_test_result(td, {
+                "test_run_id": test_run_id,
+                "test_suite_id": test_suite_id,
+                "test_time": test_starttime,
+                "test_definition_id": td.id,
+                "test_type": td.test_type,
+                "schema_name": td.schema_name,
+                "table_name": td.table_name,
+                "column_names": td.column_name,
+                "skip_errors": td.skip_errors or 0,
+                "input_parameters": input_parameters_fn(td),
+                "result_code": result_codes[index],
+                "result_measure": result_measures[index] if result_measures[index] != null_value else None,
+            }))
 
     return test_results
 
@@ -227,22 +343,7 @@ class TestExecutionSQL:
 
     null_value = "<NULL>"
     test_results_table = "test_results"
-    result_columns = (
-        "test_run_id",
-        "test_suite_id",
-        "test_time",
-        "test_definition_id",
-        "test_type",
-        "schema_name",
-        "table_name",
-        "column_names",
-        "skip_errors",
-        "input_parameters",
-        "result_code",
-        "result_status",
-        "result_message",
-        "result_measure",
-    )
+    result_columns = RESULT_COLUMNS
 
     def __init__(self, connection: Connection, table_group: TableGroup, test_suite: TestSuite, test_run: TestRun):
         self.connection = connection
@@ -364,12 +465,10 @@ class TestExecutionSQL:
         extra_params: dict | None = None,
         test_def: TestExecutionDef | None = None,
     ) -> tuple[str, dict | None]:
-        query = read_template_sql_file(template_file_name, sub_directory)
-
         params = self._get_params(test_def)
         if extra_params:
             params.update(extra_params)
-        query = replace_params(query, params)
+        query = compile_template_file(template_file_name, sub_directory).render(params)
 
         if no_bind:
             query = query.replace(":", "\\:")
@@ -406,22 +505,20 @@ class TestExecutionSQL:
 
     def get_test_errors(self, test_defs: list[TestExecutionDef]) -> list[list[UUID | str | datetime]]:
         return [
-            [
-                self.test_run.id,
-                self.test_run.test_suite_id,
-                self.test_run.test_starttime,
-                td.id,
-                td.test_type,
-                td.schema_name,
-                td.table_name,
-                td.column_name,
-                td.skip_errors or 0,
-                self._get_input_parameters(td),
-                None, # No result_code on errors
-                "Error",
-                ". ".join(td.errors),
-                None, # No result_measure on errors
-            ] for td in test_defs if td.errors
+            build_test_result(td, {
+                "test_run_id": self.test_run.id,
+                "test_suite_id": self.test_run.test_suite_id,
+                "test_time": self.test_run.test_starttime,
+                "test_definition_id": td.id,
+                "test_type": td.test_type,
+                "schema_name": td.schema_name,
+                "table_name": td.table_name,
+                "column_names": td.column_name,
+                "skip_errors": td.skip_errors or 0,
+                "input_parameters": self._get_input_parameters(td),
+                "result_status": "Error",
+                "result_message": ". ".join(td.errors),
+            }) for td in test_defs if td.errors
         ]
 
     def disable_invalid_test_definitions(self) -> tuple[str, dict]:
@@ -465,10 +562,9 @@ class TestExecutionSQL:
             if not td.measure_expression or not td.condition_expression:
                 params = self._get_params(td)
 
-                measure = replace_params(td.measure, params)
-                measure = replace_templated_functions(measure, self.flavor)
-                condition = replace_params(td.test_condition, params)
-                condition = replace_templated_functions(condition, self.flavor)
+                # Measures and conditions are shared by the tests of a type, so their compiled templates are reused
+                measure = compile_template(td.measure).render(params, flavor=self.flavor)
+                condition = compile_template(td.test_condition).render(params, flavor=self.flavor)
 
                 td.measure_expression, td.condition_expression = build_cat_expressions(
                     measure=measure,
@@ -516,9 +612,17 @@ class TestExecutionSQL:
             null_value=self.null_value,
         )
 
-    def update_test_results(self) -> list[tuple[str, dict]]:
-        # Runs on App database
+    def get_query_test_results(
+        self,
+        results: list[RowMapping],
+        test_defs: list[TestExecutionDef],
+    ) -> list[list[UUID | str | datetime | int | None]]:
+        test_defs_by_id = {str(td.id): td for td in test_defs}
         return [
-            self._get_query("update_test_results.sql"),
-            self._get_query("update_test_run_stats.sql"),
+            build_test_result(test_defs_by_id[str(result["test_definition_id"])], result)
+            for result in results
         ]
+
+    def update_test_run_stats(self) -> tuple[str, dict]:
+        # Runs on App database
+        return self._get_query("update_test_run_stats.sql")
@@ -1,15 +1,33 @@
 import dataclasses
+import re
+from typing import Any
 from uuid import UUID
 
+from sqlalchemy.engine import RowMapping
+
 from testgen.commands.queries.refresh_data_chars_query import ColumnChars
-from testgen.common import read_template_sql_file
-from testgen.common.database.database_service import process_conditionals, replace_params
+from testgen.common.database.database_service import compile_template_file
 from testgen.common.models.connection import Connection
 from testgen.common.models.profiling_run import ProfilingRun
 from testgen.common.models.table_group import TableGroup
-from testgen.common.read_file import replace_templated_functions
 from testgen.utils import to_sql_timestamp
 
+TARGET_TABLE_CTE_PATTERN = re.compile(r"^(WITH target_table AS \(.*?\n\)\n)(.*)$", re.DOTALL)
+SQL_LITERAL_PATTERN = re.compile(r"'[^']*'|\"[^\"]*\"|`[^`]*`|--[^\n]*")
+SELECT_PATTERN = re.compile(r"\s*SELECT(?:\s+TOP\s+\d+)?\s", re.IGNORECASE)
+SELECT_TOKEN_PATTERN = re.compile(r"[(),]|\bFROM\b", re.IGNORECASE)
+SELECT_ITEM_ALIAS_PATTERN = re.compile(r"\bAS\s+(\w+)\s*\Z", re.IGNORECASE)
+FROM_TARGET_TABLE_PATTERN = re.compile(r"\s+target_table\b", re.IGNORECASE)
+JOINED_SUBQUERY_PATTERN = re.compile(r"\s*,\s*\(")
+SUBQUERY_ALIAS_PATTERN = re.compile(r"\s*(?:AS\s+)?(\w+)", re.IGNORECASE)
+IDENTIFIER_PATTERN = re.compile(r"(?<![.\w])\w+(?:\.\w+)?")
+BATCH_ALIAS_FORMAT = "col{index}__{alias}"
+BATCH_ALIAS_PATTERN = re.compile(r"^col(\d+)__(\w+)$", re.IGNORECASE)
+# Characters of a batch query besides its CTE, select items and joins
+BATCH_QUERY_CHARS = 30
+# Redshift limits queries to 1600 columns, the lowest of the supported flavors
+MAX_BATCH_SELECT_ITEMS = 1600
+
 
 @dataclasses.dataclass
 class TableSampling:
@@ -53,6 +71,210 @@ def calculate_sampling_params(
     )
 
 
+@dataclasses.dataclass
+class ColumnProfilingQuery:
+    """Column profiling query split into the parts that can be combined with the other columns of its table."""
+    table_cte: str
+    select_items: list[tuple[str, str]]
+    # Joined subqueries, with their alias and the names of their columns
+    subqueries: list[tuple[str, str, list[str]]]
+
+
+def _mask_literals(sql: str) -> str:
+    # Blanks out strings, quoted identifiers and comments so that their contents are not parsed as SQL
+    return SQL_LITERAL_PATTERN.sub(lambda match: " " * len(match.group()), sql)
+
+
+def _split_select_list(sql: str, masked: str, start: int) -> tuple[list[tuple[str, str]], int] | None:
+    """Split a select list into (expression, alias) items, up to the FROM keyword ending it.
+
+    Returns None if an item has no alias or the list does not end with FROM, otherwise the items and the
+    position after FROM.
+    """
+    items: list[tuple[str, str]] = []
+    depth = 0
+    item_start = start
+    for token in SELECT_TOKEN_PATTERN.finditer(masked, start):
+        if token.group() == "(":
+            depth += 1
+        elif token.group() == ")":
+            depth -= 1
+        elif depth == 0:
+            if not (alias := SELECT_ITEM_ALIAS_PATTERN.search(masked, item_start, token.start())):
+                return None
+            items.append((sql[item_start:alias.start()].strip(), alias.group(1)))
+            item_start = token.end()
+            if token.group() != ",":
+                return items, token.end()
+    return None
+
+
+def _find_closing_parenthesis(masked: str, start: int) -> int | None:
+    depth = 0
+    for index in range(start, len(masked)):
+        if masked[index] == "(":
+            depth += 1
+        elif masked[index] == ")":
+            depth -= 1
+            if depth == 0:
+                return index
+    return None
+
+
+def split_profiling_query(query: str) -> ColumnProfilingQuery | None:
+    """Split a rendered column profiling query into its target_table CTE, select list and joined subqueries.
+
+    Returns None for queries that are not a single aggregate over target_table, which can't be combined.
+    """
+    if not (match := TARGET_TABLE_CTE_PATTERN.match(query)):
+        return None
+    table_cte, body = match.groups()
+    masked = _mask_literals(body)
+
+    if not (select := SELECT_PATTERN.match(masked)):
+        return None
+    if not (select_list := _split_select_list(body, masked, select.end())):
+        return None
+    select_items, position = select_list
+    if not (from_table := FROM_TARGET_TABLE_PATTERN.match(masked, position)):
+        return None
+    position = from_table.end()
+
+    subqueries: list[tuple[str, str, list[str]]] = []
+    while join := JOINED_SUBQUERY_PATTERN.match(masked, position):
+        end = _find_closing_parenthesis(masked, join.end() - 1)
+        if end is None or not (alias := SUBQUERY_ALIAS_PATTERN.match(masked, end + 1)):
+            return None
+        subquery = body[join.end() - 1:end + 1]
+        subquery_masked = masked[join.end() - 1:end + 1]
+        if not (subquery_select := SELECT_PATTERN.match(subquery_masked, 1)):
+            return None
+        if not (subquery_list := _split_select_list(subquery, subquery_masked, subquery_select.end())):
+            return None
+        subqueries.append((subquery, alias.group(1), [name for _, name in subquery_list[0]]))
+        position = alias.end()
+
+    if masked[position:].strip():
+        return None
+    return ColumnProfilingQuery(table_cte, select_items, subqueries)
+
+
+def _get_batch_parts(column_query: ColumnProfilingQuery, index: int) -> tuple[list[str], list[str]]:
+    """Rename the select items and joined subqueries of a column for its position in a batch."""
+    subquery_aliases = {alias.lower(): f"{alias}_{index}" for _, alias, _ in column_query.subqueries}
+    subquery_columns = {
+        name.lower(): f"{alias}_{index}" for _, alias, names in column_query.subqueries for name in names
+    }
+
+    def qualify(expression: str) -> str:
+        # References to the subquery columns are qualified, since the other columns' subqueries have the same names
+        parts = []
+        position = 0
+        for identifier in IDENTIFIER_PATTERN.finditer(_mask_literals(expression)):
+            name, _, column_name = identifier.group().partition(".")
+            if column_name and name.lower() in subquery_aliases:
+                replacement = f"{subquery_aliases[name.lower()]}.{column_name}"
+            elif not column_name and name.lower() in subquery_columns:
+                replacement = f"{subquery_columns[name.lower()]}.{name}"
+            else:
+                continue
+            parts.extend([expression[position:identifier.start()], replacement])
+            position = identifier.end()
+        parts.append(expression[position:])
+        return "".join(parts)
+
+    select_items = [
+        f"  {qualify(expression)} AS {BATCH_ALIAS_FORMAT.format(index=index, alias=alias)}"
+        for expression, alias in column_query.select_items
+    ]
+    joins = [f"  , {subquery} {alias}_{index}" for subquery, alias, _ in column_query.subqueries]
+    return select_items, joins
+
+
+def group_profiling_queries(
+    column_queries: list[tuple[ColumnChars, str]],
+    max_query_chars: int,
+    single: bool = False,
+) -> list[tuple[str, list[ColumnChars]]]:
+    """Combine the profiling queries of columns of the same table into wide queries respecting character limit.
+
+    Each batch computes the aggregates of all its columns in a single pass over the table's target_table CTE, and
+    returns one row with the results of each column aliased with its position in the batch (see
+    split_batch_results). Queries that can't be combined are run in their own batch, returning their usual row.
+
+    Args:
+        column_queries: List of (column, rendered profiling query) tuples.
+        max_query_chars: Maximum characters per query.
+        single: If True, put each query in its own batch.
+
+    Returns:
+        List of (batched query, columns in the batch) tuples.
+    """
+    if single:
+        return [(query, [column]) for column, query in column_queries]
+
+    batches: list[tuple[str, list[ColumnChars]]] = []
+    queries_by_table: dict[tuple[str, str, str], list[tuple[ColumnChars, ColumnProfilingQuery]]] = {}
+    for column, query in column_queries:
+        if column_query := split_profiling_query(query):
+            table = (column.schema_name, column.table_name, column_query.table_cte)
+            if not queries_by_table.get(table):
+                queries_by_table[table] = []
+            queries_by_table[table].append((column, column_query))
+        else:
+            batches.append((query, [column]))
+
+    def get_batch_query(table_cte: str, select_items: list[str], joins: list[str]) -> str:
+        return table_cte + "SELECT\n" + ",\n".join(select_items) + "\n  FROM target_table" + "".join(
+            f"\n{join}" for join in joins
+        )
+
+    for (_, _, table_cte), table_queries in queries_by_table.items():
+        current_chars = len(table_cte) + BATCH_QUERY_CHARS
+        current_items: list[str] = []
+        current_joins: list[str] = []
+        current_columns: list[ColumnChars] = []
+        for column, column_query in table_queries:
+            select_items, joins = _get_batch_parts(column_query, len(current_columns))
+            column_chars = sum(len(item) + 2 for item in select_items) + sum(len(join) + 1 for join in joins)
+            if current_columns and (
+                current_chars + column_chars > max_query_chars
+                or len(current_items) + len(select_items) > MAX_BATCH_SELECT_ITEMS
+            ):
+                batches.append((get_batch_query(table_cte, current_items, current_joins), current_columns))
+                current_chars = len(table_cte) + BATCH_QUERY_CHARS
+                current_items = []
+                current_joins = []
+                current_columns = []
+                select_items, joins = _get_batch_parts(column_query, 0)
+                column_chars = sum(len(item) + 2 for item in select_items) + sum(len(join) + 1 for join in joins)
+
+            current_chars += column_chars
+            current_items.extend(select_items)
+            current_joins.extend(joins)
+            current_columns.append(column)
+
+        if current_columns:
+            batches.append((get_batch_query(table_cte, current_items, current_joins), current_columns))
+
+    return batches
+
+
+def split_batch_results(batch_results: list[RowMapping]) -> list[dict[str, Any]]:
+    """Split the rows of batched profiling queries into one row per column, keyed by the profiling query's aliases."""
+    results: list[dict[str, Any]] = []
+    for batch_result in batch_results:
+        column_results: dict[int, dict[str, Any]] = {}
+        for key, value in batch_result.items():
+            if match := BATCH_ALIAS_PATTERN.match(key):
+                column_results.setdefault(int(match.group(1)), {})[match.group(2).lower()] = value
+            else:
+                # Queries run in their own batch return the results of their column unaliased
+                column_results.setdefault(-1, {})[key] = value
+        results.extend(column_results.values())
+    return results
+
+
 @dataclasses.dataclass
 class HygieneIssueType:
     id: str
@@ -84,8 +306,25 @@ class ProfilingSQL:
         "record_ct",
         "query_error",
     )
+    # Aliases of the column profiling queries, written for the results of batched queries
+    result_columns = (
+        "connection_id", "project_code", "table_groups_id", "schema_name", "run_date", "table_name", "position",
+        "column_name", "column_type", "db_data_type", "general_type", "record_ct", "value_ct", "distinct_value_ct",
+        "null_value_ct", "min_length", "max_length", "avg_length", "zero_value_ct", "distinct_std_value_ct",
+        "zero_length_ct", "lead_space_ct", "quoted_value_ct", "includes_digit_ct", "filled_value_ct", "min_text",
+        "max_text", "upper_case_ct", "lower_case_ct", "non_alpha_ct", "non_printing_ct", "numeric_ct", "date_ct",
+        "std_pattern_match", "top_patterns", "min_value", "min_value_over_0", "max_value", "avg_value",
+        "stdev_value", "percentile_25", "percentile_50", "percentile_75", "fractional_sum", "min_date", "max_date",
+        "before_1yr_date_ct", "before_5yr_date_ct", "before_20yr_date_ct", "before_100yr_date_ct",
+        "within_1yr_date_ct", "within_1mo_date_ct", "future_date_ct", "distant_future_date_ct", "date_days_present",
+        "date_weeks_present", "date_months_present", "boolean_true_ct", "distinct_pattern_ct", "embedded_space_ct",
+        "avg_embedded_spaces", "profile_run_id",
+    )
 
     max_pattern_length = 25
+    frequency_min_distinct_ct = 2
+    frequency_max_distinct_ct = 70
+    frequency_max_length = 70
     max_error_length = 2000
 
     def __init__(self, connection: Connection, table_group: TableGroup, profiling_run: ProfilingRun):
@@ -135,23 +374,35 @@ class ProfilingSQL:
         column_chars: ColumnChars | None = None,
         table_sampling: TableSampling | None = None,
     ) -> tuple[str | None, dict]:
-        query = read_template_sql_file(template_file_name, sub_directory)
-        params = {}
+        params = self._get_params(column_chars, table_sampling)
+        if extra_params:
+            params.update(extra_params)
 
-        if query:
-            query = process_conditionals(query, extra_params)
-            params.update(self._get_params(column_chars, table_sampling))
-            if extra_params:
-                params.update(extra_params)
-
-            query = replace_params(query, params)
-            query = replace_templated_functions(query, self.flavor)
+        query = compile_template_file(template_file_name, sub_directory).render(
+            params, conditions=extra_params or {}, flavor=self.flavor,
+        )
 
         return query, params
 
-    def get_frequency_analysis_columns(self) -> tuple[str, dict]:
-        # Runs on App database
-        return self._get_query("secondary_profiling_columns.sql")
+    def get_frequency_analysis_queries(self, profiling_results: list[RowMapping | dict]) -> list[tuple[str, dict]]:
+        # Runs on Target database
+        # Columns with few, short distinct values fit in the top frequency values of the results
+        return [
+            self.run_frequency_analysis(
+                ColumnChars(
+                    schema_name=result["schema_name"],
+                    table_name=result["table_name"],
+                    column_name=result["column_name"],
+                )
+            )
+            for result in profiling_results
+            if result.get("top_freq_values") is None
+            and result.get("general_type") == "A"
+            and result.get("distinct_value_ct") is not None
+            and self.frequency_min_distinct_ct <= result["distinct_value_ct"] <= self.frequency_max_distinct_ct
+            and result.get("max_length") is not None
+            and result["max_length"] <= self.frequency_max_length
+        ]
 
     def update_frequency_analysis_results(self) -> list[tuple[str, dict]]:
         # Runs on App database
@@ -193,8 +444,6 @@ class ProfilingSQL:
         }
 
         match issue_type.data_object:
-            case "Column":
-                query, params = self._get_query("profile_anomalies_screen_column.sql", extra_params=extra_params)
             case "Multi-Col":
                 query, params = self._get_query("profile_anomalies_screen_multi_column.sql", extra_params=extra_params)
             case "Dates":
@@ -208,17 +457,43 @@ class ProfilingSQL:
 
         return query, params
 
-    def update_hygiene_issue_prevalence(self, issue_type: HygieneIssueType) -> tuple[str, dict]:
+    def detect_column_hygiene_issues(self, issue_types: list[HygieneIssueType]) -> tuple[str, dict] | None:
         # Runs on App database
-        query = read_template_sql_file("profile_anomaly_scoring.sql", sub_directory="profiling")
-        params = {
-            "PROFILE_RUN_ID": self.profiling_run.id,
-            "ANOMALY_ID": issue_type.id,
-            "PREV_FORMULA": issue_type.dq_score_prevalence_formula,
-            "RISK": issue_type.dq_score_risk_factor,
-        }
-        query = replace_params(query, params)
-        return query, params
+        # Screens all the Column issue types in a single pass over the run's profile results
+        column_types = [issue_type for issue_type in issue_types if issue_type.data_object == "Column"]
+        if not column_types:
+            return None
+
+        screens = []
+        extra_params = {}
+        for index, issue_type in enumerate(column_types):
+            screens.append(
+                f"SELECT :ANOMALY_ID_{index} AS anomaly_id, ({issue_type.detail_expression}) AS detail"
+                f" WHERE ({issue_type.anomaly_criteria})"
+            )
+            extra_params[f"ANOMALY_ID_{index}"] = issue_type.id
+
+        extra_params["ANOMALY_SCREENS"] = "\nUNION ALL\n".join(screens)
+        return self._get_query("profile_anomalies_screen_columns.sql", extra_params=extra_params)
+
+    def update_hygiene_issues_prevalence(self, issue_types: list[HygieneIssueType]) -> tuple[str, dict] | None:
+        # Runs on App database
+        scored_types = [issue_type for issue_type in issue_types if issue_type.dq_score_prevalence_formula]
+        if not scored_types:
+            return None
+
+        cases = []
+        extra_params = {}
+        for index, issue_type in enumerate(scored_types):
+            cases.append(
+                f"          WHEN :ANOMALY_ID_{index} THEN ({issue_type.dq_score_prevalence_formula}) * :RISK_{index}"
+            )
+            extra_params[f"ANOMALY_ID_{index}"] = issue_type.id
+            extra_params[f"RISK_{index}"] = issue_type.dq_score_risk_factor
+
+        extra_params["PREVALENCE_CASES"] = "\n".join(cases)
+        extra_params["ANOMALY_IDS"] = ", ".join(f":ANOMALY_ID_{index}" for index in range(len(scored_types)))
+        return self._get_query("profile_anomaly_scoring.sql", extra_params=extra_params)
 
     def run_column_profiling(self, column_chars: ColumnChars, table_sampling: TableSampling | None = None) -> tuple[str, dict]:
         # Runs on Target database
@@ -250,6 +525,39 @@ class ProfilingSQL:
             table_sampling=table_sampling,
         )
 
+    def aggregate_column_profiling(
+        self,
+        data_chars: list[ColumnChars],
+        sampling_params: dict[str, TableSampling],
+        single: bool = False,
+    ) -> tuple[list[tuple[str, None]], list[list[ColumnChars]]]:
+        # Runs on Target database
+        column_queries = [
+            (column_chars, self.run_column_profiling(column_chars, sampling_params.get(column_chars.table_name))[0])
+            for column_chars in data_chars
+        ]
+
+        max_query_chars = self.connection.max_query_chars - 400
+        batches = group_profiling_queries(column_queries, max_query_chars, single)
+
+        aggregate_queries: list[tuple[str, None]] = []
+        aggregate_columns: list[list[ColumnChars]] = []
+        for query, columns in batches:
+            aggregate_queries.append((query, None))
+            aggregate_columns.append(columns)
+
+        return aggregate_queries, aggregate_columns
+
+    def get_batch_profiling_results(self, batch_results: list[RowMapping]) -> list[list[Any]]:
+        return [
+            [result.get(name) for name in self.result_columns]
+            for result in split_batch_results(batch_results)
+        ]
+
+    def get_batch_frequency_analysis_queries(self, batch_results: list[RowMapping]) -> list[tuple[str, dict]]:
+        # Runs on Target database
+        return self.get_frequency_analysis_queries(split_batch_results(batch_results))
+
     def get_profiling_errors(self, column_errors: list[tuple[ColumnChars, str]]) -> list[list[str | UUID | int]]:
         return [
             [
@@ -2,8 +2,7 @@ import dataclasses
 from collections.abc import Iterable
 from datetime import datetime
 
-from testgen.common import read_template_sql_file
-from testgen.common.database.database_service import get_flavor_service, replace_params
+from testgen.common.database.database_service import compile_template_file, get_flavor_service
 from testgen.common.models.connection import Connection
 from testgen.common.models.table_group import TableGroup
 from testgen.utils import chunk_queries, to_sql_timestamp
@@ -23,6 +22,12 @@ class ColumnChars:
     # This should not default to 0 since we don't always retrieve actual row counts
     # UI relies on the null value to know that the approx_record_ct should be displayed instead
     record_ct: int = None
+    # Catalog estimate at the time record_ct was last counted, used to detect row count changes
+    approx_record_ct_at_count: int = None
+
+    @property
+    def row_count(self) -> int:
+        return self.record_ct if self.record_ct is not None else (self.approx_record_ct or 0)
 
 
 class RefreshDataCharsSQL:
@@ -40,6 +45,7 @@ class RefreshDataCharsSQL:
         "db_data_type",
         "approx_record_ct",
         "record_ct",
+        "approx_record_ct_at_count",
     )
 
     def __init__(self, connection: Connection, table_group: TableGroup):
@@ -54,14 +60,13 @@ class RefreshDataCharsSQL:
         sub_directory: str | None = "data_chars",
         extra_params: dict | None = None,
     ) -> tuple[str, dict]:
-        query = read_template_sql_file(template_file_name, sub_directory)
         params = {
             "DATA_SCHEMA": self.table_group.table_group_schema,
             "TABLE_GROUPS_ID": self.table_group.id,
         }
         if extra_params:
             params.update(extra_params)
-        query = replace_params(query, params)
+        query = compile_template_file(template_file_name, sub_directory).render(params)
         return query, params
 
     def _get_table_criteria(self) -> str:
@@ -119,6 +124,10 @@ class RefreshDataCharsSQL:
         chunked_queries = chunk_queries(count_queries, " UNION ALL ", self.connection.max_query_chars)
         return [ (query, None) for query in chunked_queries ]
 
+    def get_previous_row_counts(self) -> tuple[str, dict]:
+        # Runs on App database
+        return self._get_query("get_previous_row_counts.sql")
+
     def verify_access(self, table_name: str) -> tuple[str, None]:
         # Runs on Target database
         schema = self.table_group.table_group_schema
@@ -146,6 +155,7 @@ class RefreshDataCharsSQL:
                 column.db_data_type,
                 column.approx_record_ct,
                 column.record_ct,
+                column.approx_record_ct_at_count,
             ]
             for column in data_chars
         ]
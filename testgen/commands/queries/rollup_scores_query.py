@@ -1,7 +1,6 @@
 from uuid import UUID
 
-from testgen.common import read_template_sql_file
-from testgen.common.database.database_service import replace_params
+from testgen.common.database.database_service import compile_template_file
 
 
 class RollupScoresSQL:
@@ -18,12 +17,11 @@ class RollupScoresSQL:
         sub_directory: str | None = "rollup_scores",
         no_bind: bool = False,
     ) -> tuple[str, dict]:
-        query = read_template_sql_file(template_file_name, sub_directory)
         params = {
             "RUN_ID": self.run_id,
             "TABLE_GROUPS_ID": self.table_group_id or "",
         }
-        query = replace_params(query, params)
+        query = compile_template_file(template_file_name, sub_directory).render(params)
         return query, None if no_bind else params
     
     def rollup_profiling_scores(self) -> list[tuple[str, dict]]:
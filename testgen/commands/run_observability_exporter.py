@@ -1,8 +1,13 @@
+import hashlib
 import json
 import logging
 import sys
+import time
 import uuid
 from collections import namedtuple
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from urllib.parse import urlparse
 
 import click
@@ -25,47 +30,150 @@ DEFAULT_COMPONENT_TYPE = "dataset"
 PAYLOAD_MAX_SIZE = 100000
 PAYLOAD_MAX_ITEMS = 500
 
-
-def calculate_chunk_size(test_outcomes):
-    size = len(json.dumps(test_outcomes))
-    split = size / PAYLOAD_MAX_SIZE * 2
-    chunk_size = int(round(len(test_outcomes) / split))
-    return min(PAYLOAD_MAX_ITEMS, chunk_size)
-
-
-def post_event(event_type, payload, api_url, api_key, test_outcomes, is_test=False):
+RETRY_ATTEMPTS = 5
+RETRY_BACKOFF = 1.0
+
+
+@dataclass
+class EventChunk:
+    body: bytes
+    result_ids: list[str]
+    idempotency_key: str
+
+
+def chunk_test_outcomes(
+    payload: dict,
+    test_outcomes: list[dict],
+    result_ids: list[str] | None = None,
+    max_size: int = PAYLOAD_MAX_SIZE,
+    max_items: int = PAYLOAD_MAX_ITEMS,
+) -> Iterator[EventChunk]:
+    """
+    Splits the test outcomes into event requests of at most max_items outcomes and max_size encoded
+    bytes (unless a single outcome is larger). Each outcome is encoded only once, as the chunks are built.
+    """
+    prefix, suffix = _encode_envelope(payload)
+    result_ids = result_ids or [None] * len(test_outcomes)
+
+    items: list[bytes] = []
+    ids: list[str] = []
+    size = len(prefix) + len(suffix)
+    for outcome, result_id in zip(test_outcomes, result_ids, strict=True):
+        item = json.dumps(outcome).encode()
+        # Items after the first one are preceded by a comma
+        if items and (len(items) >= max_items or size + len(item) + 1 > max_size):
+            yield _make_chunk(prefix, suffix, items, ids)
+            items, ids = [], []
+            size = len(prefix) + len(suffix)
+        size += len(item) + (1 if items else 0)
+        items.append(item)
+        ids.append(result_id)
+
+    if items:
+        yield _make_chunk(prefix, suffix, items, ids)
+
+
+def _encode_envelope(payload: dict) -> tuple[bytes, bytes]:
+    envelope = {key: value for key, value in payload.items() if key != "test_outcomes"}
+    encoded = json.dumps({**envelope, "test_outcomes": []}).encode()
+    # test_outcomes is the last key, so the encoded payload ends with its empty list
+    return encoded[:-2], encoded[-2:]
+
+
+def _make_chunk(prefix: bytes, suffix: bytes, items: list[bytes], result_ids: list[str | None]) -> EventChunk:
+    body = prefix + b",".join(items) + suffix
+    # The key only depends on the results being sent, so resending them after a failure is recognized as a retry
+    key_source = ",".join(result_ids).encode() if all(result_ids) else body
+    return EventChunk(body, [result_id for result_id in result_ids if result_id], hashlib.sha256(key_source).hexdigest())
+
+
+def post_event(
+    event_type,
+    payload,
+    api_url,
+    api_key,
+    test_outcomes,
+    is_test=False,
+    result_ids: list[str] | None = None,
+    on_chunk_sent: Callable[[EventChunk], None] | None = None,
+):
+    """
+    Sends the test outcomes to Observability in chunks, with up to OBSERVABILITY_EXPORT_MAX_IN_FLIGHT
+    requests in flight. Failed chunks are retried with backoff, using the same idempotency key. When a
+    chunk still fails, no new chunks are sent and the error is raised once the in-flight ones finish.
+    on_chunk_sent is called, on the calling thread, for each chunk acknowledged by the API.
+    """
     qty_of_events = len(test_outcomes)
     if not is_test and qty_of_events == 0:
         click.echo("Nothing to be sent to Observability")
         return qty_of_events
 
-    def chunkify(collection, chunk_size):
-        return [collection[i : i + chunk_size] for i in range(0, len(collection), chunk_size)]
-
-    if not is_test:
-        chunk_size = calculate_chunk_size(test_outcomes)
-        chunks = chunkify(test_outcomes, chunk_size)
-    else:
-        chunks = [[]]
-
-    session = get_session()
-
     url = _get_api_endpoint(api_url, event_type)
     headers = {
         "Content-Type": "application/json",
         "ServiceAccountAuthenticationKey": api_key,
     }
-    for chunk in chunks:
-        payload["test_outcomes"] = chunk
-        response = session.post(url, headers=headers, json=payload, verify=settings.OBSERVABILITY_VERIFY_SSL)
-        if not response.ok:
-            if is_test and "test_outcomes" in response.text and "Length must be between 1 and 500" in response.text:
-                continue
-            else:
+
+    if is_test:
+        prefix, suffix = _encode_envelope(payload)
+        response = get_session().post(url, headers=headers, data=prefix + suffix, verify=settings.OBSERVABILITY_VERIFY_SSL)
+        if not response.ok and not ("test_outcomes" in response.text and "Length must be between 1 and 500" in response.text):
+            raise requests.HTTPError(
+                f"Call to {url} failed with status code: {response.status_code} and message: {response.text}"
+            )
+        return qty_of_events
+
+    chunks = chunk_test_outcomes(payload, test_outcomes, result_ids)
+    max_in_flight = max(1, settings.OBSERVABILITY_EXPORT_MAX_IN_FLIGHT)
+    error = None
+    with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="observability-export") as executor:
+        in_flight = {}
+        while True:
+            while error is None and len(in_flight) < max_in_flight and (chunk := next(chunks, None)):
+                in_flight[executor.submit(_post_chunk, url, headers, chunk)] = chunk
+            if not in_flight:
+                break
+
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = in_flight.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    error = error or e
+                else:
+                    if on_chunk_sent:
+                        on_chunk_sent(chunk)
+
+    if error:
+        raise error
+    return qty_of_events
+
+
+def _post_chunk(url: str, headers: dict, chunk: EventChunk) -> None:
+    # Sessions share the connection pool of their adapter, so connections are still reused across chunks
+    session = get_session()
+    headers = {**headers, "Idempotency-Key": chunk.idempotency_key}
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        try:
+            response = session.post(url, headers=headers, data=chunk.body, verify=settings.OBSERVABILITY_VERIFY_SSL)
+        except requests.RequestException as e:
+            if attempt == RETRY_ATTEMPTS:
+                raise
+            LOG.warning("Call to %s failed with error: %s. Retrying (%d/%d)", url, e, attempt, RETRY_ATTEMPTS - 1)
+        else:
+            if response.ok:
+                return
+            retryable = response.status_code >= 500 or response.status_code in (408, 429)
+            if not retryable or attempt == RETRY_ATTEMPTS:
                 raise requests.HTTPError(
                     f"Call to {url} failed with status code: {response.status_code} and message: {response.text}"
                 )
-    return qty_of_events
+            LOG.warning(
+                "Call to %s failed with status code: %s. Retrying (%d/%d)",
+                url, response.status_code, attempt, RETRY_ATTEMPTS - 1,
+            )
+        time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1))
 
 
 def _get_api_endpoint(api_url: str | None, event_type: str) -> str:
@@ -308,8 +416,17 @@ def export_test_results(test_suite_id):
         test_outcomes, updated_ids = collect_test_results(test_suite_id, max_qty_events)
         if len(test_outcomes) == 0:
             return qty_of_exported_events
-        qty_of_exported_events += post_event("test-outcomes", event, api_url, api_key, test_outcomes)
-        mark_exported_results(test_suite_id, updated_ids)
+        # Results are marked as exported as soon as their chunk is acknowledged, so a failed export
+        # resumes from the results that were not sent yet
+        qty_of_exported_events += post_event(
+            "test-outcomes",
+            event,
+            api_url,
+            api_key,
+            test_outcomes,
+            result_ids=updated_ids,
+            on_chunk_sent=lambda chunk: mark_exported_results(test_suite_id, chunk.result_ids),
+        )
 
 
 @with_database_session
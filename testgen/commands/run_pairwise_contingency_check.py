@@ -1,147 +1,202 @@
-# UNUSED CODE - TO BE REVIVED LATER
-
+import logging
+from collections.abc import Iterable
 from uuid import UUID
 
+import numpy as np
 import pandas as pd
 
-from testgen.commands.queries.contingency_query import ContingencySQL
-from testgen.commands.queries.profiling_query import ContingencyTable
-from testgen.common.database.database_service import fetch_dict_from_db, write_to_app_db
-
-
-def run_pairwise_contingency_check(profiling_run_id: UUID, threshold_ratio: float) -> None:
+from testgen.commands.queries.contingency_query import ContingencySQL, ContingencyTable
+from testgen.common.database.database_service import fetch_dict_from_db, stream_dict_from_db, write_to_app_db
+from testgen.utils import get_exception_message
+
+LOG = logging.getLogger("testgen")
+
+RULE_COLUMNS = [
+    "profile_run_id",
+    "schema_name",
+    "table_name",
+    "cause_column_name",
+    "cause_column_value",
+    "effect_column_name",
+    "effect_column_value",
+    "pair_count",
+    "cause_column_total",
+    "effect_column_total",
+    "rule_ratio",
+]
+
+# Counts are accumulated by int64 keys packing a column pair (or column) index with value codes
+CODE_BITS = 20
+CODE_MASK = (1 << CODE_BITS) - 1
+# Maximum number of cells expanded at once when counting the value pairs of a chunk
+PAIR_BLOCK_CELLS = 2_000_000
+
+
+def run_pairwise_contingency_check(profiling_run_id: UUID, threshold_ratio: float, sql_flavor: str) -> int:
     # Goal: identify pairs of values that represent IF X=A THEN Y=B rules
-
     threshold_ratio = threshold_ratio / 100.0 if threshold_ratio else 0.95
 
-    sql_generator = ContingencySQL()
-    table_columns = fetch_dict_from_db(*sql_generator.get_contingency_columns(profiling_run_id))
-
-    if not table_columns:
-        return
+    sql_generator = ContingencySQL(sql_flavor)
+    tables = [
+        ContingencyTable(**item)
+        for item in fetch_dict_from_db(*sql_generator.get_contingency_columns(profiling_run_id))
+    ]
+
+    # Tables are scanned and their rules written one at a time, so only one table's counts are held in memory
+    rule_count = 0
+    for table in tables:
+        columns = table.contingency_columns.split(",")
+        if len(columns) < 2:
+            continue
+        try:
+            counts = ContingencyCounts(columns)
+            for rows in stream_dict_from_db(*sql_generator.get_contingency_counts(table), use_target_db=True):
+                counts.add(rows)
+
+            rules = counts.get_rules(threshold_ratio)
+            if not rules.empty:
+                rules.insert(0, "table_name", table.table_name)
+                rules.insert(0, "schema_name", table.schema_name)
+                rules.insert(0, "profile_run_id", str(profiling_run_id))
+                write_to_app_db(rules[RULE_COLUMNS].to_numpy().tolist(), RULE_COLUMNS, "profile_pair_rules")
+                rule_count += len(rules)
+        except Exception as e:
+            LOG.warning(
+                f"Failed to compile contingency rules for table {table.schema_name}.{table.table_name}: "
+                f"{get_exception_message(e)}"
+            )
 
-    table_columns = [ContingencyTable(item) for item in table_columns]
-    df_merged = None
-    for table in table_columns:
-        counts = fetch_dict_from_db(
-            *sql_generator.get_contingency_counts(table),
-            use_target_db=True,
+    LOG.info(f"Contingency rules compiled: {rule_count}")
+    return rule_count
+
+
+class ContingencyCounts:
+    """
+    Value and value pair counts of a table's contingency columns, accumulated over chunks of its grouped counts.
+
+    Values are encoded as integer codes per column, and the counts of all column pairs are computed together
+    with array operations on the codes.
+    """
+
+    def __init__(self, columns: list[str]):
+        self.columns = columns
+        self.row_count = 0
+        self._values: list[dict] = [{} for _ in columns]
+        self._first_columns, self._second_columns = np.triu_indices(len(columns), k=1)
+        self._value_counts = KeyCounts()
+        self._pair_counts = KeyCounts()
+
+    def add(self, rows: list) -> None:
+        """Add a chunk of grouped counts, with the values of the columns followed by their frequency."""
+        if not rows:
+            return
+
+        data = pd.DataFrame(rows)
+        frequencies = data.iloc[:, len(self.columns)].to_numpy(dtype=np.int64)
+        codes = np.column_stack([
+            self._encode(index, data.iloc[:, index]) for index in range(len(self.columns))
+        ])
+        self.row_count += int(frequencies.sum())
+
+        column_keys = (np.arange(len(self.columns), dtype=np.int64) << CODE_BITS) | codes
+        self._add_counts(self._value_counts, column_keys, codes >= 0, frequencies)
+
+        block_size = max(1, PAIR_BLOCK_CELLS // len(rows))
+        for start in range(0, len(self._first_columns), block_size):
+            first_columns = self._first_columns[start:start + block_size]
+            second_columns = self._second_columns[start:start + block_size]
+            first_codes = codes[:, first_columns]
+            second_codes = codes[:, second_columns]
+
+            pair_indexes = np.arange(start, start + len(first_columns), dtype=np.int64)
+            pair_keys = (pair_indexes << (2 * CODE_BITS)) | (first_codes << CODE_BITS) | second_codes
+            self._add_counts(self._pair_counts, pair_keys, (first_codes >= 0) & (second_codes >= 0), frequencies)
+
+    def get_rules(self, threshold_ratio: float) -> pd.DataFrame:
+        """
+        Return the value pairs where almost all the rows with one value (the cause) have the other (the effect),
+        as one row per cause and effect. Both values must occur in at least 5% of the rows, and at least 30 rows.
+        """
+        pair_keys, pair_counts = self._pair_counts.keys, self._pair_counts.counts
+        pair_indexes = pair_keys >> (2 * CODE_BITS)
+        first_columns = self._first_columns[pair_indexes]
+        second_columns = self._second_columns[pair_indexes]
+        first_codes = (pair_keys >> CODE_BITS) & CODE_MASK
+        second_codes = pair_keys & CODE_MASK
+
+        first_totals = self._value_counts.lookup((first_columns.astype(np.int64) << CODE_BITS) | first_codes)
+        second_totals = self._value_counts.lookup((second_columns.astype(np.int64) << CODE_BITS) | second_codes)
+
+        threshold_min = max(self.row_count * 0.05, 30)
+        is_frequent = (first_totals >= threshold_min) & (second_totals >= threshold_min)
+
+        directions = []
+        for cause, effect in [
+            (
+                (first_columns, first_codes, first_totals),
+                (second_columns, second_codes, second_totals),
+            ),
+            (
+                (second_columns, second_codes, second_totals),
+                (first_columns, first_codes, first_totals),
+            ),
+        ]:
+            cause_columns, cause_codes, cause_totals = cause
+            effect_columns, effect_codes, effect_totals = effect
+            ratios = pair_counts / np.maximum(cause_totals, 1)
+            is_rule = is_frequent & (ratios >= threshold_ratio)
+            directions.append(pd.DataFrame({
+                "cause_column_name": self._decode_columns(cause_columns[is_rule]),
+                "cause_column_value": self._decode_values(cause_columns[is_rule], cause_codes[is_rule]),
+                "effect_column_name": self._decode_columns(effect_columns[is_rule]),
+                "effect_column_value": self._decode_values(effect_columns[is_rule], effect_codes[is_rule]),
+                "pair_count": pair_counts[is_rule],
+                "cause_column_total": cause_totals[is_rule],
+                "effect_column_total": effect_totals[is_rule],
+                "rule_ratio": ratios[is_rule].round(4),
+            }))
+
+        return pd.concat(directions, ignore_index=True)
+
+    def _encode(self, index: int, values: pd.Series) -> np.ndarray:
+        # Factorize the chunk, then map its distinct values to the codes used in previous chunks - NULLs are -1
+        chunk_codes, uniques = pd.factorize(values)
+        known = self._values[index]
+        codes = np.fromiter(
+            (known.setdefault(value, len(known)) for value in uniques),
+            dtype=np.int64,
+            count=len(uniques),
         )
-        if counts:
-            df = pd.DataFrame(counts)
-            columns = table.contingency_columns.lower().split(",")
-            overall_counts = {col: df.groupby(col)["freq_ct"].sum() for col in columns}
+        if len(known) > CODE_MASK:
+            raise ValueError(f"Too many distinct values in column {self.columns[index]}")
+        return np.append(codes, -1)[chunk_codes]
 
-            contingency_table = []
-            for i, col1 in enumerate(columns):
-                for col2 in columns[i + 1 :]:
-                    # Create a pivot table for each pair
-                    pivot = df.pivot_table(index=col1, columns=col2, values="freq_ct", aggfunc="sum", fill_value=0)
-                    pivot = pivot.stack().reset_index()
-                    pivot.rename(columns={0: "pair_count"}, inplace=True)
+    def _decode_columns(self, column_indexes: np.ndarray) -> np.ndarray:
+        return np.array(self.columns, dtype=object)[column_indexes]
 
-                    pivot["first_column_overall_count"] = pivot[col1].map(overall_counts[col1])
-                    pivot["second_column_overall_count"] = pivot[col2].map(overall_counts[col2])
+    def _decode_values(self, column_indexes: np.ndarray, codes: np.ndarray) -> np.ndarray:
+        offsets = np.cumsum([0] + [len(values) for values in self._values])
+        all_values = np.array([value for values in self._values for value in values] + [None], dtype=object)
+        return all_values[offsets[column_indexes] + codes]
 
-                    pivot["first_column_name"] = col1
-                    pivot["second_column_name"] = col2
+    @staticmethod
+    def _add_counts(counts: "KeyCounts", keys: np.ndarray, is_valid: np.ndarray, frequencies: np.ndarray) -> None:
+        counts.add(keys[is_valid], np.broadcast_to(frequencies[:, None], keys.shape)[is_valid])
 
-                    contingency_table.append(pivot)
 
-            # Combine all pairs into a single DataFrame
-            contingency_table = pd.concat(contingency_table, ignore_index=True)
+class KeyCounts:
+    """Sums of counts by int64 key, kept as sorted arrays of distinct keys and their counts."""
 
-            contingency_table["pair_to_first_ratio"] = (
-                contingency_table["pair_count"] / contingency_table["first_column_overall_count"]
-            )
-            contingency_table["pair_to_second_ratio"] = (
-                contingency_table["pair_count"] / contingency_table["second_column_overall_count"]
-            )
+    def __init__(self):
+        self.keys = np.empty(0, dtype=np.int64)
+        self.counts = np.empty(0, dtype=np.int64)
 
-            # Include rows where both cols meet minimum threshold count (max of 30 or 5%)
-            total_observations = contingency_table["pair_count"].sum()
-            threshold_min = max(total_observations * 0.05, 30)
-            contingency_table = contingency_table[
-                (contingency_table["first_column_overall_count"] >= threshold_min)
-                & (contingency_table["second_column_overall_count"] >= threshold_min)
-            ]
-            # Drop rows where neither ratio meets the threshold ratio (keep if either meets it)
-            #  -- note we still have to check individual columns when saving pairs
-            contingency_table = contingency_table[
-                ~(
-                    (contingency_table["pair_to_first_ratio"] < threshold_ratio)
-                    & (contingency_table["pair_to_second_ratio"] < threshold_ratio)
-                )
-            ]
-
-            contingency_table["profiling_run_id"] = profiling_run_id
-            contingency_table["schema_name"] = table.schema_name
-            contingency_table["table_name"] = table.table_name
-
-            if df_merged is None:
-                df_merged = contingency_table
-            else:
-                df_merged = pd.concat([df_merged, contingency_table], ignore_index=True)
-
-    save_contingency_rules(df_merged, threshold_ratio)
-
-
-def save_contingency_rules(df: pd.DataFrame, threshold_ratio: float) -> None:
-    if df is None or df.empty:
-        return
-    
-    contingency_rules = []
-    for row in df.itertuples():
-        # First causes second: almost all of first coincide with second value
-        if row.pair_to_first_ratio >= threshold_ratio:
-            contingency_rules.append(
-                [
-                    row.profiling_run_id,
-                    row.schema_name,
-                    row.table_name,
-                    row.first_column_name,
-                    getattr(row, row.first_column_name),
-                    row.second_column_name,
-                    getattr(row, row.second_column_name),
-                    row.pair_count,
-                    row.first_column_overall_count,
-                    row.second_column_overall_count,
-                    row.pair_to_first_ratio,
-                ]
-            )
-
-        # Second causes first: almost all of second coincide with first value
-        if row.pair_to_second_ratio >= threshold_ratio:
-            contingency_rules.append(
-                [
-                    row.profiling_run_id,
-                    row.schema_name,
-                    row.table_name,
-                    row.second_column_name,
-                    getattr(row, row.second_column_name),
-                    row.first_column_name,
-                    getattr(row, row.first_column_name),
-                    row.pair_count,
-                    row.second_column_overall_count,
-                    row.first_column_overall_count,
-                    row.pair_to_second_ratio,
-                ]
-            )
+    def add(self, keys: Iterable[int], counts: Iterable[int]) -> None:
+        all_keys = np.concatenate([self.keys, np.asarray(keys, dtype=np.int64)])
+        all_counts = np.concatenate([self.counts, np.asarray(counts, dtype=np.int64)])
+        self.keys, inverse = np.unique(all_keys, return_inverse=True)
+        self.counts = np.bincount(inverse.ravel(), weights=all_counts, minlength=len(self.keys)).astype(np.int64)
 
-    write_to_app_db(
-        contingency_rules,
-        [
-            "profile_run_id",
-            "schema_name",
-            "table_name",
-            "cause_column_name",
-            "cause_column_value",
-            "effect_column_name",
-            "effect_column_value",
-            "pair_count",
-            "cause_column_total",
-            "effect_column_total",
-            "rule_ratio",
-        ],
-        "profile_pair_rules",
-    )
+    def lookup(self, keys: np.ndarray) -> np.ndarray:
+        """Return the counts of keys that were all added before."""
+        return self.counts[np.searchsorted(self.keys, keys)]
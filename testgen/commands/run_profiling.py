@@ -1,8 +1,10 @@
 import logging
 import os
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from uuid import UUID
 
+from testgen import settings
 from testgen.commands.queries.profiling_query import (
     HygieneIssueType,
     ProfilingSQL,
@@ -10,16 +12,22 @@ from testgen.commands.queries.profiling_query import (
     calculate_sampling_params,
 )
 from testgen.commands.queries.refresh_data_chars_query import ColumnChars
+from testgen.commands.run_pairwise_contingency_check import run_pairwise_contingency_check
 from testgen.commands.run_refresh_data_chars import run_data_chars_refresh
 from testgen.commands.test_generation import run_monitor_generation, run_test_generation
 from testgen.common import (
     execute_db_queries,
     fetch_dict_from_db,
-    fetch_from_db_threaded,
     set_target_db_params,
     write_to_app_db,
 )
-from testgen.common.database.database_service import ThreadedProgress
+from testgen.common.cache_invalidation import cache_tag, notify_cache_invalidation
+from testgen.common.database.database_service import (
+    StreamStage,
+    StreamStageResult,
+    ThreadedProgress,
+    stream_pipeline_from_db_threaded,
+)
 from testgen.common.job_context import job_context
 from testgen.common.mixpanel_service import MixpanelService
 from testgen.common.models import get_current_session, with_database_session
@@ -28,6 +36,7 @@ from testgen.common.models.data_column import DataColumnChars
 from testgen.common.models.profiling_run import ProfilingRun
 from testgen.common.models.table_group import TableGroup
 from testgen.common.models.test_suite import TestSuite
+from testgen.common.monitor_snapshot_service import refresh_monitor_table_snapshots
 from testgen.utils import get_exception_message
 
 LOG = logging.getLogger("testgen")
@@ -75,24 +84,25 @@ def run_profiling(
         data_chars = run_data_chars_refresh(connection, table_group, profiling_run.profiling_starttime)
         if table_group.profile_exclude_xde:
             data_chars = _exclude_xde_columns(data_chars, table_group.id)
-        distinct_tables = {(column.table_name, column.record_ct) for column in data_chars}
+        distinct_tables = {(column.table_name, column.row_count) for column in data_chars}
 
         profiling_run.set_progress("data_chars", "Completed")
         profiling_run.table_ct = len(distinct_tables)
         profiling_run.column_ct = len(data_chars)
         profiling_run.record_ct = sum(table[1] for table in distinct_tables)
-        profiling_run.data_point_ct = sum(column.record_ct for column in data_chars)
+        profiling_run.data_point_ct = sum(column.row_count for column in data_chars)
 
         if data_chars:
             sql_generator = ProfilingSQL(connection, table_group, profiling_run)
 
             _run_column_profiling(sql_generator, data_chars)
-            _run_frequency_analysis(sql_generator)
             _run_hygiene_issue_detection(sql_generator)
 
-            # if table_group.profile_do_pair_rules == "Y":
-            #     LOG.info("Compiling pairwise contingency rules")
-            #     run_pairwise_contingency_check(profiling_run.id, table_group.profile_pair_rule_pct)
+            if table_group.profile_do_pair_rules:
+                LOG.info("Compiling pairwise contingency rules")
+                run_pairwise_contingency_check(
+                    profiling_run.id, table_group.profile_pair_rule_pct, connection.sql_flavor
+                )
         else:
             LOG.info("No columns were selected to profile.")
     except Exception as e:
@@ -112,7 +122,17 @@ def run_profiling(
         session.commit()
 
         _generate_tests(table_group)
+
+        if table_group.monitor_test_suite_id:
+            # Profiling refreshes the table list that the monitor summaries are based on
+            try:
+                refresh_monitor_table_snapshots(table_group.monitor_test_suite_id)
+            except Exception:
+                LOG.exception("Error refreshing monitor table snapshots")
     finally:
+        notify_cache_invalidation(cache_tag("profiling_run", profiling_run.id), cache_tag("table_group", table_group.id))
+        session.commit()
+
         MixpanelService().send_event(
             "run-profiling",
             source=job_context.get().source.upper(),
@@ -146,6 +166,7 @@ def _exclude_xde_columns(data_chars: list[ColumnChars], table_group_id: UUID) ->
 def _run_column_profiling(sql_generator: ProfilingSQL, data_chars: list[ColumnChars]) -> None:
     profiling_run = sql_generator.profiling_run
     profiling_run.set_progress("col_profiling", "Running")
+    profiling_run.set_progress("freq_analysis", "Running")
     profiling_run.save()
     get_current_session().commit()
 
@@ -157,7 +178,7 @@ def _run_column_profiling(sql_generator: ProfilingSQL, data_chars: list[ColumnCh
             if not sampling_params.get(column.table_name):
                 result = calculate_sampling_params(
                     table_name=column.table_name,
-                    record_count=column.record_ct,
+                    record_count=column.row_count,
                     sample_percent_raw=table_group.profile_sample_percent,
                     min_sample=table_group.profile_sample_min_count,
                 )
@@ -176,27 +197,48 @@ def _run_column_profiling(sql_generator: ProfilingSQL, data_chars: list[ColumnCh
         profiling_run.save()
         get_current_session().commit()
 
-    profiling_results, result_columns, error_data = fetch_from_db_threaded(
-        [sql_generator.run_column_profiling(column, sampling_params.get(column.table_name)) for column in data_chars],
-        use_target_db=True,
-        max_threads=sql_generator.connection.max_threads,
-        progress_callback=update_column_progress,
-    )
+    def update_frequency_progress(progress: ThreadedProgress) -> None:
+        profiling_run.set_progress(
+            "freq_analysis", "Running", detail=f"{progress['processed']} of {progress['total']}"
+        )
+        profiling_run.save()
+        get_current_session().commit()
+
+    # Results are written to the App database as queries complete. Frequency analysis for a column
+    # is queued on the same worker threads as soon as its profiling results come back.
+    frequency_stage = StreamStage(sql_generator.frequency_staging_table, progress_callback=update_frequency_progress)
+    if settings.PROFILING_BATCH_COLUMNS:
+        result_count, column_errors, frequency_results = _run_batched_column_profiling(
+            sql_generator, data_chars, sampling_params, update_column_progress, frequency_stage,
+        )
+    else:
+        column_result, frequency_result = stream_pipeline_from_db_threaded(
+            [sql_generator.run_column_profiling(column, sampling_params.get(column.table_name)) for column in data_chars],
+            [
+                StreamStage(
+                    sql_generator.profiling_results_table,
+                    progress_callback=update_column_progress,
+                    follow_up=sql_generator.get_frequency_analysis_queries,
+                ),
+                frequency_stage,
+            ],
+            use_target_db=True,
+            max_threads=sql_generator.connection.max_threads,
+        )
+        _check_write_error(column_result)
+        result_count = column_result.written_count
+        column_errors = [(data_chars[index], error) for index, error in column_result.errors.items()]
+        frequency_results = [frequency_result]
 
-    if error_count := len(error_data):
+    if error_count := len(column_errors):
         LOG.warning(f"Errors running column profiling queries: {error_count}")
         LOG.info("Writing column profiling errors")
-        error_results = sql_generator.get_profiling_errors(
-            [(data_chars[index], error) for index, error in error_data.items()]
-        )
+        error_results = sql_generator.get_profiling_errors(column_errors)
         write_to_app_db(error_results, sql_generator.error_columns, sql_generator.profiling_results_table)
 
-    if not profiling_results:  # All queries failed, so stop the process
+    if not result_count:  # All queries failed, so stop the process
         raise RuntimeError(f"{error_count} errors during column profiling. See details in results.")
 
-    LOG.info("Writing column profiling results")
-    write_to_app_db(profiling_results, result_columns, sql_generator.profiling_results_table)
-
     if sampling_params:
         try:
             LOG.info("Updating sampled profiling results")
@@ -217,51 +259,112 @@ def _run_column_profiling(sql_generator: ProfilingSQL, data_chars: list[ColumnCh
         else None,
     )
 
+    _update_frequency_analysis(sql_generator, frequency_results)
+
+
+def _run_batched_column_profiling(
+    sql_generator: ProfilingSQL,
+    data_chars: list[ColumnChars],
+    sampling_params: dict[str, TableSampling],
+    progress_callback: Callable[[ThreadedProgress], None],
+    frequency_stage: StreamStage,
+) -> tuple[int, list[tuple[ColumnChars, str]], list[StreamStageResult]]:
+    total_count = len(data_chars)
+    LOG.info(f"Batching column profiling queries: {total_count}")
+    batch_queries, batch_columns = sql_generator.aggregate_column_profiling(data_chars, sampling_params)
+
+    def update_batch_progress(progress: ThreadedProgress) -> None:
+        progress_callback({
+            **progress,
+            "processed": sum(len(batch_columns[index]) for index in progress["indexes"]),
+            "total": total_count,
+        })
+
+    LOG.info(f"Running batched column profiling queries: {len(batch_queries)}")
+    # Each batch returns one wide row, split back into a row per column
+    batch_result, frequency_result = stream_pipeline_from_db_threaded(
+        batch_queries,
+        [
+            StreamStage(
+                sql_generator.profiling_results_table,
+                column_names=sql_generator.result_columns,
+                transform=sql_generator.get_batch_profiling_results,
+                progress_callback=update_batch_progress,
+                follow_up=sql_generator.get_batch_frequency_analysis_queries,
+            ),
+            frequency_stage,
+        ],
+        use_target_db=True,
+        max_threads=sql_generator.connection.max_threads,
+    )
+    _check_write_error(batch_result)
+    result_count = batch_result.written_count
+    frequency_results = [frequency_result]
+
+    column_errors: list[tuple[ColumnChars, str]] = []
+    if batch_result.errors:
+        LOG.warning(f"Errors running batched column profiling queries: {len(batch_result.errors)}")
+        error_columns: list[ColumnChars] = []
+        for index, error in batch_result.errors.items():
+            if len(batch_columns[index]) > 1:
+                error_columns.extend(batch_columns[index])
+            else:
+                # Rerunning a batch with a single column would run the same query again
+                column_errors.append((batch_columns[index][0], error))
+
+        if error_columns:
+            single_queries, single_columns = sql_generator.aggregate_column_profiling(
+                error_columns, sampling_params, single=True,
+            )
 
-def _run_frequency_analysis(sql_generator: ProfilingSQL) -> None:
-    profiling_run = sql_generator.profiling_run
-    profiling_run.set_progress("freq_analysis", "Running")
-    profiling_run.save()
-    get_current_session().commit()
+            LOG.info(f"Rerunning errored column profiling queries singly: {len(single_queries)}")
+            single_result, frequency_result = stream_pipeline_from_db_threaded(
+                single_queries,
+                [
+                    StreamStage(
+                        sql_generator.profiling_results_table,
+                        follow_up=sql_generator.get_frequency_analysis_queries,
+                    ),
+                    frequency_stage,
+                ],
+                use_target_db=True,
+                max_threads=sql_generator.connection.max_threads,
+            )
 
-    error_data = None
-    try:
-        LOG.info("Selecting columns for frequency analysis")
-        frequency_columns = fetch_dict_from_db(*sql_generator.get_frequency_analysis_columns())
+            _check_write_error(single_result)
+            result_count += single_result.written_count
+            frequency_results.append(frequency_result)
+            column_errors.extend((single_columns[index][0], error) for index, error in single_result.errors.items())
 
-        if frequency_columns:
-            LOG.info(f"Running frequency analysis queries: {len(frequency_columns)}")
+    return result_count, column_errors, frequency_results
 
-            def update_frequency_progress(progress: ThreadedProgress) -> None:
-                profiling_run.set_progress(
-                    "freq_analysis", "Running", detail=f"{progress['processed']} of {progress['total']}"
-                )
-                profiling_run.save()
-                get_current_session().commit()
 
-            frequency_results, result_columns, error_data = fetch_from_db_threaded(
-                [sql_generator.run_frequency_analysis(ColumnChars(**column)) for column in frequency_columns],
-                use_target_db=True,
-                max_threads=sql_generator.connection.max_threads,
-                progress_callback=update_frequency_progress,
-            )
-            if error_data:
-                LOG.warning(f"Errors running frequency analysis queries: {len(error_data)}")
+def _check_write_error(column_result: StreamStageResult) -> None:
+    # Unlike frequency analysis, profiling cannot continue without the column results
+    if column_result.write_error:
+        raise RuntimeError(f"Error writing column profiling results. {column_result.write_error}")
+
 
-            if frequency_results:
-                LOG.info("Writing frequency results to staging")
-                write_to_app_db(frequency_results, result_columns, sql_generator.frequency_staging_table)
+def _update_frequency_analysis(sql_generator: ProfilingSQL, frequency_results: list[StreamStageResult]) -> None:
+    profiling_run = sql_generator.profiling_run
+    query_count = sum(result.query_count for result in frequency_results)
+    errors = [error for result in frequency_results for error in result.errors.values()]
+    errors.extend(f"Error writing results. {result.write_error}" for result in frequency_results if result.write_error)
 
-                LOG.info("Updating profiling results with frequency analysis and deleting staging")
-                execute_db_queries(sql_generator.update_frequency_analysis_results())
+    try:
+        LOG.info(f"Frequency analysis queries run: {query_count}")
+        if errors:
+            LOG.warning(f"Errors running frequency analysis queries: {len(errors)}")
+
+        if any(result.written_count for result in frequency_results):
+            LOG.info("Updating profiling results with frequency analysis and deleting staging")
+            execute_db_queries(sql_generator.update_frequency_analysis_results())
     except Exception as e:
         LOG.exception("Error running frequency analysis")
         profiling_run.set_progress("freq_analysis", "Warning", error=f"Error encountered. {get_exception_message(e)}")
     else:
-        if error_data:
-            profiling_run.set_progress(
-                "freq_analysis", "Warning", error=f"Error encountered. {next(iter(error_data.values()))}"
-            )
+        if errors:
+            profiling_run.set_progress("freq_analysis", "Warning", error=f"Error encountered. {errors[0]}")
         else:
             profiling_run.set_progress("freq_analysis", "Completed")
 
@@ -281,6 +384,8 @@ def _run_hygiene_issue_detection(sql_generator: ProfilingSQL) -> None:
         hygiene_issue_types = [HygieneIssueType(**item) for item in hygiene_issue_types]
 
         LOG.info("Detecting hygiene issues and updating prevalence and counts")
+        # Column issue types are screened together in a single pass over the profile results,
+        # while the few table-level and multi-column types still run one statement each
         execute_db_queries(
             [
                 *[
@@ -289,9 +394,12 @@ def _run_hygiene_issue_detection(sql_generator: ProfilingSQL) -> None:
                     if (query := sql_generator.detect_hygiene_issue(issue_type))
                 ],
                 *[
-                    sql_generator.update_hygiene_issue_prevalence(issue_type)
-                    for issue_type in hygiene_issue_types
-                    if issue_type.dq_score_prevalence_formula
+                    query
+                    for query in (
+                        sql_generator.detect_column_hygiene_issues(hygiene_issue_types),
+                        sql_generator.update_hygiene_issues_prevalence(hygiene_issue_types),
+                    )
+                    if query
                 ],
                 sql_generator.update_hygiene_issue_counts(),
             ]
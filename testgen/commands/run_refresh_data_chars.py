@@ -1,5 +1,6 @@
 import logging
 from datetime import datetime
+from typing import Literal
 
 from testgen.commands.queries.refresh_data_chars_query import ColumnChars, RefreshDataCharsSQL
 from testgen.common.database.database_service import (
@@ -26,18 +27,44 @@ def run_data_chars_refresh(connection: Connection, table_group: TableGroup, run_
     
     data_chars = [ColumnChars(**column) for column in data_chars]
     if data_chars:
-        distinct_tables = {column.table_name for column in data_chars}
+        distinct_tables = {column.table_name: column.approx_record_ct for column in data_chars}
         LOG.info(f"Tables: {len(distinct_tables)}, Columns: {len(data_chars)}")
-        count_queries = sql_generator.get_row_counts(distinct_tables)
-        
-        LOG.info("Getting row counts for table group")
-        count_results, _, error_data = fetch_from_db_threaded(
-            count_queries, use_target_db=True, max_threads=connection.max_threads,
-        )
-
-        count_map = {row["table_name"]: row["row_count"] for row in count_results}
+
+        previous_counts = {}
+        if table_group.row_count_strategy == "estimate_change":
+            previous_counts = {
+                row["table_name"]: (row["record_ct"], row["approx_record_ct_at_count"])
+                for row in fetch_dict_from_db(*sql_generator.get_previous_row_counts())
+            }
+
+        count_map: dict[str, int | None] = {}
+        basis_map: dict[str, int | None] = {}
+        tables_to_count = []
+        for table_name, approx_record_ct in distinct_tables.items():
+            record_ct, basis = previous_counts.get(table_name, (None, None))
+            match _get_row_count_source(table_group, approx_record_ct, record_ct, basis):
+                case "count":
+                    tables_to_count.append(table_name)
+                    basis_map[table_name] = approx_record_ct
+                case "previous":
+                    count_map[table_name] = record_ct
+                    basis_map[table_name] = basis
+                case "estimate":
+                    count_map[table_name] = None
+
+        error_data = {}
+        if tables_to_count:
+            LOG.info(f"Getting row counts for table group: {len(tables_to_count)} of {len(distinct_tables)} tables")
+            count_results, _, error_data = fetch_from_db_threaded(
+                sql_generator.get_row_counts(tables_to_count), use_target_db=True, max_threads=connection.max_threads,
+            )
+            count_map.update({row["table_name"]: row["row_count"] for row in count_results})
+        else:
+            LOG.info("Skipping row counts for table group: catalog estimates are current")
+
         for column in data_chars:
             column.record_ct = count_map.get(column.table_name)
+            column.approx_record_ct_at_count = basis_map.get(column.table_name)
 
         write_data_chars(data_chars, sql_generator, run_date)
 
@@ -49,6 +76,34 @@ def run_data_chars_refresh(connection: Connection, table_group: TableGroup, run_
     return data_chars
 
 
+def _get_row_count_source(
+    table_group: TableGroup,
+    approx_record_ct: int | None,
+    previous_record_ct: int | None,
+    previous_basis: int | None,
+) -> Literal["count", "previous", "estimate"]:
+    """Decides whether a table's row count needs a COUNT(*) query on the target database.
+
+    Tables without a catalog estimate are always counted. With the "estimate" strategy, the catalog estimate is used
+    as-is. With "estimate_change", the last exact count is reused until the catalog estimate moves by more than
+    `row_count_change_pct` percent from its value at the time of that count.
+    """
+    strategy = table_group.row_count_strategy or "exact"
+    if strategy == "exact" or approx_record_ct is None:
+        return "count"
+    if strategy == "estimate":
+        return "estimate"
+
+    if previous_record_ct is None or previous_basis is None:
+        return "count"
+    change_pct = table_group.row_count_change_pct if table_group.row_count_change_pct is not None else 10
+    if previous_basis == 0:
+        return "previous" if approx_record_ct == 0 else "count"
+    if abs(approx_record_ct - previous_basis) * 100 > change_pct * previous_basis:
+        return "count"
+    return "previous"
+
+
 def write_data_chars(data_chars: list[ColumnChars], sql_generator: RefreshDataCharsSQL, run_date: datetime) -> None:
     staging_results = sql_generator.get_staging_data_chars(data_chars, run_date)
 
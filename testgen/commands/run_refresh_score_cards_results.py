@@ -1,8 +1,12 @@
 import datetime
 import logging
 import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
 
-from testgen.common.models import get_current_session, with_database_session
+from testgen import settings
+from testgen.common.models import database_session, get_current_session, with_database_session
 from testgen.common.models.scores import (
     SCORE_CATEGORIES,
     ScoreCard,
@@ -11,89 +15,159 @@ from testgen.common.models.scores import (
     ScoreDefinitionResult,
     ScoreDefinitionResultHistoryEntry,
 )
+from testgen.common.models.table_group import TableGroup
 from testgen.common.notifications.score_drop import collect_score_notification_data, send_score_drop_notifications
 
 LOG = logging.getLogger("testgen")
 
 
-@with_database_session
 def run_refresh_score_cards_results(
     project_code: str | None = None,
     definition_id: str | None = None,
     add_history_entry: bool = False,
     refresh_date: datetime.datetime | None = None,
+    table_group_id: str | UUID | None = None,
 ):
+    """
+    Refresh the results of the scorecards in a project, or of a single
+    scorecard.
+
+    When a table group is given, only the scorecards whose filters can
+    match that table group are refreshed. Called without an enclosing
+    database session, the scorecards are refreshed concurrently, each in
+    its own session.
+    """
     start_time = time.time()
     _refresh_date = refresh_date or datetime.datetime.now(datetime.UTC)
+    owns_session = get_current_session() is None
 
-    try:
-        if not definition_id:
-            definitions = ScoreDefinition.all(project_code=project_code)
+    with database_session():
+        try:
+            if not definition_id:
+                definitions = ScoreDefinition.all(project_code=project_code)
+                if table_group_id:
+                    definitions = _get_table_group_definitions(definitions, table_group_id)
+            else:
+                definitions = [ScoreDefinition.get(str(definition_id))]
+        except Exception:
+            LOG.exception("Stopping scorecards results refresh after unexpected error")
+            return
+
+        score_notification_data = []
+        max_threads = min(settings.SCORE_REFRESH_MAX_THREADS, len(definitions)) if owns_session else 1
+        if max_threads > 1:
+            with ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="score-refresh") as executor:
+                futures = [
+                    executor.submit(
+                        _refresh_score_card_in_session, definition.id, definition.name, definition.project_code,
+                        add_history_entry, _refresh_date,
+                    )
+                    for definition in definitions
+                ]
+                for future in futures:
+                    score_notification_data.extend(future.result())
         else:
-            definitions = [ScoreDefinition.get(str(definition_id))]
+            for definition in definitions:
+                try:
+                    score_notification_data.extend(
+                        _refresh_score_card(definition, add_history_entry, _refresh_date)
+                    )
+                except Exception:
+                    LOG.exception(
+                        "Error refreshing scorecard %s in project %s",
+                        definition.name,
+                        definition.project_code,
+                    )
+
+        scope = "all scorecards"
+        if project_code:
+            scope = f"all scorecards in project {project_code}"
+        if table_group_id:
+            scope = f"{len(definitions)} scorecards affected by table group {table_group_id}"
+        if definition_id:
+            scope = f"scorecard {definition_id}"
+
+        end_time = time.time()
+        LOG.info("Refreshing results for %s done after %s seconds", scope, round(end_time - start_time, 2))
+
+        send_score_drop_notifications(score_notification_data)
+
+
+def _get_table_group_definitions(
+    definitions: Iterable[ScoreDefinition],
+    table_group_id: str | UUID,
+) -> list[ScoreDefinition]:
+    table_group = TableGroup.get(table_group_id)
+    if not table_group:
+        return list(definitions)
+    return [
+        definition for definition in definitions
+        if definition.depends_on_table_group(table_group.table_groups_name)
+    ]
+
+
+def _refresh_score_card_in_session(
+    definition_id: UUID,
+    definition_name: str,
+    project_code: str,
+    add_history_entry: bool,
+    refresh_date: datetime.datetime,
+) -> list[tuple[ScoreDefinition, str, float, float]]:
+    try:
+        with database_session():
+            return _refresh_score_card(ScoreDefinition.get(str(definition_id)), add_history_entry, refresh_date)
     except Exception:
-        LOG.exception("Stopping scorecards results refresh after unexpected error")
-        return
+        LOG.exception("Error refreshing scorecard %s in project %s", definition_name, project_code)
+        return []
+
+
+def _refresh_score_card(
+    definition: ScoreDefinition,
+    add_history_entry: bool,
+    refresh_date: datetime.datetime,
+) -> list[tuple[ScoreDefinition, str, float, float]]:
+    LOG.info(
+        "Refreshing results for scorecard %s in project %s",
+        definition.name,
+        definition.project_code,
+    )
 
     db_session = get_current_session()
     score_notification_data = []
 
-    for definition in definitions:
-        LOG.info(
-            "Refreshing results for scorecard %s in project %s",
+    fresh_score_card = definition.as_score_card()
+
+    collect_score_notification_data(score_notification_data, definition, fresh_score_card)
+
+    definition.clear_results()
+    definition.results = _score_card_to_results(fresh_score_card)
+    definition.breakdown = _score_definition_to_results_breakdown(definition)
+    if add_history_entry:
+        LOG.debug(
+            "Adding history entry for scorecard %s in project %s",
             definition.name,
             definition.project_code,
         )
 
-        try:
-            fresh_score_card = definition.as_score_card()
-
-            collect_score_notification_data(score_notification_data, definition, fresh_score_card)
-
-            definition.clear_results()
-            definition.results = _score_card_to_results(fresh_score_card)
-            definition.breakdown = _score_definition_to_results_breakdown(definition)
-            if add_history_entry:
-                LOG.debug(
-                    "Adding history entry for scorecard %s in project %s",
-                    definition.name,
-                    definition.project_code,
+        last_added_entry = None
+        historical_categories = ["score", "cde_score"]
+        for result in definition.results:
+            if result.category in historical_categories:
+                history_entry = ScoreDefinitionResultHistoryEntry(
+                    definition_id=result.definition_id,
+                    category=result.category,
+                    score=result.score,
+                    last_run_time=refresh_date.replace(tzinfo=None),
                 )
+                db_session.add(history_entry)
+                db_session.flush([history_entry])
+                last_added_entry = history_entry
 
-                last_added_entry = None
-                historical_categories = ["score", "cde_score"]
-                for result in definition.results:
-                    if result.category in historical_categories:
-                        history_entry = ScoreDefinitionResultHistoryEntry(
-                            definition_id=result.definition_id,
-                            category=result.category,
-                            score=result.score,
-                            last_run_time=_refresh_date.replace(tzinfo=None),
-                        )
-                        db_session.add(history_entry)
-                        db_session.flush([history_entry])
-                        last_added_entry = history_entry
-
-                if last_added_entry:
-                    last_added_entry.add_as_cutoff()
-            definition.save()
-        except Exception:
-            LOG.exception(
-                "Error refreshing scorecard %s in project %s",
-                definition.name,
-                definition.project_code,
-            )
-
-    scope = "all scorecards"
-    if project_code:
-        scope = f"all scorecards in project {project_code}"
-    if definition_id:
-        scope = f"scorecard {definition_id}"
-
-    end_time = time.time()
-    LOG.info("Refreshing results for %s done after %s seconds", scope, round(end_time - start_time, 2))
+        if last_added_entry:
+            last_added_entry.add_as_cutoff()
+    definition.save()
 
-    send_score_drop_notifications(score_notification_data)
+    return score_notification_data
 
 
 def _score_card_to_results(score_card: ScoreCard) -> list[ScoreDefinitionResult]:
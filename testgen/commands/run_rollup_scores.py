@@ -10,7 +10,7 @@ LOG = logging.getLogger("testgen")
 def run_profile_rollup_scoring_queries(project_code: str, run_id: str, table_group_id: str | None = None):
     sql_generator = RollupScoresSQL(run_id, table_group_id)
     execute_db_queries(sql_generator.rollup_profiling_scores())
-    run_refresh_score_cards_results(project_code=project_code)
+    run_refresh_score_cards_results(project_code=project_code, table_group_id=table_group_id)
 
 
 def run_test_rollup_scoring_queries(project_code: str, run_id: str, table_group_id: str | None = None):
@@ -18,4 +18,4 @@ def run_test_rollup_scoring_queries(project_code: str, run_id: str, table_group_
     execute_db_queries(
         sql_generator.rollup_test_scores(update_table_group=table_group_id is not None)
     )
-    run_refresh_score_cards_results(project_code=project_code)
+    run_refresh_score_cards_results(project_code=project_code, table_group_id=table_group_id)
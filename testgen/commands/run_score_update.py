@@ -50,6 +50,7 @@ def _rollup_profiling(parent_je_id: UUID) -> None:
     execute_db_queries(RollupScoresSQL(run_id, table_group_id).rollup_profiling_scores())
     run_refresh_score_cards_results(
         project_code=project_code,
+        table_group_id=table_group_id,
         add_history_entry=True,
         refresh_date=refresh_date,
     )
@@ -73,6 +74,7 @@ def _rollup_test(parent_je_id: UUID) -> None:
     )
     run_refresh_score_cards_results(
         project_code=project_code,
+        table_group_id=table_group_id,
         add_history_entry=True,
         refresh_date=refresh_date,
     )
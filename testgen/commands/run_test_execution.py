@@ -12,10 +12,11 @@ from testgen.commands.test_thresholds_prediction import TestThresholdsPrediction
 from testgen.common import (
     execute_db_queries,
     fetch_dict_from_db,
-    fetch_from_db_threaded,
     set_target_db_params,
+    stream_from_db_threaded,
     write_to_app_db,
 )
+from testgen.common.cache_invalidation import cache_tag, notify_cache_invalidation
 from testgen.common.database.database_service import ThreadedProgress
 from testgen.common.job_context import job_context
 from testgen.common.mixpanel_service import MixpanelService
@@ -24,6 +25,7 @@ from testgen.common.models.connection import Connection
 from testgen.common.models.table_group import TableGroup
 from testgen.common.models.test_run import TestRun
 from testgen.common.models.test_suite import TestSuite
+from testgen.common.monitor_snapshot_service import refresh_monitor_table_snapshots
 from testgen.utils import get_exception_message
 
 from .run_refresh_data_chars import run_data_chars_refresh
@@ -122,11 +124,11 @@ def run_test_execution(
         else:
             LOG.info("No active tests to run")
 
-        LOG.info("Updating test results and test run")
+        LOG.info("Updating test run statistics")
         test_run.save()
         session.commit()
-        execute_db_queries(sql_generator.update_test_results())
-        # Refresh needed because previous query updates the test run too
+        execute_db_queries([sql_generator.update_test_run_stats()])
+        # Refresh needed because previous query updates the test run
         test_run.refresh()
 
     except Exception as e:
@@ -156,6 +158,15 @@ def run_test_execution(
         except Exception:
             LOG.exception("Error predicting test thresholds")
 
+        if test_suite.is_monitor:
+            try:
+                refresh_monitor_table_snapshots(test_suite.id)
+            except Exception:
+                LOG.exception("Error refreshing monitor table snapshots")
+
+        notify_cache_invalidation(cache_tag("test_run", test_run.id), cache_tag("test_suite", test_suite.id))
+        session.commit()
+
         MixpanelService().send_event(
             "run-monitors" if test_suite.is_monitor else "run-tests",
             source=job_context.get().source.upper(),
@@ -228,17 +239,17 @@ def _run_tests(
         get_current_session().commit()
 
     LOG.info(f"Running {run_type} tests: {len(test_defs)}")
-    test_results, result_columns, error_data = fetch_from_db_threaded(
+    # Results are completed and written to the App database as queries complete
+    _, _, error_data = stream_from_db_threaded(
         [sql_generator.run_query_test(td) for td in test_defs],
+        sql_generator.test_results_table,
+        column_names=sql_generator.result_columns,
+        transform=partial(sql_generator.get_query_test_results, test_defs=test_defs),
         use_target_db=run_type != "METADATA",
         max_threads=sql_generator.connection.max_threads,
         progress_callback=update_test_progress if save_progress else None,
     )
 
-    if test_results:
-        LOG.info(f"Writing {run_type} test results")
-        write_to_app_db(test_results, result_columns, sql_generator.test_results_table)
-
     if error_count := len(error_data):
         LOG.warning(f"Errors running {run_type} tests: {error_count}")
         LOG.info(f"Writing {run_type} test errors")
@@ -285,18 +296,17 @@ def _run_cat_tests(
         get_current_session().commit()
 
     LOG.info(f"Running aggregated CAT test queries: {len(aggregate_queries)}")
-    aggregate_results, _, aggregate_errors = fetch_from_db_threaded(
+    # Results are parsed and written to the App database as queries complete
+    _, _, aggregate_errors = stream_from_db_threaded(
         aggregate_queries,
+        sql_generator.test_results_table,
+        column_names=sql_generator.result_columns,
+        transform=partial(sql_generator.get_cat_test_results, aggregate_test_defs=aggregate_test_defs),
         use_target_db=True,
         max_threads=sql_generator.connection.max_threads,
         progress_callback=update_aggegate_progress if save_progress else None,
     )
 
-    if aggregate_results:
-        LOG.info("Writing aggregated CAT test results")
-        test_results = sql_generator.get_cat_test_results(aggregate_results, aggregate_test_defs)
-        write_to_app_db(test_results, sql_generator.result_columns, sql_generator.test_results_table)
-
     error_count = 0
     if aggregate_errors:
         LOG.warning(f"Errors running aggregated CAT test queries: {len(aggregate_errors)}")
@@ -327,18 +337,16 @@ def _run_cat_tests(
             get_current_session().commit()
 
         LOG.info(f"Rerunning errored CAT tests singly: {len(single_test_defs)}")
-        single_results, _, single_errors = fetch_from_db_threaded(
+        _, _, single_errors = stream_from_db_threaded(
             single_queries,
+            sql_generator.test_results_table,
+            column_names=sql_generator.result_columns,
+            transform=partial(sql_generator.get_cat_test_results, aggregate_test_defs=single_test_defs),
             use_target_db=True,
             max_threads=sql_generator.connection.max_threads,
-            progress_callback=update_single_progress if save_progress else False,
+            progress_callback=update_single_progress if save_progress else None,
         )
 
-        if single_results:
-            LOG.info("Writing single CAT test results")
-            test_results = sql_generator.get_cat_test_results(single_results, single_test_defs)
-            write_to_app_db(test_results, sql_generator.result_columns, sql_generator.test_results_table)
-
         if error_count := len(single_errors):
             LOG.warning(f"Errors running CAT tests singly: {error_count}")
             LOG.info("Writing single CAT test errors")
@@ -5,17 +5,16 @@ from typing import Literal
 from uuid import UUID
 
 from testgen.common.database.database_service import (
+    compile_template_file,
     execute_db_queries,
     fetch_dict_from_db,
     get_flavor_service,
-    replace_params,
 )
 from testgen.common.job_context import job_context
 from testgen.common.mixpanel_service import MixpanelService
 from testgen.common.models.connection import Connection
 from testgen.common.models.table_group import TableGroup
 from testgen.common.models.test_suite import TestSuite
-from testgen.common.read_file import read_template_sql_file
 from testgen.utils import to_sql_timestamp
 
 LOG = logging.getLogger("testgen")
@@ -203,9 +202,8 @@ class TestGeneration:
         test_type: TestTypeParams | None = None,
         extra_params: dict | None = None,
     ) -> tuple[str, dict | None]:
-        query = read_template_sql_file(template_file_name, sub_directory)
         params = self._get_params(test_type)
         if extra_params:
             params.update(extra_params)
-        query = replace_params(query, params)
+        query = compile_template_file(template_file_name, sub_directory).render(params)
         return query, params
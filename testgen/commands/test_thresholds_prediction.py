@@ -1,14 +1,17 @@
+import concurrent.futures
 import json
 import logging
+import multiprocessing
 from datetime import datetime
+from functools import partial
 
 import pandas as pd
-from scipy import stats
 
+from testgen import settings
 from testgen.common.database.database_service import (
+    compile_template_file,
     execute_db_queries,
     fetch_dict_from_db,
-    replace_params,
     write_to_app_db,
 )
 from testgen.common.freshness_service import (
@@ -20,10 +23,10 @@ from testgen.common.freshness_service import (
 from testgen.common.models import with_database_session
 from testgen.common.models.scheduler import JobSchedule
 from testgen.common.models.test_suite import PredictSensitivity, TestSuite
-from testgen.common.read_file import read_template_sql_file
 from testgen.common.time_series_service import (
     NotEnoughData,
-    get_sarimax_forecast,
+    SarimaxModelState,
+    get_sarimax_forecast_with_state,
 )
 from testgen.utils import to_dataframe, to_sql_timestamp
 
@@ -71,6 +74,7 @@ class TestThresholdsPrediction:
         "upper_tolerance",
         "threshold_value",
         "prediction",
+        "model_state",
     )
 
     @with_database_session
@@ -85,47 +89,57 @@ class TestThresholdsPrediction:
         test_results = fetch_dict_from_db(*self._get_query("get_historical_test_results.sql"))
         if test_results:
             df = to_dataframe(test_results, coerce_float=True)
+            model_states = {
+                str(row["test_definition_id"]): row["model_state"]
+                for row in fetch_dict_from_db(*self._get_query("get_prediction_model_states.sql"))
+            }
             grouped_dfs = df.groupby("test_definition_id", group_keys=False)
 
             LOG.info(f"Training prediction models for tests: {len(grouped_dfs)}")
-            prediction_results = []
+            test_def_ids: list[str] = []
+            test_types: list[str] = []
+            histories: list[pd.DataFrame] = []
+            states: list[dict | None] = []
             for test_def_id, group in grouped_dfs:
-                test_type = group["test_type"].iloc[0]
-                history = group[["test_time", "result_signal"]]
-                history = history.set_index("test_time")
-
-                test_prediction = [
-                    self.test_suite.id,
-                    test_def_id,
-                    to_sql_timestamp(self.run_date),
-                ]
-                if test_type == "Freshness_Trend":
-                    lower, upper, staleness, prediction = compute_freshness_threshold(
-                        history,
-                        sensitivity=self.test_suite.predict_sensitivity or PredictSensitivity.medium,
-                        min_lookback=self.test_suite.predict_min_lookback or 1,
-                        exclude_weekends=self.test_suite.predict_exclude_weekends,
-                        holiday_codes=self.test_suite.holiday_codes_list,
-                        schedule_tz=self.tz,
-                    )
-                    test_prediction.extend([lower, upper, staleness, prediction])
-                else:
-                    lower, upper, prediction = compute_sarimax_threshold(
-                        history,
-                        sensitivity=self.test_suite.predict_sensitivity or PredictSensitivity.medium,
-                        min_lookback=self.test_suite.predict_min_lookback or 1,
-                        exclude_weekends=self.test_suite.predict_exclude_weekends,
-                        holiday_codes=self.test_suite.holiday_codes_list,
-                        schedule_tz=self.tz,
-                    )
-                    if test_type == "Volume_Trend":
-                        if lower is not None: 
-                            lower = max(lower, 0.0)
-                        if upper is not None:
-                            upper = max(upper, 0.0)
-                    test_prediction.extend([lower, upper, None, prediction])
-
-                prediction_results.append(test_prediction)
+                test_def_ids.append(test_def_id)
+                test_types.append(group["test_type"].iloc[0])
+                histories.append(group[["test_time", "result_signal"]].set_index("test_time"))
+                states.append(model_states.get(str(test_def_id)))
+
+            predict = partial(
+                predict_test_thresholds,
+                sensitivity=self.test_suite.predict_sensitivity or PredictSensitivity.medium,
+                min_lookback=self.test_suite.predict_min_lookback or 1,
+                exclude_weekends=self.test_suite.predict_exclude_weekends,
+                holiday_codes=self.test_suite.holiday_codes_list,
+                schedule_tz=self.tz,
+                refit_interval=settings.PREDICTION_REFIT_INTERVAL,
+            )
+
+            max_workers = min(settings.PREDICTION_MAX_WORKERS, len(histories))
+            if max_workers > 1:
+                LOG.info(f"Training prediction models in {max_workers} worker processes")
+                # Spawn instead of fork so workers don't inherit the open database connections
+                with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as executor:
+                    # map() returns results in input order, so staged output matches the serial path
+                    predictions = list(executor.map(
+                        predict,
+                        test_types,
+                        histories,
+                        states,
+                        chunksize=max(1, len(histories) // (max_workers * 4)),
+                    ))
+            else:
+                predictions = list(map(predict, test_types, histories, states))
+
+            run_date = to_sql_timestamp(self.run_date)
+            prediction_results = [
+                [self.test_suite.id, test_def_id, run_date, *prediction]
+                for test_def_id, prediction in zip(test_def_ids, predictions, strict=True)
+            ]
 
             LOG.info("Writing predicted test thresholds to staging")
             write_to_app_db(prediction_results, self.staging_columns, self.staging_table)
@@ -133,6 +147,7 @@ class TestThresholdsPrediction:
             LOG.info("Updating predicted test thresholds and deleting staging")
             execute_db_queries([
                 self._get_query("update_predicted_test_thresholds.sql"),
+                self._get_query("update_prediction_model_states.sql"),
                 self._get_query("delete_staging_test_definitions.sql"),
             ])
 
@@ -145,11 +160,55 @@ class TestThresholdsPrediction:
             "TEST_SUITE_ID": self.test_suite.id,
             "RUN_DATE": to_sql_timestamp(self.run_date),
         }
-        query = read_template_sql_file(template_file_name, sub_directory)
-        query = replace_params(query, params)
+        query = compile_template_file(template_file_name, sub_directory).render(params)
         return query, params
 
 
+def predict_test_thresholds(
+    test_type: str,
+    history: pd.DataFrame,
+    model_state: dict | None,
+    sensitivity: PredictSensitivity,
+    min_lookback: int = 1,
+    exclude_weekends: bool = False,
+    holiday_codes: list[str] | None = None,
+    schedule_tz: str | None = None,
+    refit_interval: int = 0,
+) -> tuple[float | None, float | None, float | None, str | None, str | None]:
+    """Compute the thresholds for a single test definition.
+
+    Module-level so that it can be run in worker processes.
+
+    Returns (lower, upper, threshold_value, prediction_json, model_state_json).
+    """
+    if test_type == "Freshness_Trend":
+        return *compute_freshness_threshold(
+            history,
+            sensitivity=sensitivity,
+            min_lookback=min_lookback,
+            exclude_weekends=exclude_weekends,
+            holiday_codes=holiday_codes,
+            schedule_tz=schedule_tz,
+        ), None
+
+    lower, upper, prediction, new_state = compute_sarimax_threshold(
+        history,
+        sensitivity=sensitivity,
+        min_lookback=min_lookback,
+        exclude_weekends=exclude_weekends,
+        holiday_codes=holiday_codes,
+        schedule_tz=schedule_tz,
+        model_state=SarimaxModelState.from_dict(model_state),
+        refit_interval=refit_interval,
+    )
+    if test_type == "Volume_Trend":
+        if lower is not None:
+            lower = max(lower, 0.0)
+        if upper is not None:
+            upper = max(upper, 0.0)
+    return lower, upper, None, prediction, new_state.to_json() if new_state else None
+
+
 def compute_freshness_threshold(
     history: pd.DataFrame,
     sensitivity: PredictSensitivity,
@@ -268,21 +327,27 @@ def compute_sarimax_threshold(
     exclude_weekends: bool = False,
     holiday_codes: list[str] | None = None,
     schedule_tz: str | None = None,
-) -> tuple[float | None, float | None, str | None]:
+    model_state: SarimaxModelState | None = None,
+    refit_interval: int = 0,
+) -> tuple[float | None, float | None, str | None, SarimaxModelState | None]:
     """Compute SARIMAX-based thresholds for the next forecast point.
 
-    Returns (lower, upper, forecast_json) or (None, None, None) if insufficient data.
+    Returns (lower, upper, forecast_json, model_state) or (None, None, None, None) if insufficient data.
     """
+    from scipy import stats
+
     if len(history) < min_lookback:
-        return None, None, None
+        return None, None, None, None
 
     try:
-        forecast = get_sarimax_forecast(
+        forecast, new_state = get_sarimax_forecast_with_state(
             history,
             num_forecast=num_forecast,
             exclude_weekends=exclude_weekends,
             holiday_codes=holiday_codes,
             tz=schedule_tz,
+            model_state=model_state,
+            refit_interval=refit_interval,
         )
 
         num_points = len(history)
@@ -300,8 +365,8 @@ def compute_sarimax_threshold(
         upper_tolerance = forecast.at[next_date, f"upper_tolerance|{sensitivity.value}"]
 
         if pd.isna(lower_tolerance) or pd.isna(upper_tolerance):
-            return None, None, None
+            return None, None, None, None
         else:
-            return float(lower_tolerance), float(upper_tolerance), forecast.to_json()
+            return float(lower_tolerance), float(upper_tolerance), forecast.to_json(), new_state
     except NotEnoughData:
-        return None, None, None
+        return None, None, None, None
@@ -0,0 +1,45 @@
+"""Invalidation of the UI's query caches from the other TestGen processes.
+
+The UI caches query results in its own process, indexed by tags naming the entities they were
+read from. Jobs, the API and the MCP server announce their changes to those entities with
+`notify_cache_invalidation`, on a notification channel of the app database the UI listens to.
+"""
+from typing import Literal
+from uuid import UUID
+
+from sqlalchemy import text
+
+from testgen import settings
+from testgen.common.models import get_current_session
+from testgen.common.notification_listener import NotificationListener
+
+# Notified with the comma-separated tags of the cache entries to drop
+CACHE_INVALIDATIONS_CHANNEL = f"{settings.DATABASE_SCHEMA}_cache_invalidations"
+
+CacheTagKind = Literal["project", "table_group", "test_suite", "test_run", "profiling_run"]
+
+
+def cache_tag(kind: CacheTagKind, key: str | UUID) -> str:
+    return f"{kind}:{key}"
+
+
+def notify_cache_invalidation(*tags: str) -> None:
+    """Drops the UI cache entries read from the given entities.
+
+    The notification is sent in the current session, so it is delivered when the changes are committed.
+    """
+    get_current_session().execute(
+        text("SELECT pg_notify(:channel, :tags)"),
+        {"channel": CACHE_INVALIDATIONS_CHANNEL, "tags": ",".join(tags)},
+    )
+
+
+def _parse_tags(payload: str) -> list[str]:
+    return [tag for tag in payload.split(",") if tag]
+
+
+class CacheInvalidationListener(NotificationListener[str]):
+    """Receives the cache tags notified by `notify_cache_invalidation`."""
+
+    def __init__(self):
+        super().__init__(CACHE_INVALIDATIONS_CHANNEL, _parse_tags)
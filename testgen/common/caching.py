@@ -0,0 +1,56 @@
+"""Streamlit caching for code shared by the UI and the CLI.
+
+Importing streamlit takes a large part of the CLI's startup time, and only the UI benefits
+from its caches. `cache_data` defers the import until a cached function is first used,
+so CLI commands and jobs that never reach one don't pay for it.
+"""
+import functools
+import sys
+import threading
+from collections.abc import Callable
+from typing import Any
+
+_lock = threading.Lock()
+
+
+class _LazyCachedFunc:
+
+    def __init__(self, func: Callable, kwargs: dict[str, Any]):
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._kwargs = kwargs
+        self._cached_func = None
+
+    def _get_cached_func(self):
+        if self._cached_func is None:
+            import streamlit as st
+
+            with _lock:
+                if self._cached_func is None:
+                    self._cached_func = st.cache_data(**self._kwargs)(self._func)
+        return self._cached_func
+
+    def __get__(self, instance: Any, owner: Any | None = None) -> Any:
+        # Same as streamlit's cached functions, so that cached methods bind to their instance or class
+        if instance is None:
+            return self
+        return self._get_cached_func().__get__(instance, owner)
+
+    def __call__(self, *args, **kwargs) -> Any:
+        return self._get_cached_func()(*args, **kwargs)
+
+    def clear(self, *args, **kwargs) -> None:
+        self._get_cached_func().clear(*args, **kwargs)
+
+
+def cache_data(**kwargs) -> Callable[[Callable], Callable]:
+    """Same as `st.cache_data(**kwargs)`, importing streamlit on the first call of the function."""
+    return lambda func: _LazyCachedFunc(func, kwargs)
+
+
+def clear_cache_data() -> None:
+    """Same as `st.cache_data.clear()`, without importing streamlit if no cached function was used."""
+    if "streamlit" in sys.modules:
+        import streamlit as st
+
+        st.cache_data.clear()
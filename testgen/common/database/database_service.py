@@ -1,17 +1,24 @@
 import concurrent.futures
 import csv
+import hashlib
 import importlib
+import json
 import logging
 import math
+import queue
 import re
-from collections.abc import Callable, Iterable
-from contextlib import suppress
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass, field
+from functools import cache, lru_cache
 from typing import Any, Literal, TypedDict
 from urllib.parse import quote_plus
 
 import psycopg2.sql
-from sqlalchemy import Connection, Engine, Row, create_engine, text
+from sqlalchemy import Connection, Engine, Row, create_engine, event, text
 from sqlalchemy.engine import RowMapping
 from sqlalchemy.exc import ProgrammingError, SQLAlchemyError
 from sqlalchemy.pool import NullPool, PoolProxiedConnection
@@ -29,10 +36,17 @@ from testgen.common.database import FilteredStringIO
 from testgen.common.database.flavor.flavor_service import (
     ConnectionParams,
     FlavorService,
+    ResolvedConnectionParams,
     SQLFlavor,
     resolve_connection_params,
 )
-from testgen.common.read_file import get_template_files
+from testgen.common.read_file import (
+    DK_FUNCTIONS_PATTERN,
+    expand_templated_function,
+    get_template_files,
+    read_template_sql_file,
+    replace_templated_functions,
+)
 from testgen.common.standalone_postgres import get_connection_string as get_standalone_connection_string
 from testgen.common.standalone_postgres import is_standalone_mode
 from testgen.utils import get_exception_message
@@ -49,9 +63,86 @@ class EngineCache:
     app_db: Engine | None = field(default=None)
     target_db: Engine | None = field(default=None)
 
+
+class TargetEngineCache:
+    """
+    Process-wide cache of target database engines for interactive lookups (UI, MCP).
+
+    Engines are keyed by connection id and a hash of the connection parameters, so an edited connection
+    never reuses a stale engine. The least recently used engine is disposed when the cache is full,
+    and engines unused for longer than the idle timeout are disposed on the next access.
+    """
+
+    def __init__(self):
+        self._engines: OrderedDict[tuple[Any, str], tuple[Engine, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connect(self, connection_params: ConnectionParams) -> Iterator[Connection]:
+        engine, is_cached = self._get_engine(connection_params)
+        try:
+            with engine.connect() as connection:
+                yield connection
+        finally:
+            if not is_cached:
+                engine.dispose()
+
+    def invalidate(self, connection_id: int) -> None:
+        with self._lock:
+            keys = [key for key in self._engines if key[0] == connection_id]
+            engines = [self._engines.pop(key)[0] for key in keys]
+        for engine in engines:
+            engine.dispose()
+
+    def clear(self) -> None:
+        with self._lock:
+            engines = [engine for engine, _ in self._engines.values()]
+            self._engines.clear()
+        for engine in engines:
+            engine.dispose()
+
+    def _get_engine(self, connection_params: ConnectionParams) -> tuple[Engine, bool]:
+        params_hash = hashlib.sha256(json.dumps(connection_params, sort_keys=True, default=str).encode()).hexdigest()
+        key = (connection_params.get("connection_id"), params_hash)
+        now = time.monotonic()
+        expired: list[Engine] = []
+
+        with self._lock:
+            for cached_key, (cached_engine, last_used) in list(self._engines.items()):
+                if now - last_used > settings.TARGET_ENGINE_IDLE_TIMEOUT:
+                    del self._engines[cached_key]
+                    expired.append(cached_engine)
+
+            engine = self._engines.pop(key, (None, None))[0]
+            if engine is None:
+                engine = _create_interactive_target_engine(connection_params)
+
+            is_cached = settings.TARGET_ENGINE_CACHE_SIZE > 0
+            if is_cached:
+                self._engines[key] = (engine, now)
+                while len(self._engines) > settings.TARGET_ENGINE_CACHE_SIZE:
+                    expired.append(self._engines.popitem(last=False)[1][0])
+
+        for expired_engine in expired:
+            expired_engine.dispose()
+        return engine, is_cached
+
+
+def _create_interactive_target_engine(connection_params: ConnectionParams) -> Engine:
+    flavor_service = get_flavor_service(connection_params["sql_flavor"])
+    # Cached connections can be dropped by the server while idle - check them on checkout
+    engine = flavor_service.create_engine(connection_params, pool_pre_ping=True)
+    add_session_setup_listener(engine, flavor_service, resolve_connection_params(connection_params))
+    return engine
+
+
 # Initialize variables global to this script
 target_db_params: ConnectionParams | None = None
 engine_cache = EngineCache()
+target_engine_cache = TargetEngineCache()
+
+# Rows buffered before each COPY when streaming query results to the App database
+STREAM_CHUNK_SIZE = 5000
 
 
 def quote_csv_items(csv_row: str, quote_character: str = '"') -> str:
@@ -85,7 +176,12 @@ def empty_cache() -> None:
 
 def set_target_db_params(connection_params: ConnectionParams) -> None:
     global target_db_params
-    target_db_params = dict(connection_params)
+    connection_params = dict(connection_params)
+    # The target engine's pool and session setup are specific to the connection
+    if connection_params != target_db_params and engine_cache.target_db is not None:
+        engine_cache.target_db.dispose()
+        engine_cache.target_db = None
+    target_db_params = connection_params
 
 
 def get_flavor_service(flavor: SQLFlavor) -> FlavorService:
@@ -177,6 +273,53 @@ def execute_db_queries(
     return return_values, row_counts
 
 
+class ThreadConnections:
+    """
+    Connections held by the worker threads of a threaded batch, one per thread.
+
+    Reusing the same connection for all the queries run by a thread avoids checking out a connection
+    and running the session setup for each query.
+    """
+
+    def __init__(self, use_target_db: bool = False):
+        self.use_target_db = use_target_db
+        self._local = threading.local()
+        self._connections: list[Connection] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> Connection:
+        connection: Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = _init_db_connection(self.use_target_db)
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    def discard(self) -> None:
+        # The connection may be broken or in an aborted transaction after a failed query
+        connection: Connection | None = getattr(self._local, "connection", None)
+        if connection is not None:
+            self._local.connection = None
+            with self._lock:
+                self._connections.remove(connection)
+            with suppress(Exception):
+                connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            with suppress(Exception):
+                connection.close()
+
+    def __enter__(self) -> "ThreadConnections":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
 class ThreadedProgress(TypedDict):
     processed: int
     errors: int
@@ -198,12 +341,12 @@ def fetch_from_db_threaded(
         error = None
 
         try:
-            with _init_db_connection(use_target_db) as connection:
-                result = connection.execute(text(query), params)
-                LOG.debug(f"{result.rowcount} records retrieved")
-                row_data = result.mappings().fetchall()
-                column_names = list(result.keys())
+            result = thread_connections.get().execute(text(query), params)
+            LOG.debug(f"{result.rowcount} records retrieved")
+            row_data = result.mappings().fetchall()
+            column_names = list(result.keys())
         except Exception as e:
+            thread_connections.discard()
             error = get_exception_message(e)
             LOG.exception(f"Failed to execute threaded query: {query}")
 
@@ -218,7 +361,10 @@ def fetch_from_db_threaded(
     processed_indexes: list[int] = []
     max_threads = max(1, min(10, max_threads))
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
+    with (
+        ThreadConnections(use_target_db) as thread_connections,
+        concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor,
+    ):
         futures = [
             executor.submit(fetch_data, query, params, index)
             for index, (query, params) in enumerate(queries)
@@ -247,6 +393,221 @@ def fetch_from_db_threaded(
     return result_data, result_columns, error_data
 
 
+@dataclass
+class StreamStage:
+    """
+    One stage of a streamed query pipeline and the App database table its query results are written to.
+
+    follow_up is called with the rows of each successful query of the stage and returns the queries to run
+    for them in the next stage.
+    """
+    table_name: str
+    column_names: Iterable[str] | None = None
+    transform: Callable[[list[RowMapping]], list[Iterable]] | None = None
+    progress_callback: Callable[[ThreadedProgress], None] | None = None
+    follow_up: Callable[[list[RowMapping]], list[tuple[str, dict | None]]] | None = None
+
+
+@dataclass
+class StreamStageResult:
+    query_count: int = 0
+    written_count: int = 0
+    result_columns: list[str] = field(default_factory=list)
+    errors: dict[int, str] = field(default_factory=dict)
+    # Set when writing the results failed, after which the remaining results of the stage are discarded
+    write_error: str | None = None
+
+
+def stream_from_db_threaded(
+    queries: list[tuple[str, dict | None]],
+    table_name: str,
+    column_names: Iterable[str] | None = None,
+    transform: Callable[[list[RowMapping]], list[Iterable]] | None = None,
+    use_target_db: bool = False,
+    max_threads: int = 4,
+    progress_callback: Callable[[ThreadedProgress], None] | None = None,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> tuple[int, list[str], dict[int, str]]:
+    """Run queries concurrently and write their results to an App database table while they are still running.
+
+    Args:
+        queries: List of (query, params) tuples.
+        table_name: App database table to write to.
+        column_names: Destination columns. If not provided, the column names of the query results are used.
+        transform: Callable that converts the rows of one query result into rows to write.
+        use_target_db: Whether to run the queries on the Target database.
+        max_threads: Maximum concurrent queries.
+        progress_callback: Called after each query is processed.
+        chunk_size: Number of rows written in each COPY.
+
+    Returns:
+        (number of rows written, column names of the query results, errors by query index)
+    """
+    [result] = stream_pipeline_from_db_threaded(
+        queries,
+        [StreamStage(table_name, column_names, transform, progress_callback)],
+        use_target_db=use_target_db,
+        max_threads=max_threads,
+        chunk_size=chunk_size,
+    )
+    if result.write_error:
+        raise RuntimeError(f"Error writing results to {table_name}. {result.write_error}")
+    return result.written_count, result.result_columns, result.errors
+
+
+def stream_pipeline_from_db_threaded(
+    queries: list[tuple[str, dict | None]],
+    stages: list[StreamStage],
+    use_target_db: bool = False,
+    max_threads: int = 4,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> list[StreamStageResult]:
+    """Run a pipeline of queries concurrently and write the results of each stage to its App database table.
+
+    The queries run in the first stage. As each query completes, its stage's follow_up can queue queries for the
+    next stage, which run on the same worker threads. Queued queries of later stages are started first, so work
+    moves through the pipeline as soon as its inputs are ready instead of waiting for a whole stage to finish.
+
+    At most max_threads queries run at a time and their results are handed over to the calling thread, which
+    writes them with COPY whenever chunk_size rows of a stage are buffered.
+
+    Failures are contained to their stage: a query, transform or follow_up error is recorded for that query, and a
+    failed COPY stops the writes of that stage only, so the other stages still run and write their results.
+
+    Args:
+        queries: List of (query, params) tuples for the first stage.
+        stages: Pipeline stages, in order.
+        use_target_db: Whether to run the queries on the Target database.
+        max_threads: Maximum concurrent queries.
+        chunk_size: Number of rows written in each COPY.
+
+    Returns:
+        Results of each stage. Errors are keyed by query index within the stage, with follow_up errors counted
+        as failed queries of the next stage.
+    """
+    LOG.debug(f"DB operation: stream_pipeline_from_db_threaded ({len(queries)}) on {'Target' if use_target_db else 'App'} database (User type = normal)")
+
+    max_threads = max(1, min(10, max_threads))
+    result_queue: queue.Queue[tuple[int, int, list[RowMapping], list[str], str | None]] = queue.Queue()
+
+    def fetch_data(stage_index: int, index: int, query: str, params: dict | None) -> None:
+        LOG.debug(f"Query: {query}")
+        row_data: list[RowMapping] = []
+        column_names: list[str] = []
+        error = None
+
+        try:
+            result = thread_connections.get().execute(text(query), params)
+            LOG.debug(f"{result.rowcount} records retrieved")
+            row_data = result.mappings().fetchall()
+            column_names = list(result.keys())
+        except Exception as e:
+            thread_connections.discard()
+            error = get_exception_message(e)
+            LOG.exception(f"Failed to execute threaded query: {query}")
+
+        result_queue.put((stage_index, index, row_data, column_names, error))
+
+    results = [StreamStageResult() for _ in stages]
+    pending: list[deque[tuple[int, str, dict | None]]] = [deque() for _ in stages]
+    buffers: list[list[Iterable]] = [[] for _ in stages]
+    processed_indexes: list[list[int]] = [[] for _ in stages]
+
+    def queue_queries(stage_index: int, stage_queries: list[tuple[str, dict | None]]) -> None:
+        result = results[stage_index]
+        for query, params in stage_queries:
+            pending[stage_index].append((result.query_count, query, params))
+            result.query_count += 1
+
+    connection = None
+
+    def write_buffer(stage_index: int) -> None:
+        nonlocal connection
+        stage, result, buffer = stages[stage_index], results[stage_index], buffers[stage_index]
+        buffers[stage_index] = []
+        try:
+            connection = connection or _init_db_connection(use_raw=True)
+            _copy_to_app_db(connection, buffer, stage.column_names or result.result_columns, stage.table_name)
+        except Exception as e:
+            result.write_error = get_exception_message(e)
+            LOG.exception(f"Failed to write threaded query results to {stage.table_name}")
+            if connection:
+                # The failed COPY leaves the transaction aborted, so the connection is not reused
+                with suppress(Exception):
+                    connection.close()
+                connection = None
+        else:
+            result.written_count += len(buffer)
+
+    queue_queries(0, queries)
+    running_count = 0
+    thread_connections = ThreadConnections(use_target_db)
+    try:
+        with thread_connections, concurrent.futures.ThreadPoolExecutor(max_workers=max_threads) as executor:
+
+            def start_queries() -> None:
+                nonlocal running_count
+                while running_count < max_threads:
+                    stage_index = next((index for index in reversed(range(len(stages))) if pending[index]), None)
+                    if stage_index is None:
+                        break
+                    executor.submit(fetch_data, stage_index, *pending[stage_index].popleft())
+                    running_count += 1
+
+            start_queries()
+            while running_count:
+                stage_index, index, row_data, row_columns, error = result_queue.get()
+                running_count -= 1
+                stage, result = stages[stage_index], results[stage_index]
+
+                if row_data and not error:
+                    result.result_columns = result.result_columns or row_columns
+                    try:
+                        rows = stage.transform(row_data) if stage.transform else row_data
+                    except Exception as e:
+                        error = get_exception_message(e)
+                        LOG.exception(f"Failed to transform threaded query results for {stage.table_name}")
+                    else:
+                        if not result.write_error:
+                            buffers[stage_index].extend(rows)
+                if error:
+                    result.errors[index] = error
+                elif stage.follow_up and stage_index + 1 < len(stages):
+                    try:
+                        queue_queries(stage_index + 1, stage.follow_up(row_data))
+                    except Exception as e:
+                        next_result = results[stage_index + 1]
+                        next_result.errors[next_result.query_count] = get_exception_message(e)
+                        processed_indexes[stage_index + 1].append(next_result.query_count)
+                        next_result.query_count += 1
+                        LOG.exception(f"Failed to get follow-up queries for {stage.table_name}")
+                start_queries()
+
+                if len(buffers[stage_index]) >= chunk_size:
+                    write_buffer(stage_index)
+
+                processed_indexes[stage_index].append(index)
+                if stage.progress_callback:
+                    stage.progress_callback({
+                        "processed": len(processed_indexes[stage_index]),
+                        "errors": len(result.errors),
+                        "total": result.query_count,
+                        "indexes": processed_indexes[stage_index],
+                    })
+                LOG.debug(f"Processed {len(processed_indexes[stage_index])} of {result.query_count} threaded queries in stage {stage_index + 1}")
+
+        for stage_index, buffer in enumerate(buffers):
+            if buffer:
+                write_buffer(stage_index)
+    finally:
+        if connection:
+            connection.close()
+
+    for stage, result in zip(stages, results, strict=True):
+        LOG.debug(f"{result.written_count} records written to {stage.table_name}")
+    return results
+
+
 def fetch_list_from_db(
     query: str, params: dict | None = None, use_target_db: bool = False
 ) -> tuple[list[Row], list[str]]:
@@ -274,11 +635,33 @@ def fetch_dict_from_db(
         return result.mappings().all()
 
 
+def stream_dict_from_db(
+    query: str, params: dict | None = None, use_target_db: bool = False, chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[list[RowMapping]]:
+    """Yield the results of a query in chunks, using a server-side cursor where the database supports it."""
+    LOG.debug(f"DB operation: stream_dict_from_db on {'Target' if use_target_db else 'App'} database (User type = normal)")
+
+    with _init_db_connection(use_target_db) as connection:
+        LOG.debug(f"Query: {query}")
+        result = connection.execution_options(stream_results=True, yield_per=chunk_size).execute(text(query), params)
+        yield from result.mappings().partitions(chunk_size)
+
+
 def write_to_app_db(data: list[Row], column_names: Iterable[str], table_name: str) -> None:
     LOG.debug("DB operation: write_to_app_db on App database (User type = normal)")
 
     # use_raw is required to make use of the copy_expert method for fast batch ingestion
     connection = _init_db_connection(use_raw=True)
+    _copy_to_app_db(connection, data, column_names, table_name)
+    connection.close()
+
+
+def _copy_to_app_db(
+    connection: PoolProxiedConnection,
+    data: list[Row | RowMapping | Iterable],
+    column_names: Iterable[str],
+    table_name: str,
+) -> None:
     cursor = connection.cursor()
 
     # Write List to CSV in memory
@@ -304,7 +687,11 @@ def write_to_app_db(data: list[Row], column_names: Iterable[str], table_name: st
     LOG.debug(f"Query: {query}")
     cursor.copy_expert(query, buffer)
     connection.commit()
-    connection.close()
+
+
+TEMPLATE_CONDITIONAL_PATTERN = re.compile(r"^--\s+TG-(IF|ELSE|ENDIF)(?:\s+(\w+))?\s*$")
+TEMPLATE_SLOT_PATTERN = re.compile(r"\{(\w+)\}")
+TRAILING_WORD_PATTERN = re.compile(r"\w*\Z")
 
 
 def apply_params(query: str, params: dict[str, Any]) -> str:
@@ -314,17 +701,21 @@ def apply_params(query: str, params: dict[str, Any]) -> str:
 
 
 def replace_params(query: str, params: dict[str, Any]) -> str:
+    # One-shot strings are faster to render in place than to compile - templates rendered repeatedly are compiled
+    return _replace_params_in_order(query, params)
+
+
+def _replace_params_in_order(query: str, params: dict[str, Any]) -> str:
     for key, value in params.items():
         query = query.replace(f"{{{key}}}", "" if value is None else str(value))
     return query
 
 
 def process_conditionals(query: str, params: dict[str, Any]) -> str:
-    re_pattern = re.compile(r"^--\s+TG-(IF|ELSE|ENDIF)(?:\s+(\w+))?\s*$")
     condition = None
     updated_query = []
     for line in query.splitlines(True):
-        if re_match := re_pattern.match(line):
+        if re_match := TEMPLATE_CONDITIONAL_PATTERN.match(line):
             match re_match.group(1):
                 case "IF" if condition is None and (variable := re_match.group(2)) is not None:
                     condition = bool(params.get(variable))
@@ -343,6 +734,222 @@ def process_conditionals(query: str, params: dict[str, Any]) -> str:
     return "".join(updated_query)
 
 
+@dataclass(frozen=True, slots=True)
+class _TemplateFunctionCall:
+    name: str
+    # Parameter tokens of the arguments, as in _TemplateBlock.tokens - None if called without arguments
+    arg_tokens: list[str] | None
+
+
+@dataclass(frozen=True, slots=True)
+class _TemplateBlock:
+    text: str
+    # Literal text alternating with parameter names: [text, name, text, ..., text]
+    tokens: list[str]
+    # Parameter tokens of the text alternating with its templated function calls: [tokens, call, tokens, ..., tokens]
+    pieces: list[list[str] | _TemplateFunctionCall]
+    # None for unconditional lines, "" for the conditional markers themselves
+    condition: str | None = None
+    expected: bool = True
+
+
+class CompiledTemplate:
+    """
+    SQL template parsed once into conditional blocks, parameter slots and templated function calls, so that each
+    rendering is a single pass over the pieces instead of a regex pass per line, a str.replace pass per parameter
+    and a regex pass for the function calls.
+
+    The output is identical to process_conditionals followed by replace_params and replace_templated_functions.
+    When that can't be guaranteed for a rendering (e.g. parameter values containing braces, which replace_params
+    would substitute again), the original functions are used instead.
+    """
+
+    def __init__(self, template: str):
+        self.template = template
+        self._blocks: list[_TemplateBlock] = []
+        self._conditionals_valid = True
+        self._safe = True
+        self._functions_safe = True
+
+        condition: str | None = None
+        expected = True
+        lines: list[str] = []
+
+        def add_block(text: str, block_condition: str | None, block_expected: bool = True) -> None:
+            if text:
+                tokens = TEMPLATE_SLOT_PATTERN.split(text)
+                self._safe = self._safe and self._is_safe(tokens)
+                pieces = self._parse_function_calls(text)
+                self._blocks.append(_TemplateBlock(text, tokens, pieces, block_condition, block_expected))
+
+        for line in template.splitlines(True):
+            if re_match := TEMPLATE_CONDITIONAL_PATTERN.match(line):
+                add_block("".join(lines), condition, expected)
+                lines = []
+                add_block(line, "")
+                match re_match.group(1):
+                    case "IF" if condition is None and (variable := re_match.group(2)) is not None:
+                        condition, expected = variable, True
+                    case "ELSE" if condition is not None:
+                        expected = not expected
+                    case "ENDIF" if condition is not None:
+                        condition, expected = None, True
+                    case _:
+                        self._conditionals_valid = False
+            else:
+                lines.append(line)
+        add_block("".join(lines), condition, expected)
+
+        if condition is not None:
+            self._conditionals_valid = False
+
+    @staticmethod
+    def _is_safe(tokens: list[str]) -> bool:
+        # replace_params substitutes parameters one at a time, so a substituted value could join the text before it
+        # into a new "{name}" slot - only possible if an opening brace precedes the slot through word characters
+        for index in range(1, len(tokens), 2):
+            literal_index = index - 1
+            while True:
+                literal = tokens[literal_index]
+                prefix = literal[:TRAILING_WORD_PATTERN.search(literal).start()]
+                if prefix:
+                    if prefix.endswith("{"):
+                        return False
+                    break
+                if literal_index == 0:
+                    break
+                # Only word characters between this slot and the previous one
+                literal_index -= 2
+        return True
+
+    def _parse_function_calls(self, text: str) -> list[list[str] | _TemplateFunctionCall]:
+        pieces: list[list[str] | _TemplateFunctionCall] = []
+        end_pos = 0
+        for func_match in DK_FUNCTIONS_PATTERN.finditer(text):
+            literal = text[end_pos:func_match.start()]
+            # A "<%" left outside of the calls could start one once the parameters are substituted, e.g. "<%{NAME}%>"
+            self._functions_safe = self._functions_safe and "<%" not in literal
+            pieces.append(TEMPLATE_SLOT_PATTERN.split(literal))
+            function_name, args_str = func_match.groups()
+            arg_tokens = TEMPLATE_SLOT_PATTERN.split(args_str) if args_str is not None else None
+            pieces.append(_TemplateFunctionCall(function_name, arg_tokens))
+            end_pos = func_match.end()
+        literal = text[end_pos:]
+        self._functions_safe = self._functions_safe and "<%" not in literal
+        pieces.append(TEMPLATE_SLOT_PATTERN.split(literal))
+        return pieces
+
+    def render(
+        self,
+        params: dict[str, Any],
+        conditions: dict[str, Any] | None = None,
+        flavor: str | None = None,
+    ) -> str:
+        """
+        Replaces the parameters in the template, and if conditions are provided,
+        removes the conditional blocks that don't apply. If a flavor is provided,
+        also replaces the templated function calls with the flavor's SQL.
+        """
+        if conditions is None:
+            blocks = self._blocks
+        elif not self._conditionals_valid:
+            raise ValueError("Template conditional misused")
+        else:
+            blocks = [
+                block for block in self._blocks
+                if block.condition is None
+                or (block.condition and bool(conditions.get(block.condition)) == block.expected)
+            ]
+
+        # Parameter names that are not word characters can't be matched to the parsed slots
+        if (
+            not self._safe
+            or (flavor is not None and not self._functions_safe)
+            or not all(key.replace("_", "a").isalnum() for key in params)
+        ):
+            return self._render_in_order(blocks, params, flavor)
+
+        parts: list[str] = []
+        if flavor is None:
+            for block in blocks:
+                if not self._render_tokens(parts, block.tokens, params, _changes_slots):
+                    return self._render_in_order(blocks, params, flavor)
+            return "".join(parts)
+
+        for block in blocks:
+            for piece in block.pieces:
+                if not isinstance(piece, _TemplateFunctionCall):
+                    if not self._render_tokens(parts, piece, params, _changes_slots_or_calls):
+                        return self._render_in_order(blocks, params, flavor)
+                    continue
+
+                args_str = None
+                if piece.arg_tokens is not None:
+                    arg_parts: list[str] = []
+                    if not self._render_tokens(arg_parts, piece.arg_tokens, params, _changes_slots_or_calls):
+                        return self._render_in_order(blocks, params, flavor)
+                    args_str = "".join(arg_parts)
+                    # The call would not be matched with empty arguments, nor across lines
+                    if not args_str or "\n" in args_str:
+                        return self._render_in_order(blocks, params, flavor)
+                parts.append(expand_templated_function(piece.name, args_str, flavor))
+        return "".join(parts)
+
+    @staticmethod
+    def _render_tokens(
+        parts: list[str],
+        tokens: list[str],
+        params: dict[str, Any],
+        changes_template: Callable[[str], bool],
+    ) -> bool:
+        for index, token in enumerate(tokens):
+            if not index % 2:
+                parts.append(token)
+            elif token in params:
+                value = params[token]
+                value = "" if value is None else str(value)
+                if changes_template(value):
+                    return False
+                parts.append(value)
+            else:
+                parts.append(f"{{{token}}}")
+        return True
+
+    @staticmethod
+    def _render_in_order(blocks: list[_TemplateBlock], params: dict[str, Any], flavor: str | None) -> str:
+        query = _replace_params_in_order("".join(block.text for block in blocks), params)
+        return replace_templated_functions(query, flavor) if flavor is not None else query
+
+
+def _changes_slots(value: str) -> bool:
+    # Braces in a value could form slots that replace_params would substitute again
+    return "{" in value or "}" in value
+
+
+def _changes_slots_or_calls(value: str) -> bool:
+    # Besides slots, the value could form the "<%" or "%>" delimiters of function calls, alone or with the text around it
+    return (
+        _changes_slots(value)
+        or "<%" in value
+        or "%>" in value
+        or value.startswith(("%", ">"))
+        or value.endswith(("<", "%"))
+    )
+
+
+@lru_cache(maxsize=1024)
+def compile_template(template: str) -> CompiledTemplate:
+    """Compiles a query string rendered repeatedly, such as a test type's measure. The cache is bounded, since
+    the strings are read from the database. One-shot strings are faster to render with replace_params."""
+    return CompiledTemplate(template)
+
+
+@cache
+def compile_template_file(template_file_name: str, sub_directory: str | None = None) -> CompiledTemplate:
+    """Compiles a template file once per process."""
+    return CompiledTemplate(read_template_sql_file(template_file_name, sub_directory))
+
+
 def get_queries_for_command(
     sub_directory: str, params: dict[str, Any], mask: str = r"^.*sql$", path: str | None = None
 ) -> list[str]:
@@ -449,23 +1056,40 @@ def _init_target_db_connection() -> Connection:
 
     engine = engine_cache.target_db
     if not engine:
+        # Threaded operations hold one connection per thread - keep them all in the pool between batches
+        max_threads = max(1, min(10, target_db_params.get("max_threads") or settings.PROJECT_CONNECTION_MAX_THREADS))
         try:
-            engine: Engine = flavor_service.create_engine(target_db_params)
+            engine: Engine = flavor_service.create_engine(target_db_params, pool_size=max_threads)
         except SQLAlchemyError as e:
             raise ValueError(f"Failed to create engine for Target database '{params.dbname}' (User type = normal)") from e
         else:
+            add_session_setup_listener(engine, flavor_service, params)
             engine_cache.target_db = engine
 
-    connection: Connection = engine.connect()
+    return engine.connect()
 
-    for query, query_params in flavor_service.get_pre_connection_queries(params):
-        try:
-            connection.execute(text(query), query_params)
-        except Exception:
-            LOG.warning(
-                f"Failed to execute preconnection query on Target database: {query}",
-                exc_info=settings.IS_DEBUG,
-                stack_info=settings.IS_DEBUG,
-            )
 
-    return connection
+def add_session_setup_listener(engine: Engine, flavor_service: FlavorService, params: ResolvedConnectionParams) -> None:
+    """Runs the flavor's pre-connection queries once per physical connection instead of on every checkout."""
+    pre_connection_queries = flavor_service.get_pre_connection_queries(params)
+    if not pre_connection_queries:
+        return
+
+    @event.listens_for(engine, "connect")
+    def setup_session(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for query, query_params in pre_connection_queries:
+                try:
+                    if query_params:
+                        cursor.execute(query, query_params)
+                    else:
+                        cursor.execute(query)
+                except Exception:
+                    LOG.warning(
+                        f"Failed to execute preconnection query on Target database: {query}",
+                        exc_info=settings.IS_DEBUG,
+                        stack_info=settings.IS_DEBUG,
+                    )
+        finally:
+            cursor.close()
@@ -113,12 +113,12 @@ class FlavorService:
     def get_engine_args(self, params: ResolvedConnectionParams) -> dict[str, Any]:  # noqa: ARG002
         return {}
 
-    def create_engine(self, connection_params: ConnectionParams) -> Engine:
+    def create_engine(self, connection_params: ConnectionParams, **engine_args) -> Engine:
         params = resolve_connection_params(connection_params)
         return sqlalchemy_create_engine(
             self.get_connection_string(params),
             connect_args=self.get_connect_args(params),
-            **self.get_engine_args(params),
+            **{**engine_args, **self.get_engine_args(params)},
         )
 
     def get_connection_string(self, params: ResolvedConnectionParams) -> str:
@@ -1,6 +1,5 @@
 import base64
 
-import streamlit_authenticator as stauth
 from Crypto.Cipher import AES
 from Crypto.Protocol.KDF import PBKDF2
 from Crypto.Random import get_random_bytes
@@ -51,5 +50,7 @@ def DecryptText(baEncrypted):
 
 
 def encrypt_ui_password(plain_password):
+    import streamlit_authenticator as stauth
+
     hashed_passwords = stauth.Hasher([plain_password]).generate()
     return hashed_passwords.pop()
@@ -12,8 +12,6 @@ from urllib.request import Request, urlopen
 from testgen import settings
 from testgen.common.models import with_database_session
 from testgen.common.models.settings import PersistedSetting, SettingNotFound
-from testgen.ui.services.database_service import fetch_one_from_db
-from testgen.ui.session import session
 from testgen.utils.singleton import Singleton
 
 LOG = logging.getLogger("testgen")
@@ -54,6 +52,8 @@ class MixpanelService(Singleton):
 
     @safe_method
     def send_event(self, event_name, include_usage=False, **properties):
+        from testgen.ui.session import session
+
         properties.setdefault("instance_id", self.instance_id)
         properties.setdefault("edition", settings.DOCKER_HUB_REPOSITORY)
         properties.setdefault("version", settings.VERSION)
@@ -92,6 +92,8 @@ class MixpanelService(Singleton):
 
     @with_database_session
     def get_usage(self):
+        from testgen.ui.services.database_service import fetch_one_from_db
+
         query = """
         SELECT
             (SELECT COUNT(*) FROM auth_users) AS user_count,
@@ -4,7 +4,6 @@ from typing import Literal, Self
 from urllib.parse import parse_qs, urlparse
 from uuid import UUID, uuid4
 
-import streamlit as st
 from sqlalchemy import (
     BigInteger,
     Boolean,
@@ -20,6 +19,8 @@ from sqlalchemy import (
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import InstrumentedAttribute
 
+from testgen.common.caching import cache_data
+from testgen.common.database.database_service import target_engine_cache
 from testgen.common.database.flavor.flavor_service import SQLFlavor
 from testgen.common.models import get_current_session
 from testgen.common.models.custom_types import JSON_TYPE, EncryptedBytea, EncryptedJson
@@ -69,7 +70,7 @@ class Connection(Entity):
     _minimal_columns = ConnectionMinimal.__annotations__.keys()
 
     @classmethod
-    @st.cache_data(show_spinner=False)
+    @cache_data(show_spinner=False)
     def get_minimal(cls, identifier: int) -> ConnectionMinimal | None:
         result = cls._get_columns(identifier, cls._minimal_columns)
         return ConnectionMinimal(**result) if result else None
@@ -83,7 +84,7 @@ class Connection(Entity):
         return get_current_session().scalars(query).first()
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def select_minimal_where(
         cls, *clauses, order_by: tuple[str | InstrumentedAttribute] = _default_order_by
     ) -> Iterable[ConnectionMinimal]:
@@ -101,6 +102,8 @@ class Connection(Entity):
         if table_groups:
             TableGroup.cascade_delete([item.id for item in table_groups])
         cls.delete_where(cls.connection_id.in_(ids))
+        for connection_id in ids:
+            target_engine_cache.invalidate(connection_id)
 
     def save(self) -> None:
         if self.connect_by_url and self.url:
@@ -127,3 +130,4 @@ class Connection(Entity):
             self.warehouse = extras.get("warehouse") or None
 
         super().save()
+        target_engine_cache.invalidate(self.connection_id)
@@ -3,12 +3,12 @@ from dataclasses import asdict, dataclass, fields
 from typing import Any, Self
 from uuid import UUID
 
-import streamlit as st
 from sqlalchemy import delete, func, select
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql.elements import BinaryExpression, BooleanClauseList
 
+from testgen.common.caching import cache_data
 from testgen.common.models import Base, get_current_session
 from testgen.utils import is_uuid4, make_json_safe
 
@@ -46,7 +46,7 @@ class Entity(Base):
     _default_order_by: tuple[str | InstrumentedAttribute] = ("id",)
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def get(cls, identifier: str | int | UUID, *clauses) -> Self | None:
         """Fetch by primary key, optionally narrowed by extra WHERE clauses.
 
@@ -89,7 +89,7 @@ class Entity(Base):
         return get_current_session().execute(query).mappings().first()
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def select_where(cls, *clauses, order_by: tuple[str | InstrumentedAttribute] | None = None) -> Iterable[Self]:
         order_by = order_by or cls._default_order_by
         query = select(cls).where(*clauses).order_by(*order_by)
@@ -1,13 +1,20 @@
+import json
 import logging
+import threading
+import time
+from collections import Counter
+from collections.abc import Collection, Iterable
 from datetime import UTC, datetime
 from enum import StrEnum
 from typing import Any, Self
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, String, Text, case, func, select, text, update
+from sqlalchemy import BigInteger, Column, String, Text, and_, case, func, or_, select, text, update
 from sqlalchemy.dialects import postgresql
 
-from testgen.common.models import Base, get_current_session
+from testgen import settings
+from testgen.common.models import Base, database_session, get_current_session
+from testgen.common.notification_listener import NotificationListener
 
 LOG = logging.getLogger("testgen")
 
@@ -22,6 +29,8 @@ class JobStatus(StrEnum):
     CANCELED = "canceled"
 
 
+FINAL_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.ERROR, JobStatus.CANCELED})
+
 _VALID_TRANSITIONS: dict[JobStatus, frozenset[JobStatus]] = {
     JobStatus.PENDING: frozenset({JobStatus.CLAIMED, JobStatus.CANCEL_REQUESTED}),
     JobStatus.CLAIMED: frozenset({JobStatus.RUNNING, JobStatus.ERROR, JobStatus.CANCEL_REQUESTED}),
@@ -31,6 +40,10 @@ _VALID_TRANSITIONS: dict[JobStatus, frozenset[JobStatus]] = {
 }
 
 
+# Notified by the job_executions triggers on inserts and status changes, with the id and status as JSON
+JOB_EXECUTIONS_CHANNEL = f"{settings.DATABASE_SCHEMA}_job_executions"
+
+
 class JobExecution(Base):
     __tablename__ = "job_executions"
 
@@ -44,6 +57,8 @@ class JobExecution(Base):
     status: str = Column(String(20), nullable=False, default=JobStatus.PENDING, server_default=text("'pending'"))
     project_code: str = Column(String(30), nullable=False)
     job_schedule_id: UUID | None = Column(postgresql.UUID(as_uuid=True), nullable=True)
+    # Connection of the table group or test suite the job runs on, for the concurrency limit per connection
+    connection_id: int | None = Column(BigInteger, nullable=True)
     error_message: str | None = Column(Text, nullable=True)
     created_at: datetime = Column(postgresql.TIMESTAMP(timezone=True), nullable=False, server_default=text("NOW()"))
     claimed_at: datetime | None = Column(postgresql.TIMESTAMP(timezone=True), nullable=True)
@@ -67,39 +82,107 @@ class JobExecution(Base):
             source=source,
             project_code=project_code,
             job_schedule_id=job_schedule_id,
+            connection_id=cls._get_connection_id(kwargs),
         )
         session.add(job_exec)
         session.flush([job_exec])
         LOG.info("Submitted job execution %s: job_key=%s, source=%s", job_exec.id, job_key, source)
         return job_exec
 
+    @staticmethod
+    def _get_connection_id(kwargs: dict[str, Any]) -> int | None:
+        session = get_current_session()
+        if table_group_id := kwargs.get("table_group_id"):
+            return session.scalar(
+                text("SELECT connection_id FROM table_groups WHERE id = :id"), {"id": str(table_group_id)}
+            )
+        if test_suite_id := kwargs.get("test_suite_id"):
+            return session.scalar(
+                text("SELECT connection_id FROM test_suites WHERE id = :id"), {"id": str(test_suite_id)}
+            )
+        return None
+
+    @classmethod
+    def _is_active(cls):
+        """Condition for the job executions that are claimed or running, and count towards the concurrency limits."""
+        return or_(
+            cls.status.in_([JobStatus.CLAIMED, JobStatus.RUNNING]),
+            and_(cls.status == JobStatus.CANCEL_REQUESTED, cls.claimed_at.is_not(None)),
+        )
+
     @classmethod
     def claim_actionable(cls, limit: int = 5) -> list[Self]:
-        """Claim pending rows and fetch cancel_requested rows in one query.
+        """Claim pending rows and fetch cancel_requested rows.
 
-        Pending rows are transitioned to claimed. Cancel_requested rows
-        are returned as-is for the scheduler to act on.
+        Up to `limit` pending rows are transitioned to claimed, within the limits of concurrent jobs overall
+        (JOB_MAX_RUNNING), per project and per connection. Projects with fewer active jobs claim first, then the
+        oldest rows. Cancel_requested rows are returned as-is for the scheduler to act on.
         Uses SELECT FOR UPDATE SKIP LOCKED to prevent concurrent processing.
         """
         session = get_current_session()
-        query = (
+        # Serialize the claims of concurrent schedulers, so that they count each other's claimed jobs
+        session.execute(text("SELECT pg_advisory_xact_lock(hashtext('job_executions_claim'));"))
+
+        cancel_requested = session.scalars(
             select(cls)
-            .where(cls.status.in_([JobStatus.PENDING, JobStatus.CANCEL_REQUESTED]))
+            .where(cls.status == JobStatus.CANCEL_REQUESTED)
             .order_by(cls.created_at)
             .with_for_update(skip_locked=True)
             .limit(limit)
+        ).all()
+
+        # The oldest pending rows of each project and connection are candidates, so that the rows blocked by the
+        # limit of one connection do not hide the rows of other connections or projects
+        ranked = (
+            select(
+                cls.id,
+                func.row_number().over(
+                    partition_by=(cls.project_code, cls.connection_id), order_by=cls.created_at,
+                ).label("position"),
+            )
+            .where(cls.status == JobStatus.PENDING)
+            .subquery()
+        )
+        candidates = session.scalars(
+            select(cls)
+            .where(cls.id.in_(select(ranked.c.id).where(ranked.c.position <= limit)))
+            .order_by(cls.created_at)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        active_counts = session.execute(
+            select(cls.project_code, cls.connection_id, func.count())
+            .where(cls._is_active())
+            .group_by(cls.project_code, cls.connection_id)
+        ).all() if candidates else []
+
+        rows = _select_fair(
+            candidates,
+            active_counts,
+            limit,
+            max_running=settings.JOB_MAX_RUNNING,
+            max_running_per_project=settings.JOB_MAX_RUNNING_PER_PROJECT,
+            max_running_per_connection=settings.JOB_MAX_RUNNING_PER_CONNECTION,
         )
-        rows = session.scalars(query).all()
         now = datetime.now(UTC)
-        claimed = 0
         for row in rows:
-            if row.status == JobStatus.PENDING:
-                row.status = JobStatus.CLAIMED.value
-                row.claimed_at = now
-                claimed += 1
-        if claimed:
-            LOG.info("Claimed %d pending job execution(s)", claimed)
-        return rows
+            row.status = JobStatus.CLAIMED.value
+            row.claimed_at = now
+        if rows:
+            LOG.info("Claimed %d of %d pending job execution(s)", len(rows), len(candidates))
+        return [*rows, *cancel_requested]
+
+    @classmethod
+    def get_queue_state(cls, project_code: str) -> tuple[int, int]:
+        """Return the numbers of pending and active job executions of a project."""
+        session = get_current_session()
+        pending, active = session.execute(
+            select(
+                func.count().filter(cls.status == JobStatus.PENDING),
+                func.count().filter(cls._is_active()),
+            ).where(cls.project_code == project_code)
+        ).one()
+        return pending, active
 
     @classmethod
     def find_stale(cls) -> list[Self]:
@@ -189,3 +272,154 @@ class JobExecution(Base):
     def mark_interrupted(self, error_message: str) -> bool:
         """Mark as ERROR, or CANCELED if a cancellation was requested concurrently."""
         return self._transition(JobStatus.ERROR, JobStatus.CANCELED, completed_at=datetime.now(UTC), error_message=error_message)
+
+
+def _select_fair(
+    candidates: list[JobExecution],
+    active_counts: list[tuple[str, int | None, int]],
+    limit: int,
+    max_running: int,
+    max_running_per_project: int,
+    max_running_per_connection: int,
+) -> list[JobExecution]:
+    """Select the pending job executions to claim, given the numbers of active ones by project and connection.
+
+    Each job goes to the project with the fewest active jobs, among the jobs within the limits (0 is unlimited).
+    """
+    total = 0
+    by_project = Counter()
+    by_connection = Counter()
+    for project_code, connection_id, count in active_counts:
+        total += count
+        by_project[project_code] += count
+        if connection_id is not None:
+            by_connection[connection_id] += count
+
+    def is_allowed(job_exec: JobExecution) -> bool:
+        return (
+            (not max_running_per_project or by_project[job_exec.project_code] < max_running_per_project)
+            and (
+                job_exec.connection_id is None
+                or not max_running_per_connection
+                or by_connection[job_exec.connection_id] < max_running_per_connection
+            )
+        )
+
+    remaining = sorted(candidates, key=lambda job_exec: job_exec.created_at)
+    selected = []
+    while len(selected) < limit and (not max_running or total < max_running):
+        allowed = [job_exec for job_exec in remaining if is_allowed(job_exec)]
+        if not allowed:
+            break
+        # min() keeps the oldest job of the project with the fewest active jobs
+        job_exec = min(allowed, key=lambda job_exec: by_project[job_exec.project_code])
+        remaining.remove(job_exec)
+        selected.append(job_exec)
+        total += 1
+        by_project[job_exec.project_code] += 1
+        if job_exec.connection_id is not None:
+            by_connection[job_exec.connection_id] += 1
+    return selected
+
+
+def _parse_job_notification(payload: str) -> list[tuple[UUID, str]]:
+    notification = json.loads(payload)
+    return [(UUID(notification["id"]), notification["status"])]
+
+
+class JobExecutionListener(NotificationListener[tuple[UUID, str]]):
+    """Receives the ids and new statuses of job executions, notified when they are submitted or change status."""
+
+    def __init__(self):
+        super().__init__(JOB_EXECUTIONS_CHANNEL, _parse_job_notification)
+
+
+# Seconds between the checks of the shared listener for remaining waiters, after which it stops listening
+WAITERS_CHECK_INTERVAL = 1
+
+_waiters_lock = threading.Lock()
+_waiters: dict[UUID, set[threading.Event]] = {}
+_waiters_thread: threading.Thread | None = None
+
+
+def wait_for_job_status(
+    job_execution_id: UUID,
+    statuses: Collection[JobStatus],
+    timeout: float | None = None,
+) -> JobExecution | None:
+    """Block until a job execution has one of the statuses, or the timeout expires.
+
+    Wakes up on the notifications of the job execution, received by one listener shared by the waiting threads of
+    the process, and otherwise rereads it every JOB_POLL_INTERVAL seconds, so that it keeps working if notifications
+    cannot be received. Returns the job execution as last read, or None if it does not exist. Manages its own
+    sessions, unless called within one.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    notified = _add_waiter(job_execution_id)
+    try:
+        while True:
+            # Cleared before reading, so that a notification sent after the read is not missed
+            notified.clear()
+            with database_session():
+                job_exec = get_current_session().get(JobExecution, job_execution_id, populate_existing=True)
+            if job_exec is None or job_exec.status in statuses:
+                return job_exec
+
+            poll_end = time.monotonic() + settings.JOB_POLL_INTERVAL
+            if deadline is not None:
+                poll_end = min(poll_end, deadline)
+                if poll_end <= time.monotonic():
+                    return job_exec
+
+            notified.wait(max(poll_end - time.monotonic(), 0))
+    finally:
+        _remove_waiter(job_execution_id, notified)
+
+
+def _add_waiter(job_execution_id: UUID) -> threading.Event:
+    global _waiters_thread
+    event = threading.Event()
+    with _waiters_lock:
+        _waiters.setdefault(job_execution_id, set()).add(event)
+        if _waiters_thread is None:
+            _waiters_thread = threading.Thread(target=_notify_waiters, name="job-execution-listener", daemon=True)
+            _waiters_thread.start()
+    return event
+
+
+def _remove_waiter(job_execution_id: UUID, event: threading.Event) -> None:
+    with _waiters_lock:
+        events = _waiters.get(job_execution_id, set())
+        events.discard(event)
+        if not events:
+            _waiters.pop(job_execution_id, None)
+
+
+def _wake_waiters(job_execution_ids: Iterable[UUID] | None = None) -> None:
+    with _waiters_lock:
+        for job_execution_id in _waiters if job_execution_ids is None else job_execution_ids:
+            for event in _waiters.get(job_execution_id, ()):
+                event.set()
+
+
+def _notify_waiters() -> None:
+    """Wakes the waiters of the notified job executions, holding one listener connection while there are any."""
+    global _waiters_thread
+    listener = JobExecutionListener()
+    try:
+        while True:
+            with _waiters_lock:
+                if not _waiters:
+                    _waiters_thread = None
+                    return
+            try:
+                if listener.listen():
+                    # Status changes may have been missed while not listening
+                    _wake_waiters()
+                if notifications := listener.wait(WAITERS_CHECK_INTERVAL):
+                    _wake_waiters({job_id for job_id, _ in notifications})
+            except Exception:
+                LOG.debug("Job execution notifications unavailable, waiters are polling instead", exc_info=True)
+                time.sleep(WAITERS_CHECK_INTERVAL)
+    finally:
+        listener.close()
@@ -4,13 +4,13 @@ from datetime import UTC, datetime
 from typing import ClassVar, Literal, NamedTuple, Self, TypedDict
 from uuid import UUID, uuid4
 
-import streamlit as st
 from sqlalchemy import BigInteger, Column, Float, Integer, String, desc, func, select, text, update
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.sql.expression import case
 
+from testgen.common.caching import cache_data
 from testgen.common.models import get_current_session
 from testgen.common.models.connection import Connection
 from testgen.common.models.entity import ENTITY_HASH_FUNCS, Entity, EntityMinimal
@@ -135,7 +135,7 @@ class ProfilingRun(Entity):
         return get_current_session().scalars(query).first()
 
     @classmethod
-    @st.cache_data(show_spinner=False)
+    @cache_data(show_spinner=False)
     def get_minimal(cls, run_id: str | UUID) -> ProfilingRunMinimal | None:
         if not is_uuid4(run_id):
             return None
@@ -180,7 +180,7 @@ class ProfilingRun(Entity):
         return get_current_session().scalar(query)
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def select_minimal_where(
         cls, *clauses, order_by: tuple[str | InstrumentedAttribute] = _default_order_by
     ) -> Iterable[ProfilingRunMinimal]:
@@ -307,6 +307,12 @@ class ProfilingRun(Entity):
         DELETE FROM profile_results
         WHERE profile_run_id IN :profiling_run_ids;
 
+        DELETE FROM score_profiling_column_facts
+        WHERE profile_run_id IN :profiling_run_ids;
+
+        DELETE FROM score_profiling_dimension_facts
+        WHERE profile_run_id IN :profiling_run_ids;
+
         DELETE FROM job_executions
         WHERE id IN (
             SELECT job_execution_id FROM profiling_runs
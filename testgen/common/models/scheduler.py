@@ -3,12 +3,12 @@ from datetime import datetime
 from typing import Any, Self
 from uuid import UUID, uuid4
 
-import streamlit as st
 from cron_converter import Cron
 from sqlalchemy import Boolean, Column, String, cast, delete, func, select, update
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import InstrumentedAttribute
 
+from testgen.common.caching import cache_data
 from testgen.common.models import Base, get_current_session
 from testgen.common.models.entity import ENTITY_HASH_FUNCS
 from testgen.common.models.test_definition import TestDefinition
@@ -33,7 +33,7 @@ class JobSchedule(Base):
     active: bool = Column(Boolean, default=True)
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def get(cls, *clauses) -> Self | None:
         query = select(cls).where(*clauses)
         return get_current_session().scalars(query).first()
@@ -203,6 +203,12 @@ class ScoreDefinition(Base):
         db_session.add(self)
         db_session.delete(self)
 
+    def depends_on_table_group(self, table_groups_name: str) -> bool:
+        if not self.criteria:
+            return True
+        names = self.criteria.get_table_groups_names()
+        return names is None or table_groups_name in names
+
     def clear_results(self) -> None:
         db_session = get_current_session()
 
@@ -575,6 +581,33 @@ class ScoreDefinitionCriteria(Base):
     def has_filters(self) -> bool:
         return len(self.filters) > 0
 
+    def get_table_groups_names(self) -> set[str] | None:
+        """
+        Resolve the names of the table groups that the filters can
+        match, following the same grouping rules as :meth:`get_as_sql`.
+
+        Returns None when the filters can match any table group.
+        """
+        if not self.filters:
+            return None
+
+        def _union(names_list: list[set[str] | None]) -> set[str] | None:
+            if any(names is None for names in names_list):
+                return None
+            return set().union(*names_list)
+
+        def _intersection(names_list: list[set[str] | None]) -> set[str] | None:
+            restricted = [names for names in names_list if names is not None]
+            return set.intersection(*restricted) if restricted else None
+
+        if self.group_by_field:
+            grouped_filters = groupby(sorted(self.filters, key=lambda f: f.field), key=lambda f: f.field)
+            names_list = [_union([f.get_table_groups_names() for f in field_filters]) for _, field_filters in grouped_filters]
+        else:
+            names_list = [f.get_table_groups_names() for f in self.filters]
+
+        return _intersection(names_list) if self.operand == "AND" else _union(names_list)
+
     @classmethod
     def from_filters(cls, filters: list[dict], group_by_field: bool = True) -> ScoreDefinitionCriteria:
         chained_filters: list[ScoreDefinitionFilter] = []
@@ -632,6 +665,13 @@ class ScoreDefinitionFilter(Base):
         sql_filters = [f"{prefix or ''}{f.field} = '{f.value}'" for f in self]
         return f"({f' {operand} '.join(sql_filters)})"
 
+    def get_table_groups_names(self) -> set[str] | None:
+        names = {f.value for f in self if f.field == "table_groups_name"}
+        if not names:
+            return None
+        # Linked filters are joined with AND, so conflicting names never match
+        return names if len(names) == 1 else set()
+
 
 class ScoreDefinitionResult(Base):
     __tablename__ = "score_definition_results"
@@ -3,11 +3,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID, uuid4
 
-import streamlit as st
 from sqlalchemy import BigInteger, Boolean, Column, Float, ForeignKey, Integer, String, asc, func, text, update
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import InstrumentedAttribute
 
+from testgen.common.caching import cache_data
 from testgen.common.models import get_current_session
 from testgen.common.models.custom_types import NullIfEmptyString, YNString
 from testgen.common.models.entity import ENTITY_HASH_FUNCS, Entity, EntityMinimal
@@ -123,6 +123,8 @@ class TableGroup(Entity):
     profile_exclude_xde: bool = Column(Boolean, default=True)
     profile_do_pair_rules: bool = Column(YNString, default="N")
     profile_pair_rule_pct: int = Column(Integer, default=95)
+    row_count_strategy: str = Column(String, default="exact")
+    row_count_change_pct: int = Column(Integer, default=10)
     include_in_dashboard: bool = Column(Boolean, default=True)
     description: str = Column(NullIfEmptyString)
     data_source: str = Column(NullIfEmptyString)
@@ -151,13 +153,13 @@ class TableGroup(Entity):
     )
 
     @classmethod
-    @st.cache_data(show_spinner=False)
+    @cache_data(show_spinner=False)
     def get_minimal(cls, id_: str | UUID) -> TableGroupMinimal | None:
         result = cls._get_columns(id_, cls._minimal_columns)
         return TableGroupMinimal(**result) if result else None
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def select_minimal_where(
         cls, *clauses, order_by: tuple[str | InstrumentedAttribute] = _default_order_by
     ) -> Iterable[TableGroupMinimal]:
@@ -418,6 +420,12 @@ class TableGroup(Entity):
         USING table_groups tg
         WHERE tg.id = pr.table_groups_id AND tg.id IN :table_group_ids;
 
+        DELETE FROM score_profiling_column_facts
+        WHERE table_groups_id IN :table_group_ids;
+
+        DELETE FROM score_profiling_dimension_facts
+        WHERE table_groups_id IN :table_group_ids;
+
         DELETE FROM job_executions
         WHERE id IN (
             SELECT pr.job_execution_id FROM profiling_runs pr
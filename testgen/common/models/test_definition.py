@@ -5,7 +5,6 @@ from itertools import zip_longest
 from typing import ClassVar, Literal
 from uuid import UUID, uuid4
 
-import streamlit as st
 from sqlalchemy import (
     Boolean,
     Column,
@@ -25,6 +24,7 @@ from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql.expression import case, literal
 
+from testgen.common.caching import cache_data
 from testgen.common.models import Base, get_current_session
 from testgen.common.models.custom_types import NullIfEmptyString, YNString, ZeroIfEmptyInteger
 from testgen.common.models.entity import ENTITY_HASH_FUNCS, Entity, EntityMinimal
@@ -290,7 +290,7 @@ class TestDefinition(Entity):
     )
 
     @classmethod
-    @st.cache_data(show_spinner=False)
+    @cache_data(show_spinner=False)
     def get(cls, identifier: str | UUID) -> TestDefinitionSummary | None:
         if not is_uuid4(identifier):
             return None
@@ -329,7 +329,7 @@ class TestDefinition(Entity):
         return TestDefinitionSummary(**result) if result else None
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def select_where(
         cls, *clauses, order_by: tuple[str | InstrumentedAttribute] = _default_order_by
     ) -> Iterable[TestDefinitionSummary]:
@@ -343,7 +343,7 @@ class TestDefinition(Entity):
         return [TestDefinitionSummary(**row) for row in results]
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def select_minimal_where(
         cls, *clauses, order_by: tuple[str | InstrumentedAttribute] = _default_order_by
     ) -> Iterable[TestDefinitionMinimal]:
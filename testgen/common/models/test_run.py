@@ -3,12 +3,12 @@ from datetime import UTC, datetime
 from typing import ClassVar, Literal, NamedTuple, Self, TypedDict
 from uuid import UUID, uuid4
 
-import streamlit as st
 from sqlalchemy import BigInteger, Column, Float, ForeignKey, Integer, String, Text, desc, func, select, text, update
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.sql.expression import case
 
+from testgen.common.caching import cache_data
 from testgen.common.models import get_current_session
 from testgen.common.models.connection import Connection
 from testgen.common.models.entity import Entity, EntityMinimal
@@ -159,7 +159,7 @@ class TestRun(Entity):
         return {row.id: row.job_execution_id for row in rows}
 
     @classmethod
-    @st.cache_data(show_spinner=False)
+    @cache_data(show_spinner=False)
     def get_minimal(cls, run_id: str | UUID) -> TestRunMinimal | None:
         if not is_uuid4(run_id):
             return None
@@ -383,6 +383,12 @@ class TestRun(Entity):
         DELETE FROM test_results
         WHERE test_run_id IN :test_run_ids;
 
+        DELETE FROM score_test_column_facts
+        WHERE test_run_id IN :test_run_ids;
+
+        DELETE FROM score_test_dimension_facts
+        WHERE test_run_id IN :test_run_ids;
+
         DELETE FROM job_executions
         WHERE id IN (
             SELECT job_execution_id FROM test_runs
@@ -4,11 +4,11 @@ from dataclasses import dataclass
 from datetime import datetime
 from uuid import UUID, uuid4
 
-import streamlit as st
 from sqlalchemy import BigInteger, Boolean, Column, Enum, ForeignKey, Integer, String, asc, func, select, text
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import InstrumentedAttribute
 
+from testgen.common.caching import cache_data
 from testgen.common.models import get_current_session
 from testgen.common.models.custom_types import NullIfEmptyString, YNString
 from testgen.common.models.entity import ENTITY_HASH_FUNCS, Entity, EntityMinimal
@@ -94,13 +94,13 @@ class TestSuite(Entity):
 
 
     @classmethod
-    @st.cache_data(show_spinner=False)
+    @cache_data(show_spinner=False)
     def get_minimal(cls, identifier: int) -> TestSuiteMinimal | None:
         result = cls._get_columns(identifier, cls._minimal_columns)
         return TestSuiteMinimal(**result) if result else None
 
     @classmethod
-    @st.cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
+    @cache_data(show_spinner=False, hash_funcs=ENTITY_HASH_FUNCS)
     def select_minimal_where(
         cls, *clauses, order_by: tuple[str | InstrumentedAttribute] = _default_order_by
     ) -> Iterable[TestSuiteMinimal]:
@@ -242,6 +242,12 @@ class TestSuite(Entity):
         DELETE FROM test_results
         WHERE test_suite_id IN :test_suite_ids;
 
+        DELETE FROM score_test_column_facts
+        WHERE test_suite_id IN :test_suite_ids;
+
+        DELETE FROM score_test_dimension_facts
+        WHERE test_suite_id IN :test_suite_ids;
+
         DELETE FROM test_definitions
         WHERE test_suite_id IN :test_suite_ids;
 
@@ -2,10 +2,10 @@ from datetime import UTC, datetime
 from typing import Self
 from uuid import UUID, uuid4
 
-import streamlit as st
 from sqlalchemy import Boolean, Column, String, asc, func, select, update
 from sqlalchemy.dialects import postgresql
 
+from testgen.common.caching import cache_data
 from testgen.common.models import get_current_session
 from testgen.common.models.custom_types import NullIfEmptyString
 from testgen.common.models.entity import Entity
@@ -42,7 +42,7 @@ class User(Entity):
             super().save()
 
     @classmethod
-    @st.cache_data(show_spinner=False)
+    @cache_data(show_spinner=False)
     def get(cls, identifier: str) -> Self | None:
         query = select(cls).where(func.lower(User.username) == func.lower(identifier))
         return get_current_session().scalars(query).first()
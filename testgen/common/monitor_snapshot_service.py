@@ -0,0 +1,204 @@
+"""Per-table monitor summaries of a monitor suite.
+
+The summaries are computed from the results of the runs within the suite's lookback window
+and stored in monitor_table_snapshots, so that the monitors dashboard reads them instead of
+aggregating the run history on every render. They are refreshed when the monitors run and
+when the lookback or the monitored tables change.
+"""
+from uuid import UUID
+
+from sqlalchemy import text
+
+from testgen.common.models import get_current_session
+
+SNAPSHOT_COLUMNS = [
+    "lookback",
+    "freshness_anomalies",
+    "volume_anomalies",
+    "schema_anomalies",
+    "metric_anomalies",
+    "latest_update",
+    "row_count",
+    "column_adds",
+    "column_drops",
+    "column_mods",
+    "freshness_error_message",
+    "volume_error_message",
+    "schema_error_message",
+    "metric_error_message",
+    "freshness_is_training",
+    "volume_is_training",
+    "metric_is_training",
+    "freshness_is_pending",
+    "volume_is_pending",
+    "schema_is_pending",
+    "metric_is_pending",
+    "table_state",
+    "lookback_start",
+    "lookback_end",
+    "previous_row_count",
+]
+
+
+def refresh_monitor_table_snapshots(test_suite_id: str | UUID) -> None:
+    """Recompute the per-table summaries of a monitor suite, replacing the previous ones."""
+    query = f"""
+    -- Lock the test suite so that concurrent refreshes of the same suite do not interleave
+    SELECT id FROM test_suites WHERE id = :test_suite_id FOR UPDATE;
+
+    DELETE FROM monitor_table_snapshots
+    WHERE test_suite_id = :test_suite_id;
+
+    INSERT INTO monitor_table_snapshots (test_suite_id, table_groups_id, table_name, {", ".join(SNAPSHOT_COLUMNS)})
+    WITH ranked_test_runs AS (
+        SELECT
+            test_runs.id,
+            test_runs.test_starttime,
+            COALESCE(test_suites.monitor_lookback, 1) AS lookback,
+            ROW_NUMBER() OVER (PARTITION BY test_runs.test_suite_id ORDER BY test_runs.test_starttime DESC) AS position
+        FROM test_suites
+        INNER JOIN test_runs
+            ON (test_runs.test_suite_id = test_suites.id)
+        WHERE test_suites.id = :test_suite_id
+    ),
+    lookback_window AS (
+        SELECT MIN(test_starttime) AS lookback_start
+        FROM ranked_test_runs
+        WHERE position <= lookback
+    ),
+    latest_tables AS (
+        SELECT DISTINCT
+            table_chars.schema_name,
+            table_chars.table_name
+        FROM test_suites
+        INNER JOIN data_table_chars table_chars
+            ON (table_chars.table_groups_id = test_suites.table_groups_id)
+        CROSS JOIN lookback_window
+        WHERE test_suites.id = :test_suite_id
+            -- Include current tables and tables dropped within lookback window
+            AND (table_chars.drop_date IS NULL OR table_chars.drop_date >= lookback_window.lookback_start)
+    ),
+    monitor_results AS (
+        SELECT
+            latest_tables.table_name,
+            results.test_time,
+            results.test_type,
+            results.result_code,
+            ranked_test_runs.lookback,
+            ranked_test_runs.position,
+            ranked_test_runs.test_starttime,
+            -- result_code = -1 indicates training mode
+            CASE WHEN results.result_code = -1 THEN 1 ELSE 0 END AS is_training,
+            CASE WHEN results.test_type = 'Freshness_Trend' AND results.result_code = 0 THEN 1 ELSE 0 END AS freshness_anomaly,
+            CASE WHEN results.test_type = 'Volume_Trend' AND results.result_code = 0 THEN 1 ELSE 0 END AS volume_anomaly,
+            CASE WHEN results.test_type = 'Schema_Drift' AND results.result_code = 0 THEN 1 ELSE 0 END AS schema_anomaly,
+            CASE WHEN results.test_type = 'Metric_Trend' AND results.result_code = 0 THEN 1 ELSE 0 END AS metric_anomaly,
+            CASE WHEN results.test_type = 'Freshness_Trend' THEN results.result_signal ELSE NULL END AS freshness_interval,
+            CASE WHEN results.test_type = 'Volume_Trend' THEN results.result_signal::BIGINT ELSE NULL END AS row_count,
+            CASE WHEN results.test_type = 'Schema_Drift' THEN SPLIT_PART(results.result_signal, '|', 1) ELSE NULL END AS table_change,
+            CASE WHEN results.test_type = 'Schema_Drift' THEN NULLIF(SPLIT_PART(results.result_signal, '|', 2), '')::INT ELSE 0 END AS col_adds,
+            CASE WHEN results.test_type = 'Schema_Drift' THEN NULLIF(SPLIT_PART(results.result_signal, '|', 3), '')::INT ELSE 0 END AS col_drops,
+            CASE WHEN results.test_type = 'Schema_Drift' THEN NULLIF(SPLIT_PART(results.result_signal, '|', 4), '')::INT ELSE 0 END AS col_mods,
+            CASE WHEN results.result_status = 'Error' THEN results.result_message ELSE NULL END AS error_message
+        FROM latest_tables
+        LEFT JOIN ranked_test_runs ON TRUE
+        LEFT JOIN test_results AS results
+            ON results.test_run_id = ranked_test_runs.id
+            AND results.table_name = latest_tables.table_name
+        WHERE ranked_test_runs.position IS NULL
+            -- Also capture 1 run before the lookback to get baseline results
+            OR ranked_test_runs.position <= ranked_test_runs.lookback + 1
+    ),
+    monitor_tables AS (
+        SELECT
+            table_name,
+            MAX(lookback) AS lookback,
+            SUM(freshness_anomaly) AS freshness_anomalies,
+            SUM(volume_anomaly) AS volume_anomalies,
+            SUM(schema_anomaly) AS schema_anomalies,
+            SUM(metric_anomaly) AS metric_anomalies,
+            MAX(test_time - (COALESCE(NULLIF(freshness_interval, 'Unknown')::INTEGER, 0) * INTERVAL '1 minute'))
+                FILTER (WHERE test_type = 'Freshness_Trend' AND position = 1) AS latest_update,
+            MAX(row_count) FILTER (WHERE position = 1) AS row_count,
+            SUM(col_adds) AS column_adds,
+            SUM(col_drops) AS column_drops,
+            SUM(col_mods) AS column_mods,
+            MAX(error_message) FILTER (WHERE test_type = 'Freshness_Trend' AND position = 1) AS freshness_error_message,
+            MAX(error_message) FILTER (WHERE test_type = 'Volume_Trend' AND position = 1) AS volume_error_message,
+            MAX(error_message) FILTER (WHERE test_type = 'Schema_Drift' AND position = 1) AS schema_error_message,
+            MAX(error_message) FILTER (WHERE test_type = 'Metric_Trend' AND position = 1) AS metric_error_message,
+            BOOL_OR(is_training = 1) FILTER (WHERE test_type = 'Freshness_Trend' AND position = 1) AS freshness_is_training,
+            BOOL_OR(is_training = 1) FILTER (WHERE test_type = 'Volume_Trend' AND position = 1) AS volume_is_training,
+            BOOL_OR(is_training = 1) FILTER (WHERE test_type = 'Metric_Trend' AND position = 1) AS metric_is_training,
+            BOOL_OR(test_type = 'Freshness_Trend') IS NOT TRUE AS freshness_is_pending,
+            BOOL_OR(test_type = 'Volume_Trend') IS NOT TRUE AS volume_is_pending,
+            -- Schema monitor only creates results on schema changes (Failed)
+            -- Mark it as pending only if there are no results of any test type
+            BOOL_OR(test_time IS NOT NULL) IS NOT TRUE AS schema_is_pending,
+            BOOL_OR(test_type = 'Metric_Trend') IS NOT TRUE AS metric_is_pending,
+            CASE
+                -- Mark as Dropped if latest Schema Drift result for the table indicates it was dropped
+                WHEN (ARRAY_AGG(table_change ORDER BY test_time DESC) FILTER (WHERE table_change IS NOT NULL))[1] = 'D'
+                    THEN 'dropped'
+                -- Only mark as Added if latest change does not indicate a drop
+                WHEN MAX(CASE WHEN table_change = 'A' THEN 1 ELSE 0 END) = 1
+                    THEN 'added'
+                WHEN SUM(schema_anomaly) > 0
+                    THEN 'modified'
+                ELSE NULL
+            END AS table_state
+        FROM monitor_results
+        -- Only aggregate within lookback runs
+        WHERE position IS NULL OR position <= COALESCE(lookback, 1)
+        GROUP BY table_name
+    ),
+    table_bounds AS (
+        SELECT
+            table_name,
+            MIN(position) AS min_position,
+            MAX(position) AS max_position
+        FROM monitor_results
+        WHERE position IS NOT NULL
+        GROUP BY table_name
+    ),
+    baseline_tables AS (
+        SELECT
+            monitor_results.table_name,
+            MIN(monitor_results.test_starttime) FILTER (
+                WHERE monitor_results.position = LEAST(monitor_results.lookback + 1, table_bounds.max_position)
+            ) AS lookback_start,
+            MAX(monitor_results.test_starttime) FILTER (
+                WHERE monitor_results.position = GREATEST(1, table_bounds.min_position)
+            ) AS lookback_end,
+            MAX(monitor_results.row_count) FILTER (
+                WHERE monitor_results.test_type = 'Volume_Trend'
+                AND monitor_results.position = LEAST(monitor_results.lookback + 1, table_bounds.max_position)
+            ) AS previous_row_count
+        FROM monitor_results
+        JOIN table_bounds ON monitor_results.table_name = table_bounds.table_name
+        GROUP BY monitor_results.table_name
+    )
+    SELECT
+        test_suites.id,
+        test_suites.table_groups_id,
+        monitor_tables.table_name,
+        {", ".join(
+            f"baseline_tables.{column}" if column in ("lookback_start", "lookback_end", "previous_row_count")
+            else f"monitor_tables.{column}"
+            for column in SNAPSHOT_COLUMNS
+        )}
+    FROM monitor_tables
+    INNER JOIN test_suites ON (test_suites.id = :test_suite_id)
+    LEFT JOIN baseline_tables ON monitor_tables.table_name = baseline_tables.table_name;
+    """
+    session = get_current_session()
+    session.execute(text(query), {"test_suite_id": str(test_suite_id)})
+    session.commit()
+
+
+def has_monitor_table_snapshots(test_suite_id: str | UUID) -> bool:
+    session = get_current_session()
+    return bool(session.execute(
+        text("SELECT EXISTS (SELECT 1 FROM monitor_table_snapshots WHERE test_suite_id = :test_suite_id);"),
+        {"test_suite_id": str(test_suite_id)},
+    ).scalar())
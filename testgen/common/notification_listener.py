@@ -0,0 +1,74 @@
+"""Listening to the notification channels of the app database.
+
+Processes announce changes with `pg_notify` on a channel, and the listeners of the other processes
+wait on a dedicated connection for the notifications, parsed from their payloads.
+"""
+import logging
+import select as select_module
+from collections.abc import Callable, Iterable
+from typing import Generic, TypeVar
+
+from testgen.common import models
+
+LOG = logging.getLogger("testgen")
+
+T = TypeVar("T")
+
+
+class NotificationListener(Generic[T]):
+    """Receives the notifications sent on a channel of the app database.
+
+    Holds a dedicated app database connection outside of the pool while listening.
+    """
+
+    def __init__(self, channel: str, parse_payload: Callable[[str], Iterable[T]]):
+        self._channel = channel
+        self._parse_payload = parse_payload
+        self._connection = None
+
+    def listen(self) -> bool:
+        """Start listening if not already, and return whether it was started now.
+
+        Notifications sent before listening started are not received.
+        """
+        if self._connection is not None:
+            return False
+        connection = models.engine.raw_connection()
+        # Detach so that the connection is closed instead of returned to the pool with a LISTEN on it
+        connection.detach()
+        try:
+            connection.dbapi_connection.autocommit = True
+            with connection.dbapi_connection.cursor() as cursor:
+                cursor.execute(f'LISTEN "{self._channel}"')
+        except Exception:
+            connection.close()
+            raise
+        self._connection = connection.dbapi_connection
+        return True
+
+    def wait(self, timeout: float) -> list[T]:
+        """Block until notifications are received or the timeout expires, and return their parsed payloads.
+
+        Listening is started if needed, and stopped if the connection fails, before raising the error.
+        """
+        self.listen()
+        try:
+            if not self._connection.notifies:
+                select_module.select([self._connection], [], [], timeout)
+            self._connection.poll()
+        except Exception:
+            self.close()
+            raise
+
+        notifications = []
+        while self._connection.notifies:
+            notifications.extend(self._parse_payload(self._connection.notifies.pop(0).payload))
+        return notifications
+
+    def close(self) -> None:
+        if self._connection is not None:
+            try:
+                self._connection.close()
+            except Exception:
+                LOG.debug("Error closing listener of channel %s", self._channel, exc_info=True)
+            self._connection = None
@@ -1,3 +1,4 @@
+import contextlib
 import functools
 import inspect
 import logging
@@ -5,11 +6,11 @@ import operator
 import re
 import smtplib
 import ssl
-from collections.abc import Mapping
+import threading
+from collections.abc import Callable, Iterator, Mapping
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-
-from pybars import Compiler
+from typing import ClassVar
 
 from testgen import settings
 
@@ -32,9 +33,81 @@ class EmailTemplateException(Exception):
     pass
 
 
+class SMTPSession:
+    """
+    SMTP connection shared by the emails sent within a batch.
+
+    The connection is opened and authenticated on the first email sent, and
+    reopened once if the server dropped it in between.
+    """
+
+    def __init__(self):
+        self._server: smtplib.SMTP_SSL | None = None
+
+    def _connect(self) -> smtplib.SMTP_SSL:
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+        server = smtplib.SMTP_SSL(settings.SMTP_ENDPOINT, settings.SMTP_PORT, context=ssl_context)
+        try:
+            server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def sendmail(self, recipients: list[str], message: str) -> dict:
+        if self._server is None:
+            self._server = self._connect()
+        try:
+            return self._server.sendmail(settings.EMAIL_FROM_ADDRESS, recipients, message)
+        except smtplib.SMTPServerDisconnected:
+            self._server = self._connect()
+            return self._server.sendmail(settings.EMAIL_FROM_ADDRESS, recipients, message)
+
+    def close(self) -> None:
+        if self._server is not None:
+            with contextlib.suppress(smtplib.SMTPException, OSError):
+                self._server.quit()
+            self._server = None
+
+
+_current_smtp_session = threading.local()
+
+
+@contextlib.contextmanager
+def smtp_session() -> Iterator[SMTPSession]:
+    """Provide a thread-local SMTP session reused by all the emails sent within the block.
+
+    Nested: yields the existing session.
+    """
+    existing = getattr(_current_smtp_session, "value", None)
+    if existing:
+        yield existing
+        return
+    session = SMTPSession()
+    _current_smtp_session.value = session
+    try:
+        yield session
+    finally:
+        _current_smtp_session.value = None
+        session.close()
+
+
 class BaseEmailTemplate:
 
+    _compiled_templates: ClassVar[dict[type, tuple[Callable, Callable]]] = {}
+    _compile_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self):
+        template_cls = self.__class__
+        if template_cls not in BaseEmailTemplate._compiled_templates:
+            with BaseEmailTemplate._compile_lock:
+                if template_cls not in BaseEmailTemplate._compiled_templates:
+                    BaseEmailTemplate._compiled_templates[template_cls] = self._compile_templates()
+        self.compiled_subject, self.compiled_body = BaseEmailTemplate._compiled_templates[template_cls]
+
+    def _compile_templates(self) -> tuple[Callable, Callable]:
+        from pybars import Compiler
+
         compiler = Compiler()
         partials = {}
 
@@ -55,11 +128,9 @@ class BaseEmailTemplate:
             if match := re.match(r"(\w+)_helper", name):
                 helpers[match.group(1)] = func
 
-        self.compiled_subject = functools.partial(
-            compiler.compile(self.get_subject_template()), partials=partials, helpers=helpers,
-        )
-        self.compiled_body = functools.partial(
-            compiler.compile(self.get_body_template()), partials=partials, helpers=helpers,
+        return (
+            functools.partial(compiler.compile(self.get_subject_template()), partials=partials, helpers=helpers),
+            functools.partial(compiler.compile(self.get_body_template()), partials=partials, helpers=helpers),
         )
 
     def validate_settings(self):
@@ -96,11 +167,14 @@ class BaseEmailTemplate:
         return message
 
     def send_mime_message(self, recipients: list[str], message: MIMEMultipart) -> dict:
-        ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
         try:
-            with smtplib.SMTP_SSL(settings.SMTP_ENDPOINT, settings.SMTP_PORT, context=ssl_context) as smtp_server:
-                smtp_server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-                response = smtp_server.sendmail(settings.EMAIL_FROM_ADDRESS, recipients, message.as_string())
+            if session := getattr(_current_smtp_session, "value", None):
+                response = session.sendmail(recipients, message.as_string())
+            else:
+                ssl_context = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+                with smtplib.SMTP_SSL(settings.SMTP_ENDPOINT, settings.SMTP_PORT, context=ssl_context) as smtp_server:
+                    smtp_server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+                    response = smtp_server.sendmail(settings.EMAIL_FROM_ADDRESS, recipients, message.as_string())
         except Exception as e:
             LOG.error("Template '%s' failed to send email with: %s", self.__class__.__name__, e) # noqa: TRY400
             raise EmailTemplateException("Failed sending email notifications") from e
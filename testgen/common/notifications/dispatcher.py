@@ -0,0 +1,77 @@
+import atexit
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+
+from testgen.common.notifications.base import smtp_session
+
+LOG = logging.getLogger("testgen")
+
+DRAIN_TIMEOUT = 300
+
+
+class NotificationDispatcher:
+    """
+    Sends notifications from a background thread, so that the caller is not
+    blocked by building and delivering them.
+
+    Notifications queued together are delivered as a batch over a single SMTP
+    session. The queue is drained before the process exits.
+    """
+
+    def __init__(self):
+        self._queue: queue.Queue[tuple[Callable, tuple, dict]] = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+
+    def submit(self, func: Callable, *args, **kwargs) -> None:
+        self._queue.put((func, args, kwargs))
+        self._ensure_worker()
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until all the queued notifications were processed. Returns False on timeout."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic() if deadline is not None else None
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker and self._worker.is_alive():
+                return
+            if self._worker is None:
+                atexit.register(self.drain_before_exit)
+            self._worker = threading.Thread(target=self._run, name="notification-dispatcher", daemon=True)
+            self._worker.start()
+
+    def drain_before_exit(self) -> None:
+        """Wait up to `DRAIN_TIMEOUT` for the queued notifications, logging the ones left pending."""
+        if not self.drain(DRAIN_TIMEOUT):
+            LOG.error("Exiting with %d notification(s) still pending", self._queue.unfinished_tasks)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            with smtp_session():
+                for func, args, kwargs in batch:
+                    try:
+                        func(*args, **kwargs)
+                    except Exception:
+                        LOG.exception("Error sending notification %s", getattr(func, "__name__", func))
+                    finally:
+                        self._queue.task_done()
+
+
+notification_dispatcher = NotificationDispatcher()
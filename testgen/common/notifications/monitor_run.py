@@ -10,6 +10,7 @@ from testgen.common.models.project import Project
 from testgen.common.models.table_group import TableGroup
 from testgen.common.models.test_result import TestResult, TestResultStatus
 from testgen.common.models.test_run import TestRun
+from testgen.common.notifications.base import smtp_session
 from testgen.common.notifications.notifications import BaseNotificationTemplate
 from testgen.utils import log_and_swallow_exception
 
@@ -171,6 +172,7 @@ class MonitorEmailTemplate(BaseNotificationTemplate):
 
 @log_and_swallow_exception
 @with_database_session
+@smtp_session()
 def send_monitor_notifications(test_run: TestRun, result_list_ct=20):
     notifications = list(MonitorNotificationSettings.select(
         enabled=True,
@@ -189,6 +191,7 @@ def send_monitor_notifications(test_run: TestRun, result_list_ct=20):
         return
 
     project = Project.get(table_group.project_code)
+    template = MonitorEmailTemplate()
     for notification in notifications:
         table_name = notification.settings.get("table_name")
         test_results = list(TestResult.select_where(
@@ -232,7 +235,7 @@ def send_monitor_notifications(test_run: TestRun, result_list_ct=20):
             )
         )
         try:
-            MonitorEmailTemplate().send(
+            template.send(
                 notification.recipients,
                 {
                     "summary": {
@@ -13,6 +13,7 @@ from testgen.common.models.notification_settings import (
 from testgen.common.models.profiling_run import ProfilingRun
 from testgen.common.models.project import Project
 from testgen.common.models.table_group import TableGroup
+from testgen.common.notifications.base import smtp_session
 from testgen.common.notifications.notifications import BaseNotificationTemplate
 from testgen.utils import log_and_swallow_exception
 
@@ -234,6 +235,7 @@ class ProfilingRunEmailTemplate(BaseNotificationTemplate):
 
 @log_and_swallow_exception
 @with_database_session
+@smtp_session()
 def send_profiling_run_notifications(profiling_run: ProfilingRun, result_list_ct=20):
     notifications = list(
         ProfilingRunNotificationSettings.select(enabled=True, table_group_id=profiling_run.table_groups_id)
@@ -332,9 +334,10 @@ def send_profiling_run_notifications(profiling_run: ProfilingRun, result_list_ct
         **get_current_session().execute(labels_query).mappings().one(),
     }
 
+    template = ProfilingRunEmailTemplate()
     for ns in notifications:
         try:
-            ProfilingRunEmailTemplate().send(
+            template.send(
                 ns.recipients, {**context, "notification_trigger": ns.trigger.value}
             )
         except Exception:
@@ -8,6 +8,7 @@ from testgen.common.models import get_current_session, with_database_session
 from testgen.common.models.notification_settings import ScoreDropNotificationSettings
 from testgen.common.models.project import Project
 from testgen.common.models.scores import ScoreDefinition
+from testgen.common.notifications.base import smtp_session
 from testgen.common.notifications.notifications import BaseNotificationTemplate
 from testgen.utils import log_and_swallow_exception
 
@@ -117,6 +118,7 @@ class ScoreDropEmailTemplate(BaseNotificationTemplate):
 
 @log_and_swallow_exception
 @with_database_session
+@smtp_session()
 def send_score_drop_notifications(notification_data: list[tuple[ScoreDefinition, str, float, float]]):
 
     if not notification_data:
@@ -141,6 +143,7 @@ def send_score_drop_notifications(notification_data: list[tuple[ScoreDefinition,
     for definition, *data in notification_data:
         diff_per_score_id[definition.id].append((definition, *data))
 
+    template = ScoreDropEmailTemplate()
     for score_id in diff_per_score_id.keys() & ns_per_score_id.keys():
         score_diff = diff_per_score_id[score_id]
         definition = score_diff[0][0]
@@ -191,7 +194,7 @@ def send_score_drop_notifications(notification_data: list[tuple[ScoreDefinition,
             }
 
             try:
-                ScoreDropEmailTemplate().send(ns.recipients, context)
+                template.send(ns.recipients, context)
             except Exception:
                 LOG.exception("Failed sending test run email notifications")
 
@@ -11,6 +11,7 @@ from testgen.common.models.notification_settings import (
 from testgen.common.models.test_definition import TestType
 from testgen.common.models.test_result import TestResult, TestResultStatus
 from testgen.common.models.test_run import TestRun
+from testgen.common.notifications.base import smtp_session
 from testgen.common.notifications.notifications import BaseNotificationTemplate
 from testgen.utils import log_and_swallow_exception
 
@@ -245,6 +246,7 @@ class TestRunEmailTemplate(BaseNotificationTemplate):
 
 @log_and_swallow_exception
 @with_database_session
+@smtp_session()
 def send_test_run_notifications(test_run: TestRun, result_list_ct=20, result_status_min=5):
 
     notifications = list(TestRunNotificationSettings.select(
@@ -352,9 +354,10 @@ def send_test_run_notifications(test_run: TestRun, result_list_ct=20, result_sta
         ]
     }
 
+    template = TestRunEmailTemplate()
     for ns in notifications:
         try:
-            TestRunEmailTemplate().send(
+            template.send(
                 ns.recipients, {**context, "notification_trigger": ns.trigger.value}
             )
         except Exception:
@@ -83,6 +83,28 @@ def read_template_yaml_function(function_name: str, db_flavour: str) -> str:
     return template
 
 
+@cache
+def _get_templated_function_tokens(function_name: str, db_flavour: str) -> list[str]:
+    # Literal text alternating with argument numbers: [text, number, text, ..., text]
+    return DK_FUNCTIONS_ARG_REPL_PATTERN.split(read_template_yaml_function(function_name, db_flavour))
+
+
+def expand_templated_function(function_name: str, args_str: str | None, db_flavour: str) -> str:
+    """Returns the flavor's SQL for a templated function call, given the call's semicolon-separated arguments."""
+    args = args_str.split(";") if args_str is not None else []
+    tokens = _get_templated_function_tokens(function_name, db_flavour)
+
+    parts = [tokens[0]]
+    for index in range(1, len(tokens), 2):
+        try:
+            parts.append(args[int(tokens[index]) - 1])
+        except IndexError:
+            call = f"<%{function_name}{'' if args_str is None else ';' + args_str}%>"
+            raise ValueError(f"Templated function call missing required arguments: {call}") from None
+        parts.append(tokens[index + 1])
+    return "".join(parts)
+
+
 def replace_templated_functions(query: str, db_flavour: str) -> str:
 
     # Arguments in the template yaml take the form {$<index>} like {$1}
@@ -94,25 +116,9 @@ def replace_templated_functions(query: str, db_flavour: str) -> str:
     query_parts = []
     end_pos = 0
     for func_match in DK_FUNCTIONS_PATTERN.finditer(query):
-
-        query_parts.append(query[end_pos:func_match.span(0)[0]])
-        end_pos = func_match.span(0)[1]
-
-        function_name, args_str = func_match.groups()
-        function_template = read_template_yaml_function(function_name, db_flavour)
-        args = args_str.split(";")
-
-        tpl_end_pos = 0
-        for arg_match in DK_FUNCTIONS_ARG_REPL_PATTERN.finditer(function_template):
-            query_parts.append(function_template[tpl_end_pos:arg_match.span(0)[0]])
-            tpl_end_pos = arg_match.span(0)[1]
-            try:
-                query_parts.append(args[int(arg_match.group(1)) - 1])
-            except IndexError:
-                raise ValueError(
-                    f"Templated function call missing required arguments: {query[slice(*func_match.span(0))]}"
-                ) from None
-        query_parts.append(function_template[tpl_end_pos:])
+        query_parts.append(query[end_pos:func_match.start()])
+        end_pos = func_match.end()
+        query_parts.append(expand_templated_function(*func_match.groups(), db_flavour))
 
     query_parts.append(query[end_pos:])
     return "".join(query_parts)
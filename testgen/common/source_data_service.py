@@ -10,20 +10,22 @@ from typing import Literal
 
 import pandas as pd
 from sqlalchemy import text
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.exc import DatabaseError, DBAPIError, ProgrammingError
 
 from testgen.common.clean_sql import concat_columns
-from testgen.common.database.database_service import get_flavor_service, replace_params
+from testgen.common.database.database_service import compile_template, get_flavor_service, replace_params
 from testgen.common.date_service import parse_fuzzy_date
 from testgen.common.models import get_current_session
 from testgen.common.models.connection import Connection, SQLFlavor
 from testgen.common.models.test_definition import TestDefinition
 from testgen.common.pii_masking import PII_REDACTED, get_pii_columns, mask_source_data_pii
-from testgen.common.read_file import replace_templated_functions
 from testgen.ui.services.database_service import fetch_from_target_db
 from testgen.utils import to_dataframe, to_sql_timestamp
 
 LOG = logging.getLogger("testgen")
 DEFAULT_LIMIT = 500
+INSUFFICIENT_PRIVILEGE_SQLSTATE = "42501"
 
 
 @dataclass
@@ -71,12 +73,10 @@ def fetch_test_result_source_data(
             return SourceDataResult("NA", "Source data lookup is not available for this test.", None, None)
 
         connection = Connection.get_by_table_group(issue_data["table_groups_id"])
-        results = fetch_from_target_db(connection, lookup_query)
+        results = _fetch_lookup_results(connection, lookup_query, limit, push_down_limit=is_custom)
 
         if results:
             df = to_dataframe(results)
-            if limit:
-                df = df.sample(n=min(len(df), limit)).sort_index()
             redacted = False
             if mask_pii:
                 if is_custom:
@@ -133,9 +133,7 @@ def build_hygiene_query(issue_data: dict, limit: int = DEFAULT_LIMIT) -> str | N
         "LIMIT_4": int(limit / 4),
     }
 
-    lookup_query = replace_params(lookup_query, params)
-    lookup_query = replace_templated_functions(lookup_query, lookup_data.sql_flavor)
-    return lookup_query
+    return compile_template(lookup_query).render(params, flavor=lookup_data.sql_flavor)
 
 
 def fetch_hygiene_source_data(
@@ -151,12 +149,10 @@ def fetch_hygiene_source_data(
             return SourceDataResult("NA", "Source data lookup is not available for this hygiene issue.", None, None)
 
         connection = Connection.get_by_table_group(issue_data["table_groups_id"])
-        results = fetch_from_target_db(connection, lookup_query)
+        results = _fetch_lookup_results(connection, lookup_query, limit)
 
         if results:
             df = to_dataframe(results)
-            if limit:
-                df = df.sample(n=min(len(df), limit)).sort_index()
             redacted = False
             if mask_pii:
                 redacted = _mask_lookup_pii(
@@ -233,9 +229,7 @@ def _build_query_standard(issue_data: dict, limit: int) -> str | None:
         "LIMIT_4": int(limit / 4),
     }
 
-    lookup_query = replace_params(lookup_data.lookup_query, params)
-    lookup_query = replace_templated_functions(lookup_query, lookup_data.sql_flavor)
-    return lookup_query
+    return compile_template(lookup_data.lookup_query).render(params, flavor=lookup_data.sql_flavor)
 
 
 def _build_query_custom(issue_data: dict) -> str | None:
@@ -278,6 +272,61 @@ def _generate_recency_lookup_query(
     return " UNION ALL ".join(queries) + " ORDER BY max_date_available DESC;"
 
 
+def _build_limited_query(lookup_query: str, sql_flavor: SQLFlavor, limit: int) -> str:
+    """Wrap a lookup query in the flavor's row limiting clause, so the database stops producing rows at the limit."""
+    # Line break before the closing parenthesis in case the query ends with a comment
+    subquery = f"(\n{lookup_query.strip().rstrip(';')}\n)"
+    row_limiting = get_flavor_service(sql_flavor).row_limiting_clause
+    if row_limiting == "top":
+        return f"SELECT TOP {limit} * FROM {subquery} AS lookup"
+    if row_limiting == "fetch":
+        return f"SELECT * FROM {subquery} lookup FETCH FIRST {limit} ROWS ONLY"
+    return f"SELECT * FROM {subquery} AS lookup LIMIT {limit}"
+
+
+# ---------------------------------------------------------------------------
+# Target DB helpers
+# ---------------------------------------------------------------------------
+
+def _fetch_lookup_results(
+    connection: Connection,
+    lookup_query: str,
+    limit: int | None,
+    push_down_limit: bool = False,
+) -> list[RowMapping]:
+    """
+    Fetch the rows of a lookup query, up to the limit. Built-in lookup queries are already limited by their templates;
+    with push_down_limit, the query is also wrapped in a row limiting clause (e.g. for user-defined queries).
+    """
+    if limit and push_down_limit:
+        try:
+            return fetch_from_target_db(
+                connection, _build_limited_query(lookup_query, connection.sql_flavor, limit), limit=limit,
+            )
+        except DBAPIError as error:
+            # Not every query can be used as a subquery (e.g. CTEs on SQL Server), so run it as is instead
+            if not _is_query_rejected(error):
+                raise
+            LOG.debug("Limited source data lookup was rejected, rerunning without row limiting clause", exc_info=True)
+    return fetch_from_target_db(connection, lookup_query, limit=limit)
+
+
+def _is_query_rejected(error: DBAPIError) -> bool:
+    """
+    Whether the target database rejected a query as invalid (e.g. a syntax error), rather than failed to run it
+    (e.g. a timeout, a permission error or a lost connection).
+    """
+    if error.connection_invalidated:
+        return False
+    # Drivers raise syntax errors as a ProgrammingError or as a generic DatabaseError (e.g. Oracle, Databricks),
+    # and timeouts and lost connections as an OperationalError
+    if not isinstance(error, ProgrammingError) and type(error) is not DatabaseError:
+        return False
+    # Some drivers also raise permission errors as a ProgrammingError
+    sqlstate = getattr(error.orig, "pgcode", None) or getattr(error.orig, "sqlstate", None)
+    return sqlstate != INSUFFICIENT_PRIVILEGE_SQLSTATE
+
+
 # ---------------------------------------------------------------------------
 # Metadata DB helpers
 # ---------------------------------------------------------------------------
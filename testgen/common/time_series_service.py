@@ -1,10 +1,10 @@
+import json
 import logging
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime
 
-import holidays
 import numpy as np
 import pandas as pd
-from statsmodels.tsa.statespace.sarimax import SARIMAX
 
 LOG = logging.getLogger("testgen")
 
@@ -17,6 +17,51 @@ class NotEnoughData(ValueError):
     pass
 
 
+# Standardized one-step error on a new observation that signals the persisted model no longer fits
+DRIFT_Z_SCORE = 4.0
+
+
+@dataclass
+class SarimaxModelState:
+    """
+    Fitted SARIMAX parameters and Kalman filter state, persisted between runs
+    so that the next forecast only needs to filter the new observations.
+    """
+    frequency: str
+    exog_key: str
+    last_index: str
+    last_value: float
+    params: list[float]
+    predicted_state: list[float]
+    predicted_state_cov: list[list[float]]
+    resid_count: int
+    resid_sum: float
+    resid_sumsq: float
+    num_updates: int = 0
+
+    @classmethod
+    def from_dict(cls, data: dict | str | None) -> "SarimaxModelState | None":
+        if isinstance(data, str):
+            data = json.loads(data)
+        if not data:
+            return None
+        try:
+            return cls(**data)
+        except TypeError:
+            # Saved by an incompatible version - a full refit will replace it
+            return None
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+    @property
+    def resid_se(self) -> float:
+        if self.resid_count < 5:
+            return 0.0
+        variance = (self.resid_sumsq - self.resid_sum ** 2 / self.resid_count) / (self.resid_count - 1)
+        return max(variance, 0.0) ** 0.5
+
+
 def get_sarimax_forecast(
     history: pd.DataFrame,
     num_forecast: int,
@@ -37,6 +82,33 @@ def get_sarimax_forecast(
     # Return value
     Returns a Pandas dataframe with forecast DatetimeIndex, "mean" column, and "se" (standard error) column.
     """
+    forecast, _ = get_sarimax_forecast_with_state(history, num_forecast, exclude_weekends, holiday_codes, tz)
+    return forecast
+
+
+def get_sarimax_forecast_with_state(
+    history: pd.DataFrame,
+    num_forecast: int,
+    exclude_weekends: bool = False,
+    holiday_codes: list[str] | None = None,
+    tz: str | None = None,
+    model_state: SarimaxModelState | None = None,
+    refit_interval: int = 0,
+) -> tuple[pd.DataFrame, SarimaxModelState | None]:
+    """
+    Same as get_sarimax_forecast, but updates a previously fitted model with only the observations
+    added since it was saved instead of refitting it on the whole history.
+
+    The model is fully refit when there is no usable state (changed frequency or exogenous settings,
+    history no longer matching the saved state), after refit_interval new observations,
+    or when the new observations drift away from the model's one-step predictions.
+
+    # Return value
+    Returns the forecast dataframe and the model state to be persisted for the next run.
+    """
+    # statsmodels is slow to import and only needed by the prediction and monitor tests
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
     if len(history) < MIN_TRAIN_VALUES:
         raise NotEnoughData("Not enough data points in history.")
 
@@ -49,6 +121,10 @@ def get_sarimax_forecast(
     if len(resampled_history) < MIN_TRAIN_VALUES:
         raise NotEnoughData("Not enough data points after resampling.")
 
+    exog_key = json.dumps([exclude_weekends, sorted(holiday_codes or []), tz])
+    new_history = _get_new_observations(resampled_history, frequency, exog_key, model_state, refit_interval)
+    train_history = resampled_history if new_history is None else new_history
+
     # Generate DatetimeIndex with future dates
     forecast_start = resampled_history.index[-1] + pd.to_timedelta(frequency)
     forecast_index = pd.date_range(start=forecast_start, periods=num_forecast, freq=frequency)
@@ -56,7 +132,7 @@ def get_sarimax_forecast(
     # Detect holidays in entire date range
     holiday_dates = None
     if holiday_codes:
-        all_dates_index = resampled_history.index.append(forecast_index)
+        all_dates_index = train_history.index.append(forecast_index)
         holiday_dates = get_holiday_dates(holiday_codes, all_dates_index)
 
     def get_exog_flags(index: pd.DatetimeIndex) -> pd.DataFrame:
@@ -71,25 +147,74 @@ def get_sarimax_forecast(
             exog.loc[pd.Index(check_index.date).isin(holiday_dates), "is_excluded"] = 1
         return exog
 
-    exog_train = get_exog_flags(resampled_history.index)
-
-    # When seasonal_order is not specified, this is effectively the ARIMAX model
-    model = SARIMAX(
-        resampled_history.iloc[:, 0],
-        exog=exog_train,
-        # This is a good starting point according to Gemini - tune if needed
-        order=(1, 1, 1),
-        # Prevent model from crashing when it encounters noisy/non-standard data
-        enforce_stationarity=False,
-        enforce_invertibility=False
+    def build_model(series: pd.DataFrame) -> SARIMAX:
+        # When seasonal_order is not specified, this is effectively the ARIMAX model
+        return SARIMAX(
+            series.iloc[:, 0],
+            exog=get_exog_flags(series.index),
+            # This is a good starting point according to Gemini - tune if needed
+            order=(1, 1, 1),
+            # Prevent model from crashing when it encounters noisy/non-standard data
+            enforce_stationarity=False,
+            enforce_invertibility=False
+        )
+
+    fitted_model = None
+    if new_history is not None:
+        # Continue filtering from the saved Kalman state - equivalent to statsmodels' extend()
+        # on the previous results, without holding on to the full history
+        try:
+            model = build_model(new_history)
+            model.initialize_known(np.array(model_state.predicted_state), np.array(model_state.predicted_state_cov))
+            fitted_model = model.filter(np.array(model_state.params))
+        except (ValueError, np.linalg.LinAlgError):
+            LOG.debug("Saved SARIMAX state could not be applied, refitting", exc_info=True)
+        else:
+            errors = np.abs(fitted_model.standardized_forecasts_error[0])
+            if np.nanmax(errors, initial=0.0) > DRIFT_Z_SCORE:
+                LOG.debug("New observations drifted from the saved SARIMAX model, refitting")
+                fitted_model = None
+            else:
+                residuals = fitted_model.resid.dropna()
+                new_state = replace(
+                    model_state,
+                    resid_count=model_state.resid_count + len(residuals),
+                    resid_sum=model_state.resid_sum + float(residuals.sum()),
+                    resid_sumsq=model_state.resid_sumsq + float((residuals ** 2).sum()),
+                    num_updates=model_state.num_updates + len(new_history),
+                )
+
+    if fitted_model is None:
+        model = build_model(resampled_history)
+        fitted_model = model.fit(disp=False)
+
+        order_sum = model.k_ar + model.k_diff + model.k_ma
+        burn_in = max(order_sum, 3)
+        usable_residuals = fitted_model.resid.iloc[burn_in:].dropna()
+        new_state = SarimaxModelState(
+            frequency=frequency,
+            exog_key=exog_key,
+            last_index="",
+            last_value=0.0,
+            params=[],
+            predicted_state=[],
+            predicted_state_cov=[],
+            resid_count=len(usable_residuals),
+            resid_sum=float(usable_residuals.sum()),
+            resid_sumsq=float((usable_residuals ** 2).sum()),
+        )
+
+    new_state = replace(
+        new_state,
+        last_index=resampled_history.index[-1].isoformat(),
+        last_value=float(resampled_history.iloc[-1, 0]),
+        params=fitted_model.params.tolist(),
+        predicted_state=fitted_model.predicted_state[:, -1].tolist(),
+        predicted_state_cov=fitted_model.predicted_state_cov[:, :, -1].tolist(),
     )
-    fitted_model = model.fit(disp=False)
+    if not all(np.isfinite(new_state.params + new_state.predicted_state)):
+        new_state = None
 
-    forecast_index = pd.date_range(
-        start=resampled_history.index[-1] + pd.to_timedelta(frequency),
-        periods=num_forecast,
-        freq=frequency
-    )
     exog_forecast = get_exog_flags(forecast_index)
     forecast = fitted_model.get_forecast(steps=num_forecast, exog=exog_forecast)
 
@@ -98,19 +223,41 @@ def get_sarimax_forecast(
 
     # SE estimation: take the max of three sources to prevent overconfident bounds.
     # 1. Model SE (var_pred_mean): can be artificially small when AR/MA nearly cancel
-    # 2. Residual SE: the model's actual 1-step prediction errors (after Kalman burn-in)
+    # 2. Residual SE: the model's actual 1-step prediction errors (after Kalman burn-in),
+    #    accumulated across incremental updates
     # 3. Raw diff SE: std of first-differences of the original data — captures inherent
     #    point-to-point variability that the model may underestimate
     model_se = forecast.var_pred_mean ** 0.5
-    order_sum = model.k_ar + model.k_diff + model.k_ma
-    burn_in = max(order_sum, 3)
-    usable_residuals = fitted_model.resid.iloc[burn_in:]
-    resid_se = usable_residuals.std() if len(usable_residuals) >= 5 else 0.0
+    resid_se = new_state.resid_se if new_state else 0.0
     raw_diffs = np.diff(history.iloc[:, 0].values)
     raw_diff_se = np.std(raw_diffs, ddof=1) if len(raw_diffs) > 1 else 0.0
     results["se"] = np.maximum(model_se, max(resid_se, raw_diff_se))
 
-    return results
+    return results, new_state
+
+
+def _get_new_observations(
+    resampled_history: pd.DataFrame,
+    frequency: str,
+    exog_key: str,
+    model_state: SarimaxModelState | None,
+    refit_interval: int,
+) -> pd.DataFrame | None:
+    """Returns the observations to update the saved model with, or None if it needs a full refit."""
+    if not model_state or model_state.frequency != frequency or model_state.exog_key != exog_key:
+        return None
+
+    last_index = pd.Timestamp(model_state.last_index)
+    if last_index not in resampled_history.index:
+        return None
+    # Older observations changed since the state was saved, e.g. late results in the last resampled period
+    if not np.isclose(resampled_history.at[last_index, resampled_history.columns[0]], model_state.last_value):
+        return None
+
+    new_history = resampled_history[resampled_history.index > last_index]
+    if new_history.empty or model_state.num_updates + len(new_history) > refit_interval:
+        return None
+    return new_history
 
 
 def infer_frequency(datetime_series: pd.Series) -> str:
@@ -138,6 +285,8 @@ def infer_frequency(datetime_series: pd.Series) -> str:
 
 
 def get_holiday_dates(holiday_codes: list[str], datetime_index: pd.DatetimeIndex) -> set[datetime]:
+    import holidays
+
     years = list(range(datetime_index.year.min(), datetime_index.year.max() + 1))
 
     holiday_dates = set()
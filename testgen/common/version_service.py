@@ -1,10 +1,7 @@
 import logging
 from dataclasses import dataclass
 
-import requests
-
 from testgen import settings
-from testgen.ui.session import session
 
 LOG = logging.getLogger("testgen")
 LATEST_VERSIONS_URL = "https://dk-support-external.s3.us-east-1.amazonaws.com/testgen-observability/testgen-latest-versions.json"
@@ -18,6 +15,8 @@ class Version:
 
 
 def get_version() -> Version:
+    from testgen.ui.session import session
+
     if not session.version:
         session.version = Version(
             edition=_get_app_edition(),
@@ -40,6 +39,8 @@ def _get_app_edition() -> str:
 
 
 def _get_latest_version() -> str | None:
+    import requests
+
     try:
         response = requests.get(LATEST_VERSIONS_URL, timeout=3)
         if response.status_code != 200:
@@ -1,10 +1,12 @@
 from uuid import UUID
 
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, select
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.functions import func
 
-from testgen.common.models import with_database_session
+from testgen.commands.run_rollup_scores import run_profile_rollup_scoring_queries
+from testgen.common.cache_invalidation import cache_tag, notify_cache_invalidation
+from testgen.common.models import get_current_session, with_database_session
 from testgen.common.models.hygiene_issue import Disposition, HygieneIssue, HygieneIssueType, IssueLikelihood, PiiRisk
 from testgen.common.models.job_execution import JobExecution
 from testgen.common.models.profiling_run import ProfilingRun
@@ -221,12 +223,36 @@ def update_hygiene_issue(*, issue_id: str, disposition: str) -> str:
     )
     if not updated:
         raise MCPResourceNotAccessible("Hygiene issue", issue_id)
+    _rollup_profiling_scores(issue_uuid)
 
     doc = MdDoc()
     doc.text(f"Updated hygiene issue {MdDoc.code(issue_id)} disposition to **{disposition}**.")
     return doc.render()
 
 
+def _rollup_profiling_scores(issue_id: UUID) -> None:
+    """Recalculate the scores of the issue's profiling run, same as refreshing them in the UI."""
+    session = get_current_session()
+    run_id, project_code, table_group_id, latest_run_id = session.execute(
+        select(
+            HygieneIssue.profile_run_id,
+            HygieneIssue.project_code,
+            HygieneIssue.table_groups_id,
+            TableGroup.last_complete_profile_run_id,
+        )
+        .join(TableGroup, TableGroup.id == HygieneIssue.table_groups_id)
+        .where(HygieneIssue.id == issue_id)
+    ).one()
+    # The rollup queries run on their own connection, so they need the disposition committed
+    session.commit()
+    run_profile_rollup_scoring_queries(
+        project_code,
+        str(run_id),
+        str(table_group_id) if run_id == latest_run_id else None,
+    )
+    notify_cache_invalidation(cache_tag("profiling_run", run_id))
+
+
 @with_database_session
 @mcp_permission("view")
 def get_hygiene_issue(*, issue_id: str) -> str:
@@ -1,4 +1,5 @@
 import logging
+import os
 import signal
 import subprocess
 import sys
@@ -13,12 +14,20 @@ from uuid import UUID
 from testgen import settings
 from testgen.commands.job_registry import JOB_DISPATCH, run_final_callbacks
 from testgen.common.models import database_session, with_database_session
-from testgen.common.models.job_execution import JobExecution, JobStatus
+from testgen.common.models.job_execution import FINAL_STATUSES, JobExecution, JobExecutionListener, JobStatus
 from testgen.common.models.scheduler import JobSchedule
+from testgen.common.standalone_postgres import STANDALONE_URI_ENV_VAR, get_server_uri
 from testgen.scheduler.base import DelayedPolicy, Job, Scheduler
+from testgen.scheduler.worker_pool import PooledJob, WorkerPool
 
 LOG = logging.getLogger("testgen")
 
+# Seconds between attempts to listen for job notifications while they are unavailable
+LISTEN_RETRY_INTERVAL = 5
+# Statuses the scheduler acts on: claim pending jobs, terminate canceled ones, and claim
+# waiting jobs when others finish
+WAKEUP_STATUSES = frozenset({JobStatus.PENDING, JobStatus.CANCEL_REQUESTED, *FINAL_STATUSES})
+
 @dataclass
 class CliJob(Job):
     key: str
@@ -31,12 +40,22 @@ class CliJob(Job):
 class CliScheduler(Scheduler):
 
     def __init__(self):
-        self._running_jobs: dict[UUID, subprocess.Popen] = {}
+        self._running_jobs: dict[UUID, subprocess.Popen | PooledJob] = {}
         self._running_jobs_cond = threading.Condition()
+        self._jobs_notified = threading.Event()
         self.reload_timer = None
         self._current_jobs = {}
         self._poll_interval = settings.JOB_POLL_INTERVAL
         self._poll_batch_size = 5
+        self._worker_pool = None
+        if settings.JOB_WORKER_POOL_SIZE > 0:
+            self._worker_pool = WorkerPool(
+                size=settings.JOB_WORKER_POOL_SIZE,
+                max_jobs=settings.JOB_WORKER_MAX_JOBS,
+                max_memory_mb=settings.JOB_WORKER_MAX_MEMORY_MB,
+                log_level=LOG.getEffectiveLevel(),
+                server_uri=get_server_uri() or os.environ.get(STANDALONE_URI_ENV_VAR),
+            )
         LOG.info("Starting CLI Scheduler with registered jobs: %s", ", ".join(JOB_DISPATCH.keys()))
         super().__init__()
 
@@ -86,17 +105,52 @@ class CliScheduler(Scheduler):
         )
 
     def start(self, base_time):
+        self._listen_thread = threading.Thread(target=self._listen_loop, name="listen-loop")
+        self._listen_thread.start()
         self._poll_thread = threading.Thread(target=self._poll_loop, name="poll-loop")
         self._poll_thread.start()
         super().start(base_time)
 
+    def shutdown(self):
+        super().shutdown()
+        self._jobs_notified.set()
+
     def wait(self, timeout=None):
         super().wait(timeout)
         self._poll_thread.join(timeout)
+        self._listen_thread.join(timeout)
+
+    def _listen_loop(self):
+        """Wake up the poll loop as soon as job executions are submitted, canceled or finished."""
+        listener = JobExecutionListener()
+        try:
+            while not self._stopping.is_set():
+                try:
+                    if listener.listen():
+                        # Jobs submitted while not listening are claimed right away
+                        self._jobs_notified.set()
+                    # Wait in short slices to notice the shutdown
+                    notifications = listener.wait(timeout=1)
+                except Exception:
+                    LOG.warning("Error listening for job notifications, polling instead", exc_info=True)
+                    self._stopping.wait(timeout=LISTEN_RETRY_INTERVAL)
+                    # Poll at the retry interval while notifications are unavailable
+                    self._jobs_notified.set()
+                    continue
+                if any(status in WAKEUP_STATUSES for _, status in notifications):
+                    self._jobs_notified.set()
+        finally:
+            listener.close()
+
+    def _wait_for_jobs(self) -> bool:
+        """Wait for job notifications, or for the poll interval as a fallback. Return whether the scheduler is stopping."""
+        self._jobs_notified.wait(timeout=self._poll_interval)
+        self._jobs_notified.clear()
+        return self._stopping.is_set()
 
     def _poll_loop(self):
         skip_wait = False
-        while skip_wait or not self._stopping.wait(timeout=self._poll_interval):
+        while skip_wait or not self._wait_for_jobs():
             try:
                 with database_session():
                     actionable = JobExecution.claim_actionable(limit=self._poll_batch_size)
@@ -144,17 +198,21 @@ class CliScheduler(Scheduler):
                 job_exec.mark_interrupted(f"Unknown job key: {job_exec.job_key}")
             return
 
-        exec_cmd = [sys.executable, sys.argv[0], "exec-job", str(job_exec.id)]
-        LOG.info("Dispatching job execution %s: %s", job_exec.id, " ".join(exec_cmd))
+        if self._worker_pool:
+            proc = self._worker_pool.submit(job_exec.id)
+            LOG.info("Dispatching job execution %s to worker PID %d", job_exec.id, proc.pid)
+        else:
+            exec_cmd = [sys.executable, sys.argv[0], "exec-job", str(job_exec.id)]
+            LOG.info("Dispatching job execution %s: %s", job_exec.id, " ".join(exec_cmd))
 
-        proc = subprocess.Popen(
-            exec_cmd,  # noqa: S603
-            start_new_session=True,
-        )
+            proc = subprocess.Popen(
+                exec_cmd,  # noqa: S603
+                start_new_session=True,
+            )
         threading.Thread(target=self._proc_wrapper, args=(proc, job_exec)).start()
 
-    def _proc_wrapper(self, proc: subprocess.Popen, job_exec: JobExecution):
-        """Monitor a subprocess and act as crash-recovery safety net.
+    def _proc_wrapper(self, proc: subprocess.Popen | PooledJob, job_exec: JobExecution):
+        """Monitor a subprocess (or pool worker) and act as crash-recovery safety net.
 
         exec_job owns the full lifecycle (mark_running/completed/interrupted).
         This wrapper only intervenes on nonzero exit codes, which indicate exec_job
@@ -215,6 +273,9 @@ class CliScheduler(Scheduler):
                     LOG.info("Waiting %d running job(s) to complete", len(self._running_jobs))
                     self._running_jobs_cond.wait_for(lambda: len(self._running_jobs) == 0)
 
+            if self._worker_pool:
+                self._worker_pool.close()
+
             LOG.info("All jobs terminated")
 
 
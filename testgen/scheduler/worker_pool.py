@@ -0,0 +1,249 @@
+"""Warm worker processes for the scheduler's job executions.
+
+Instead of starting a new `testgen exec-job` interpreter for every job, the scheduler can hand
+the jobs to long-lived worker processes that have already imported the job handlers and keep
+their database engines between jobs. Each worker runs one job at a time, and is replaced after
+a number of jobs, when its memory grows past a limit, or when it dies or is terminated.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from contextlib import suppress
+from multiprocessing.connection import Connection, wait
+from uuid import UUID
+
+import psutil
+
+from testgen.common.notifications.dispatcher import DRAIN_TIMEOUT
+
+LOG = logging.getLogger("testgen")
+
+# Seconds an idle worker is given to exit after being asked to stop, including the time to
+# send the notifications still queued by its jobs
+STOP_TIMEOUT = DRAIN_TIMEOUT + 10
+
+
+def _run_worker(
+    connection: Connection,
+    log_level: int,
+    server_uri: str | None,
+    max_jobs: int,
+    max_memory_mb: int,
+) -> None:
+    if hasattr(os, "setsid"):
+        # Same as the exec-job subprocesses: signals sent to the scheduler's process group
+        # do not reach the jobs, the scheduler forwards them on a second signal
+        os.setsid()
+
+    from testgen.common import configure_logging
+    from testgen.common.standalone_postgres import ensure_standalone_setup, is_standalone_mode
+
+    configure_logging(level=log_level)
+    if is_standalone_mode() and server_uri:
+        ensure_standalone_setup(server_uri)
+
+    _serve_jobs(connection, max_jobs, max_memory_mb)
+
+
+def _serve_jobs(connection: Connection, max_jobs: int, max_memory_mb: int) -> None:
+    # Importing the job handlers is most of the startup time of a job, so it is done once per worker
+    from testgen.commands.exec_job import exec_job
+    from testgen.common.caching import clear_cache_data
+    from testgen.common.notifications.dispatcher import notification_dispatcher
+
+    job_count = 0
+    try:
+        while True:
+            try:
+                job_execution_id = connection.recv()
+            except EOFError:
+                return
+            if job_execution_id is None:
+                return
+
+            # The cached model lookups of the previous jobs may be outdated
+            clear_cache_data()
+            try:
+                exec_job(job_execution_id)
+                exit_code = 0
+            except SystemExit as e:
+                exit_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+
+            job_count += 1
+            memory_mb = psutil.Process().memory_info().rss / (1024 * 1024)
+            can_continue = (
+                exit_code == 0
+                and (not max_jobs or job_count < max_jobs)
+                and (not max_memory_mb or memory_mb < max_memory_mb)
+            )
+            if not can_continue:
+                LOG.info("Retiring job worker after %d job(s), using %.0f MB", job_count, memory_mb)
+
+            connection.send((exit_code, can_continue))
+            if not can_continue:
+                return
+    finally:
+        # Send the notifications queued in the background by the jobs before the worker exits,
+        # while the pool still waits for it to stop
+        notification_dispatcher.drain_before_exit()
+
+
+class _Worker:
+
+    def __init__(self, context: multiprocessing.context.BaseContext, *args):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_run_worker, args=(child_connection, *args), name="testgen-job-worker")
+        self.process.start()
+        child_connection.close()
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def run(self, job_execution_id: UUID) -> None:
+        self.connection.send(job_execution_id)
+
+    def wait_result(self) -> tuple[int, bool]:
+        """Block until the worker reports the result of its job or exits.
+
+        Returns the exit code of the job, and whether the worker can run more jobs.
+        """
+        wait([self.connection, self.process.sentinel])
+        with suppress(EOFError, OSError):
+            if self.connection.poll():
+                return self.connection.recv()
+        self.process.join()
+        return self.process.exitcode, False
+
+    def terminate(self) -> None:
+        self.process.terminate()
+
+    def send_signal(self, signum: int) -> None:
+        with suppress(ProcessLookupError):
+            os.kill(self.process.pid, signum)
+
+    def stop(self) -> None:
+        if self.process.is_alive():
+            with suppress(OSError):
+                self.connection.send(None)
+            self.process.join(STOP_TIMEOUT)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.connection.close()
+
+
+class PooledJob:
+    """A job execution running in a pool worker.
+
+    Provides the part of the `subprocess.Popen` interface the scheduler uses for its exec-job
+    subprocesses, with the exit code of the job in place of the exit code of the process. A
+    worker that crashes or is terminated during the job reports its own exit code instead.
+    """
+
+    def __init__(self, pool: "WorkerPool", worker: _Worker):
+        self._pool = pool
+        self._worker = worker
+        self._lock = threading.Lock()
+        self._finished = False
+        self._terminated = False
+
+    @property
+    def pid(self) -> int:
+        return self._worker.pid
+
+    def wait(self) -> int:
+        exit_code, can_continue = self._worker.wait_result()
+        with self._lock:
+            self._finished = True
+            reusable = can_continue and not self._terminated
+        self._pool.release(self._worker, reusable)
+        return exit_code
+
+    def terminate(self) -> None:
+        with self._lock:
+            # Once the job is finished the worker may be running another one
+            if not self._finished:
+                self._terminated = True
+                self._worker.terminate()
+
+    def send_signal(self, signum: int) -> None:
+        with self._lock:
+            if not self._finished:
+                self._worker.send_signal(signum)
+
+
+class WorkerPool:
+    """Keeps up to `size` idle workers ready to run jobs.
+
+    Jobs submitted while all the workers are busy start an additional worker, so they are never
+    queued behind running jobs.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        max_jobs: int,
+        max_memory_mb: int,
+        log_level: int = logging.INFO,
+        server_uri: str | None = None,
+    ):
+        # Spawn instead of fork so workers don't inherit the open database connections
+        self._context = multiprocessing.get_context("spawn")
+        self._worker_args = (log_level, server_uri, max_jobs, max_memory_mb)
+        self._size = size
+        self._idle: list[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(size):
+            self._idle.append(self._start_worker())
+
+    def submit(self, job_execution_id: UUID) -> PooledJob:
+        worker = None
+        with self._lock:
+            while self._idle and not worker:
+                worker = self._idle.pop()
+                if not worker.is_alive():
+                    LOG.warning("Job worker PID %d exited while idle with code %s", worker.pid, worker.process.exitcode)
+                    worker.connection.close()
+                    worker = None
+        if not worker:
+            worker = self._start_worker()
+
+        worker.run(job_execution_id)
+        return PooledJob(self, worker)
+
+    def release(self, worker: _Worker, reusable: bool) -> None:
+        with self._lock:
+            if reusable and not self._closed and len(self._idle) < self._size:
+                self._idle.append(worker)
+                return
+        worker.stop()
+
+        with self._lock:
+            if self._closed or len(self._idle) >= self._size:
+                return
+        # Replace the retired worker so the next job still finds a warm one
+        replacement = self._start_worker()
+        with self._lock:
+            if not self._closed:
+                self._idle.append(replacement)
+                return
+        replacement.stop()
+
+    def close(self) -> None:
+        """Stop the idle workers. Busy workers are stopped when their jobs finish."""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+    def _start_worker(self) -> _Worker:
+        worker = _Worker(self._context, *self._worker_args)
+        LOG.info("Started job worker PID %d", worker.pid)
+        return worker
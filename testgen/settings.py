@@ -301,6 +301,25 @@ from env variable: `TG_TARGET_DB_TRUST_SERVER_CERTIFICATE`
 defaults to: `True`
 """
 
+TARGET_ENGINE_CACHE_SIZE: int = int(getenv("TG_TARGET_ENGINE_CACHE_SIZE", "10"))
+"""
+Maximum number of target database engines kept open for interactive
+lookups (source data, data catalog previews). The least recently used
+engine is disposed when the limit is reached. Set to 0 to disable caching.
+
+from env variable: `TG_TARGET_ENGINE_CACHE_SIZE`
+defaults to: `10`
+"""
+
+TARGET_ENGINE_IDLE_TIMEOUT: int = int(getenv("TG_TARGET_ENGINE_IDLE_TIMEOUT", "900"))
+"""
+Seconds after which an unused cached target database engine is disposed,
+closing its connections.
+
+from env variable: `TG_TARGET_ENGINE_IDLE_TIMEOUT`
+defaults to: `900`
+"""
+
 DEFAULT_TABLE_GROUPS_NAME: str = getenv("DEFAULT_TABLE_GROUPS_NAME", "default")
 """
 Name assigned to the auto generated table group.
@@ -416,6 +435,15 @@ from env variable: `TG_OBSERVABILITY_EXPORT_MAX_QTY`
 defaults to: `5000`
 """
 
+OBSERVABILITY_EXPORT_MAX_IN_FLIGHT: int = int(getenv("TG_OBSERVABILITY_EXPORT_MAX_IN_FLIGHT", "4"))
+"""
+When exporting to your instance of Observability, the maximum number of
+event requests that are sent concurrently.
+
+from env variable: `TG_OBSERVABILITY_EXPORT_MAX_IN_FLIGHT`
+defaults to: `4`
+"""
+
 OBSERVABILITY_DEFAULT_COMPONENT_TYPE: str = getenv("OBSERVABILITY_DEFAULT_COMPONENT_TYPE", "dataset")
 """
 When exporting to your instance of Observability, the type of event that
@@ -512,11 +540,111 @@ ANALYTICS_ENABLED: bool = getenv("TG_ANALYTICS", "yes").lower() in ("yes", "true
 Disables sending usage data when set to any value except "true" and "yes". Defaults to "yes"
 """
 
-JOB_POLL_INTERVAL: int = int(getenv("TG_JOB_POLL_INTERVAL", "5"))
+JOB_POLL_INTERVAL: int = int(getenv("TG_JOB_POLL_INTERVAL", "30"))
 """
-Seconds between polls for pending job executions.
+Seconds between polls for pending job executions, and for the status of
+the jobs waited on. The scheduler and the waiters are notified of job
+changes by the database, so polling is only a fallback for notifications
+that are not delivered, e.g. through a connection pooler in transaction mode.
 from env variable: 'TG_JOB_POLL_INTERVAL'
-defaults to: 5
+defaults to: 30
+"""
+
+JOB_MAX_RUNNING: int = int(getenv("TG_JOB_MAX_RUNNING", "10"))
+"""
+Maximum number of jobs the scheduler runs at the same time. Further
+pending jobs wait until running ones finish. Set to 0 to not limit it.
+
+from env variable: `TG_JOB_MAX_RUNNING`
+defaults to: `10`
+"""
+
+JOB_MAX_RUNNING_PER_PROJECT: int = int(getenv("TG_JOB_MAX_RUNNING_PER_PROJECT", "0"))
+"""
+Maximum number of jobs of the same project the scheduler runs at the
+same time. Set to 0 to not limit it.
+
+from env variable: `TG_JOB_MAX_RUNNING_PER_PROJECT`
+defaults to: `0`
+"""
+
+JOB_MAX_RUNNING_PER_CONNECTION: int = int(getenv("TG_JOB_MAX_RUNNING_PER_CONNECTION", "3"))
+"""
+Maximum number of jobs on the same database connection (profiling,
+test generation and test runs) the scheduler runs at the same time.
+Set to 0 to not limit it.
+
+from env variable: `TG_JOB_MAX_RUNNING_PER_CONNECTION`
+defaults to: `3`
+"""
+
+JOB_WORKER_POOL_SIZE: int = int(getenv("TG_JOB_WORKER_POOL_SIZE", "0"))
+"""
+Number of warm worker processes the scheduler keeps ready to run jobs.
+Workers import the job handlers once and keep their database engines
+between jobs, instead of starting a new process for every job. Set to 0
+to run each job in its own process.
+
+from env variable: `TG_JOB_WORKER_POOL_SIZE`
+defaults to: `0`
+"""
+
+JOB_WORKER_MAX_JOBS: int = int(getenv("TG_JOB_WORKER_MAX_JOBS", "50"))
+"""
+Number of jobs a scheduler worker process runs before it is replaced
+with a new one. Set to 0 to not limit it.
+
+from env variable: `TG_JOB_WORKER_MAX_JOBS`
+defaults to: `50`
+"""
+
+JOB_WORKER_MAX_MEMORY_MB: int = int(getenv("TG_JOB_WORKER_MAX_MEMORY_MB", "1024"))
+"""
+Memory (RSS, in MB) above which a scheduler worker process is replaced
+with a new one after finishing its job. Set to 0 to not limit it.
+
+from env variable: `TG_JOB_WORKER_MAX_MEMORY_MB`
+defaults to: `1024`
+"""
+
+PROFILING_BATCH_COLUMNS: bool = getenv("TG_PROFILING_BATCH_COLUMNS", "yes").lower() in ("yes", "true")
+"""
+When set, the profiling aggregates of the columns of each table are
+computed by a single wide query (split in chunks capped by the connection's
+max query characters) that scans the table once, instead of one query per
+column. Batches that fail are rerun one column at a time. Oracle columns
+are always profiled one query per column.
+
+from env variable: `TG_PROFILING_BATCH_COLUMNS`
+defaults to: `yes`
+"""
+
+PREDICTION_MAX_WORKERS: int = int(getenv("TG_PREDICTION_MAX_WORKERS", "1"))
+"""
+Number of worker processes used to train the prediction models for
+monitor thresholds after a test run. Set to 1 to train them serially.
+
+from env variable: `TG_PREDICTION_MAX_WORKERS`
+defaults to: `1`
+"""
+
+PREDICTION_REFIT_INTERVAL: int = int(getenv("TG_PREDICTION_REFIT_INTERVAL", "20"))
+"""
+Number of new observations a persisted prediction model is updated with
+before it is fully refit on the whole history. Set to 0 to refit the
+models on every run.
+
+from env variable: `TG_PREDICTION_REFIT_INTERVAL`
+defaults to: `20`
+"""
+
+SCORE_REFRESH_MAX_THREADS: int = int(getenv("TG_SCORE_REFRESH_MAX_THREADS", "4"))
+"""
+Number of scorecards whose results are refreshed concurrently after a
+profiling or test run. Set to 1 to refresh them serially.
+
+from env variable: `TG_SCORE_REFRESH_MAX_THREADS`
+defaults to: `4`
 """
 
 ACCESS_TOKEN_EXPIRES_IN: int = 3600  # 1 hour
@@ -535,6 +663,37 @@ ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT: int = getenv("TG_ISSUE_REPORT_SOURCE_DATA
 Limit the number of records used to generate the PDF with test results and hygiene issue reports.
 """
 
+ISSUE_REPORT_MAX_WORKERS: int = int(getenv("TG_ISSUE_REPORT_MAX_WORKERS", "4"))
+"""
+Maximum number of worker processes used to render the PDFs when several test
+result or hygiene issue reports are downloaded together, capped by the number
+of CPUs. Set to 1 to render them serially.
+
+from env variable: `TG_ISSUE_REPORT_MAX_WORKERS`
+defaults to: `4`
+"""
+
+UI_CACHE_TTL: int = int(getenv("TG_UI_CACHE_TTL", "600"))
+"""
+Number of seconds the UI keeps the results of heavy per-run queries, such as the
+test results and hygiene issues grids. Results of runs still in progress are
+not kept. Changes made through the UI, by runs, the API or the MCP server
+invalidate them right away; this only bounds how long other changes, or missed
+invalidations, can take to show up.
+
+from env variable: `TG_UI_CACHE_TTL`
+defaults to: `600`
+"""
+
+UI_CACHE_MAX_ENTRIES: int = int(getenv("TG_UI_CACHE_MAX_ENTRIES", "1000"))
+"""
+Maximum number of query results kept by the UI cache for heavy per-run queries.
+The least recently used results are evicted first.
+
+from env variable: `TG_UI_CACHE_MAX_ENTRIES`
+defaults to: `1000`
+"""
+
 EMAIL_FROM_ADDRESS: str | None = getenv("TG_EMAIL_FROM_ADDRESS")
 """
 Email: Sender address
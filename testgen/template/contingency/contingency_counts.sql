@@ -1,3 +1,3 @@
 SELECT {CONTINGENCY_COLUMNS}, COUNT(*) as freq_ct
-  FROM {DATA_SCHEMA}.{DATA_TABLE}
+  FROM {QUOTE}{DATA_SCHEMA}{QUOTE}.{QUOTE}{DATA_TABLE}{QUOTE}
 GROUP BY {CONTINGENCY_COLUMNS};
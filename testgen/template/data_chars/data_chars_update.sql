@@ -10,6 +10,7 @@ WITH new_chars AS (
       run_date,
       MAX(approx_record_ct) AS approx_record_ct,
       MAX(record_ct) AS record_ct,
+      MAX(approx_record_ct_at_count) AS approx_record_ct_at_count,
       COUNT(*) AS column_ct
    FROM stg_data_chars_updates
    WHERE table_groups_id = :TABLE_GROUPS_ID
@@ -22,6 +23,7 @@ updated_records AS (
    UPDATE data_table_chars
    SET approx_record_ct = n.approx_record_ct,
       record_ct = n.record_ct,
+      approx_record_ct_at_count = n.approx_record_ct_at_count,
       column_ct = n.column_ct,
       last_refresh_date = n.run_date,
       drop_date = NULL
@@ -57,6 +59,7 @@ WITH new_chars AS (
       run_date,
       MAX(approx_record_ct) AS approx_record_ct,
       MAX(record_ct) AS record_ct,
+      MAX(approx_record_ct_at_count) AS approx_record_ct_at_count,
       COUNT(*) AS column_ct
    FROM stg_data_chars_updates
    WHERE table_groups_id = :TABLE_GROUPS_ID
@@ -74,6 +77,7 @@ inserted_records AS (
          last_refresh_date,
          approx_record_ct,
          record_ct,
+         approx_record_ct_at_count,
          column_ct
       )
    SELECT n.table_groups_id,
@@ -83,6 +87,7 @@ inserted_records AS (
       n.run_date,
       n.approx_record_ct,
       n.record_ct,
+      n.approx_record_ct_at_count,
       n.column_ct
    FROM new_chars n
       LEFT JOIN data_table_chars d ON (
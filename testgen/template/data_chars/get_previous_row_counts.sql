@@ -0,0 +1,7 @@
+SELECT table_name,
+   record_ct,
+   approx_record_ct_at_count
+FROM data_table_chars
+WHERE table_groups_id = :TABLE_GROUPS_ID
+   AND schema_name = :DATA_SCHEMA
+   AND drop_date IS NULL;
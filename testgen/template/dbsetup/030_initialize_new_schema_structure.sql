@@ -36,7 +36,8 @@ CREATE TABLE stg_data_chars_updates (
    column_type           VARCHAR(50),
    db_data_type          VARCHAR(50),
    approx_record_ct      BIGINT,
-   record_ct             BIGINT
+   record_ct             BIGINT,
+   approx_record_ct_at_count BIGINT
 );
 
 CREATE TABLE stg_test_definition_updates (
@@ -46,7 +47,8 @@ CREATE TABLE stg_test_definition_updates (
    lower_tolerance    VARCHAR(1000),
    upper_tolerance    VARCHAR(1000),
    threshold_value    VARCHAR(1000),
-   prediction         JSONB
+   prediction         JSONB,
+   model_state        JSONB
 );
 
 CREATE TABLE projects (
@@ -118,6 +120,8 @@ CREATE TABLE table_groups
     profile_exclude_xde      BOOLEAN DEFAULT TRUE,
     profile_do_pair_rules    VARCHAR(3) DEFAULT 'N',
     profile_pair_rule_pct    INTEGER DEFAULT 95,
+    row_count_strategy       VARCHAR(20) DEFAULT 'exact',
+    row_count_change_pct     INTEGER DEFAULT 10,
     include_in_dashboard     BOOLEAN DEFAULT TRUE,
     description              VARCHAR(1000),
     data_source              VARCHAR(40),
@@ -258,6 +262,12 @@ CREATE TABLE test_definition_notes (
 
 CREATE INDEX ix_tdn_tdid ON test_definition_notes(test_definition_id, created_at DESC);
 
+CREATE TABLE prediction_model_states (
+   test_definition_id   UUID PRIMARY KEY REFERENCES test_definitions ON DELETE CASCADE,
+   model_state          JSONB NOT NULL,
+   updated_at           TIMESTAMP
+);
+
 CREATE TABLE profile_results (
    id                    UUID DEFAULT gen_random_uuid()
       CONSTRAINT profile_results_id_pk
@@ -433,6 +443,7 @@ CREATE TABLE data_table_chars (
    last_refresh_date     TIMESTAMP,
    approx_record_ct      BIGINT,
    record_ct             BIGINT,
+   approx_record_ct_at_count BIGINT,
    column_ct             BIGINT,
    last_complete_profile_run_id UUID,
    last_profile_record_ct       BIGINT,
@@ -665,6 +676,42 @@ CREATE TABLE test_results (
       FOREIGN KEY (test_suite_id) REFERENCES test_suites
 );
 
+CREATE TABLE monitor_table_snapshots (
+   test_suite_id            UUID NOT NULL
+      CONSTRAINT monitor_table_snapshots_test_suites_test_suite_id_fk
+         REFERENCES test_suites ON DELETE CASCADE,
+   table_groups_id          UUID NOT NULL,
+   table_name               VARCHAR(120) NOT NULL,
+   lookback                 INTEGER,
+   freshness_anomalies      INTEGER,
+   volume_anomalies         INTEGER,
+   schema_anomalies         INTEGER,
+   metric_anomalies         INTEGER,
+   latest_update            TIMESTAMP,
+   row_count                BIGINT,
+   previous_row_count       BIGINT,
+   column_adds              INTEGER,
+   column_drops             INTEGER,
+   column_mods              INTEGER,
+   freshness_error_message  VARCHAR,
+   volume_error_message     VARCHAR,
+   schema_error_message     VARCHAR,
+   metric_error_message     VARCHAR,
+   freshness_is_training    BOOLEAN,
+   volume_is_training       BOOLEAN,
+   metric_is_training       BOOLEAN,
+   freshness_is_pending     BOOLEAN,
+   volume_is_pending        BOOLEAN,
+   schema_is_pending        BOOLEAN,
+   metric_is_pending        BOOLEAN,
+   table_state              VARCHAR(10),
+   lookback_start           TIMESTAMP,
+   lookback_end             TIMESTAMP,
+   snapshot_date            TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+   CONSTRAINT monitor_table_snapshots_pk
+      PRIMARY KEY (test_suite_id, table_name)
+);
+
 CREATE TABLE cat_test_conditions (
    id             VARCHAR,
    test_type      VARCHAR(200) NOT NULL
@@ -1011,6 +1058,9 @@ CREATE INDEX idx_dtc_tg_schema_table
 CREATE INDEX idx_dtc_id
   ON data_table_chars (table_id);
 
+CREATE INDEX idx_dtc_tg_lower_table
+  ON data_table_chars (table_groups_id, LOWER(table_name), table_id);
+
 -- Index data_column_chars
 CREATE INDEX idx_dcc_tg_schema_table_column
   ON data_column_chars (table_groups_id, schema_name, table_name, column_name);
@@ -1062,6 +1112,72 @@ CREATE INDEX shlast_runs_pro_run
 CREATE INDEX shlast_runs_tst_run
    ON score_history_latest_runs(last_test_run_id);
 
+CREATE TABLE score_profiling_column_facts (
+   profile_run_id   UUID NOT NULL,
+   table_groups_id  UUID,
+   run_date         TIMESTAMP,
+   table_name       VARCHAR(120),
+   column_name      VARCHAR(120),
+   record_ct        BIGINT,
+   issue_ct         INTEGER,
+   good_data_pct    DOUBLE PRECISION
+);
+
+CREATE INDEX score_pro_col_facts_run
+   ON score_profiling_column_facts(profile_run_id);
+
+CREATE TABLE score_profiling_dimension_facts (
+   profile_run_id   UUID NOT NULL,
+   table_groups_id  UUID,
+   run_date         TIMESTAMP,
+   table_name       VARCHAR(120),
+   column_name      VARCHAR(120),
+   dimension_type   VARCHAR(20) NOT NULL,
+   dimension        VARCHAR(50),
+   record_ct        BIGINT,
+   issue_ct         INTEGER,
+   good_data_pct    DOUBLE PRECISION
+);
+
+CREATE INDEX score_pro_dim_facts_run
+   ON score_profiling_dimension_facts(profile_run_id, dimension_type);
+
+CREATE TABLE score_test_column_facts (
+   test_run_id      UUID NOT NULL,
+   test_suite_id    UUID,
+   table_groups_id  UUID,
+   test_time        TIMESTAMP,
+   table_name       VARCHAR(100),
+   column_name      VARCHAR(500),
+   test_ct          INTEGER,
+   passed_ct        INTEGER,
+   issue_ct         INTEGER,
+   dq_record_ct     BIGINT,
+   good_data_pct    DOUBLE PRECISION
+);
+
+CREATE INDEX score_tst_col_facts_run
+   ON score_test_column_facts(test_run_id);
+
+CREATE TABLE score_test_dimension_facts (
+   test_run_id      UUID NOT NULL,
+   test_suite_id    UUID,
+   table_groups_id  UUID,
+   test_time        TIMESTAMP,
+   table_name       VARCHAR(100),
+   column_name      VARCHAR(500),
+   dimension_type   VARCHAR(20) NOT NULL,
+   dimension        VARCHAR(50),
+   test_ct          INTEGER,
+   passed_ct        INTEGER,
+   issue_ct         INTEGER,
+   dq_record_ct     BIGINT,
+   good_data_pct    DOUBLE PRECISION
+);
+
+CREATE INDEX score_tst_dim_facts_run
+   ON score_test_dimension_facts(test_run_id, dimension_type);
+
 CREATE TABLE job_schedules (
     id UUID NOT NULL PRIMARY KEY,
     project_code VARCHAR(30) NOT NULL,
@@ -1085,6 +1201,7 @@ CREATE TABLE job_executions (
     status          VARCHAR(20)     NOT NULL DEFAULT 'pending',
     project_code    VARCHAR(30)     NOT NULL,
     job_schedule_id UUID            REFERENCES job_schedules(id) ON DELETE SET NULL,
+    connection_id   BIGINT,
     error_message   TEXT,
     created_at      TIMESTAMPTZ     NOT NULL DEFAULT NOW(),
     claimed_at      TIMESTAMPTZ,
@@ -1096,6 +1213,28 @@ CREATE INDEX idx_job_executions_poll ON job_executions (status, created_at) WHER
 CREATE INDEX idx_job_executions_schedule ON job_executions (job_schedule_id);
 CREATE INDEX idx_job_executions_project ON job_executions (project_code, created_at DESC);
 
+-- Notify listeners (scheduler, job waiters) when job executions are submitted or change status
+CREATE OR REPLACE FUNCTION fn_notify_job_execution() RETURNS TRIGGER
+AS
+$$
+BEGIN
+    PERFORM pg_notify(
+        TG_TABLE_SCHEMA || '_job_executions',
+        json_build_object('id', NEW.id, 'status', NEW.status)::TEXT
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER job_executions_notify_insert
+    AFTER INSERT ON job_executions
+    FOR EACH ROW EXECUTE FUNCTION fn_notify_job_execution();
+
+CREATE TRIGGER job_executions_notify_status
+    AFTER UPDATE OF status ON job_executions
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION fn_notify_job_execution();
+
 CREATE TABLE settings (
     key VARCHAR(50) NOT NULL PRIMARY KEY,
     value JSONB NOT NULL
@@ -150,8 +150,8 @@ DROP VIEW IF EXISTS v_dq_profile_scoring_latest_by_dimension;
 CREATE VIEW v_dq_profile_scoring_latest_by_dimension
 AS
 SELECT tg.project_code,
-       pr.table_groups_id,
-       pr.profile_run_id,
+       f.table_groups_id,
+       f.profile_run_id,
        tg.table_groups_name,
        tg.data_location,
        COALESCE(dcc.data_source, dtc.data_source, tg.data_source) as data_source,
@@ -163,50 +163,31 @@ SELECT tg.project_code,
        COALESCE(dcc.critical_data_element, dtc.critical_data_element) as critical_data_element,
        COALESCE(dcc.data_product, dtc.data_product, tg.data_product) as data_product,
        dcc.functional_data_type as semantic_data_type,
-       t.dq_dimension,
-       pr.table_name,
-       pr.column_name,
-       pr.run_date,
-       MAX(pr.record_ct) as record_ct,
-       MAX(pr.record_ct
-           * CASE WHEN proj.use_dq_score_weights
-             THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
-             ELSE 1.0 END
+       f.dimension as dq_dimension,
+       f.table_name,
+       f.column_name,
+       f.run_date,
+       f.record_ct,
+       (f.record_ct
+        * CASE WHEN proj.use_dq_score_weights
+          THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
+          ELSE 1.0 END
        ) AS weighted_record_ct,
-       COUNT(p.anomaly_id) as issue_ct,
-       SUM_LN(COALESCE(p.dq_prevalence, 0.0)) as good_data_pct
-  FROM profile_results pr
+       f.issue_ct,
+       f.good_data_pct
+  FROM score_profiling_dimension_facts f
 INNER JOIN table_groups tg
-   ON (pr.profile_run_id = tg.last_complete_profile_run_id)
+   ON (f.profile_run_id = tg.last_complete_profile_run_id)
 INNER JOIN data_column_chars dcc
-   ON (pr.table_groups_id = dcc.table_groups_id
-  AND  pr.table_name = dcc.table_name
-  AND  pr.column_name = dcc.column_name)
+   ON (f.table_groups_id = dcc.table_groups_id
+  AND  f.table_name = dcc.table_name
+  AND  f.column_name = dcc.column_name)
 INNER JOIN data_table_chars dtc
    ON (dcc.table_id = dtc.table_id)
 INNER JOIN projects proj
    ON (tg.project_code = proj.project_code)
-LEFT JOIN (profile_anomaly_results p
-   INNER JOIN profile_anomaly_types t
-      ON p.anomaly_id = t.id)
-  ON (pr.profile_run_id = p.profile_run_id
- AND  pr.column_name = p.column_name
- AND  pr.table_name = p.table_name)
-WHERE (p.disposition = 'Confirmed' OR p.disposition IS NULL)
-   AND dcc.drop_date IS NULL
-GROUP BY pr.profile_run_id, pr.table_groups_id,
-         pr.table_name, pr.column_name,
-         tg.table_groups_name, tg.data_location,
-         COALESCE(dcc.data_source, dtc.data_source, tg.data_source),
-         COALESCE(dcc.source_system, dtc.source_system, tg.source_system),
-         COALESCE(dcc.source_process, dtc.source_process, tg.source_process),
-         COALESCE(dcc.business_domain, dtc.business_domain, tg.business_domain),
-         COALESCE(dcc.stakeholder_group, dtc.stakeholder_group, tg.stakeholder_group),
-         COALESCE(dcc.transform_level, dtc.transform_level, tg.transform_level),
-         COALESCE(dcc.critical_data_element, dtc.critical_data_element),
-         COALESCE(dcc.data_product, dtc.data_product, tg.data_product),
-         dcc.functional_data_type, t.dq_dimension, pr.run_date,
-         tg.project_code ;
+WHERE f.dimension_type = 'dq_dimension'
+   AND dcc.drop_date IS NULL;
 
 
 -- ==============================================================================
@@ -219,9 +200,9 @@ CREATE VIEW v_dq_test_scoring_latest_by_column
 AS
 SELECT
        tg.project_code,
-       r.table_groups_id,
-       r.test_suite_id,
-       r.test_run_id,
+       f.table_groups_id,
+       f.test_suite_id,
+       f.test_run_id,
        tg.table_groups_name,
        tg.data_location,
        COALESCE(dcc.data_source, dtc.data_source, tg.data_source) as data_source,
@@ -233,46 +214,33 @@ SELECT
        COALESCE(dcc.critical_data_element, dtc.critical_data_element) as critical_data_element,
        COALESCE(dcc.data_product, dtc.data_product, tg.data_product) as data_product,
        dcc.functional_data_type as semantic_data_type,
-       r.test_time, r.table_name, r.column_names as column_name,
-       COUNT(*) as test_ct,
-       SUM(CASE WHEN r.result_code = 1 THEN 1 ELSE 0 END) as passed_ct,
-       SUM(CASE WHEN r.result_code = 0 THEN 1 ELSE 0 END) as issue_ct,
-       MAX(r.dq_record_ct) as dq_record_ct,
-       MAX(r.dq_record_ct
-           * CASE WHEN proj.use_dq_score_weights
-             THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
-             ELSE 1.0 END
+       f.test_time, f.table_name, f.column_name,
+       f.test_ct,
+       f.passed_ct,
+       f.issue_ct,
+       f.dq_record_ct,
+       (f.dq_record_ct
+        * CASE WHEN proj.use_dq_score_weights
+          THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
+          ELSE 1.0 END
        ) AS weighted_dq_record_ct,
-       SUM_LN(COALESCE(r.dq_prevalence, 0.0)) as good_data_pct
-  FROM test_results r
+       f.good_data_pct
+  FROM score_test_column_facts f
 INNER JOIN test_suites s
-   ON (r.test_run_id = s.last_complete_test_run_id)
+   ON (f.test_run_id = s.last_complete_test_run_id)
 INNER JOIN table_groups tg
-   ON r.table_groups_id = tg.id
+   ON f.table_groups_id = tg.id
 INNER JOIN projects proj
    ON (tg.project_code = proj.project_code)
 LEFT JOIN data_table_chars dtc
-   ON (r.table_groups_id = dtc.table_groups_id
-  AND  r.table_name = dtc.table_name)
+   ON (f.table_groups_id = dtc.table_groups_id
+  AND  f.table_name = dtc.table_name)
 LEFT JOIN data_column_chars dcc
-  ON (r.table_groups_id = dcc.table_groups_id
- AND  r.table_name = dcc.table_name
- AND  r.column_names = dcc.column_name)
- WHERE r.dq_prevalence IS NOT NULL
-   AND s.dq_score_exclude = FALSE
-   AND (r.disposition IS NULL OR r.disposition = 'Confirmed')
-   AND dcc.drop_date IS NULL
-GROUP BY r.table_groups_id, r.table_name, r.column_names,
-         r.test_suite_id, r.test_run_id, tg.table_groups_name, dcc.data_source, dtc.data_source,
-         tg.data_source, tg.data_location, dcc.data_source, dtc.data_source,
-         tg.data_source, dcc.source_system, dtc.source_system, tg.source_system,
-         dcc.source_process, dtc.source_process, tg.source_process, dcc.business_domain,
-         dtc.business_domain, tg.business_domain, dcc.stakeholder_group, dtc.stakeholder_group,
-         tg.stakeholder_group, dcc.transform_level, dtc.transform_level, tg.transform_level,
-         dcc.critical_data_element, dtc.critical_data_element,
-         dcc.data_product, dtc.data_product, tg.data_product,
-         dcc.functional_data_type, r.test_time,
-         tg.project_code;
+  ON (f.table_groups_id = dcc.table_groups_id
+ AND  f.table_name = dcc.table_name
+ AND  f.column_name = dcc.column_name)
+ WHERE s.dq_score_exclude = FALSE
+   AND dcc.drop_date IS NULL;
 
 
 DROP VIEW IF EXISTS v_dq_test_scoring_latest_by_dimension;
@@ -280,23 +248,14 @@ DROP VIEW IF EXISTS v_dq_test_scoring_latest_by_dimension;
 CREATE VIEW v_dq_test_scoring_latest_by_dimension
 AS
 WITH dimension_rollup
-   AS (SELECT r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time,
-              r.table_name, r.column_names, tt.dq_dimension,
-              COUNT(*) as test_ct,
-              SUM(CASE WHEN r.result_code = 1 THEN 1 ELSE 0 END) as passed_ct,
-              SUM(CASE WHEN r.result_code = 0 THEN 1 ELSE 0 END) as issue_ct,
-              MAX(r.dq_record_ct) as dq_record_ct,
-              SUM_LN(COALESCE(r.dq_prevalence::NUMERIC, 0)) as good_data_pct
-         FROM test_results r
-         INNER JOIN test_types tt
-            ON (r.test_type = tt.test_type)
+   AS (SELECT f.test_run_id, f.test_suite_id, f.table_groups_id, f.test_time,
+              f.table_name, f.column_name as column_names, f.dimension as dq_dimension,
+              f.test_ct, f.passed_ct, f.issue_ct, f.dq_record_ct, f.good_data_pct
+         FROM score_test_dimension_facts f
          INNER JOIN test_suites s
-            ON (r.test_run_id = s.last_complete_test_run_id)
-         WHERE r.dq_prevalence IS NOT NULL
-           AND s.dq_score_exclude = FALSE
-           AND COALESCE(r.disposition, 'Confirmed') = 'Confirmed'
-         GROUP BY r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time,
-              r.table_name, r.column_names, tt.dq_dimension )
+            ON (f.test_run_id = s.last_complete_test_run_id)
+         WHERE f.dimension_type = 'dq_dimension'
+           AND s.dq_score_exclude = FALSE )
 SELECT
        tg.project_code,
        r.table_groups_id,
@@ -356,8 +315,8 @@ DROP VIEW IF EXISTS v_dq_profile_scoring_latest_by_impact_dimension;
 CREATE VIEW v_dq_profile_scoring_latest_by_impact_dimension
 AS
 SELECT tg.project_code,
-       pr.table_groups_id,
-       pr.profile_run_id,
+       f.table_groups_id,
+       f.profile_run_id,
        tg.table_groups_name,
        tg.data_location,
        COALESCE(dcc.data_source, dtc.data_source, tg.data_source) as data_source,
@@ -369,50 +328,31 @@ SELECT tg.project_code,
        COALESCE(dcc.critical_data_element, dtc.critical_data_element) as critical_data_element,
        COALESCE(dcc.data_product, dtc.data_product, tg.data_product) as data_product,
        dcc.functional_data_type as semantic_data_type,
-       t.impact_dimension,
-       pr.table_name,
-       pr.column_name,
-       pr.run_date,
-       MAX(pr.record_ct) as record_ct,
-       MAX(pr.record_ct
-           * CASE WHEN proj.use_dq_score_weights
-             THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
-             ELSE 1.0 END
+       f.dimension as impact_dimension,
+       f.table_name,
+       f.column_name,
+       f.run_date,
+       f.record_ct,
+       (f.record_ct
+        * CASE WHEN proj.use_dq_score_weights
+          THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
+          ELSE 1.0 END
        ) AS weighted_record_ct,
-       COUNT(p.anomaly_id) as issue_ct,
-       SUM_LN(COALESCE(p.dq_prevalence, 0.0)) as good_data_pct
-  FROM profile_results pr
+       f.issue_ct,
+       f.good_data_pct
+  FROM score_profiling_dimension_facts f
 INNER JOIN table_groups tg
-   ON (pr.profile_run_id = tg.last_complete_profile_run_id)
+   ON (f.profile_run_id = tg.last_complete_profile_run_id)
 INNER JOIN data_column_chars dcc
-   ON (pr.table_groups_id = dcc.table_groups_id
-  AND  pr.table_name = dcc.table_name
-  AND  pr.column_name = dcc.column_name)
+   ON (f.table_groups_id = dcc.table_groups_id
+  AND  f.table_name = dcc.table_name
+  AND  f.column_name = dcc.column_name)
 INNER JOIN data_table_chars dtc
    ON (dcc.table_id = dtc.table_id)
 INNER JOIN projects proj
    ON (tg.project_code = proj.project_code)
-LEFT JOIN (profile_anomaly_results p
-   INNER JOIN profile_anomaly_types t
-      ON p.anomaly_id = t.id)
-  ON (pr.profile_run_id = p.profile_run_id
- AND  pr.column_name = p.column_name
- AND  pr.table_name = p.table_name)
-WHERE (p.disposition = 'Confirmed' OR p.disposition IS NULL)
-   AND dcc.drop_date IS NULL
-GROUP BY pr.profile_run_id, pr.table_groups_id,
-         pr.table_name, pr.column_name,
-         tg.table_groups_name, tg.data_location,
-         COALESCE(dcc.data_source, dtc.data_source, tg.data_source),
-         COALESCE(dcc.source_system, dtc.source_system, tg.source_system),
-         COALESCE(dcc.source_process, dtc.source_process, tg.source_process),
-         COALESCE(dcc.business_domain, dtc.business_domain, tg.business_domain),
-         COALESCE(dcc.stakeholder_group, dtc.stakeholder_group, tg.stakeholder_group),
-         COALESCE(dcc.transform_level, dtc.transform_level, tg.transform_level),
-         COALESCE(dcc.critical_data_element, dtc.critical_data_element),
-         COALESCE(dcc.data_product, dtc.data_product, tg.data_product),
-         dcc.functional_data_type, t.impact_dimension, pr.run_date,
-         tg.project_code;
+WHERE f.dimension_type = 'impact_dimension'
+   AND dcc.drop_date IS NULL;
 
 
 DROP VIEW IF EXISTS v_dq_test_scoring_latest_by_impact_dimension;
@@ -420,21 +360,14 @@ DROP VIEW IF EXISTS v_dq_test_scoring_latest_by_impact_dimension;
 CREATE VIEW v_dq_test_scoring_latest_by_impact_dimension
 AS
 WITH impact_dimension_rollup
-   AS (SELECT r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time,
-              r.table_name, r.column_names, r.impact_dimension,
-              COUNT(*) as test_ct,
-              SUM(CASE WHEN r.result_code = 1 THEN 1 ELSE 0 END) as passed_ct,
-              SUM(CASE WHEN r.result_code = 0 THEN 1 ELSE 0 END) as issue_ct,
-              MAX(r.dq_record_ct) as dq_record_ct,
-              SUM_LN(COALESCE(r.dq_prevalence::NUMERIC, 0)) as good_data_pct
-         FROM test_results r
+   AS (SELECT f.test_run_id, f.test_suite_id, f.table_groups_id, f.test_time,
+              f.table_name, f.column_name as column_names, f.dimension as impact_dimension,
+              f.test_ct, f.passed_ct, f.issue_ct, f.dq_record_ct, f.good_data_pct
+         FROM score_test_dimension_facts f
          INNER JOIN test_suites s
-            ON (r.test_run_id = s.last_complete_test_run_id)
-         WHERE r.dq_prevalence IS NOT NULL
-           AND s.dq_score_exclude = FALSE
-           AND COALESCE(r.disposition, 'Confirmed') = 'Confirmed'
-         GROUP BY r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time,
-              r.table_name, r.column_names, r.impact_dimension)
+            ON (f.test_run_id = s.last_complete_test_run_id)
+         WHERE f.dimension_type = 'impact_dimension'
+           AND s.dq_score_exclude = FALSE )
 SELECT
        tg.project_code,
        r.table_groups_id,
@@ -499,8 +432,8 @@ AS
 SELECT tg.project_code,
        sr.definition_id,
        sr.score_history_cutoff_time,
-       pr.table_groups_id,
-       pr.profile_run_id,
+       f.table_groups_id,
+       f.profile_run_id,
        tg.table_groups_name,
        tg.data_location,
        COALESCE(dcc.data_source, dtc.data_source, tg.data_source) as data_source,
@@ -512,53 +445,30 @@ SELECT tg.project_code,
        COALESCE(dcc.critical_data_element, dtc.critical_data_element) as critical_data_element,
        COALESCE(dcc.data_product, dtc.data_product, tg.data_product) as data_product,
        dcc.functional_data_type as semantic_data_type,
-       pr.table_name,
-       pr.column_name,
-       pr.run_date,
-       MAX(pr.record_ct) as record_ct,
-       MAX(pr.record_ct
-           * CASE WHEN proj.use_dq_score_weights
-             THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
-             ELSE 1.0 END
+       f.table_name,
+       f.column_name,
+       f.run_date,
+       f.record_ct,
+       (f.record_ct
+        * CASE WHEN proj.use_dq_score_weights
+          THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
+          ELSE 1.0 END
        ) AS weighted_record_ct,
-       COUNT(p.anomaly_id) as issue_ct,
-       SUM_LN(COALESCE(p.dq_prevalence, 0.0)) as good_data_pct
-  FROM profile_results pr
+       f.issue_ct,
+       f.good_data_pct
+  FROM score_profiling_column_facts f
 INNER JOIN score_history_latest_runs sr
-   ON (pr.profile_run_id = sr.last_profiling_run_id)
+   ON (f.profile_run_id = sr.last_profiling_run_id)
 INNER JOIN data_column_chars dcc
-   ON (pr.table_groups_id = dcc.table_groups_id
-  AND  pr.table_name = dcc.table_name
-  AND  pr.column_name = dcc.column_name)
+   ON (f.table_groups_id = dcc.table_groups_id
+  AND  f.table_name = dcc.table_name
+  AND  f.column_name = dcc.column_name)
 INNER JOIN data_table_chars dtc
    ON (dcc.table_id = dtc.table_id)
 INNER JOIN table_groups tg
-   ON (pr.table_groups_id = tg.id)
+   ON (f.table_groups_id = tg.id)
 INNER JOIN projects proj
-   ON (tg.project_code = proj.project_code)
-LEFT JOIN (profile_anomaly_results p
-   INNER JOIN profile_anomaly_types t
-      ON p.anomaly_id = t.id)
-  ON (pr.profile_run_id = p.profile_run_id
- AND  pr.column_name = p.column_name
- AND  pr.table_name = p.table_name)
-WHERE p.disposition = 'Confirmed' OR p.disposition IS NULL
-GROUP BY pr.profile_run_id,
-         sr.definition_id,
-         sr.score_history_cutoff_time,
-         pr.table_groups_id,
-         pr.table_name, pr.column_name,
-         tg.table_groups_name, tg.data_location,
-         COALESCE(dcc.data_source, dtc.data_source, tg.data_source),
-         COALESCE(dcc.source_system, dtc.source_system, tg.source_system),
-         COALESCE(dcc.source_process, dtc.source_process, tg.source_process),
-         COALESCE(dcc.business_domain, dtc.business_domain, tg.business_domain),
-         COALESCE(dcc.stakeholder_group, dtc.stakeholder_group, tg.stakeholder_group),
-         COALESCE(dcc.transform_level, dtc.transform_level, tg.transform_level),
-         COALESCE(dcc.critical_data_element, dtc.critical_data_element),
-         COALESCE(dcc.data_product, dtc.data_product, tg.data_product),
-         dcc.functional_data_type, pr.run_date,
-         tg.project_code ;
+   ON (tg.project_code = proj.project_code);
 
 DROP VIEW IF EXISTS v_dq_test_scoring_history_by_column;
 
@@ -568,9 +478,9 @@ SELECT
        tg.project_code,
        sr.definition_id,
        sr.score_history_cutoff_time,
-       r.table_groups_id,
-       r.test_suite_id,
-       r.test_run_id,
+       f.table_groups_id,
+       f.test_suite_id,
+       f.test_run_id,
        tg.table_groups_name,
        tg.data_location,
        COALESCE(dcc.data_source, dtc.data_source, tg.data_source) as data_source,
@@ -582,46 +492,31 @@ SELECT
        COALESCE(dcc.critical_data_element, dtc.critical_data_element) as critical_data_element,
        COALESCE(dcc.data_product, dtc.data_product, tg.data_product) as data_product,
        dcc.functional_data_type as semantic_data_type,
-       r.test_time, r.table_name, r.column_names as column_name,
-       COUNT(*) as test_ct,
-       SUM(CASE WHEN r.result_code = 1 THEN 1 ELSE 0 END) as passed_ct,
-       SUM(CASE WHEN r.result_code = 0 THEN 1 ELSE 0 END) as issue_ct,
-       MAX(r.dq_record_ct) as dq_record_ct,
-       MAX(r.dq_record_ct
-           * CASE WHEN proj.use_dq_score_weights
-             THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
-             ELSE 1.0 END
+       f.test_time, f.table_name, f.column_name,
+       f.test_ct,
+       f.passed_ct,
+       f.issue_ct,
+       f.dq_record_ct,
+       (f.dq_record_ct
+        * CASE WHEN proj.use_dq_score_weights
+          THEN COALESCE(dtc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_weight, 1.0) * COALESCE(dcc.dq_score_pii_weight, 1.0)
+          ELSE 1.0 END
        ) AS weighted_dq_record_ct,
-       SUM_LN(COALESCE(r.dq_prevalence, 0.0)) as good_data_pct
-  FROM test_results r
+       f.good_data_pct
+  FROM score_test_column_facts f
 INNER JOIN test_suites s
-   ON (r.test_suite_id = s.id)
+   ON (f.test_suite_id = s.id)
 INNER JOIN score_history_latest_runs sr
-   ON (r.test_run_id = sr.last_test_run_id)
+   ON (f.test_run_id = sr.last_test_run_id)
 INNER JOIN table_groups tg
-   ON r.table_groups_id = tg.id
+   ON f.table_groups_id = tg.id
 INNER JOIN projects proj
    ON (tg.project_code = proj.project_code)
 LEFT JOIN data_table_chars dtc
-   ON (r.table_groups_id = dtc.table_groups_id
-  AND  r.table_name = dtc.table_name)
+   ON (f.table_groups_id = dtc.table_groups_id
+  AND  f.table_name = dtc.table_name)
 LEFT JOIN data_column_chars dcc
-  ON (r.table_groups_id = dcc.table_groups_id
- AND  r.table_name = dcc.table_name
- AND  r.column_names = dcc.column_name)
- WHERE r.dq_prevalence IS NOT NULL
-   AND s.dq_score_exclude = FALSE
-   AND (r.disposition IS NULL OR r.disposition = 'Confirmed')
-GROUP BY sr.definition_id,
-         sr.score_history_cutoff_time,
-         r.table_groups_id, r.table_name, r.column_names,
-         r.test_suite_id, r.test_run_id, tg.table_groups_name, dcc.data_source, dtc.data_source,
-         tg.data_source, tg.data_location, dcc.data_source, dtc.data_source,
-         tg.data_source, dcc.source_system, dtc.source_system, tg.source_system,
-         dcc.source_process, dtc.source_process, tg.source_process, dcc.business_domain,
-         dtc.business_domain, tg.business_domain, dcc.stakeholder_group, dtc.stakeholder_group,
-         tg.stakeholder_group, dcc.transform_level, dtc.transform_level, tg.transform_level,
-         dcc.critical_data_element, dtc.critical_data_element,
-         dcc.data_product, dtc.data_product, tg.data_product,
-         dcc.functional_data_type, r.test_time,
-         tg.project_code;
+  ON (f.table_groups_id = dcc.table_groups_id
+ AND  f.table_name = dcc.table_name
+ AND  f.column_name = dcc.column_name)
+ WHERE s.dq_score_exclude = FALSE;
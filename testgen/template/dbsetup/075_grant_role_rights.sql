@@ -25,6 +25,7 @@ GRANT SELECT, INSERT, DELETE, UPDATE ON
     {SCHEMA_NAME}.stg_test_definition_updates,
     {SCHEMA_NAME}.test_runs,
     {SCHEMA_NAME}.functional_test_results,
+    {SCHEMA_NAME}.monitor_table_snapshots,
     {SCHEMA_NAME}.connections,
     {SCHEMA_NAME}.table_groups,
     {SCHEMA_NAME}.projects,
@@ -40,11 +41,16 @@ GRANT SELECT, INSERT, DELETE, UPDATE ON
     {SCHEMA_NAME}.score_definition_results_breakdown,
     {SCHEMA_NAME}.score_definition_results_history,
     {SCHEMA_NAME}.score_history_latest_runs,
+    {SCHEMA_NAME}.score_profiling_column_facts,
+    {SCHEMA_NAME}.score_profiling_dimension_facts,
+    {SCHEMA_NAME}.score_test_column_facts,
+    {SCHEMA_NAME}.score_test_dimension_facts,
     {SCHEMA_NAME}.job_schedules,
     {SCHEMA_NAME}.job_executions,
     {SCHEMA_NAME}.settings,
     {SCHEMA_NAME}.notification_settings,
     {SCHEMA_NAME}.test_definition_notes,
+    {SCHEMA_NAME}.prediction_model_states,
     {SCHEMA_NAME}.oauth2_clients,
     {SCHEMA_NAME}.oauth2_authorization_codes,
     {SCHEMA_NAME}.oauth2_tokens
@@ -0,0 +1,12 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Persisted SARIMAX model state for incremental prediction updates
+
+ALTER TABLE stg_test_definition_updates
+    ADD COLUMN IF NOT EXISTS model_state JSONB;
+
+CREATE TABLE IF NOT EXISTS prediction_model_states (
+   test_definition_id   UUID PRIMARY KEY REFERENCES test_definitions ON DELETE CASCADE,
+   model_state          JSONB NOT NULL,
+   updated_at           TIMESTAMP
+);
@@ -0,0 +1,13 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Row count strategy for data characteristics refresh
+
+ALTER TABLE table_groups
+    ADD COLUMN IF NOT EXISTS row_count_strategy   VARCHAR(20) DEFAULT 'exact',
+    ADD COLUMN IF NOT EXISTS row_count_change_pct INTEGER DEFAULT 10;
+
+ALTER TABLE data_table_chars
+    ADD COLUMN IF NOT EXISTS approx_record_ct_at_count BIGINT;
+
+ALTER TABLE stg_data_chars_updates
+    ADD COLUMN IF NOT EXISTS approx_record_ct_at_count BIGINT;
@@ -0,0 +1,147 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Pre-aggregated score facts per run, maintained by the score rollups
+
+CREATE TABLE IF NOT EXISTS score_profiling_column_facts (
+   profile_run_id   UUID NOT NULL,
+   table_groups_id  UUID,
+   run_date         TIMESTAMP,
+   table_name       VARCHAR(120),
+   column_name      VARCHAR(120),
+   record_ct        BIGINT,
+   issue_ct         INTEGER,
+   good_data_pct    DOUBLE PRECISION
+);
+
+CREATE INDEX IF NOT EXISTS score_pro_col_facts_run
+   ON score_profiling_column_facts(profile_run_id);
+
+CREATE TABLE IF NOT EXISTS score_profiling_dimension_facts (
+   profile_run_id   UUID NOT NULL,
+   table_groups_id  UUID,
+   run_date         TIMESTAMP,
+   table_name       VARCHAR(120),
+   column_name      VARCHAR(120),
+   dimension_type   VARCHAR(20) NOT NULL,
+   dimension        VARCHAR(50),
+   record_ct        BIGINT,
+   issue_ct         INTEGER,
+   good_data_pct    DOUBLE PRECISION
+);
+
+CREATE INDEX IF NOT EXISTS score_pro_dim_facts_run
+   ON score_profiling_dimension_facts(profile_run_id, dimension_type);
+
+CREATE TABLE IF NOT EXISTS score_test_column_facts (
+   test_run_id      UUID NOT NULL,
+   test_suite_id    UUID,
+   table_groups_id  UUID,
+   test_time        TIMESTAMP,
+   table_name       VARCHAR(100),
+   column_name      VARCHAR(500),
+   test_ct          INTEGER,
+   passed_ct        INTEGER,
+   issue_ct         INTEGER,
+   dq_record_ct     BIGINT,
+   good_data_pct    DOUBLE PRECISION
+);
+
+CREATE INDEX IF NOT EXISTS score_tst_col_facts_run
+   ON score_test_column_facts(test_run_id);
+
+CREATE TABLE IF NOT EXISTS score_test_dimension_facts (
+   test_run_id      UUID NOT NULL,
+   test_suite_id    UUID,
+   table_groups_id  UUID,
+   test_time        TIMESTAMP,
+   table_name       VARCHAR(100),
+   column_name      VARCHAR(500),
+   dimension_type   VARCHAR(20) NOT NULL,
+   dimension        VARCHAR(50),
+   test_ct          INTEGER,
+   passed_ct        INTEGER,
+   issue_ct         INTEGER,
+   dq_record_ct     BIGINT,
+   good_data_pct    DOUBLE PRECISION
+);
+
+CREATE INDEX IF NOT EXISTS score_tst_dim_facts_run
+   ON score_test_dimension_facts(test_run_id, dimension_type);
+
+-- Backfill score facts for existing runs
+
+INSERT INTO score_profiling_column_facts
+       (profile_run_id, table_groups_id, run_date, table_name, column_name,
+        record_ct, issue_ct, good_data_pct)
+SELECT pr.profile_run_id, pr.table_groups_id, pr.run_date, pr.table_name, pr.column_name,
+       MAX(pr.record_ct) as record_ct,
+       COUNT(p.anomaly_id) as issue_ct,
+       SUM_LN(COALESCE(p.dq_prevalence, 0.0)) as good_data_pct
+  FROM profile_results pr
+LEFT JOIN (profile_anomaly_results p
+   INNER JOIN profile_anomaly_types t
+      ON p.anomaly_id = t.id)
+  ON (pr.profile_run_id = p.profile_run_id
+ AND  pr.column_name = p.column_name
+ AND  pr.table_name = p.table_name)
+ WHERE pr.profile_run_id IS NOT NULL
+   AND (p.disposition = 'Confirmed' OR p.disposition IS NULL)
+GROUP BY pr.profile_run_id, pr.table_groups_id, pr.run_date, pr.table_name, pr.column_name;
+
+INSERT INTO score_profiling_dimension_facts
+       (profile_run_id, table_groups_id, run_date, table_name, column_name,
+        dimension_type, dimension, record_ct, issue_ct, good_data_pct)
+SELECT pr.profile_run_id, pr.table_groups_id, pr.run_date, pr.table_name, pr.column_name,
+       d.dimension_type,
+       CASE d.dimension_type WHEN 'dq_dimension' THEN t.dq_dimension ELSE t.impact_dimension END as dimension,
+       MAX(pr.record_ct) as record_ct,
+       COUNT(p.anomaly_id) as issue_ct,
+       SUM_LN(COALESCE(p.dq_prevalence, 0.0)) as good_data_pct
+  FROM profile_results pr
+CROSS JOIN (VALUES ('dq_dimension'), ('impact_dimension')) AS d(dimension_type)
+LEFT JOIN (profile_anomaly_results p
+   INNER JOIN profile_anomaly_types t
+      ON p.anomaly_id = t.id)
+  ON (pr.profile_run_id = p.profile_run_id
+ AND  pr.column_name = p.column_name
+ AND  pr.table_name = p.table_name)
+ WHERE pr.profile_run_id IS NOT NULL
+   AND (p.disposition = 'Confirmed' OR p.disposition IS NULL)
+GROUP BY pr.profile_run_id, pr.table_groups_id, pr.run_date, pr.table_name, pr.column_name,
+         d.dimension_type,
+         CASE d.dimension_type WHEN 'dq_dimension' THEN t.dq_dimension ELSE t.impact_dimension END;
+
+INSERT INTO score_test_column_facts
+       (test_run_id, test_suite_id, table_groups_id, test_time, table_name, column_name,
+        test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct)
+SELECT r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time, r.table_name, r.column_names,
+       COUNT(*) as test_ct,
+       SUM(CASE WHEN r.result_code = 1 THEN 1 ELSE 0 END) as passed_ct,
+       SUM(CASE WHEN r.result_code = 0 THEN 1 ELSE 0 END) as issue_ct,
+       MAX(r.dq_record_ct) as dq_record_ct,
+       SUM_LN(COALESCE(r.dq_prevalence, 0.0)) as good_data_pct
+  FROM test_results r
+ WHERE r.dq_prevalence IS NOT NULL
+   AND COALESCE(r.disposition, 'Confirmed') = 'Confirmed'
+GROUP BY r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time, r.table_name, r.column_names;
+
+INSERT INTO score_test_dimension_facts
+       (test_run_id, test_suite_id, table_groups_id, test_time, table_name, column_name,
+        dimension_type, dimension, test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct)
+SELECT r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time, r.table_name, r.column_names,
+       d.dimension_type,
+       CASE d.dimension_type WHEN 'dq_dimension' THEN tt.dq_dimension ELSE r.impact_dimension END as dimension,
+       COUNT(*) as test_ct,
+       SUM(CASE WHEN r.result_code = 1 THEN 1 ELSE 0 END) as passed_ct,
+       SUM(CASE WHEN r.result_code = 0 THEN 1 ELSE 0 END) as issue_ct,
+       MAX(r.dq_record_ct) as dq_record_ct,
+       SUM_LN(COALESCE(r.dq_prevalence::NUMERIC, 0)) as good_data_pct
+  FROM test_results r
+INNER JOIN test_types tt
+   ON (r.test_type = tt.test_type)
+CROSS JOIN (VALUES ('dq_dimension'), ('impact_dimension')) AS d(dimension_type)
+ WHERE r.dq_prevalence IS NOT NULL
+   AND COALESCE(r.disposition, 'Confirmed') = 'Confirmed'
+GROUP BY r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time, r.table_name, r.column_names,
+         d.dimension_type,
+         CASE d.dimension_type WHEN 'dq_dimension' THEN tt.dq_dimension ELSE r.impact_dimension END;
@@ -0,0 +1,6 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Keyset pagination of the data catalog tables
+
+CREATE INDEX IF NOT EXISTS idx_dtc_tg_lower_table
+  ON data_table_chars (table_groups_id, LOWER(table_name), table_id);
@@ -0,0 +1,39 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Per-table monitor summaries, refreshed when monitors run and read by the monitors dashboard
+
+CREATE TABLE IF NOT EXISTS monitor_table_snapshots (
+   test_suite_id            UUID NOT NULL
+      CONSTRAINT monitor_table_snapshots_test_suites_test_suite_id_fk
+         REFERENCES test_suites ON DELETE CASCADE,
+   table_groups_id          UUID NOT NULL,
+   table_name               VARCHAR(120) NOT NULL,
+   lookback                 INTEGER,
+   freshness_anomalies      INTEGER,
+   volume_anomalies         INTEGER,
+   schema_anomalies         INTEGER,
+   metric_anomalies         INTEGER,
+   latest_update            TIMESTAMP,
+   row_count                BIGINT,
+   previous_row_count       BIGINT,
+   column_adds              INTEGER,
+   column_drops             INTEGER,
+   column_mods              INTEGER,
+   freshness_error_message  VARCHAR,
+   volume_error_message     VARCHAR,
+   schema_error_message     VARCHAR,
+   metric_error_message     VARCHAR,
+   freshness_is_training    BOOLEAN,
+   volume_is_training       BOOLEAN,
+   metric_is_training       BOOLEAN,
+   freshness_is_pending     BOOLEAN,
+   volume_is_pending        BOOLEAN,
+   schema_is_pending        BOOLEAN,
+   metric_is_pending        BOOLEAN,
+   table_state              VARCHAR(10),
+   lookback_start           TIMESTAMP,
+   lookback_end             TIMESTAMP,
+   snapshot_date            TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+   CONSTRAINT monitor_table_snapshots_pk
+      PRIMARY KEY (test_suite_id, table_name)
+);
@@ -0,0 +1,25 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Notify listeners (scheduler, job waiters) when job executions are submitted or change status
+CREATE OR REPLACE FUNCTION fn_notify_job_execution() RETURNS TRIGGER
+AS
+$$
+BEGIN
+    PERFORM pg_notify(
+        TG_TABLE_SCHEMA || '_job_executions',
+        json_build_object('id', NEW.id, 'status', NEW.status)::TEXT
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS job_executions_notify_insert ON job_executions;
+CREATE TRIGGER job_executions_notify_insert
+    AFTER INSERT ON job_executions
+    FOR EACH ROW EXECUTE FUNCTION fn_notify_job_execution();
+
+DROP TRIGGER IF EXISTS job_executions_notify_status ON job_executions;
+CREATE TRIGGER job_executions_notify_status
+    AFTER UPDATE OF status ON job_executions
+    FOR EACH ROW WHEN (OLD.status IS DISTINCT FROM NEW.status)
+    EXECUTE FUNCTION fn_notify_job_execution();
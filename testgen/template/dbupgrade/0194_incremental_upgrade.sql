@@ -0,0 +1,13 @@
+SET SEARCH_PATH TO {SCHEMA_NAME};
+
+-- Connection of the table group or test suite a job runs on, for the concurrency limit per connection
+
+ALTER TABLE job_executions ADD COLUMN IF NOT EXISTS connection_id BIGINT;
+
+UPDATE job_executions
+SET connection_id = COALESCE(table_groups.connection_id, test_suites.connection_id)
+FROM job_executions AS jobs
+LEFT JOIN table_groups ON (table_groups.id::VARCHAR = jobs.kwargs->>'table_group_id')
+LEFT JOIN test_suites ON (test_suites.id::VARCHAR = jobs.kwargs->>'test_suite_id')
+WHERE job_executions.id = jobs.id
+    AND job_executions.status IN ('pending', 'claimed', 'running', 'cancel_requested');
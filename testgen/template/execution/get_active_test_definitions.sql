@@ -34,8 +34,16 @@ SELECT td.id,
     tm.template,
     c.measure,
     c.test_operator,
-    c.test_condition
+    c.test_condition,
+    COALESCE(td.severity, ts.severity, tt.default_severity) AS severity,
+    COALESCE(td.test_description, tt.test_description) AS test_description,
+    COALESCE(td.export_to_observability, ts.export_to_observability) AS export_to_observability,
+    tt.measure_uom,
+    COALESCE(td.impact_dimension, tt.impact_dimension) AS impact_dimension,
+    td.table_groups_id,
+    td.last_auto_gen_date IS NOT NULL AS auto_gen
 FROM test_definitions td
+    INNER JOIN test_suites ts ON (td.test_suite_id = ts.id)
     LEFT JOIN test_types tt ON (td.test_type = tt.test_type)
     LEFT JOIN test_templates tm ON (
         td.test_type = tm.test_type
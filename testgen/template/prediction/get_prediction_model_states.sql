@@ -0,0 +1,7 @@
+SELECT s.test_definition_id,
+  s.model_state
+FROM prediction_model_states s
+JOIN test_definitions d ON d.id = s.test_definition_id
+WHERE d.test_suite_id = :TEST_SUITE_ID
+  AND d.test_active = 'Y'
+  AND d.history_calculation = 'PREDICT';
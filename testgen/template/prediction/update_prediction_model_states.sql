@@ -0,0 +1,11 @@
+INSERT INTO prediction_model_states (test_definition_id, model_state, updated_at)
+SELECT s.test_definition_id,
+  s.model_state,
+  s.run_date
+FROM stg_test_definition_updates s
+WHERE s.test_suite_id = :TEST_SUITE_ID
+  AND s.run_date = :RUN_DATE
+  AND s.model_state IS NOT NULL
+ON CONFLICT (test_definition_id) DO UPDATE
+SET model_state = EXCLUDED.model_state,
+  updated_at = EXCLUDED.updated_at;
@@ -4,22 +4,24 @@ INSERT INTO profile_anomaly_results
 SELECT p.project_code,
        p.table_groups_id,
        p.profile_run_id,
-       :ANOMALY_ID as anomaly_id,
+       a.anomaly_id,
        p.schema_name,
        p.table_name,
        p.column_name,
        p.column_type,
        p.db_data_type,
-       {DETAIL_EXPRESSION} AS detail,
+       a.detail,
        at.impact_dimension
   FROM profile_results p
-INNER JOIN profile_anomaly_types at ON at.id = :ANOMALY_ID
+CROSS JOIN LATERAL (
+{ANOMALY_SCREENS}
+) a
+INNER JOIN profile_anomaly_types at ON at.id = a.anomaly_id
 LEFT JOIN v_inactive_anomalies i
   ON (p.table_groups_id = i.table_groups_id
  AND  p.schema_name = i.schema_name
  AND  p.table_name = i.table_name
  AND  p.column_name = i.column_name
- AND  :ANOMALY_ID = i.anomaly_id)
+ AND  a.anomaly_id = i.anomaly_id)
  WHERE p.profile_run_id = :PROFILE_RUN_ID
-   AND i.anomaly_id IS NULL
-   AND ({ANOMALY_CRITERIA});
+   AND i.anomaly_id IS NULL;
@@ -1,10 +1,10 @@
 UPDATE profile_anomaly_results r
-   SET dq_prevalence = ({PREV_FORMULA}) * :RISK
-  FROM profile_anomaly_results r2
-INNER JOIN profile_results p
-   ON (r2.profile_run_id = p.profile_run_id
-  AND  r2.table_name = p.table_name
-  AND  r2.column_name = p.column_name)
+   SET dq_prevalence = CASE r.anomaly_id
+{PREVALENCE_CASES}
+       END
+  FROM profile_results p
  WHERE r.profile_run_id = :PROFILE_RUN_ID
-   AND r2.anomaly_id = :ANOMALY_ID
-   AND r.id = r2.id;
\ No newline at end of file
+   AND r.anomaly_id IN ({ANOMALY_IDS})
+   AND p.profile_run_id = r.profile_run_id
+   AND p.table_name = r.table_name
+   AND p.column_name = r.column_name;
@@ -50,3 +50,51 @@ UPDATE profiling_runs
        dq_score_profiling = (1.0 - sum_affected_data_points::FLOAT / NULLIF(sum_data_points::FLOAT, 0))
   FROM score_calc
  WHERE profiling_runs.id = score_calc.profile_run_id;
+
+-- Refresh score facts for profiling run
+DELETE FROM score_profiling_column_facts
+ WHERE profile_run_id = :RUN_ID;
+
+INSERT INTO score_profiling_column_facts
+       (profile_run_id, table_groups_id, run_date, table_name, column_name,
+        record_ct, issue_ct, good_data_pct)
+SELECT pr.profile_run_id, pr.table_groups_id, pr.run_date, pr.table_name, pr.column_name,
+       MAX(pr.record_ct) as record_ct,
+       COUNT(p.anomaly_id) as issue_ct,
+       SUM_LN(COALESCE(p.dq_prevalence, 0.0)) as good_data_pct
+  FROM profile_results pr
+LEFT JOIN (profile_anomaly_results p
+   INNER JOIN profile_anomaly_types t
+      ON p.anomaly_id = t.id)
+  ON (pr.profile_run_id = p.profile_run_id
+ AND  pr.column_name = p.column_name
+ AND  pr.table_name = p.table_name)
+ WHERE pr.profile_run_id = :RUN_ID
+   AND (p.disposition = 'Confirmed' OR p.disposition IS NULL)
+GROUP BY pr.profile_run_id, pr.table_groups_id, pr.run_date, pr.table_name, pr.column_name;
+
+DELETE FROM score_profiling_dimension_facts
+ WHERE profile_run_id = :RUN_ID;
+
+INSERT INTO score_profiling_dimension_facts
+       (profile_run_id, table_groups_id, run_date, table_name, column_name,
+        dimension_type, dimension, record_ct, issue_ct, good_data_pct)
+SELECT pr.profile_run_id, pr.table_groups_id, pr.run_date, pr.table_name, pr.column_name,
+       d.dimension_type,
+       CASE d.dimension_type WHEN 'dq_dimension' THEN t.dq_dimension ELSE t.impact_dimension END as dimension,
+       MAX(pr.record_ct) as record_ct,
+       COUNT(p.anomaly_id) as issue_ct,
+       SUM_LN(COALESCE(p.dq_prevalence, 0.0)) as good_data_pct
+  FROM profile_results pr
+CROSS JOIN (VALUES ('dq_dimension'), ('impact_dimension')) AS d(dimension_type)
+LEFT JOIN (profile_anomaly_results p
+   INNER JOIN profile_anomaly_types t
+      ON p.anomaly_id = t.id)
+  ON (pr.profile_run_id = p.profile_run_id
+ AND  pr.column_name = p.column_name
+ AND  pr.table_name = p.table_name)
+ WHERE pr.profile_run_id = :RUN_ID
+   AND (p.disposition = 'Confirmed' OR p.disposition IS NULL)
+GROUP BY pr.profile_run_id, pr.table_groups_id, pr.run_date, pr.table_name, pr.column_name,
+         d.dimension_type,
+         CASE d.dimension_type WHEN 'dq_dimension' THEN t.dq_dimension ELSE t.impact_dimension END;
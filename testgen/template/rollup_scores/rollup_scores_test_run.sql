@@ -46,3 +46,47 @@ UPDATE test_runs
        dq_score_test_run = (1.0 - sum_affected_data_points::FLOAT / NULLIF(sum_data_points::FLOAT, 0))
   FROM score_calc
  WHERE test_runs.id = score_calc.test_run_id;
+
+-- Refresh score facts for test run
+DELETE FROM score_test_column_facts
+ WHERE test_run_id = :RUN_ID;
+
+INSERT INTO score_test_column_facts
+       (test_run_id, test_suite_id, table_groups_id, test_time, table_name, column_name,
+        test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct)
+SELECT r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time, r.table_name, r.column_names,
+       COUNT(*) as test_ct,
+       SUM(CASE WHEN r.result_code = 1 THEN 1 ELSE 0 END) as passed_ct,
+       SUM(CASE WHEN r.result_code = 0 THEN 1 ELSE 0 END) as issue_ct,
+       MAX(r.dq_record_ct) as dq_record_ct,
+       SUM_LN(COALESCE(r.dq_prevalence, 0.0)) as good_data_pct
+  FROM test_results r
+ WHERE r.test_run_id = :RUN_ID
+   AND r.dq_prevalence IS NOT NULL
+   AND COALESCE(r.disposition, 'Confirmed') = 'Confirmed'
+GROUP BY r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time, r.table_name, r.column_names;
+
+DELETE FROM score_test_dimension_facts
+ WHERE test_run_id = :RUN_ID;
+
+INSERT INTO score_test_dimension_facts
+       (test_run_id, test_suite_id, table_groups_id, test_time, table_name, column_name,
+        dimension_type, dimension, test_ct, passed_ct, issue_ct, dq_record_ct, good_data_pct)
+SELECT r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time, r.table_name, r.column_names,
+       d.dimension_type,
+       CASE d.dimension_type WHEN 'dq_dimension' THEN tt.dq_dimension ELSE r.impact_dimension END as dimension,
+       COUNT(*) as test_ct,
+       SUM(CASE WHEN r.result_code = 1 THEN 1 ELSE 0 END) as passed_ct,
+       SUM(CASE WHEN r.result_code = 0 THEN 1 ELSE 0 END) as issue_ct,
+       MAX(r.dq_record_ct) as dq_record_ct,
+       SUM_LN(COALESCE(r.dq_prevalence::NUMERIC, 0)) as good_data_pct
+  FROM test_results r
+INNER JOIN test_types tt
+   ON (r.test_type = tt.test_type)
+CROSS JOIN (VALUES ('dq_dimension'), ('impact_dimension')) AS d(dimension_type)
+ WHERE r.test_run_id = :RUN_ID
+   AND r.dq_prevalence IS NOT NULL
+   AND COALESCE(r.disposition, 'Confirmed') = 'Confirmed'
+GROUP BY r.test_run_id, r.test_suite_id, r.table_groups_id, r.test_time, r.table_name, r.column_names,
+         d.dimension_type,
+         CASE d.dimension_type WHEN 'dq_dimension' THEN tt.dq_dimension ELSE r.impact_dimension END;
@@ -14,6 +14,7 @@ from testgen.ui import bootstrap
 from testgen.ui.assets import get_asset_path
 from testgen.ui.components import widgets as testgen
 from testgen.ui.services import javascript_service
+from testgen.ui.services.query_cache import start_invalidation_listener
 from testgen.ui.session import session
 
 if is_standalone_mode() and (standalone_uri := os.environ.get(STANDALONE_URI_ENV_VAR)):
@@ -99,6 +100,7 @@ def render(log_level: int = logging.INFO):
 
 @st.cache_resource(validate=lambda _: not settings.IS_DEBUG, show_spinner=False)
 def get_application(log_level: int = logging.INFO):
+    start_invalidation_listener()
     return bootstrap.run(log_level=log_level)
 
 
@@ -307,7 +307,8 @@ const PiiDisplay = (/** @type string|null */ value) => {
  */
 const MetadataTagsMultiEdit = (props, selectedItems) => {
     const emit = props.emit;
-    const columnCount = van.derive(() => selectedItems.val?.reduce((count, { children }) => count + children.length, 0));
+    // Tables selected before their columns were loaded include all their columns
+    const columnCount = van.derive(() => selectedItems.val?.reduce((count, { children, all, childCount }) => count + (all && !children.length ? childCount ?? 0 : children.length), 0));
 
     const attributes = [
         'critical_data_element',
@@ -384,7 +385,7 @@ const MetadataTagsMultiEdit = (props, selectedItems) => {
                         onclick: () => {
                             const items = selectedItems.val.reduce((array, table) => {
                                 const [ type, id ] = table.id.split('_');
-                                array.push({ type, id });
+                                array.push({ type, id, all: !!table.all && !table.children.length });
 
                                 table.children.forEach(column => {
                                     const [ type, id ] = column.id.split('_');
@@ -3,6 +3,33 @@
  * @import { TreeNode, SelectedNode } from '/app/static/js/components/tree.js';
  * @import { FilterOption, ProjectSummary } from '../types.js';
  * 
+ * @typedef TablePath
+ * @type {object}
+ * @property {string} table_id
+ * @property {string} table_name
+ * @property {number} record_ct
+ * @property {number} column_ct
+ * @property {string} table_add_date
+ * @property {string} table_drop_date
+ * @property {boolean} table_critical_data_element
+ * @property {ColumnPath[]?} columns
+ *
+ * @typedef CatalogFilters
+ * @type {object}
+ * @property {string?} search
+ * @property {boolean} search_tables
+ * @property {boolean} search_columns
+ * @property {boolean} critical_data_element
+ * @property {boolean} pii_flag
+ * @property {boolean} show_excluded
+ * @property {Object.<string, string>} tags
+ *
+ * @typedef CatalogState
+ * @type {object}
+ * @property {CatalogFilters} filters
+ * @property {boolean} has_tables
+ * @property {boolean} has_more
+ *
  * @typedef ColumnPath
  * @type {object}
  * @property {string} column_id
@@ -53,7 +80,8 @@
  * @type {object}
  * @property {ProjectSummary} project_summary
  * @property {FilterOption[]} table_group_filter_options
- * @property {ColumnPath[]} columns
+ * @property {TablePath[]} tables
+ * @property {CatalogState} catalog
  * @property {Table | Column} selected_item
  * @property {Object.<string, string[]>} tag_values
  * @property {string} last_saved_timestamp
@@ -78,7 +106,7 @@ import { getColumnIcon, TABLE_ICON, LatestProfilingTime } from '../data_profilin
 import { RadioGroup } from '/app/static/js/components/radio_group.js';
 import { Checkbox } from '/app/static/js/components/checkbox.js';
 import { Select } from '/app/static/js/components/select.js';
-import { capitalize, caseInsensitiveIncludes, DISABLED_ACTION_TEXT } from '/app/static/js/display_utils.js';
+import { capitalize, DISABLED_ACTION_TEXT } from '/app/static/js/display_utils.js';
 import { TableSizeCard } from '../data_profiling/table_size.js';
 import { Card } from '/app/static/js/components/card.js';
 import { Button } from '/app/static/js/components/button.js';
@@ -111,57 +139,37 @@ const DataCatalog = (/** @type Properties */ props) => {
 
     /** @type TreeNode[] */
     const treeNodes = van.derive(() => {
-        let columns = [];
+        /** @type TablePath[] */
+        let tables = [];
         try {
-            columns = JSON.parse(getValue(props.columns) ?? []);
+            tables = JSON.parse(getValue(props.tables) ?? []);
         } catch { }
 
-        const tables = {};
-        columns.forEach((item) => {
-            const { column_id, table_id, column_name, table_name, record_ct, value_ct, add_date, drop_date, table_add_date, table_drop_date } = item;
-            if (!tables[table_id]) {
-                tables[table_id] = {
-                    id: table_id,
-                    label: table_name,
-                    classes: table_drop_date ? 'text-disabled' : (table_add_date && (Date.now() - new Date(table_add_date * 1000).getTime()) < 7 * 86400000) ? 'text-bold' : '',
-                    ...TABLE_ICON,
-                    iconClass: record_ct === 0 ? 'text-error' : null,
-                    iconTooltip: record_ct === 0 ? 'No records detected' : null,
-                    criticalDataElement: !!item.table_critical_data_element,
-                    children: [],
-                };
-                TAG_KEYS.forEach(key => tables[table_id][key] = item[`table_${key}`]);
-            }
-            const columnNode = {
-                id: column_id,
-                label: column_name,
-                classes: `column ${drop_date ? 'text-disabled' : (add_date && (Date.now() - new Date(add_date * 1000).getTime()) < 7 * 86400000) ? 'text-bold' : ''}`,
-                ...getColumnIcon(item),
-                iconClass: value_ct === 0 ? 'text-error' : null,
-                iconTooltip: value_ct === 0 ? 'No non-null values detected' : null,
-                prefix: () => {
-                    const icons = [];
-                    if (item.critical_data_element ?? item.table_critical_data_element) {
-                        icons.push(withTooltip(Icon({ size: 15, classes: 'text-purple' }, 'star'), { text: 'Critical data element', position: 'right' }));
-                    }
-                    if (item.excluded_data_element) {
-                        icons.push(withTooltip(Icon({ size: 15, classes: 'text-brown' }, 'visibility_off'), { text: 'Excluded data element', position: 'right' }));
-                    }
-                    if (item.pii_flag) {
-                        icons.push(withTooltip(Icon({ size: 15, classes: 'text-orange' }, 'shield_person'), { text: 'PII data', position: 'right' }));
-                    }
-                    return span({ class: 'tg-dh--column-prefix' }, ...icons);
-                },
-                criticalDataElement: !!(item.critical_data_element ?? item.table_critical_data_element),
-                excludedDataElement: !!item.excluded_data_element,
-                piiFlag: !!item.pii_flag,
+        return tables.map((table) => {
+            const { table_id, table_name, record_ct, column_ct, table_add_date, table_drop_date, columns } = table;
+            const tableNode = {
+                id: table_id,
+                label: table_name,
+                classes: table_drop_date ? 'text-disabled' : (table_add_date && (Date.now() - new Date(table_add_date * 1000).getTime()) < 7 * 86400000) ? 'text-bold' : '',
+                ...TABLE_ICON,
+                iconClass: record_ct === 0 ? 'text-error' : null,
+                iconTooltip: record_ct === 0 ? 'No records detected' : null,
+                criticalDataElement: !!table.table_critical_data_element,
+                // Columns are loaded when the table is expanded
+                children: columns ? columns.map(ColumnNode) : undefined,
+                childCount: column_ct,
+                expanded: !!columns?.length,
             };
-            TAG_KEYS.forEach(key => columnNode[key] = item[key] ?? item[`table_${key}`]);
-            tables[table_id].children.push(columnNode);
+            TAG_KEYS.forEach(key => tableNode[key] = table[`table_${key}`]);
+            return tableNode;
         });
-        return Object.values(tables);
     });
 
+    const catalog = van.derive(() => getValue(props.catalog) ?? {});
+    const hasTables = van.derive(() => !!catalog.val.has_tables);
+    /** @type CatalogFilters */
+    const initialFilters = catalog.rawVal.filters ?? {};
+
     const selectedItem = van.derive(() => {
         try {
             return JSON.parse(getValue(props.selected_item));
@@ -187,12 +195,30 @@ const DataCatalog = (/** @type Properties */ props) => {
         }
     };
 
+    const search = van.state(initialFilters.search ?? '');
     const searchOptions = {
-        tableName: van.state(true),
-        columnName: van.state(true),
+        tableName: van.state(initialFilters.search_tables ?? true),
+        columnName: van.state(initialFilters.search_columns ?? true),
+    };
+    const filters = {
+        criticalDataElement: van.state(!!initialFilters.critical_data_element),
+        piiFlag: van.state(!!initialFilters.pii_flag),
+        showExcluded: van.state(!!initialFilters.show_excluded),
     };
-    const filters = { criticalDataElement: van.state(false), piiFlag: van.state(false), showExcluded: van.state(false) };
-    TAG_KEYS.forEach(key => filters[key] = van.state(null));
+    TAG_KEYS.forEach(key => filters[key] = van.state(initialFilters.tags?.[key] ?? null));
+
+    // Search and filters are applied server-side, which reloads the tables
+    const emitFilters = () => emit('CatalogFiltersChanged', {
+        payload: {
+            search: search.rawVal || null,
+            search_tables: searchOptions.tableName.rawVal,
+            search_columns: searchOptions.columnName.rawVal,
+            critical_data_element: filters.criticalDataElement.rawVal,
+            pii_flag: filters.piiFlag.rawVal,
+            show_excluded: filters.showExcluded.rawVal,
+            tags: Object.fromEntries(TAG_KEYS.filter(key => filters[key].rawVal).map(key => [ key, filters[key].rawVal ])),
+        },
+    });
 
     // To hold temporary state within the portals, which might be discarded by clicking outside
     const tempSearchOptions = {};
@@ -237,10 +263,10 @@ const DataCatalog = (/** @type Properties */ props) => {
                             onclick: () => emit('ImportClicked', {}),
                         })
                         : null,
-                    ExportOptions(treeNodes, multiSelectedItems, userCanEdit, emit),
+                    ExportOptions(multiSelectedItems, userCanEdit, emit),
                 ),
             ),
-            () => treeNodes.val.length
+            () => hasTables.val
                 ? div(
                     {
                         class: 'flex-row tg-dh--content',
@@ -259,14 +285,25 @@ const DataCatalog = (/** @type Properties */ props) => {
                             multiSelectToggle: userCanEdit,
                             multiSelectToggleLabel: 'Edit multiple',
                             onMultiSelect: (/** @type string[] | null */ selected) => multiSelectedItems.val = selected,
-                            isNodeHidden: (/** @type TreeNode */ node, /** string */ search) => search 
-                                && (!caseInsensitiveIncludes(node.label, search)
-                                    || (!!node.children && !searchOptions.tableName.val)
-                                    || (!node.children && !searchOptions.columnName.val))
-                                || ![ node.criticalDataElement, false ].includes(filters.criticalDataElement.val)
-                                || ![ node.piiFlag, false ].includes(filters.piiFlag.val)
-                                || (node.excludedDataElement && !filters.showExcluded.val)
-                                || TAG_KEYS.some(key => ![ node[key], null ].includes(filters[key].val)),
+                            // The nodes are already filtered server-side
+                            isNodeHidden: () => false,
+                            search: search.rawVal,
+                            onSearch: (/** @type string */ value) => {
+                                search.val = value;
+                                emitFilters();
+                            },
+                            onExpand: (/** @type TreeNode[] */ nodes) => emit('TablesExpanded', { payload: nodes.map(node => node.id) }),
+                            footer: () => catalog.val.has_more
+                                ? div(
+                                    { class: 'flex-row fx-justify-center mt-2 mb-2' },
+                                    Button({
+                                        type: 'stroked',
+                                        label: 'Load more tables',
+                                        width: 'auto',
+                                        onclick: () => emit('MoreTablesRequested', {}),
+                                    }),
+                                )
+                                : '',
                             onApplySearchOptions: () => {
                                 copyState(tempSearchOptions, searchOptions);
                                 // If both were unselected, reset their values
@@ -275,9 +312,15 @@ const DataCatalog = (/** @type Properties */ props) => {
                                     searchOptions.tableName.val = true;
                                     searchOptions.columnName.val = true;
                                 }
+                                if (search.rawVal) {
+                                    emitFilters();
+                                }
                             },
                             hasActiveFilters: () => filters.criticalDataElement.val || filters.piiFlag.val || filters.showExcluded.val || TAG_KEYS.some(key => !!filters[key].val),
-                            onApplyFilters: () => copyState(tempFilters, filters),
+                            onApplyFilters: () => {
+                                copyState(tempFilters, filters);
+                                emitFilters();
+                            },
                             onResetFilters: () => {
                                 tempFilters.criticalDataElement.val = false;
                                 tempFilters.piiFlag.val = false;
@@ -446,7 +489,41 @@ const DataCatalog = (/** @type Properties */ props) => {
 };
 
 
-const ExportOptions = (/** @type TreeNode[] */ treeNodes, /** @type SelectedNode[] */ selectedNodes, _userCanEdit, emit) => {
+/**
+ * @param {ColumnPath} item
+ * @returns {TreeNode}
+ */
+const ColumnNode = (item) => {
+    const { column_id, column_name, value_ct, add_date, drop_date } = item;
+    const columnNode = {
+        id: column_id,
+        label: column_name,
+        classes: `column ${drop_date ? 'text-disabled' : (add_date && (Date.now() - new Date(add_date * 1000).getTime()) < 7 * 86400000) ? 'text-bold' : ''}`,
+        ...getColumnIcon(item),
+        iconClass: value_ct === 0 ? 'text-error' : null,
+        iconTooltip: value_ct === 0 ? 'No non-null values detected' : null,
+        prefix: () => {
+            const icons = [];
+            if (item.critical_data_element ?? item.table_critical_data_element) {
+                icons.push(withTooltip(Icon({ size: 15, classes: 'text-purple' }, 'star'), { text: 'Critical data element', position: 'right' }));
+            }
+            if (item.excluded_data_element) {
+                icons.push(withTooltip(Icon({ size: 15, classes: 'text-brown' }, 'visibility_off'), { text: 'Excluded data element', position: 'right' }));
+            }
+            if (item.pii_flag) {
+                icons.push(withTooltip(Icon({ size: 15, classes: 'text-orange' }, 'shield_person'), { text: 'PII data', position: 'right' }));
+            }
+            return span({ class: 'tg-dh--column-prefix' }, ...icons);
+        },
+        criticalDataElement: !!(item.critical_data_element ?? item.table_critical_data_element),
+        excludedDataElement: !!item.excluded_data_element,
+        piiFlag: !!item.pii_flag,
+    };
+    TAG_KEYS.forEach(key => columnNode[key] = item[key] ?? item[`table_${key}`]);
+    return columnNode;
+};
+
+const ExportOptions = (/** @type SelectedNode[] */ selectedNodes, _userCanEdit, emit) => {
     return DropdownButton({
         icon: 'download',
         label: 'Export',
@@ -458,23 +535,8 @@ const ExportOptions = (/** @type TreeNode[] */ treeNodes, /** @type SelectedNode
                 },
                 {
                     label: 'Filtered columns',
-                    onclick: () => {
-                        const payload = treeNodes.val.reduce((array, table) => {
-                            if (!table.hidden.val) {
-                                const [ type, id ] = table.id.split('_');
-                                array.push({ type, id, selected: table.selected.val });
-
-                                table.children.forEach(column => {
-                                    if (!column.hidden.val) {
-                                        const [ type, id ] = column.id.split('_');
-                                        array.push({ type, id, selected: column.selected.val });
-                                    }
-                                });
-                            }
-                            return array;
-                        }, []);
-                        emit('ExportClicked', { payload });
-                    },
+                    // Includes the tables and columns that are not loaded yet
+                    onclick: () => emit('ExportFilteredClicked', {}),
                 },
             ];
             if (selectedNodes.val?.length) {
@@ -483,7 +545,7 @@ const ExportOptions = (/** @type TreeNode[] */ treeNodes, /** @type SelectedNode
                     onclick: () => {
                         const payload = selectedNodes.val.reduce((array, table) => {
                             const [ type, id ] = table.id.split('_');
-                            array.push({ type, id });
+                            array.push({ type, id, all: !!table.all && !table.children.length });
 
                             table.children.forEach(column => {
                                 const [ type, id ] = column.id.split('_');
@@ -1,9 +1,7 @@
-import tempfile
 from collections.abc import Callable, Iterable
 from datetime import datetime
 from io import BytesIO
 from typing import TypedDict
-from zipfile import ZipFile
 
 import pandas as pd
 import streamlit as st
@@ -94,33 +92,6 @@ def get_excel_file_data(
         return f"{title}.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet", buffer.getvalue()
 
 
-def zip_multi_file_data(
-    zip_file_name: str,
-    file_data_func: Callable[[PROGRESS_UPDATE_TYPE, ...], FILE_DATA_TYPE],
-    args_list: list[Iterable],
-) -> Callable[[PROGRESS_UPDATE_TYPE, ...], FILE_DATA_TYPE]:
-
-    def _file_content_func(update_main_progress, *args):
-
-        progress = 0.0
-        step = 1.0 / len(args_list)
-
-        def _update_progress(f_progress):
-            update_main_progress(progress + step * f_progress)
-
-        with tempfile.NamedTemporaryFile() as zip_file:
-            with ZipFile(zip_file.name, "w") as zip_writer:
-                for args in args_list:
-                    file_name, _, file_data = file_data_func(_update_progress, *args)
-                    zip_writer.writestr(file_name, file_data)
-                    progress += step
-            zip_content = zip_file.read()
-
-        return zip_file_name, "application/zip", zip_content
-
-    return _file_content_func
-
-
 def download_dialog(
     dialog_title: str,
     file_content_func: Callable[[PROGRESS_UPDATE_TYPE, ...], FILE_DATA_TYPE],
@@ -105,7 +105,9 @@ class Router(Singleton):
                 session.page_args_pending_router = {
                     name: value for name, value in final_args.items() if value and value not in [None, "None", ""]
                 }
-                if not session.current_page.startswith("quality-dashboard") and not to.startswith("quality-dashboard"):
+                # Only clear the cache when leaving a page, not on its own filter, sort or paging changes.
+                # Heavy per-run queries are cached separately and invalidated by tag when they change.
+                if is_different_page and not session.current_page.startswith("quality-dashboard") and not to.startswith("quality-dashboard"):
                     st.cache_data.clear()
 
                 if is_different_page:
@@ -0,0 +1,114 @@
+import concurrent.futures
+import multiprocessing
+import os
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import streamlit as st
+
+from testgen import settings
+from testgen.common.models import database_session
+from testgen.ui.pdf import hygiene_issue_report, test_result_report
+from testgen.ui.pdf.style import report_timezone
+
+REPORT_MODULES = {
+    "hygiene": hygiene_issue_report,
+    "test": test_result_report,
+}
+
+
+@dataclass
+class IssueReport:
+    file_name: str
+    issue_type: Literal["hygiene", "test"]
+    issue_data: dict
+    mask_pii: bool = False
+
+
+def zip_issue_reports(
+    update_progress: Callable[[float], None],
+    zip_file_name: str,
+    reports: list[IssueReport],
+) -> tuple[str, str, bytes]:
+    """
+    Generates the PDFs of several issue reports into a single zip file.
+
+    The source data and history lookups of all the reports are prefetched
+    concurrently, the PDFs are rendered in worker processes as soon as their
+    data is ready, and each PDF is added to the zip file on disk as soon as it
+    is rendered. Progress advances once when a report's data is fetched and
+    once when its PDF is added to the zip file.
+    """
+    step = 1.0 / (2 * len(reports))
+    progress = 0.0
+    timezone = st.session_state.get("browser_timezone")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        zip_path = os.path.join(temp_dir, "reports.zip")
+        with (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(settings.PROJECT_CONNECTION_MAX_THREADS, len(reports)),
+                thread_name_prefix="issue-report-fetch",
+            ) as fetch_executor,
+            _get_render_executor(len(reports)) as render_executor,
+            ZipFile(zip_path, "w", compression=ZIP_DEFLATED) as zip_writer,
+        ):
+            fetches = {
+                fetch_executor.submit(_fetch_report_data, report): (report, os.path.join(temp_dir, f"{index}.pdf"))
+                for index, report in enumerate(reports)
+            }
+            renders = {}
+            pending = set(fetches)
+            while pending:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    if future in fetches:
+                        report, pdf_path = fetches[future]
+                        render_future = render_executor.submit(
+                            render_report, report, pdf_path, future.result(), timezone,
+                        )
+                        renders[render_future] = (report, pdf_path)
+                        pending.add(render_future)
+                    else:
+                        future.result()
+                        report, pdf_path = renders[future]
+                        zip_writer.write(pdf_path, report.file_name)
+                        os.remove(pdf_path)
+
+                    progress += step
+                    update_progress(min(progress, 1.0))
+
+        with open(zip_path, "rb") as zip_file:
+            return zip_file_name, "application/zip", zip_file.read()
+
+
+def render_report(report: IssueReport, file_path: str, report_data: dict, timezone: str | None = None) -> None:
+    token = report_timezone.set(timezone)
+    try:
+        REPORT_MODULES[report.issue_type].create_report(
+            file_path,
+            report.issue_data,
+            mask_pii=report.mask_pii,
+            **report_data,
+        )
+    finally:
+        report_timezone.reset(token)
+
+
+def _fetch_report_data(report: IssueReport) -> dict:
+    with database_session():
+        return REPORT_MODULES[report.issue_type].fetch_report_data(report.issue_data, mask_pii=report.mask_pii)
+
+
+def _get_render_executor(report_count: int) -> concurrent.futures.Executor:
+    max_workers = min(settings.ISSUE_REPORT_MAX_WORKERS, os.cpu_count() or 1, report_count)
+    if max_workers > 1:
+        # Spawn instead of fork so workers don't inherit the open database connections
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="issue-report-render")
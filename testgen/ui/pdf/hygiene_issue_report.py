@@ -5,6 +5,7 @@ from reportlab.lib.styles import ParagraphStyle
 from reportlab.platypus import CondPageBreak, KeepTogether, Paragraph, Table, TableStyle
 
 from testgen import settings
+from testgen.common.source_data_service import fetch_hygiene_source_data
 from testgen.settings import ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT
 from testgen.ui.pdf.dataframe_table import DataFrameTableBuilder
 from testgen.ui.pdf.style import (
@@ -22,7 +23,7 @@ from testgen.ui.pdf.style import (
     get_formatted_datetime,
 )
 from testgen.ui.pdf.templates import DatakitchenTemplate
-from testgen.ui.queries.source_data_queries import get_hygiene_issue_source_data
+from testgen.ui.queries.source_data_queries import get_hygiene_issue_source_data, to_source_data_tuple
 
 SECTION_MIN_AVAILABLE_HEIGHT = 120
 
@@ -184,7 +185,7 @@ def build_sql_query_content(sample_data_tuple):
         return Paragraph("No sample data lookup query registered for this issue.")
 
 
-def get_report_content(document, hi_data, mask_pii: bool = False):
+def get_report_content(document, hi_data, mask_pii: bool = False, sample_data_tuple=None):
     yield Paragraph("TestGen Hygiene Issue Report", PARA_STYLE_TITLE)
     yield build_summary_table(document, hi_data)
 
@@ -192,7 +193,8 @@ def get_report_content(document, hi_data, mask_pii: bool = False):
     yield Paragraph("Suggested Action", style=PARA_STYLE_H1)
     yield Paragraph(hi_data["suggested_action"], style=PARA_STYLE_TEXT)
 
-    sample_data_tuple = get_hygiene_issue_source_data(hi_data, limit=ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT, mask_pii=mask_pii)
+    if sample_data_tuple is None:
+        sample_data_tuple = get_hygiene_issue_source_data(hi_data, limit=ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT, mask_pii=mask_pii)
 
     yield CondPageBreak(SECTION_MIN_AVAILABLE_HEIGHT)
     yield Paragraph("Sample Data", PARA_STYLE_H1)
@@ -204,6 +206,15 @@ def get_report_content(document, hi_data, mask_pii: bool = False):
     ])
 
 
-def create_report(filename, hi_data, mask_pii: bool = False):
+def fetch_report_data(hi_data, mask_pii: bool = False) -> dict:
+    """Runs the database lookups of a report, so that it can be rendered later without a database session."""
+    return {
+        "sample_data_tuple": to_source_data_tuple(
+            fetch_hygiene_source_data(hi_data, limit=ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT, mask_pii=mask_pii)
+        ),
+    }
+
+
+def create_report(filename, hi_data, mask_pii: bool = False, sample_data_tuple=None):
     doc = DatakitchenTemplate(filename)
-    doc.build(flowables=list(get_report_content(doc, hi_data, mask_pii=mask_pii)))
+    doc.build(flowables=list(get_report_content(doc, hi_data, mask_pii=mask_pii, sample_data_tuple=sample_data_tuple)))
@@ -1,3 +1,5 @@
+from contextvars import ContextVar
+
 import pandas
 import streamlit as st
 from reportlab.lib import enums
@@ -7,6 +9,9 @@ from reportlab.platypus import TableStyle
 
 from testgen.common import date_service
 
+# Set when rendering outside of the Streamlit session, e.g. in a worker process
+report_timezone: ContextVar[str | None] = ContextVar("report_timezone", default=None)
+
 COLOR_GRAY_BG = HexColor(0xF2F2F2)
 COLOR_GREEN_BG = HexColor(0xDCE4DA)
 COLOR_YELLOW_BG = HexColor(0xA0C84E40, hasAlpha=True)
@@ -102,8 +107,9 @@ PARA_STYLE_LINK = ParagraphStyle(
 
 
 def get_formatted_datetime(value) -> str:
+    timezone = report_timezone.get()
     return date_service.get_timezoned_timestamp(
-        st.session_state,
+        {"browser_timezone": timezone} if timezone else st.session_state,
         pandas.to_datetime(value),
         "%b %-d, %-I:%M %p %Z",
     )
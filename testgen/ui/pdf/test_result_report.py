@@ -11,6 +11,7 @@ from reportlab.platypus import (
 )
 
 from testgen import settings
+from testgen.common.source_data_service import fetch_test_result_source_data
 from testgen.settings import ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT
 from testgen.ui.pdf.dataframe_table import TABLE_STYLE_DATA, DataFrameTableBuilder
 from testgen.ui.pdf.style import (
@@ -31,13 +32,17 @@ from testgen.ui.pdf.templates import DatakitchenTemplate
 from testgen.ui.queries.source_data_queries import (
     get_test_issue_source_data,
     get_test_issue_source_data_custom,
+    to_source_data_tuple,
 )
 from testgen.ui.queries.test_result_queries import (
+    fetch_test_result_history,
     get_test_result_history,
 )
 
 SECTION_MIN_AVAILABLE_HEIGHT = 120
 
+HISTORY_LIMIT = 15
+
 RESULT_STATUS_COLORS = {
     "Passed": HexColor(0x8BC34A),
     "Warning": HexColor(0xFBC02D),
@@ -172,8 +177,9 @@ def build_summary_table(document, tr_data):
     return Table(summary_table_data, style=summary_table_style, hAlign="LEFT", colWidths=summary_table_col_widths)
 
 
-def build_history_table(document, tr_data):
-    history_data = get_test_result_history(tr_data, limit=15)
+def build_history_table(document, tr_data, history_data=None):
+    if history_data is None:
+        history_data = get_test_result_history(tr_data, limit=HISTORY_LIMIT)
 
     history_table_style = TableStyle(
         (
@@ -235,7 +241,7 @@ def build_sql_query_content(sample_data_tuple):
         return Paragraph("No sample data lookup query registered for this test.")
 
 
-def get_report_content(document, tr_data, mask_pii: bool = False):
+def get_report_content(document, tr_data, mask_pii: bool = False, sample_data_tuple=None, history_data=None):
     yield Paragraph("TestGen Test Issue Report", PARA_STYLE_TITLE)
     yield build_summary_table(document, tr_data)
 
@@ -247,11 +253,11 @@ def get_report_content(document, tr_data, mask_pii: bool = False):
 
     yield CondPageBreak(SECTION_MIN_AVAILABLE_HEIGHT)
     yield Paragraph("Result History", PARA_STYLE_H1)
-    yield build_history_table(document, tr_data)
+    yield build_history_table(document, tr_data, history_data)
 
-    if tr_data["test_type"] == "CUSTOM":
+    if sample_data_tuple is None and tr_data["test_type"] == "CUSTOM":
         sample_data_tuple = get_test_issue_source_data_custom(tr_data, limit=ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT, mask_pii=mask_pii)
-    else:
+    elif sample_data_tuple is None:
         sample_data_tuple = get_test_issue_source_data(tr_data, limit=ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT, mask_pii=mask_pii)
 
     yield CondPageBreak(SECTION_MIN_AVAILABLE_HEIGHT)
@@ -264,6 +270,18 @@ def get_report_content(document, tr_data, mask_pii: bool = False):
     ])
 
 
-def create_report(filename, tr_data, mask_pii: bool = False):
+def fetch_report_data(tr_data, mask_pii: bool = False) -> dict:
+    """Runs the database lookups of a report, so that it can be rendered later without a database session."""
+    return {
+        "history_data": fetch_test_result_history(tr_data, limit=HISTORY_LIMIT),
+        "sample_data_tuple": to_source_data_tuple(
+            fetch_test_result_source_data(tr_data, limit=ISSUE_REPORT_SOURCE_DATA_LOOKUP_LIMIT, mask_pii=mask_pii)
+        ),
+    }
+
+
+def create_report(filename, tr_data, mask_pii: bool = False, sample_data_tuple=None, history_data=None):
     doc = DatakitchenTemplate(filename)
-    doc.build(flowables=list(get_report_content(doc, tr_data, mask_pii=mask_pii)))
+    doc.build(flowables=list(get_report_content(
+        doc, tr_data, mask_pii=mask_pii, sample_data_tuple=sample_data_tuple, history_data=history_data,
+    )))
@@ -0,0 +1,217 @@
+from dataclasses import dataclass, field
+
+import streamlit as st
+
+from testgen.ui.queries.profiling_queries import TAG_FIELDS
+from testgen.ui.services.database_service import fetch_all_from_db
+from testgen.utils import is_uuid4
+
+CATALOG_PAGE_SIZE = 200
+
+
+@dataclass(frozen=True)
+class CatalogFilters:
+    search: str | None = None
+    search_tables: bool = True
+    search_columns: bool = True
+    critical_data_element: bool = False
+    pii_flag: bool = False
+    show_excluded: bool = False
+    tags: tuple[tuple[str, str], ...] = field(default_factory=tuple)
+
+    @classmethod
+    def from_dict(cls, data: dict | None) -> "CatalogFilters":
+        data = data or {}
+        search_tables = bool(data.get("search_tables", True))
+        search_columns = bool(data.get("search_columns", True))
+        # Searching by neither would match nothing, so search by both instead
+        if not search_tables and not search_columns:
+            search_tables = search_columns = True
+        return cls(
+            search=(data.get("search") or "").strip() or None,
+            search_tables=search_tables,
+            search_columns=search_columns,
+            critical_data_element=bool(data.get("critical_data_element")),
+            pii_flag=bool(data.get("pii_flag")),
+            show_excluded=bool(data.get("show_excluded")),
+            tags=tuple(sorted(
+                (key, value) for key, value in (data.get("tags") or {}).items() if key in TAG_FIELDS and value
+            )),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "search": self.search,
+            "search_tables": self.search_tables,
+            "search_columns": self.search_columns,
+            "critical_data_element": self.critical_data_element,
+            "pii_flag": self.pii_flag,
+            "show_excluded": self.show_excluded,
+            "tags": dict(self.tags),
+        }
+
+    def get_params(self) -> dict:
+        params = {f"tag_{key}": value for key, value in self.tags}
+        if self.search:
+            params["search"] = self.search
+        return params
+
+    def get_table_condition(self) -> str:
+        """Whether the table itself matches, assuming table_chars is aliased as "t"."""
+        conditions = []
+        if self.search:
+            conditions.append("POSITION(LOWER(:search) IN LOWER(t.table_name)) > 0" if self.search_tables else "FALSE")
+        if self.critical_data_element:
+            conditions.append("t.critical_data_element IS TRUE")
+        if self.pii_flag:
+            conditions.append("FALSE")
+        conditions.extend(f"t.{key} = :tag_{key}" for key, _ in self.tags)
+        return " AND ".join(conditions) or "TRUE"
+
+    def get_column_condition(self) -> str:
+        """Whether the column matches, assuming column_chars is aliased as "c" and its table as "t"."""
+        conditions = []
+        if self.search:
+            conditions.append("POSITION(LOWER(:search) IN LOWER(c.column_name)) > 0" if self.search_columns else "FALSE")
+        if self.critical_data_element:
+            conditions.append("COALESCE(c.critical_data_element, t.critical_data_element) IS TRUE")
+        if self.pii_flag:
+            conditions.append("COALESCE(c.pii_flag, '') <> ''")
+        if not self.show_excluded:
+            conditions.append("c.excluded_data_element IS NOT TRUE")
+        conditions.extend(f"COALESCE(c.{key}, t.{key}) = :tag_{key}" for key, _ in self.tags)
+        return " AND ".join(conditions) or "TRUE"
+
+
+@st.cache_data(show_spinner=False)
+def get_catalog_tables(
+    table_group_id: str,
+    filters: CatalogFilters,
+    after: tuple[str, str] | None = None,
+    limit: int = CATALOG_PAGE_SIZE,
+) -> tuple[list[dict], bool]:
+    """
+    Returns one page of the tables that match the filters, or that have columns matching them,
+    ordered by name. Pages are keyset-paginated: pass the "cursor" of the last table of a page as
+    "after" to get the next one. Also returns whether there are more tables after the page.
+    """
+    if not is_uuid4(table_group_id):
+        return [], False
+
+    column_condition = filters.get_column_condition()
+    params = {
+        **filters.get_params(),
+        "table_group_id": table_group_id,
+        "limit": limit + 1,
+    }
+
+    after_condition = ""
+    if after:
+        after_condition = "AND (LOWER(t.table_name), t.table_id) > (:after_name, CAST(:after_id AS UUID))"
+        params["after_name"], params["after_id"] = after
+
+    query = f"""
+    WITH page AS (
+        SELECT t.*
+        FROM data_table_chars t
+        WHERE t.table_groups_id = :table_group_id
+            AND EXISTS (SELECT 1 FROM data_column_chars c WHERE c.table_id = t.table_id)
+            AND (
+                ({filters.get_table_condition()})
+                OR EXISTS (SELECT 1 FROM data_column_chars c WHERE c.table_id = t.table_id AND {column_condition})
+            )
+            {after_condition}
+        ORDER BY LOWER(t.table_name), t.table_id
+        LIMIT :limit
+    )
+    SELECT CONCAT('table_', t.table_id) AS table_id,
+        t.table_id::VARCHAR AS cursor_id,
+        LOWER(t.table_name) AS cursor_name,
+        t.table_name,
+        t.schema_name,
+        t.record_ct,
+        t.add_date AS table_add_date,
+        t.drop_date AS table_drop_date,
+        t.critical_data_element AS table_critical_data_element,
+        t.dq_score_profiling,
+        t.dq_score_testing,
+        {", ".join([ f"t.{tag} AS table_{tag}" for tag in TAG_FIELDS ])},
+        (SELECT COUNT(*) FROM data_column_chars c WHERE c.table_id = t.table_id AND {column_condition}) AS column_ct
+    FROM page t
+    ORDER BY LOWER(t.table_name), t.table_id;
+    """
+
+    results = [ dict(row) for row in fetch_all_from_db(query, params) ]
+    return results[:limit], len(results) > limit
+
+
+@st.cache_data(show_spinner=False)
+def get_catalog_columns(table_id: str, filters: CatalogFilters) -> list[dict]:
+    """Returns the columns of a table that match the filters, in ordinal order."""
+    if not is_uuid4(table_id):
+        return []
+
+    query = f"""
+    SELECT CONCAT('column_', c.column_id) AS column_id,
+        CONCAT('table_', t.table_id) AS table_id,
+        c.column_name,
+        t.table_name,
+        c.schema_name,
+        c.general_type,
+        c.db_data_type,
+        c.functional_data_type,
+        profile_results.datatype_suggestion,
+        profile_results.value_ct,
+        c.add_date,
+        c.drop_date,
+        c.critical_data_element,
+        t.critical_data_element AS table_critical_data_element,
+        c.pii_flag,
+        c.excluded_data_element,
+        {", ".join([ f"c.{tag}" for tag in TAG_FIELDS ])},
+        {", ".join([ f"t.{tag} AS table_{tag}" for tag in TAG_FIELDS ])}
+    FROM data_column_chars c
+        INNER JOIN data_table_chars t ON (c.table_id = t.table_id)
+        LEFT JOIN profile_results ON (
+            c.last_complete_profile_run_id = profile_results.profile_run_id
+            AND c.table_name = profile_results.table_name
+            AND c.column_name = profile_results.column_name
+        )
+    WHERE c.table_id = :table_id
+        AND {filters.get_column_condition()}
+    ORDER BY c.ordinal_position;
+    """
+    params = {**filters.get_params(), "table_id": table_id}
+
+    results = fetch_all_from_db(query, params)
+    return [ dict(row) for row in results ]
+
+
+def get_catalog_items(table_group_id: str, filters: CatalogFilters) -> list[dict]:
+    """Returns the IDs of all the tables and columns that match the filters, including those not loaded in the tree."""
+    if not is_uuid4(table_group_id):
+        return []
+
+    column_condition = filters.get_column_condition()
+    query = f"""
+    SELECT 'table' AS type,
+        t.table_id::VARCHAR AS id
+    FROM data_table_chars t
+    WHERE t.table_groups_id = :table_group_id
+        AND EXISTS (SELECT 1 FROM data_column_chars c WHERE c.table_id = t.table_id)
+        AND (
+            ({filters.get_table_condition()})
+            OR EXISTS (SELECT 1 FROM data_column_chars c WHERE c.table_id = t.table_id AND {column_condition})
+        )
+    UNION ALL
+    SELECT 'column' AS type,
+        c.column_id::VARCHAR AS id
+    FROM data_column_chars c
+        INNER JOIN data_table_chars t ON (c.table_id = t.table_id)
+    WHERE c.table_groups_id = :table_group_id
+        AND {column_condition};
+    """
+    params = {**filters.get_params(), "table_group_id": table_group_id}
+
+    results = fetch_all_from_db(query, params)
+    return [ dict(row) for row in results ]
@@ -1,9 +1,12 @@
+from collections.abc import Callable
 from typing import Literal
 
 import pandas as pd
 import streamlit as st
 
+from testgen.common.models.profiling_run import ProfilingRun
 from testgen.ui.services.database_service import fetch_all_from_db, fetch_df_from_db, fetch_one_from_db
+from testgen.ui.services.query_cache import tagged_cache_data
 from testgen.utils import is_uuid4
 
 TAG_FIELDS = [
@@ -415,6 +418,7 @@ def get_columns_by_condition(
         column_chars.column_id::VARCHAR AS id,
         'column' AS type,
         column_chars.column_name,
+        column_chars.table_id::VARCHAR AS table_id,
         column_chars.table_name,
         column_chars.schema_name,
         column_chars.table_groups_id::VARCHAR AS table_group_id,
@@ -558,7 +562,19 @@ def _build_anomaly_params(
     }
 
 
-@st.cache_data(show_spinner=False)
+def _get_run_tag_key(field: str) -> Callable[[dict], str | None]:
+    def get_tag_key(arguments: dict) -> str | None:
+        run = ProfilingRun.get_minimal(arguments["profile_run_id"])
+        return str(getattr(run, field)) if run else None
+    return get_tag_key
+
+
+# Also tagged by the catalog, table group and project metadata joined to the issues
+@tagged_cache_data(
+    profiling_run="profile_run_id",
+    table_group=_get_run_tag_key("table_groups_id"),
+    project=_get_run_tag_key("project_code"),
+)
 def get_profiling_anomalies(
     profile_run_id: str,
     likelihood: str | None = None,
@@ -724,7 +740,7 @@ def get_profiling_anomaly_lookup(anomaly_id: str) -> dict | None:
     return fetch_one_from_db(query, {"id": anomaly_id})
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(profiling_run="profile_run_id")
 def get_profiling_anomalies_count(
     profile_run_id: str,
     likelihood: str | None = None,
@@ -746,7 +762,7 @@ def get_profiling_anomalies_count(
     return int(result["cnt"]) if result else 0
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(profiling_run="profile_run_id")
 def get_profiling_anomaly_ids(
     profile_run_id: str,
     likelihood: str | None = None,
@@ -768,7 +784,7 @@ def get_profiling_anomaly_ids(
     return df["id"].tolist()
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(profiling_run="profile_run_id")
 def get_hygiene_filter_options(profile_run_id: str) -> dict:
     query = """
     SELECT DISTINCT r.table_name
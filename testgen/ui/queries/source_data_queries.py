@@ -20,7 +20,7 @@ from testgen.common.source_data_service import (
 DEFAULT_LIMIT = 500
 
 
-def _to_tuple(
+def to_source_data_tuple(
     result: SourceDataResult,
 ) -> tuple[Literal["OK"], None, str, pd.DataFrame] | tuple[Literal["NA", "ND", "ERR"], str, str | None, None]:
     return result.status, result.message, result.query, result.df
@@ -36,7 +36,7 @@ def get_hygiene_issue_source_data(
     limit: int = DEFAULT_LIMIT,
     mask_pii: bool = False,
 ) -> tuple[Literal["OK"], None, str, pd.DataFrame] | tuple[Literal["NA", "ND", "ERR"], str, str | None, None]:
-    return _to_tuple(fetch_hygiene_source_data(issue_data, limit, mask_pii))
+    return to_source_data_tuple(fetch_hygiene_source_data(issue_data, limit, mask_pii))
 
 
 def get_test_issue_source_query(issue_data: dict, limit: int = DEFAULT_LIMIT) -> str:
@@ -49,7 +49,7 @@ def get_test_issue_source_data(
     limit: int = DEFAULT_LIMIT,
     mask_pii: bool = False,
 ) -> tuple[Literal["OK"], None, str, pd.DataFrame] | tuple[Literal["NA", "ND", "ERR"], str, str | None, None]:
-    return _to_tuple(fetch_test_result_source_data(issue_data, limit, mask_pii))
+    return to_source_data_tuple(fetch_test_result_source_data(issue_data, limit, mask_pii))
 
 
 def get_test_issue_source_query_custom(issue_data: dict) -> str:
@@ -62,4 +62,4 @@ def get_test_issue_source_data_custom(
     limit: int | None = None,
     mask_pii: bool = False,
 ) -> tuple[Literal["OK"], None, str, pd.DataFrame] | tuple[Literal["NA", "ND", "ERR"], str, str | None, None]:
-    return _to_tuple(fetch_test_result_source_data(issue_data, limit=limit, mask_pii=mask_pii))
+    return to_source_data_tuple(fetch_test_result_source_data(issue_data, limit=limit, mask_pii=mask_pii))
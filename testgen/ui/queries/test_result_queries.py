@@ -1,13 +1,33 @@
+from collections.abc import Callable
 from typing import Literal
 
 import pandas as pd
 import streamlit as st
 
+from testgen.common.models.test_run import TestRun
 from testgen.ui.services.database_service import fetch_df_from_db, fetch_one_from_db
+from testgen.ui.services.query_cache import tagged_cache_data
 
 DEFAULT_ORDER_BY = "ORDER BY LOWER(r.table_name), LOWER(r.column_names), tt.test_name_short"
 
 
+def _get_run_tag_key(field: str) -> Callable[[dict], str | None]:
+    def get_tag_key(arguments: dict) -> str | None:
+        run = TestRun.get_minimal(arguments["run_id"])
+        return str(getattr(run, field)) if run else None
+    return get_tag_key
+
+
+# Results are also tagged by the entities whose changes show up in them: the test definitions of the run's
+# test suite, and the catalog, table group, connection and project metadata joined to them
+cache_test_run_results = tagged_cache_data(
+    test_run="run_id",
+    test_suite=_get_run_tag_key("test_suite_id"),
+    table_group=_get_run_tag_key("table_groups_id"),
+    project=_get_run_tag_key("project_code"),
+)
+
+
 def _build_where_clause(
     test_statuses: list[str] | None = None,
     test_type_id: str | None = None,
@@ -51,7 +71,7 @@ def _build_params(
     }
 
 
-@st.cache_data(show_spinner="Loading data ...")
+@cache_test_run_results
 def get_test_results(
     run_id: str,
     test_statuses: list[str] | None = None,
@@ -262,7 +282,7 @@ def get_test_result_lookup(test_result_id: str) -> dict | None:
     return fetch_one_from_db(query, {"id": test_result_id})
 
 
-@st.cache_data(show_spinner=False)
+@cache_test_run_results
 def get_test_results_count(
     run_id: str,
     test_statuses: list[str] | None = None,
@@ -293,7 +313,7 @@ def get_test_results_count(
     return int(result["cnt"]) if result else 0
 
 
-@st.cache_data(show_spinner=False)
+@cache_test_run_results
 def get_test_result_ids(
     run_id: str,
     test_statuses: list[str] | None = None,
@@ -372,7 +392,7 @@ def get_test_definition_ids_for_run(
     return df["test_definition_id"].tolist()
 
 
-@st.cache_data(show_spinner=False)
+@cache_test_run_results
 def get_filter_options(run_id: str) -> dict:
     query = """
     SELECT DISTINCT r.table_name
@@ -411,6 +431,10 @@ def get_filter_options(run_id: str) -> dict:
 
 @st.cache_data(show_spinner=False)
 def get_test_result_history(tr_data, limit: int | None = None):
+    return fetch_test_result_history(tr_data, limit)
+
+
+def fetch_test_result_history(tr_data, limit: int | None = None) -> pd.DataFrame:
     query = f"""
     SELECT r.test_time AS test_date,
         r.test_type,
@@ -15,8 +15,7 @@ from sqlalchemy import text
 from sqlalchemy.engine import RowMapping
 from sqlalchemy.engine.cursor import CursorResult
 
-from testgen.common.database.database_service import get_flavor_service
-from testgen.common.database.flavor.flavor_service import resolve_connection_params
+from testgen.common.database.database_service import target_engine_cache
 from testgen.common.models import get_current_session
 
 
@@ -54,20 +53,18 @@ def fetch_one_from_db(query: str, params: dict | None = None) -> RowMapping | No
     return result._mapping if result else None
 
 
-def fetch_from_target_db(connection: Connection, query: str, params: dict | None = None) -> list[RowMapping]:
-    connection_params = connection.to_dict()
-    flavor_service = get_flavor_service(connection.sql_flavor)
-    resolved = resolve_connection_params(connection_params)
-    engine = flavor_service.create_engine(connection_params)
-
-    # Each call creates a fresh engine for ad-hoc target-DB access (test connection,
-    # preview, data catalog reads). Dispose on exit so the engine's pool doesn't
-    # leak an idle connection until GC — these add up over a long Streamlit session.
-    try:
-        with engine.connect() as conn:
-            for pre_query, pre_params in flavor_service.get_pre_connection_queries(resolved):
-                conn.execute(text(pre_query), pre_params)
-            cursor: CursorResult = conn.execute(text(query), params)
-            return cursor.mappings().fetchall()
-    finally:
-        engine.dispose()
+def fetch_from_target_db(
+    connection: Connection,
+    query: str,
+    params: dict | None = None,
+    limit: int | None = None,
+) -> list[RowMapping]:
+    # Engines are cached across calls so interactive lookups reuse warm connections
+    # instead of paying the connection handshake each time
+    with target_engine_cache.connect(connection.to_dict()) as conn:
+        if limit:
+            # Read from a server-side cursor and stop at the limit, instead of buffering every row of the result
+            cursor: CursorResult = conn.execute(text(query), params, execution_options={"stream_results": True})
+            return cursor.mappings().fetchmany(limit)
+        cursor: CursorResult = conn.execute(text(query), params)
+        return cursor.mappings().fetchall()
@@ -3,15 +3,33 @@
 Wraps model query methods with ``@st.cache_data`` so that the model layer
 stays free of Streamlit imports.  Non-UI callers (CLI, API, MCP) call the
 model methods directly — no caching overhead.
+
+Heavy per-run queries are cached with ``@tagged_cache_data`` instead, so that
+changes can invalidate only the entries read from the entities they touch with
+``invalidate_cache`` rather than clearing the whole Streamlit data cache. Changes
+made by the other processes are received from ``notify_cache_invalidation``.
 """
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+import functools
+import hashlib
+import inspect
+import logging
+import pickle
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Iterable
+from typing import Any
 from uuid import UUID
 
 import streamlit as st
+from sqlalchemy import select
 
+from testgen import settings
+from testgen.common.cache_invalidation import CacheInvalidationListener, CacheTagKind, cache_tag
+from testgen.common.models import database_session, get_current_session
 from testgen.common.models.connection import Connection
 from testgen.common.models.profiling_run import ProfilingRun, ProfilingRunSummary
 from testgen.common.models.project import Project, ProjectSummary
@@ -21,6 +39,179 @@ from testgen.common.models.test_definition import TestType, TestTypeSummary
 from testgen.common.models.test_run import TestRun, TestRunSummary
 from testgen.common.models.test_suite import TestSuite, TestSuiteSummary
 
+LOG = logging.getLogger("testgen")
+
+# Seconds between checks of the invalidation listener, and before listening again after an error
+LISTEN_TIMEOUT = 60
+LISTEN_RETRY_INTERVAL = 5
+
+
+class TaggedCache:
+    """
+    Process-wide cache of query results, indexed by tags naming the entities
+    (e.g. a test run or a profiling run) the results were read from.
+
+    Invalidating a tag drops only the entries read from that entity, so a change
+    made by one user doesn't force every other user to reload unrelated data.
+    Entries also expire after a TTL, in case an invalidation from another process
+    is missed, and the least recently used ones are evicted beyond the maximum
+    number of entries.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, bytes, frozenset[str]]] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self.generation = 0
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            expires_at, data, _ = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                return False, None
+            self._entries.move_to_end(key)
+        # Like st.cache_data, return a copy so callers can modify it without affecting the cache
+        return True, pickle.loads(data)  # noqa: S301
+
+    def set(self, key: str, value: Any, tags: Iterable[str], generation: int | None = None) -> None:
+        """
+        Stores a value. When the generation read before computing the value is given, the
+        value is discarded if the cache was invalidated in the meantime, as it may be stale.
+        """
+        data = pickle.dumps(value)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._remove(key)
+            tags = frozenset(tags)
+            self._entries[key] = (time.monotonic() + self._ttl, data, tags)
+            for tag in tags:
+                self._keys_by_tag[tag].add(key)
+            while len(self._entries) > self._max_entries:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags: str) -> None:
+        with self._lock:
+            self.generation += 1
+            for tag in tags:
+                for key in list(self._keys_by_tag.get(tag, ())):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+            self._keys_by_tag.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+
+_tagged_cache = TaggedCache(max_entries=settings.UI_CACHE_MAX_ENTRIES, ttl=settings.UI_CACHE_TTL)
+_listener_lock = threading.Lock()
+_listener_thread: threading.Thread | None = None
+
+_RUN_MODELS: dict[CacheTagKind, type[TestRun | ProfilingRun]] = {"test_run": TestRun, "profiling_run": ProfilingRun}
+
+
+def _is_run_final(kind: CacheTagKind, run_id: str | UUID) -> bool:
+    model = _RUN_MODELS[kind]
+    with database_session():
+        status = get_current_session().scalar(select(model.status).where(model.id == UUID(str(run_id))))
+    return status != "Running"
+
+
+def tagged_cache_data(**tags: str | Callable[[dict[str, Any]], Any]) -> Callable:
+    """
+    Caches a query function in the tagged cache. The keyword arguments map tag kinds to the name
+    of the parameter holding the tag key, or to a function of the call arguments returning it:
+
+        @tagged_cache_data(test_run="run_id", test_suite=lambda args: ...)
+
+    Tags with a None key are skipped. Results read from a test or profiling run that is still
+    running are not stored, as the run keeps writing them. Like with st.cache_data, the decorated
+    function gets a clear() method, which drops all of its entries.
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        function_tag = f"function:{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = hashlib.sha256(pickle.dumps((function_tag, bound.arguments))).hexdigest()
+
+            found, value = _tagged_cache.get(key)
+            if found:
+                return value
+
+            tag_keys = {}
+            for kind, source in tags.items():
+                tag_key = source(bound.arguments) if callable(source) else bound.arguments[source]
+                if tag_key is not None:
+                    tag_keys[kind] = tag_key
+            # Checked before running the query, so that the results of a run completed in between are not stored
+            cacheable = all(_is_run_final(kind, tag_key) for kind, tag_key in tag_keys.items() if kind in _RUN_MODELS)
+
+            generation = _tagged_cache.generation
+            value = func(*args, **kwargs)
+
+            if cacheable:
+                entry_tags = {function_tag, *(cache_tag(kind, tag_key) for kind, tag_key in tag_keys.items())}
+                _tagged_cache.set(key, value, entry_tags, generation)
+            return value
+
+        wrapper.clear = functools.partial(_tagged_cache.invalidate, function_tag)
+        return wrapper
+
+    return decorator
+
+
+def invalidate_cache(*tags: str) -> None:
+    """Drops the tagged cache entries read from the given entities, for all users."""
+    _tagged_cache.invalidate(*tags)
+
+
+def start_invalidation_listener() -> None:
+    """Starts receiving the invalidations notified by the other processes, if not already."""
+    global _listener_thread
+    with _listener_lock:
+        if _listener_thread is None:
+            _listener_thread = threading.Thread(
+                target=_listen_for_invalidations, name="cache-invalidation-listener", daemon=True,
+            )
+            _listener_thread.start()
+
+
+def _listen_for_invalidations() -> None:
+    listener = CacheInvalidationListener()
+    while True:
+        try:
+            if listener.listen():
+                # Invalidations may have been missed while not listening
+                _tagged_cache.clear()
+            if tags := listener.wait(LISTEN_TIMEOUT):
+                _tagged_cache.invalidate(*tags)
+        except Exception:
+            LOG.warning("Error receiving cache invalidations, retrying in %d seconds", LISTEN_RETRY_INTERVAL, exc_info=True)
+            time.sleep(LISTEN_RETRY_INTERVAL)
+
+
 # -- Project ------------------------------------------------------------------
 
 @st.cache_data(show_spinner=False)
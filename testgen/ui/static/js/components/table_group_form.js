@@ -20,6 +20,8 @@
  * @property {boolean?} profile_use_sampling
  * @property {number?} profile_sample_percent
  * @property {number?} profile_sample_min_count
+ * @property {'exact' | 'estimate' | 'estimate_change'?} row_count_strategy
+ * @property {number?} row_count_change_pct
  * @property {string?} description
  * @property {string?} data_source
  * @property {string?} source_system
@@ -90,6 +92,8 @@ const TableGroupForm = (props) => {
     const profileUseSampling = van.state(tableGroup.profile_use_sampling ?? false);
     const profileSamplePercent = van.state(tableGroup.profile_sample_percent ?? 30);
     const profileSampleMinCount = van.state(tableGroup.profile_sample_min_count ?? 15000);
+    const rowCountStrategy = van.state(tableGroup.row_count_strategy ?? 'exact');
+    const rowCountChangePct = van.state(tableGroup.row_count_change_pct ?? 10);
     const description = van.state(tableGroup.description);
     const dataSource = van.state(tableGroup.data_source);
     const sourceSystem = van.state(tableGroup.source_system);
@@ -131,6 +135,8 @@ const TableGroupForm = (props) => {
             profile_use_sampling: profileUseSampling.val,
             profile_sample_percent: profileSamplePercent.val,
             profile_sample_min_count: profileSampleMinCount.val,
+            row_count_strategy: rowCountStrategy.val,
+            row_count_change_pct: rowCountChangePct.val,
             description: description.val,
             data_source: dataSource.val,
             source_system: sourceSystem.val,
@@ -203,6 +209,11 @@ const TableGroupForm = (props) => {
             profileSamplePercent,
             profileSampleMinCount,
         ),
+        RowCountForm(
+            { setValidity: setFieldValidity },
+            rowCountStrategy,
+            rowCountChangePct,
+        ),
         TaggingForm(
             { setValidity: setFieldValidity },
             description,
@@ -441,6 +452,49 @@ const SamplingForm = (
     );
 };
 
+const RowCountForm = (
+    options,
+    rowCountStrategy,
+    rowCountChangePct,
+) => {
+    return ExpansionPanel(
+        { title: 'Row Count Parameters', testId: 'row-count-panel' },
+        div(
+            { class: 'flex-row fx-gap-3 fx-align-flex-start' },
+            Select({
+                name: 'row_count_strategy',
+                label: 'Row Count Strategy',
+                value: rowCountStrategy,
+                options: [
+                    { label: 'Exact count', value: 'exact' },
+                    { label: 'Catalog estimate', value: 'estimate' },
+                    { label: 'Exact count when estimate changes', value: 'estimate_change' },
+                ],
+                class: 'fx-flex',
+                onChange: (value) => rowCountStrategy.val = value,
+            }),
+            () => rowCountStrategy.val === 'estimate_change'
+                ? Input({
+                    name: 'row_count_change_pct',
+                    class: 'fx-flex',
+                    type: 'number',
+                    label: 'Estimate Change Percent',
+                    value: rowCountChangePct,
+                    help: 'Tables are counted again when their catalog row estimate changes by more than this percent since the last count',
+                    onChange: (value, state) => {
+                        rowCountChangePct.val = value;
+                        options.setValidity?.('row_count_change_pct', state.valid);
+                    },
+                })
+                : div({ class: 'fx-flex' }),
+        ),
+        Caption({
+            content: 'Tables without a catalog row estimate are always counted exactly.',
+            style: 'margin-top: 8px;',
+        }),
+    );
+};
+
 const TaggingForm = (
     options,
     description,
@@ -10,6 +10,7 @@
  * @property {string?} iconTooltip
  * @property {Element?} prefix
  * @property {TreeNode[]?} children
+ * @property {number?} childCount
  * @property {number?} level
  * @property {boolean?} expanded
  * @property {boolean?} hidden
@@ -37,6 +38,10 @@
  * @property {(function(): boolean) | null} hasActiveFilters
  * @property {function()?} onApplyFilters
  * @property {function()?} onResetFilters
+ * @property {string?} search
+ * @property {function(string)?} onSearch
+ * @property {function(TreeNode[])?} onExpand
+ * @property {any?} footer
  */
 import van from '../van.min.js';
 import { getValue, loadStylesheet, getRandomId, isState } from '../utils.js';
@@ -60,12 +65,16 @@ const Tree = (/** @type Properties */ props, /** @type any? */ searchOptionsCont
     const initialSelection = props.selected?.rawVal || props.selected || null;
     const selected = van.state(initialSelection);
 
+    let previousNodes = null;
     const treeNodes = van.derive(() => {
         const nodes = getValue(props.nodes) || [];
-        const treeSelected = initTreeState(nodes, selected.rawVal);
-        if (!treeSelected) {
+        const treeSelected = initTreeState(nodes, selected.rawVal, previousNodes ?? {});
+        // Only reset an initial selection that is not in the tree
+        // Later updates of the nodes, e.g. server-side filtering, keep the selection
+        if (!treeSelected && !previousNodes) {
             selected.val = null;
         }
+        previousNodes = indexTree(nodes);
         return nodes;
     });
 
@@ -99,8 +108,9 @@ const Tree = (/** @type Properties */ props, /** @type any? */ searchOptionsCont
                     class: 'tg-tree--nodes',
                     onclick: van.derive(() => multiSelect.val ? () => props.onMultiSelect?.(getMultiSelection(treeNodes.val)) : null),
                 },
-                treeNodes.val.map(node => TreeNode(node, selected, multiSelect.val)),
+                treeNodes.val.map(node => TreeNode(node, selected, multiSelect.val, props.onExpand)),
             ),
+            props.footer ?? '',
         ),
         () => noMatches.val
             ? span({ class: 'tg-tree--empty mt-7 mb-7 text-secondary' }, 'No matching items found')
@@ -115,7 +125,7 @@ const Toolbar = (
     /** @type any? */ searchOptionsContent,
     /** @type any? */ filtersContent,
 ) => {
-    const search = van.state('');
+    const search = van.state(props.search ?? '');
     const searchOptionsDomId = `tree-search-options-${getRandomId()}`;
     const searchOptionsOpened = van.state(false);
 
@@ -134,8 +144,16 @@ const Toolbar = (
                 icon: 'search',
                 clearable: true,
                 height: 32,
+                value: props.search ?? '',
                 onChange: (/** @type string */ value) => {
+                    if (value === search.val) {
+                        return;
+                    }
                     search.val = value;
+                    if (props.onSearch) {
+                        props.onSearch(value);
+                        return;
+                    }
                     filterTree(nodes.val, isNodeHidden);
                     if (value) {
                         expandOrCollapseTree(nodes.val, true);
@@ -180,7 +198,13 @@ const Toolbar = (
                 style: 'width: 24px; height: 24px; padding: 4px;',
                 tooltip: 'Expand All',
                 tooltipPosition: 'bottom',
-                onclick: () => expandOrCollapseTree(nodes.val, true),
+                onclick: () => {
+                    expandOrCollapseTree(nodes.val, true);
+                    const lazyNodes = nodes.val.filter(isLazy);
+                    if (lazyNodes.length) {
+                        props.onExpand?.(lazyNodes);
+                    }
+                },
             }),
             Button({
                 type: 'icon',
@@ -264,13 +288,15 @@ const TreeNode = (
     /** @type TreeNode */ node,
     /** @type string */ selected,
     /** @type boolean */ multiSelect,
+    /** @type function(TreeNode[])? */ onExpand,
 ) => {
-    const hasChildren = !!node.children?.length;
+    const lazy = isLazy(node);
+    const hasChildren = !!node.children?.length || lazy;
     return div(
         {
             onclick: multiSelect
                 ? (/** @type Event */ event) => {
-                    if (hasChildren) {
+                    if (hasChildren && !lazy) {
                         if (!event.fromChild) {
                             // Prevent the default behavior of toggling the "checked" property - we want to control it
                             event.preventDefault();
@@ -301,6 +327,9 @@ const TreeNode = (
                     onclick: (/** @type Event */ event) => {
                         event.stopPropagation();
                         node.expanded.val = hasChildren ? !node.expanded.val : false;
+                        if (lazy && node.expanded.val) {
+                            onExpand?.([node]);
+                        }
                     },
                 },
                 () => node.expanded.val ? 'arrow_drop_down' : 'arrow_right',
@@ -326,7 +355,12 @@ const TreeNode = (
         ),
         hasChildren ? div(
             { class: () => node.expanded.val ? '' : 'hidden' },
-            node.children.map(node => TreeNode(node, selected, multiSelect)),
+            lazy
+                ? div(
+                    { class: 'tg-tree--row text-secondary', style: `padding-left: ${levelOffset * (node.level + 1) + 24}px;` },
+                    'Loading ...',
+                )
+                : node.children.map(node => TreeNode(node, selected, multiSelect, onExpand)),
         ) : null,
     );
 };
@@ -334,25 +368,50 @@ const TreeNode = (
 const initTreeState = (
     /** @type TreeNode[] */ nodes,
     /** @type string */ selected,
+    /** @type Object.<string, TreeNode> */ previousNodes = {},
     /** @type number */ level = 0,
 ) => {
     let treeExpanded = false;
     nodes.forEach(node => {
+        // Keep the state of nodes that were already in the tree, e.g. when lazy children are loaded
+        const previous = previousNodes[node.id];
         node.level = level;
         // Expand node if it is initial selection
         let expanded = node.id === selected;
         if (node.children) {
+            if (previous && isLazy(previous) && previous.selected.rawVal) {
+                node.children.forEach(child => child.selected = true);
+            }
             // Expand node if initial selection is a descendent
-            expanded = initTreeState(node.children, selected, level + 1) || expanded;
+            expanded = initTreeState(node.children, selected, previousNodes, level + 1) || expanded;
         }
-        node.expanded = van.state(expanded);
+        node.expanded = van.state(previous ? previous.expanded.rawVal || expanded : node.expanded === true || expanded);
         node.hidden = van.state(false);
-        node.selected = van.state(node.selected ?? false);
+        node.selected = van.state(
+            previous
+                ? (node.children?.length ? node.children.every(child => child.selected.rawVal) : previous.selected.rawVal)
+                : (node.selected ?? false)
+        );
         treeExpanded = treeExpanded || expanded;
     });
     return treeExpanded;
 };
 
+const indexTree = (
+    /** @type TreeNode[] */ nodes,
+    /** @type Object.<string, TreeNode> */ index = {},
+) => {
+    nodes.forEach(node => {
+        index[node.id] = node;
+        if (node.children) {
+            indexTree(node.children, index);
+        }
+    });
+    return index;
+};
+
+const isLazy = (/** @type TreeNode */ node) => !node.children && node.childCount > 0;
+
 const filterTree = (
     /** @type TreeNode[] */ nodes,
     /** @type function(TreeNode): boolean */ isNodeHidden,
@@ -375,6 +434,8 @@ const expandOrCollapseTree = (
         if (node.children) {
             expandOrCollapseTree(node.children, expanded);
             node.expanded.val = expanded;
+        } else if (isLazy(node)) {
+            node.expanded.val = expanded;
         }
     });
 };
@@ -400,7 +461,12 @@ const selectTree = (
 const getMultiSelection = (nodes) => {
     const selected = [];
     nodes.forEach(node => {
-        if (node.children) {
+        if (isLazy(node)) {
+            // Children are not loaded, so the whole node is selected
+            if (node.selected.val) {
+                selected.push({ id: node.id, all: true, children: [], childCount: node.childCount });
+            }
+        } else if (node.children) {
             const selectedChildren = getMultiSelection(node.children);
             if (selectedChildren.length) {
                 selected.push({
@@ -29,6 +29,7 @@ from testgen.ui.assets import get_asset_data_url
 from testgen.ui.components import widgets as testgen
 from testgen.ui.navigation.menu import MenuItem
 from testgen.ui.navigation.page import Page
+from testgen.ui.services.query_cache import cache_tag, invalidate_cache
 from testgen.ui.session import session, temp_value
 from testgen.ui.utils import get_cron_sample_handler
 
@@ -187,6 +188,12 @@ class ConnectionsPage(Page):
                 connection.save()
                 Connection.select_where.clear()
                 Connection.get.clear()
+                invalidate_cache(*(
+                    cache_tag("table_group", table_group.id)
+                    for table_group in TableGroup.select_minimal_where(
+                        TableGroup.connection_id == connection.connection_id
+                    )
+                ))
                 message = "Changes have been saved successfully."
             except Exception as error:
                 message = "Something went wrong while creating the connection."
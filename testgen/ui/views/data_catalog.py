@@ -33,6 +33,12 @@ from testgen.ui.components.widgets.download_dialog import (
 from testgen.ui.navigation.menu import MenuItem
 from testgen.ui.navigation.page import Page
 from testgen.ui.navigation.router import Router
+from testgen.ui.queries.data_catalog_queries import (
+    CatalogFilters,
+    get_catalog_columns,
+    get_catalog_items,
+    get_catalog_tables,
+)
 from testgen.ui.queries.profiling_queries import (
     COLUMN_PROFILING_FIELDS,
     TAG_FIELDS,
@@ -45,7 +51,13 @@ from testgen.ui.queries.profiling_queries import (
     get_tables_by_table_group,
 )
 from testgen.ui.services.database_service import execute_db_query, fetch_all_from_db, fetch_from_target_db
-from testgen.ui.services.query_cache import get_profiling_run_summaries, get_project_summary, get_table_group_stats
+from testgen.ui.services.query_cache import (
+    cache_tag,
+    get_profiling_run_summaries,
+    get_project_summary,
+    get_table_group_stats,
+    invalidate_cache,
+)
 from testgen.ui.session import session
 from testgen.ui.views.dialogs.import_metadata_dialog import (
     apply_metadata_import,
@@ -69,6 +81,7 @@ DC_HISTORY_DIALOG_KEY = "dc:history_dialog"
 DC_IMPORT_DIALOG_KEY = "dc:import_dialog"
 DC_IMPORT_PREVIEW_KEY = "dc:import_preview"
 DC_IMPORT_RESULT_KEY = "dc:import_result"
+DC_CATALOG_KEY = "dc:catalog"
 
 
 class DataCatalogPage(Page):
@@ -104,11 +117,21 @@ class DataCatalogPage(Page):
                     table_group_id = str(table_groups[0].id) if table_groups else None
                     on_table_group_selected(table_group_id)
 
-                columns, selected_item, selected_table_group = [], None, None
+                tables, has_tables, has_more, selected_item, selected_table_group = [], False, False, None, None
+                catalog_state = get_catalog_state(table_group_id)
+                filters = CatalogFilters.from_dict(catalog_state["filters"])
                 if table_group_id:
                     selected_table_group = next(item for item in table_groups if str(item.id) == table_group_id)
-                    columns = get_table_group_columns(table_group_id)
                     selected_item = get_selected_item(selected, table_group_id)
+                    if selected_item and selected_item["type"] == "column":
+                        catalog_state["expanded"].add(f"table_{selected_item['table_id']}")
+                    tables, has_more = get_catalog_tree(
+                        table_group_id,
+                        filters,
+                        catalog_state["page_count"],
+                        catalog_state["expanded"],
+                    )
+                    has_tables = bool(tables) or bool(get_catalog_tables(table_group_id, CatalogFilters(), limit=1)[0])
 
         if selected_item:
             selected_item["project_code"] = project_code
@@ -168,6 +191,20 @@ class DataCatalogPage(Page):
         def on_export_clicked(items) -> None:
             st.session_state[DC_EXPORT_DIALOG_KEY] = items
 
+        def on_export_filtered_clicked(_) -> None:
+            st.session_state[DC_EXPORT_DIALOG_KEY] = get_catalog_items(table_group_id, filters)
+
+        def on_catalog_filters_changed(payload: dict) -> None:
+            catalog_state["filters"] = CatalogFilters.from_dict(payload).to_dict()
+            catalog_state["page_count"] = 1
+            catalog_state["expanded"] = set()
+
+        def on_tables_expanded(table_ids: list[str]) -> None:
+            catalog_state["expanded"].update(table_ids)
+
+        def on_more_tables_requested(_) -> None:
+            catalog_state["page_count"] += 1
+
         def on_export_csv_clicked(_) -> None:
             if selected_table_group:
                 export_metadata_csv(selected_table_group)
@@ -201,8 +238,9 @@ class DataCatalogPage(Page):
             try:
                 apply_metadata_import(preview, tg_id)
                 from testgen.ui.queries.profiling_queries import get_column_by_id, get_table_by_id
-                for func in [get_table_group_columns, get_table_by_id, get_column_by_id, get_tag_values, TableGroup.select_minimal_where]:
+                for func in [get_catalog_tables, get_catalog_columns, get_table_by_id, get_column_by_id, get_tag_values, TableGroup.select_minimal_where]:
                     func.clear()
+                invalidate_cache(cache_tag("table_group", tg_id))
                 st.session_state["data_catalog:last_saved_timestamp"] = datetime.now().timestamp()
                 parts = []
                 if tc := preview.get("matched_tables", 0):
@@ -293,7 +331,10 @@ class DataCatalogPage(Page):
 
         create_script_dialog_data = None
         if create_script_item := st.session_state.get(DC_CREATE_SCRIPT_DIALOG_KEY):
-            script = generate_create_script(create_script_item["table_name"], columns)
+            script = generate_create_script(
+                create_script_item["table_name"],
+                get_catalog_columns(create_script_item["id"], CatalogFilters(show_excluded=True)),
+            )
             create_script_dialog_data = {
                 "title": f"Table CREATE Script: {create_script_item['table_name']}",
                 "table_name": create_script_item["table_name"],
@@ -314,7 +355,12 @@ class DataCatalogPage(Page):
                         "selected": table_group_id == str(table_group.id),
                     } for table_group in table_groups
                 ],
-                "columns": json.dumps(make_json_safe(columns)) if columns else None,
+                "tables": json.dumps(make_json_safe(tables)),
+                "catalog": {
+                    "filters": filters.to_dict(),
+                    "has_tables": has_tables,
+                    "has_more": has_more,
+                },
                 "selected_item": json.dumps(make_json_safe(selected_item)) if selected_item else None,
                 "tag_values": get_tag_values(),
                 "last_saved_timestamp": st.session_state.get("data_catalog:last_saved_timestamp"),
@@ -337,6 +383,10 @@ class DataCatalogPage(Page):
             on_TableGroupSelected_change=on_table_group_selected,
             on_ItemSelected_change=on_item_selected,
             on_ExportClicked_change=on_export_clicked,
+            on_ExportFilteredClicked_change=on_export_filtered_clicked,
+            on_CatalogFiltersChanged_change=on_catalog_filters_changed,
+            on_TablesExpanded_change=on_tables_expanded,
+            on_MoreTablesRequested_change=on_more_tables_requested,
             on_ExportCsvClicked_change=on_export_csv_clicked,
             on_ImportClicked_change=on_import_clicked,
             on_RemoveTableConfirmed_change=remove_table_dialog,
@@ -429,6 +479,57 @@ def export_metadata_csv(table_group: TableGroupMinimal) -> None:
     )
 
 
+def get_catalog_state(table_group_id: str | None) -> dict:
+    catalog_state = st.session_state.get(DC_CATALOG_KEY)
+    if not catalog_state or catalog_state["table_group_id"] != table_group_id:
+        catalog_state = {
+            "table_group_id": table_group_id,
+            "filters": CatalogFilters().to_dict(),
+            "page_count": 1,
+            "expanded": set(),
+        }
+        st.session_state[DC_CATALOG_KEY] = catalog_state
+    return catalog_state
+
+
+def get_catalog_tree(
+    table_group_id: str,
+    filters: CatalogFilters,
+    page_count: int,
+    expanded: set[str],
+) -> tuple[list[dict], bool]:
+    """
+    Returns the tables of the catalog tree loaded so far, and whether there are more to load.
+    Only the expanded tables include their columns - the rest are loaded when expanded.
+    """
+    tables, after, has_more = [], None, False
+    for _ in range(page_count):
+        page, has_more = get_catalog_tables(table_group_id, filters, after)
+        tables.extend(page)
+        if not has_more:
+            break
+        after = (page[-1]["cursor_name"], page[-1]["cursor_id"])
+
+    for table in tables:
+        if table["table_id"] in expanded:
+            table["columns"] = get_catalog_columns(table["cursor_id"], filters)
+    return tables, has_more
+
+
+def expand_selected_tables(items: list[dict]) -> list[dict]:
+    """Adds the matching columns of tables that were selected before their columns were loaded in the tree."""
+    filters = CatalogFilters.from_dict(st.session_state.get(DC_CATALOG_KEY, {}).get("filters"))
+    expanded_items = []
+    for item in items:
+        expanded_items.append(item)
+        if item["type"] == "table" and item.get("all"):
+            expanded_items.extend(
+                {"type": "column", "id": column["column_id"].removeprefix("column_")}
+                for column in get_catalog_columns(item["id"], filters)
+            )
+    return expanded_items
+
+
 def on_table_group_selected(table_group_id: str | None) -> None:
     Router().set_query_params({ "table_group_id": table_group_id })
 
@@ -440,9 +541,11 @@ def on_item_selected(item_id: str | None) -> None:
 class ExportItem(typing.TypedDict):
     id: str
     type: typing.Literal["table", "column"]
+    all: typing.NotRequired[bool]
 
 def get_excel_report_data(update_progress: PROGRESS_UPDATE_TYPE, table_group: TableGroupMinimal, items: list[ExportItem] | None) -> None:
     if items:
+        items = expand_selected_tables(items)
         table_data = get_tables_by_id(
             table_ids=[ item["id"] for item in items if item["type"] == "table" ],
             include_tags=True,
@@ -597,8 +700,9 @@ def remove_table_dialog(item: dict) -> None:
         "DELETE FROM data_table_chars WHERE table_id = :table_id;",
         {"table_id": item["id"]},
     )
-    for func in [get_table_group_columns, get_tag_values]:
+    for func in [get_catalog_tables, get_catalog_columns, get_tag_values]:
         func.clear()
+    invalidate_cache(cache_tag("table_group", item["table_group_id"]))
     st.session_state["data_catalog:last_saved_timestamp"] = datetime.now().timestamp()
 
 
@@ -623,8 +727,9 @@ def on_tags_changed(spinner_container: DeltaGenerator, payload: dict) -> FILE_DA
         column_set_attributes.append("excluded_data_element = :excluded_data_element")
         params["excluded_data_element"] = tags.get("excluded_data_element")
 
-    params["table_ids"] = [ item["id"] for item in payload["items"] if item["type"] == "table" ]
-    params["column_ids"] = [ item["id"] for item in payload["items"] if item["type"] == "column" ]
+    items = expand_selected_tables(payload["items"])
+    params["table_ids"] = [ item["id"] for item in items if item["type"] == "table" ]
+    params["column_ids"] = [ item["id"] for item in items if item["type"] == "column" ]
 
     with spinner_container:
         with st.spinner("Saving tags"):
@@ -674,56 +779,13 @@ def on_tags_changed(spinner_container: DeltaGenerator, payload: dict) -> FILE_DA
                     if changed:
                         table_group.save()
 
-    for func in [ get_table_group_columns, get_table_by_id, get_column_by_id, get_tag_values, TableGroup.select_minimal_where ]:
+    for func in [ get_catalog_tables, get_catalog_columns, get_table_by_id, get_column_by_id, get_tag_values, TableGroup.select_minimal_where ]:
         func.clear()
+    # Catalog metadata is joined into the cached hygiene issues and test results of the table group
+    invalidate_cache(cache_tag("table_group", st.query_params.get("table_group_id")))
     st.session_state["data_catalog:last_saved_timestamp"] = datetime.now().timestamp()
 
 
-@st.cache_data(show_spinner=False)
-def get_table_group_columns(table_group_id: str) -> list[dict]:
-    if not is_uuid4(table_group_id):
-        return []
-    
-    query = f"""
-    SELECT CONCAT('column_', column_chars.column_id) AS column_id,
-        CONCAT('table_', table_chars.table_id) AS table_id,
-        column_chars.column_name,
-        table_chars.table_name,
-        column_chars.schema_name,
-        column_chars.general_type,
-        column_chars.db_data_type,
-        column_chars.functional_data_type,
-        profile_results.datatype_suggestion,
-        table_chars.record_ct,
-        profile_results.value_ct,
-        column_chars.add_date,
-        column_chars.drop_date,
-        table_chars.add_date AS table_add_date,
-        table_chars.drop_date AS table_drop_date,
-        column_chars.critical_data_element,
-        table_chars.critical_data_element AS table_critical_data_element,
-        column_chars.pii_flag,
-        column_chars.excluded_data_element,
-        {", ".join([ f"column_chars.{tag}" for tag in TAG_FIELDS ])},
-        {", ".join([ f"table_chars.{tag} AS table_{tag}" for tag in TAG_FIELDS ])}
-    FROM data_column_chars column_chars
-        LEFT JOIN data_table_chars table_chars ON (
-            column_chars.table_id = table_chars.table_id
-        )
-        LEFT JOIN profile_results ON (
-            column_chars.last_complete_profile_run_id = profile_results.profile_run_id
-            AND column_chars.table_name = profile_results.table_name
-            AND column_chars.column_name = profile_results.column_name
-        )
-    WHERE column_chars.table_groups_id = :table_group_id
-    ORDER BY LOWER(table_chars.table_name), ordinal_position;
-    """
-    params = {"table_group_id": table_group_id}
-
-    results = fetch_all_from_db(query, params)
-    return [ dict(row) for row in results ]
-
-
 def get_selected_item(selected: str, table_group_id: str) -> dict | None:
     if not selected or "_" not in selected or not is_uuid4(table_group_id):
         return None
@@ -5,6 +5,7 @@ from testgen.common.models.job_execution import JobExecution
 from testgen.common.models.test_suite import TestSuiteMinimal
 from testgen.ui.components import widgets as testgen
 from testgen.ui.services.database_service import execute_db_query, fetch_all_from_db, fetch_one_from_db
+from testgen.ui.services.query_cache import get_test_suite_summaries
 
 RESULT_KEY = "generate_tests_dialog:result"
 LOCK_RESULT_KEY = "generate_tests_dialog:lock_result"
@@ -46,7 +47,7 @@ def generate_tests_dialog_widget(
                     project_code=test_suite.project_code,
                 )
             st.session_state[RESULT_KEY] = {"success": True, "message": f"Test generation started for test suite '{test_suite_name}'."}
-            st.cache_data.clear()
+            get_test_suite_summaries.clear()
             on_close()
         except Exception as e:
             st.session_state[RESULT_KEY] = {"success": False, "message": f"Test generation encountered errors: {e!s}."}
@@ -18,14 +18,15 @@ from testgen.ui.components.widgets.download_dialog import (
     PROGRESS_UPDATE_TYPE,
     download_dialog,
     get_excel_file_data,
-    zip_multi_file_data,
 )
 from testgen.ui.navigation.page import Page
 from testgen.ui.navigation.router import Router
+from testgen.ui.pdf.bulk_report import IssueReport, zip_issue_reports
 from testgen.ui.pdf.hygiene_issue_report import create_report
 from testgen.ui.queries.profiling_queries import get_profiling_anomalies
 from testgen.ui.queries.source_data_queries import get_hygiene_issue_source_data, get_hygiene_issue_source_query
 from testgen.ui.services.database_service import execute_db_query
+from testgen.ui.services.query_cache import cache_tag, invalidate_cache, tagged_cache_data
 from testgen.ui.session import session
 from testgen.utils import friendly_score, make_json_safe
 
@@ -205,11 +206,7 @@ class HygieneIssuesPage(Page):
             Router().set_query_params({"selected": item_id})
 
         def _clear_disposition_caches() -> None:
-            _get_anomaly_disposition.clear()
-            _get_profiling_anomaly_summary.clear()
-            profiling_queries.get_profiling_anomalies.clear()
-            profiling_queries.get_profiling_anomalies_count.clear()
-            profiling_queries.get_profiling_anomaly_ids.clear()
+            invalidate_cache(cache_tag("profiling_run", run_id))
 
         @with_database_session
         def on_disposition_changed(payload: dict) -> None:
@@ -324,7 +321,7 @@ class HygieneIssuesPage(Page):
                 run_id,
                 run.table_groups_id if run.is_latest_run else None,
             )
-            st.cache_data.clear()
+            ProfilingRun.get_minimal.clear()
 
         @with_database_session
         def on_download_report(payload: dict) -> None:
@@ -354,12 +351,18 @@ class HygieneIssuesPage(Page):
                     args=(selected_items[0],),
                 )
             else:
-                zip_func = zip_multi_file_data(
-                    "testgen_hygiene_issue_reports.zip",
-                    get_report_file_data,
-                    [(item,) for item in selected_items],
+                mask_pii = not session.auth.user_has_permission("view_pii")
+                download_dialog(
+                    dialog_title=dialog_title,
+                    file_content_func=zip_issue_reports,
+                    args=(
+                        "testgen_hygiene_issue_reports.zip",
+                        [
+                            IssueReport(get_report_file_name(item), "hygiene", item, mask_pii)
+                            for item in selected_items
+                        ],
+                    ),
                 )
-                download_dialog(dialog_title=dialog_title, file_content_func=zip_func)
 
         def on_page_changed(payload: dict) -> None:
             new_page = payload.get("page", 0)
@@ -432,7 +435,7 @@ def _map_action_filter(action: str | None) -> str | None:
     return action
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(profiling_run="profile_run_id")
 def _get_anomaly_disposition(profile_run_id: str) -> pd.DataFrame:
     from testgen.ui.services.database_service import fetch_df_from_db
 
@@ -447,7 +450,7 @@ def _get_anomaly_disposition(profile_run_id: str) -> pd.DataFrame:
     return df[["id", "action", "disposition"]]
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(profiling_run="profile_run_id")
 def _get_profiling_anomaly_summary(profile_run_id: str) -> list[dict]:
     count_by_priority = HygieneIssue.select_count_by_priority(profile_run_id)
 
@@ -508,10 +511,14 @@ def get_excel_report_data(
     )
 
 
-def get_report_file_data(update_progress, tr_data) -> FILE_DATA_TYPE:
+def get_report_file_name(tr_data) -> str:
     hi_id = tr_data["id"][:8]
     profiling_time = pd.Timestamp(tr_data["profiling_starttime"]).strftime("%Y%m%d_%H%M%S")
-    file_name = f"testgen_hygiene_issue_report_{hi_id}_{profiling_time}.pdf"
+    return f"testgen_hygiene_issue_report_{hi_id}_{profiling_time}.pdf"
+
+
+def get_report_file_data(update_progress, tr_data) -> FILE_DATA_TYPE:
+    file_name = get_report_file_name(tr_data)
 
     with BytesIO() as buffer:
         create_report(buffer, tr_data, mask_pii=not session.auth.user_has_permission("view_pii"))
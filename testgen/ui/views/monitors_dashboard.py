@@ -18,16 +18,26 @@ from testgen.common.models.scheduler import RUN_MONITORS_JOB_KEY, JobSchedule
 from testgen.common.models.table_group import TableGroup, TableGroupMinimal
 from testgen.common.models.test_definition import TestDefinition, TestDefinitionSummary
 from testgen.common.models.test_suite import PredictSensitivity, TestSuite
+from testgen.common.monitor_snapshot_service import (
+    SNAPSHOT_COLUMNS,
+    has_monitor_table_snapshots,
+    refresh_monitor_table_snapshots,
+)
 from testgen.ui.components import widgets as testgen
 from testgen.ui.navigation.menu import MenuItem
 from testgen.ui.navigation.page import Page
 from testgen.ui.navigation.router import Router
 from testgen.ui.queries.profiling_queries import get_tables_by_table_group
 from testgen.ui.services.database_service import execute_db_query, fetch_all_from_db, fetch_one_from_db
-from testgen.ui.services.query_cache import get_project_summary, get_test_type_summaries
+from testgen.ui.services.query_cache import (
+    cache_tag,
+    get_project_summary,
+    get_test_type_summaries,
+    invalidate_cache,
+)
 from testgen.ui.services.rerun_service import safe_rerun
 from testgen.ui.session import session, temp_value
-from testgen.ui.utils import dict_from_kv, get_cron_sample, get_cron_sample_handler
+from testgen.ui.utils import get_cron_sample, get_cron_sample_handler
 from testgen.ui.views.dialogs.manage_notifications import NotificationSettingsDialogBase
 from testgen.utils import make_json_safe
 
@@ -107,6 +117,11 @@ class MonitorsDashboardPage(Page):
 
             if monitor_suite_id:
                 with st.spinner(text="Loading data ..."):
+                    # Snapshots are written by monitor runs - compute them for suites that have none yet
+                    if not has_monitor_table_snapshots(monitor_suite_id):
+                        refresh_monitor_table_snapshots(monitor_suite_id)
+                        clear_monitor_changes_caches()
+
                     monitor_schedule = JobSchedule.get(
                         JobSchedule.key == RUN_MONITORS_JOB_KEY,
                         JobSchedule.kwargs["test_suite_id"].astext == str(monitor_suite_id),
@@ -342,15 +357,22 @@ def get_monitor_changes_by_tables(
     limit: int | None = None,
     offset: int | None = None,
 ) -> list[dict]:
-    query, params = _monitor_changes_by_tables_query(
-        table_group_id,
-        table_name_filter=table_name_filter,
-        anomaly_type_filter=anomaly_type_filter,
-        sort_field=sort_field,
-        sort_order=sort_order,
-        limit=limit,
-        offset=offset,
-    )
+    condition, params = _monitor_snapshots_condition(table_group_id, table_name_filter, anomaly_type_filter)
+    query = f"""
+    SELECT
+        snapshots.table_groups_id::VARCHAR AS table_group_id,
+        snapshots.table_name,
+        {", ".join(f"snapshots.{column}" for column in SNAPSHOT_COLUMNS)}
+    FROM monitor_table_snapshots AS snapshots
+    INNER JOIN table_groups
+        ON (table_groups.monitor_test_suite_id = snapshots.test_suite_id)
+    WHERE {condition}
+    ORDER BY {"LOWER(snapshots.table_name)" if not sort_field or sort_field == "table_name" else f"snapshots.{sort_field}"}
+    {"DESC" if sort_order == "desc" else "ASC"} NULLS LAST
+    {"LIMIT :limit" if limit else ""}
+    {"OFFSET :offset" if offset else ""}
+    """
+    params.update({"limit": limit, "offset": offset})
 
     results = fetch_all_from_db(query, params)
     return [ dict(row) for row in results ]
@@ -362,20 +384,22 @@ def count_monitor_changes_by_tables(
     table_name_filter: str | None = None,
     anomaly_type_filter: list[str] | None = None,
 ) -> int:
-    query, params = _monitor_changes_by_tables_query(
-        table_group_id,
-        table_name_filter=table_name_filter,
-        anomaly_type_filter=anomaly_type_filter,
-    )
-    count_query = f"SELECT COUNT(*) AS count FROM ({query}) AS subquery"
-    result = execute_db_query(count_query, params)
+    condition, params = _monitor_snapshots_condition(table_group_id, table_name_filter, anomaly_type_filter)
+    query = f"""
+    SELECT COUNT(*) AS count
+    FROM monitor_table_snapshots AS snapshots
+    INNER JOIN table_groups
+        ON (table_groups.monitor_test_suite_id = snapshots.test_suite_id)
+    WHERE {condition}
+    """
+    result = execute_db_query(query, params)
     return result or 0
 
 
 @st.cache_data(show_spinner=False)
 def summarize_monitor_changes(table_group_id: str) -> dict:
-    query, params = _monitor_changes_by_tables_query(table_group_id)
-    count_query = f"""
+    condition, params = _monitor_snapshots_condition(table_group_id)
+    query = f"""
     SELECT
         lookback,
         MIN(lookback_start) AS lookback_start,
@@ -395,11 +419,14 @@ def summarize_monitor_changes(table_group_id: str) -> dict:
         BOOL_AND(volume_is_pending) AS volume_is_pending,
         BOOL_AND(schema_is_pending) AS schema_is_pending,
         BOOL_AND(metric_is_pending) AS metric_is_pending
-    FROM ({query}) AS subquery
+    FROM monitor_table_snapshots AS snapshots
+    INNER JOIN table_groups
+        ON (table_groups.monitor_test_suite_id = snapshots.test_suite_id)
+    WHERE {condition}
     GROUP BY lookback
     """
 
-    result = fetch_one_from_db(count_query, params)
+    result = fetch_one_from_db(query, params)
     return {**result} if result else {
         "lookback": 0,
         "freshness_anomalies": 0,
@@ -420,170 +447,28 @@ def summarize_monitor_changes(table_group_id: str) -> dict:
     }
 
 
-def _monitor_changes_by_tables_query(
+def clear_monitor_changes_caches() -> None:
+    for func in [get_monitor_changes_by_tables, count_monitor_changes_by_tables, summarize_monitor_changes]:
+        func.clear()
+
+
+def _monitor_snapshots_condition(
     table_group_id: str,
     table_name_filter: str | None = None,
     anomaly_type_filter: list[str] | None = None,
-    sort_field: str | None = None,
-    sort_order: Literal["asc"] | Literal["desc"] | None = None,
-    limit: int | None = None,
-    offset: int | None = None,
 ) -> tuple[str, dict]:
-    query = f"""
-    WITH ranked_test_runs AS (
-        SELECT
-            test_runs.id,
-            test_runs.test_starttime,
-            COALESCE(test_suites.monitor_lookback, 1) AS lookback,
-            ROW_NUMBER() OVER (PARTITION BY test_runs.test_suite_id ORDER BY test_runs.test_starttime DESC) AS position
-        FROM table_groups
-        INNER JOIN test_runs
-            ON (test_runs.test_suite_id = table_groups.monitor_test_suite_id)
-        INNER JOIN test_suites
-            ON (table_groups.monitor_test_suite_id = test_suites.id)
-        WHERE table_groups.id = :table_group_id
-    ),
-    lookback_window AS (
-        SELECT MIN(test_starttime) AS lookback_start
-        FROM ranked_test_runs
-        WHERE position <= lookback
-    ),
-    latest_tables AS (
-        SELECT DISTINCT
-            table_chars.schema_name,
-            table_chars.table_name
-        FROM data_table_chars table_chars
-        CROSS JOIN lookback_window
-        WHERE table_chars.table_groups_id = :table_group_id
-            -- Include current tables and tables dropped within lookback window
-            AND (table_chars.drop_date IS NULL OR table_chars.drop_date >= lookback_window.lookback_start)
-            {"AND table_chars.table_name ILIKE :table_name_filter" if table_name_filter else ''}
-    ),
-    monitor_results AS (
-        SELECT
-            latest_tables.table_name,
-            results.test_time,
-            results.test_type,
-            results.result_code,
-            ranked_test_runs.lookback,
-            ranked_test_runs.position,
-            ranked_test_runs.test_starttime,
-            -- result_code = -1 indicates training mode
-            CASE WHEN results.result_code = -1 THEN 1 ELSE 0 END AS is_training,
-            CASE WHEN results.test_type = 'Freshness_Trend' AND results.result_code = 0 THEN 1 ELSE 0 END AS freshness_anomaly,
-            CASE WHEN results.test_type = 'Volume_Trend' AND results.result_code = 0 THEN 1 ELSE 0 END AS volume_anomaly,
-            CASE WHEN results.test_type = 'Schema_Drift' AND results.result_code = 0 THEN 1 ELSE 0 END AS schema_anomaly,
-            CASE WHEN results.test_type = 'Metric_Trend' AND results.result_code = 0 THEN 1 ELSE 0 END AS metric_anomaly,
-            CASE WHEN results.test_type = 'Freshness_Trend' THEN results.result_signal ELSE NULL END AS freshness_interval,
-            CASE WHEN results.test_type = 'Volume_Trend' THEN results.result_signal::BIGINT ELSE NULL END AS row_count,
-            CASE WHEN results.test_type = 'Schema_Drift' THEN SPLIT_PART(results.result_signal, '|', 1) ELSE NULL END AS table_change,
-            CASE WHEN results.test_type = 'Schema_Drift' THEN NULLIF(SPLIT_PART(results.result_signal, '|', 2), '')::INT ELSE 0 END AS col_adds,
-            CASE WHEN results.test_type = 'Schema_Drift' THEN NULLIF(SPLIT_PART(results.result_signal, '|', 3), '')::INT ELSE 0 END AS col_drops,
-            CASE WHEN results.test_type = 'Schema_Drift' THEN NULLIF(SPLIT_PART(results.result_signal, '|', 4), '')::INT ELSE 0 END AS col_mods,
-            CASE WHEN results.result_status = 'Error' THEN results.result_message ELSE NULL END AS error_message
-        FROM latest_tables
-        LEFT JOIN ranked_test_runs ON TRUE
-        LEFT JOIN test_results AS results
-            ON results.test_run_id = ranked_test_runs.id
-            AND results.table_name = latest_tables.table_name
-        WHERE ranked_test_runs.position IS NULL
-            -- Also capture 1 run before the lookback to get baseline results
-            OR ranked_test_runs.position <= ranked_test_runs.lookback + 1
-    ),
-    monitor_tables AS (
-        SELECT
-            :table_group_id AS table_group_id,
-            table_name,
-            MAX(lookback) AS lookback,
-            SUM(freshness_anomaly) AS freshness_anomalies,
-            SUM(volume_anomaly) AS volume_anomalies,
-            SUM(schema_anomaly) AS schema_anomalies,
-            SUM(metric_anomaly) AS metric_anomalies,
-            MAX(test_time - (COALESCE(NULLIF(freshness_interval, 'Unknown')::INTEGER, 0) * INTERVAL '1 minute'))
-                FILTER (WHERE test_type = 'Freshness_Trend' AND position = 1) AS latest_update,
-            MAX(row_count) FILTER (WHERE position = 1) AS row_count,
-            SUM(col_adds) AS column_adds,
-            SUM(col_drops) AS column_drops,
-            SUM(col_mods) AS column_mods,
-            MAX(error_message) FILTER (WHERE test_type = 'Freshness_Trend' AND position = 1) AS freshness_error_message,
-            MAX(error_message) FILTER (WHERE test_type = 'Volume_Trend' AND position = 1) AS volume_error_message,
-            MAX(error_message) FILTER (WHERE test_type = 'Schema_Drift' AND position = 1) AS schema_error_message,
-            MAX(error_message) FILTER (WHERE test_type = 'Metric_Trend' AND position = 1) AS metric_error_message,
-            BOOL_OR(is_training = 1) FILTER (WHERE test_type = 'Freshness_Trend' AND position = 1) AS freshness_is_training,
-            BOOL_OR(is_training = 1) FILTER (WHERE test_type = 'Volume_Trend' AND position = 1) AS volume_is_training,
-            BOOL_OR(is_training = 1) FILTER (WHERE test_type = 'Metric_Trend' AND position = 1) AS metric_is_training,
-            BOOL_OR(test_type = 'Freshness_Trend') IS NOT TRUE AS freshness_is_pending,
-            BOOL_OR(test_type = 'Volume_Trend') IS NOT TRUE AS volume_is_pending,
-            -- Schema monitor only creates results on schema changes (Failed)
-            -- Mark it as pending only if there are no results of any test type
-            BOOL_OR(test_time IS NOT NULL) IS NOT TRUE AS schema_is_pending,
-            BOOL_OR(test_type = 'Metric_Trend') IS NOT TRUE AS metric_is_pending,
-            CASE
-                -- Mark as Dropped if latest Schema Drift result for the table indicates it was dropped
-                WHEN (ARRAY_AGG(table_change ORDER BY test_time DESC) FILTER (WHERE table_change IS NOT NULL))[1] = 'D'
-                    THEN 'dropped'
-                -- Only mark as Added if latest change does not indicate a drop
-                WHEN MAX(CASE WHEN table_change = 'A' THEN 1 ELSE 0 END) = 1
-                    THEN 'added'
-                WHEN SUM(schema_anomaly) > 0
-                    THEN 'modified'
-                ELSE NULL
-            END AS table_state
-        FROM monitor_results
-        -- Only aggregate within lookback runs
-        WHERE position IS NULL OR position <= COALESCE(lookback, 1)
-        GROUP BY table_name
-    ),
-    table_bounds AS (
-        SELECT
-            table_name,
-            MIN(position) AS min_position,
-            MAX(position) AS max_position
-        FROM monitor_results
-        WHERE position IS NOT NULL
-        GROUP BY table_name
-    ),
-    baseline_tables AS (
-        SELECT
-            monitor_results.table_name,
-            MIN(monitor_results.test_starttime) FILTER (
-                WHERE monitor_results.position = LEAST(monitor_results.lookback + 1, table_bounds.max_position)
-            ) AS lookback_start,
-            MAX(monitor_results.test_starttime) FILTER (
-                WHERE monitor_results.position = GREATEST(1, table_bounds.min_position)
-            ) AS lookback_end,
-            MAX(monitor_results.row_count) FILTER (
-                WHERE monitor_results.test_type = 'Volume_Trend'
-                AND monitor_results.position = LEAST(monitor_results.lookback + 1, table_bounds.max_position)
-            ) AS previous_row_count
-        FROM monitor_results
-        JOIN table_bounds ON monitor_results.table_name = table_bounds.table_name
-        GROUP BY monitor_results.table_name
-    )
-    SELECT
-        monitor_tables.*,
-        baseline_tables.lookback_start,
-        baseline_tables.lookback_end,
-        baseline_tables.previous_row_count
-    FROM monitor_tables
-    LEFT JOIN baseline_tables ON monitor_tables.table_name = baseline_tables.table_name
-    {f"WHERE ({' OR '.join(f'{ANOMALY_TYPE_FILTERS[t]} > 0' for t in anomaly_type_filter)})" if anomaly_type_filter else ""}
-    ORDER BY {"LOWER(monitor_tables.table_name)" if not sort_field or sort_field == "table_name" else f"monitor_tables.{sort_field}"}
-    {"DESC" if sort_order == "desc" else "ASC"} NULLS LAST
-    {"LIMIT :limit" if limit else ""}
-    {"OFFSET :offset" if offset else ""}
-    """
+    conditions = ["table_groups.id = :table_group_id"]
+    if table_name_filter:
+        conditions.append("snapshots.table_name ILIKE :table_name_filter")
+    if anomaly_type_filter:
+        conditions.append(f"({' OR '.join(f'snapshots.{ANOMALY_TYPE_FILTERS[t]} > 0' for t in anomaly_type_filter)})")
 
     escaped_table_name_filter = table_name_filter.replace("_", "\\_") if table_name_filter else None
     params = {
         "table_group_id": table_group_id,
         "table_name_filter": f"%{escaped_table_name_filter}%" if escaped_table_name_filter else None,
-        "sort_field": sort_field,
-        "limit": limit,
-        "offset": offset,
     }
-
-    return query, params
+    return " AND ".join(conditions), params
 
 
 def set_param_values(payload: dict) -> None:
@@ -647,6 +532,11 @@ def build_edit_monitor_settings_data(
         elif schedule.active != new_schedule_config["active"]: # Only active status changed
             JobSchedule.update_active(schedule.id, new_schedule_config["active"])
 
+        if not is_new:
+            # The lookback window may have changed
+            refresh_monitor_table_snapshots(monitor_suite.id)
+            clear_monitor_changes_caches()
+
         if is_new:
             updated_table_group = TableGroup.get(table_group.id)
             updated_table_group.monitor_test_suite_id = monitor_suite.id
@@ -682,7 +572,14 @@ def delete_monitor_suite(table_group: TableGroupMinimal) -> None:
     try:
         monitor_suite = TestSuite.get(table_group.monitor_test_suite_id)
         TestSuite.cascade_delete([monitor_suite.id])
-        st.cache_data.clear()
+        invalidate_cache(cache_tag("test_suite", monitor_suite.id))
+        for func in [
+            TableGroup.select_minimal_where,
+            TestSuite.get,
+            get_monitor_events_for_table,
+        ]:
+            func.clear()
+        clear_monitor_changes_caches()
     except Exception:
         LOG.exception("Failed to delete monitor suite")
         st.toast("Unable to delete monitors for the table group, try again.", icon=":material/error:")
@@ -904,7 +801,9 @@ def get_monitor_events_for_table(test_suite_id: str, table_name: str, lookback_m
         results.result_signal,
         results.result_message,
         results.test_definition_id::TEXT,
-        COALESCE(results.input_parameters, '') AS input_parameters,
+        -- Input parameters are stored as "name=value; ..." strings
+        NULLIF(TRIM(SUBSTRING(results.input_parameters FROM '(?:^|;)\\s*lower_tolerance=([^;]*)')), '') AS lower_tolerance,
+        NULLIF(TRIM(SUBSTRING(results.input_parameters FROM '(?:^|;)\\s*upper_tolerance=([^;]*)')), '') AS upper_tolerance,
         results.column_names
     FROM active_runs
     CROSS JOIN target_tests tt
@@ -937,15 +836,14 @@ def get_monitor_events_for_table(test_suite_id: str, table_name: str, lookback_m
                     "column_name": event["column_names"],
                     "events": [],
                 }
-            params = dict_from_kv(event.get("input_parameters") or "")
             metric_events[definition_id]["events"].append({
                 "value": float(event["result_signal"]) if event["result_signal"] else None,
                 "time": event["test_time"],
                 "is_anomaly": int(event["result_code"]) == 0 if event["result_code"] is not None else None,
                 "is_training": int(event["result_code"]) == -1 if event["result_code"] is not None else None,
                 "is_pending": not bool(event["result_id"]),
-                "lower_tolerance": params.get("lower_tolerance") if params.get("lower_tolerance") else None,
-                "upper_tolerance": params.get("upper_tolerance") if params.get("upper_tolerance") else None,
+                "lower_tolerance": event["lower_tolerance"],
+                "upper_tolerance": event["upper_tolerance"],
             })
 
     return {
@@ -967,12 +865,10 @@ def get_monitor_events_for_table(test_suite_id: str, table_name: str, lookback_m
                 "is_anomaly": int(event["result_code"]) == 0 if event["result_code"] is not None else None,
                 "is_training": int(event["result_code"]) == -1 if event["result_code"] is not None else None,
                 "is_pending": not bool(event["result_id"]),
-                **params,
+                "lower_tolerance": event["lower_tolerance"],
+                "upper_tolerance": event["upper_tolerance"],
             }
-            for event in results if event["test_type"] == "Volume_Trend" and event["result_status"] != "Error" and (
-                params := dict_from_kv(event.get("input_parameters"))
-                    or {"lower_tolerance": None, "upper_tolerance": None}
-            )
+            for event in results if event["test_type"] == "Volume_Trend" and event["result_status"] != "Error"
         ],
         "schema_events": [
             {
@@ -11,6 +11,7 @@ from testgen.common.models.project import Project
 from testgen.ui.components import widgets as testgen
 from testgen.ui.navigation.menu import MenuItem
 from testgen.ui.navigation.page import Page
+from testgen.ui.services.query_cache import cache_tag, invalidate_cache
 from testgen.ui.session import session, temp_value
 
 PAGE_TITLE = "Project Settings"
@@ -76,6 +77,7 @@ class ProjectSettingsPage(Page):
         self.project.observability_api_url = edited_project.get("observability_api_url")
         self.project.observability_api_key = edited_project.get("observability_api_key")
         self.project.save()
+        invalidate_cache(cache_tag("project", project_code))
 
         if weights_changed:
             JobExecution.submit(
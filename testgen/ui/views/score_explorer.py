@@ -25,10 +25,11 @@ from testgen.common.models.scores import (
 from testgen.common.models.test_run import TestRun
 from testgen.common.pii_masking import get_pii_columns, mask_hygiene_detail, mask_profiling_pii
 from testgen.ui.components import widgets as testgen
-from testgen.ui.components.widgets.download_dialog import FILE_DATA_TYPE, download_dialog, zip_multi_file_data
+from testgen.ui.components.widgets.download_dialog import FILE_DATA_TYPE, download_dialog
 from testgen.ui.navigation.page import Page
 from testgen.ui.navigation.router import Router
 from testgen.ui.pdf import hygiene_issue_report, test_result_report
+from testgen.ui.pdf.bulk_report import IssueReport, zip_issue_reports
 from testgen.ui.queries.profiling_queries import get_column_by_name
 from testgen.ui.queries.scoring_queries import (
     get_all_score_cards,
@@ -298,35 +299,42 @@ def export_issue_reports(selected_issues: list[SelectedIssue]) -> None:
             args=(issues_data[0],),
         )
     else:
-        zip_func = zip_multi_file_data(
-            "testgen_issue_reports.zip",
-            get_report_file_data,
-            [(arg,) for arg in issues_data],
+        download_dialog(
+            dialog_title=dialog_title,
+            file_content_func=zip_issue_reports,
+            args=("testgen_issue_reports.zip", [get_issue_report(issue) for issue in issues_data]),
         )
-        download_dialog(dialog_title=dialog_title, file_content_func=zip_func)
 
 
-def get_report_file_data(update_progress, issue) -> FILE_DATA_TYPE:
+def get_issue_report(issue) -> IssueReport:
     mask_pii = not session.auth.user_has_permission("view_pii")
     if mask_pii:
         issue = {**issue}
         mask_hygiene_detail([issue])
 
+    if issue["issue_type"] == "hygiene":
+        issue_id = issue["id"][:8]
+        timestamp = pd.Timestamp(issue["profiling_starttime"]).strftime("%Y%m%d_%H%M%S")
+    else:
+        issue_id = issue["test_result_id"][:8]
+        timestamp = pd.Timestamp(issue["test_date"]).strftime("%Y%m%d_%H%M%S")
+
+    file_name = f"testgen_{issue['issue_type']}_issue_report_{issue_id}_{timestamp}.pdf"
+    return IssueReport(file_name, issue["issue_type"], issue, mask_pii)
+
+
+def get_report_file_data(update_progress, issue) -> FILE_DATA_TYPE:
+    report = get_issue_report(issue)
+
     with BytesIO() as buffer:
-        if issue["issue_type"] == "hygiene":
-            issue_id = issue["id"][:8]
-            timestamp = pd.Timestamp(issue["profiling_starttime"]).strftime("%Y%m%d_%H%M%S")
-            hygiene_issue_report.create_report(buffer, issue, mask_pii=mask_pii)
+        if report.issue_type == "hygiene":
+            hygiene_issue_report.create_report(buffer, report.issue_data, mask_pii=report.mask_pii)
         else:
-            issue_id = issue["test_result_id"][:8]
-            timestamp = pd.Timestamp(issue["test_date"]).strftime("%Y%m%d_%H%M%S")
-            test_result_report.create_report(buffer, issue, mask_pii=mask_pii)
+            test_result_report.create_report(buffer, report.issue_data, mask_pii=report.mask_pii)
 
         update_progress(1.0)
         buffer.seek(0)
-
-        file_name = f"testgen_{issue['issue_type']}_issue_report_{issue_id}_{timestamp}.pdf"
-        return file_name, "application/pdf", buffer.read()
+        return report.file_name, "application/pdf", buffer.read()
 
 
 def _get_selected_filters(filters: list[dict]) -> set[tuple[str]]:
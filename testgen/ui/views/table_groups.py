@@ -21,7 +21,13 @@ from testgen.ui.navigation.menu import MenuItem
 from testgen.ui.navigation.page import Page
 from testgen.ui.navigation.router import Router
 from testgen.ui.queries import table_group_queries
-from testgen.ui.services.query_cache import get_profiling_run_summaries, get_project_summary, get_table_group_stats
+from testgen.ui.services.query_cache import (
+    cache_tag,
+    get_profiling_run_summaries,
+    get_project_summary,
+    get_table_group_stats,
+    invalidate_cache,
+)
 from testgen.ui.services.rerun_service import safe_rerun
 from testgen.ui.session import session, temp_value
 from testgen.ui.utils import get_cron_sample_handler
@@ -376,6 +382,7 @@ class TableGroupsPage(Page):
             if is_table_group_verified():
                 try:
                     table_group.save(add_scorecard_definition)
+                    invalidate_cache(cache_tag("table_group", table_group.id))
                     if save_data_chars:
                         try:
                             save_data_chars(table_group.id)
@@ -564,6 +571,7 @@ class TableGroupsPage(Page):
                 except IntegrityError:
                     result = {"success": False, "message": "A Table Group with the same name already exists."}
                 else:
+                    invalidate_cache(cache_tag("table_group", table_group.id))
                     if save_data_chars:
                         try:
                             save_data_chars(table_group.id)
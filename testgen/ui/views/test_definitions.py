@@ -33,6 +33,7 @@ from testgen.ui.navigation.page import Page
 from testgen.ui.navigation.router import Router
 from testgen.ui.queries import profiling_queries
 from testgen.ui.services.database_service import fetch_all_from_db, fetch_df_from_db, fetch_from_target_db
+from testgen.ui.services.query_cache import cache_tag, invalidate_cache
 from testgen.ui.session import session
 from testgen.utils import make_json_safe, to_dataframe
 
@@ -324,6 +325,7 @@ class TestDefinitionsPage(Page):
             td_columns = set(TestDefinition.__table__.columns.keys())
             TestDefinition(**{k: v for k, v in test_def.items() if k in td_columns}).save()
             st.cache_data.clear()
+            invalidate_cache(cache_tag("test_suite", test_suite.id))
             st.session_state.pop(TD_ADD_DIALOG_KEY, None)
             st.session_state.pop(TD_VALIDATE_RESULT_KEY, None)
 
@@ -333,6 +335,7 @@ class TestDefinitionsPage(Page):
             td_columns = set(TestDefinition.__table__.columns.keys())
             TestDefinition(**{k: v for k, v in test_def.items() if k in td_columns}).save()
             st.cache_data.clear()
+            invalidate_cache(cache_tag("test_suite", test_suite.id))
             st.session_state.pop(TD_EDIT_DIALOG_KEY, None)
             st.session_state.pop(TD_VALIDATE_RESULT_KEY, None)
 
@@ -341,6 +344,7 @@ class TestDefinitionsPage(Page):
             ids = payload.get("ids", [])
             TestDefinition.delete_where(TestDefinition.id.in_(ids))
             st.cache_data.clear()
+            invalidate_cache(cache_tag("test_suite", test_suite.id))
             st.session_state.pop(TD_DELETE_DIALOG_KEY, None)
 
         @with_database_session
@@ -348,6 +352,7 @@ class TestDefinitionsPage(Page):
             ids = payload.get("ids", [])
             TestDefinition.set_status_attribute("lock_refresh", ids, False)
             st.cache_data.clear()
+            invalidate_cache(cache_tag("test_suite", test_suite.id))
             st.session_state.pop(TD_UNLOCK_DIALOG_KEY, None)
 
         @with_database_session
@@ -357,6 +362,7 @@ class TestDefinitionsPage(Page):
             value = payload["value"]
             TestDefinition.set_status_attribute(attribute, ids, value)
             st.cache_data.clear()
+            invalidate_cache(cache_tag("test_suite", test_suite.id))
 
         @with_database_session
         def on_update_attribute_all(payload: dict) -> None:
@@ -366,6 +372,7 @@ class TestDefinitionsPage(Page):
             if all_ids:
                 TestDefinition.set_status_attribute(attribute, all_ids, value)
                 st.cache_data.clear()
+                invalidate_cache(cache_tag("test_suite", test_suite.id))
 
         @with_database_session
         def on_copy_confirmed(payload: dict) -> None:
@@ -396,6 +403,7 @@ class TestDefinitionsPage(Page):
                 TestDefinition.delete_where(TestDefinition.id.in_(overwrite_ids))
             TestDefinition.move(ids, target_tg_id, target_ts_id, target_table, target_col)
             st.cache_data.clear()
+            invalidate_cache(cache_tag("test_suite", test_suite.id), cache_tag("test_suite", target_ts_id))
             get_test_suite_columns.clear()
             st.session_state.pop(TD_COPY_MOVE_DIALOG_KEY, None)
             st.session_state.pop(TD_COPY_MOVE_COLLISION_KEY, None)
@@ -478,6 +486,7 @@ class TestDefinitionsPage(Page):
             TestDefinitionNote.add_note(td_id, payload["text"], current_user)
             st.session_state[TD_NOTES_DIALOG_KEY] = _load_notes_dialog_data(td_id, df)
             st.cache_data.clear()
+            invalidate_cache(cache_tag("test_suite", test_suite.id))
 
         @with_database_session
         def on_note_updated(payload: dict) -> None:
@@ -491,6 +500,7 @@ class TestDefinitionsPage(Page):
             td_id = payload["test_definition_id"]
             st.session_state[TD_NOTES_DIALOG_KEY] = _load_notes_dialog_data(td_id, df)
             st.cache_data.clear()
+            invalidate_cache(cache_tag("test_suite", test_suite.id))
 
         def on_notes_dialog_closed(*_) -> None:
             st.session_state.pop(TD_NOTES_DIALOG_KEY, None)
@@ -3,6 +3,7 @@ import typing
 from io import BytesIO
 from itertools import zip_longest
 from operator import attrgetter
+from uuid import UUID
 
 import pandas as pd
 import streamlit as st
@@ -22,10 +23,10 @@ from testgen.ui.components.widgets.download_dialog import (
     PROGRESS_UPDATE_TYPE,
     download_dialog,
     get_excel_file_data,
-    zip_multi_file_data,
 )
 from testgen.ui.navigation.page import Page
 from testgen.ui.navigation.router import Router
+from testgen.ui.pdf.bulk_report import IssueReport, zip_issue_reports
 from testgen.ui.pdf.test_result_report import create_report
 from testgen.ui.queries import test_result_queries
 from testgen.ui.queries.source_data_queries import (
@@ -35,6 +36,7 @@ from testgen.ui.queries.source_data_queries import (
     get_test_issue_source_query_custom,
 )
 from testgen.ui.services.database_service import execute_db_query, fetch_df_from_db, fetch_one_from_db
+from testgen.ui.services.query_cache import cache_tag, invalidate_cache, tagged_cache_data
 from testgen.ui.services.string_service import snake_case_to_title_case
 from testgen.ui.session import session
 from testgen.utils import friendly_score, make_json_safe
@@ -273,7 +275,7 @@ class TestResultsPage(Page):
             disposition = payload.get("status", "No Decision")
             if test_result_ids:
                 update_result_disposition(test_result_ids, disposition)
-                st.cache_data.clear()
+                invalidate_cache(cache_tag("test_run", run_id))
 
         @with_database_session
         def on_disposition_all(payload: dict) -> None:
@@ -296,7 +298,7 @@ class TestResultsPage(Page):
             )
             if all_ids:
                 update_result_disposition(all_ids, disposition)
-                st.cache_data.clear()
+                invalidate_cache(cache_tag("test_run", run_id))
 
         @with_database_session
         def on_flag_changed(payload: dict) -> None:
@@ -308,7 +310,7 @@ class TestResultsPage(Page):
                 test_definition_ids = test_result_queries.get_test_definition_ids_for_results(test_result_ids)
             if test_definition_ids:
                 TestDefinition.set_status_attribute("flagged", test_definition_ids, value)
-                st.cache_data.clear()
+                clear_test_definition_caches(test_suite.id)
 
         @with_database_session
         def on_flag_all(payload: dict) -> None:
@@ -331,7 +333,7 @@ class TestResultsPage(Page):
             )
             if all_def_ids:
                 TestDefinition.set_status_attribute("flagged", all_def_ids, value)
-                st.cache_data.clear()
+                clear_test_definition_caches(test_suite.id)
 
         def on_notes_clicked(payload: dict) -> None:
             st.session_state[NOTES_DIALOG_KEY] = payload
@@ -342,7 +344,7 @@ class TestResultsPage(Page):
             current_user = session.auth.user.username if session.auth.user else "unknown"
             TestDefinitionNote.add_note(td_id, payload["text"], current_user)
             st.session_state[NOTES_DIALOG_KEY] = _load_notes_dialog_data(td_id, df)
-            st.cache_data.clear()
+            clear_test_definition_caches(test_suite.id)
 
         @with_database_session
         def on_note_updated(payload: dict) -> None:
@@ -355,7 +357,7 @@ class TestResultsPage(Page):
             TestDefinitionNote.delete_note(payload["id"])
             td_id = payload["test_definition_id"]
             st.session_state[NOTES_DIALOG_KEY] = _load_notes_dialog_data(td_id, df)
-            st.cache_data.clear()
+            clear_test_definition_caches(test_suite.id)
 
         def on_notes_dialog_closed(*_) -> None:
             st.session_state.pop(NOTES_DIALOG_KEY, None)
@@ -406,7 +408,7 @@ class TestResultsPage(Page):
             TestDefinition(**filtered).save()
             st.session_state.pop(EDIT_TEST_KEY, None)
             st.session_state.pop(VALIDATE_RESULT_KEY, None)
-            st.cache_data.clear()
+            clear_test_definition_caches(test_suite.id)
 
         @with_database_session
         def on_validate_test(test_def: dict) -> None:
@@ -445,7 +447,7 @@ class TestResultsPage(Page):
                 run_id,
                 run.table_groups_id if run.is_latest_run else None,
             )
-            st.cache_data.clear()
+            TestRun.get_minimal.clear()
 
         def on_export_all(*_) -> None:
             st.session_state[EXPORT_FILTERS_KEY] = {"type": "all"}
@@ -543,6 +545,13 @@ class TestResultsPage(Page):
         )
 
 
+def clear_test_definition_caches(test_suite_id: str | UUID) -> None:
+    """Clears the cached data that shows the test definitions of a test suite, including its test results."""
+    invalidate_cache(cache_tag("test_suite", test_suite_id))
+    TestDefinition.get.clear()
+    TestDefinition.select_where.clear()
+
+
 def _build_edit_test_dialog_data(test_definition_id: str | None, test_suite_minimal: TestSuiteMinimal) -> dict | None:
     """Build the data payload for the Edit Test dialog, matching the test_definitions page format."""
     if not test_definition_id:
@@ -771,15 +780,17 @@ def _handle_issue_report(rows: list[dict]) -> None:
             args=(rows[0], mask_pii),
         )
     else:
-        zip_func = zip_multi_file_data(
-            "testgen_test_issue_reports.zip",
-            get_report_file_data,
-            [(row, mask_pii) for row in rows],
+        download_dialog(
+            dialog_title="Download Issue Report",
+            file_content_func=zip_issue_reports,
+            args=(
+                "testgen_test_issue_reports.zip",
+                [IssueReport(get_report_file_name(row), "test", row, mask_pii) for row in rows],
+            ),
         )
-        download_dialog(dialog_title="Download Issue Report", file_content_func=zip_func)
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(test_run="test_run_id")
 def get_test_disposition(test_run_id: str) -> pd.DataFrame:
     query = """
     SELECT id::VARCHAR, disposition
@@ -791,7 +802,7 @@ def get_test_disposition(test_run_id: str) -> pd.DataFrame:
     return df[["id", "action"]]
 
 
-@st.cache_data(show_spinner=False)
+@tagged_cache_data(test_run="test_run_id")
 def get_test_result_summary(test_run_id: str) -> list[dict]:
     query = """
     SELECT SUM(
@@ -891,10 +902,14 @@ def get_excel_report_data(
     )
 
 
-def get_report_file_data(update_progress, tr_data, mask_pii: bool = False) -> FILE_DATA_TYPE:
+def get_report_file_name(tr_data) -> str:
     tr_id = tr_data["test_result_id"][:8]
     tr_time = pd.Timestamp(tr_data["test_date"]).strftime("%Y%m%d_%H%M%S")
-    file_name = f"testgen_test_issue_report_{tr_id}_{tr_time}.pdf"
+    return f"testgen_test_issue_report_{tr_id}_{tr_time}.pdf"
+
+
+def get_report_file_data(update_progress, tr_data, mask_pii: bool = False) -> FILE_DATA_TYPE:
+    file_name = get_report_file_name(tr_data)
 
     with BytesIO() as buffer:
         create_report(buffer, tr_data, mask_pii=mask_pii)
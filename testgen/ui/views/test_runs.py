@@ -117,7 +117,7 @@ class TestRunsPage(Page):
                 show_link = False
             st.session_state[TR_RUN_TESTS_RESULT_KEY] = {"success": success, "message": message, "show_link": show_link}
             if success and not show_link:
-                st.cache_data.clear()
+                get_test_run_summaries.clear()
                 Router().set_query_params({"page": 1})
                 st.session_state.pop(TR_RUN_TESTS_DIALOG_KEY, None)
                 st.session_state.pop(TR_RUN_TESTS_RESULT_KEY, None)
@@ -125,7 +125,7 @@ class TestRunsPage(Page):
         def on_go_to_test_runs(payload: dict) -> None:
             st.session_state.pop(TR_RUN_TESTS_DIALOG_KEY, None)
             st.session_state.pop(TR_RUN_TESTS_RESULT_KEY, None)
-            st.cache_data.clear()
+            get_test_run_summaries.clear()
             Router().queue_navigation(to="test-runs", with_args=payload)
 
         def on_run_tests_dialog_closed(*_) -> None:
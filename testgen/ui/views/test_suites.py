@@ -14,7 +14,13 @@ from testgen.ui.components import widgets as testgen
 from testgen.ui.navigation.menu import MenuItem
 from testgen.ui.navigation.page import Page
 from testgen.ui.navigation.router import Router
-from testgen.ui.services.query_cache import get_project_summary, get_test_suite_summaries
+from testgen.ui.services.query_cache import (
+    cache_tag,
+    get_project_summary,
+    get_test_run_summaries,
+    get_test_suite_summaries,
+    invalidate_cache,
+)
 from testgen.ui.session import session
 from testgen.ui.views.dialogs.generate_tests_dialog import (
     get_generation_set_choices,
@@ -182,14 +188,14 @@ class TestSuitesPage(Page):
                 show_link = False
             st.session_state[RUN_TESTS_RESULT_KEY] = {"success": success, "message": message, "show_link": show_link}
             if success and not show_link:
-                st.cache_data.clear()
+                get_test_suite_summaries.clear()
                 st.session_state.pop(RUN_TESTS_DIALOG_KEY, None)
                 st.session_state.pop(RUN_TESTS_RESULT_KEY, None)
 
         def on_go_to_test_runs(payload: dict) -> None:
             st.session_state.pop(RUN_TESTS_DIALOG_KEY, None)
             st.session_state.pop(RUN_TESTS_RESULT_KEY, None)
-            st.cache_data.clear()
+            get_test_run_summaries.clear()
             Router().queue_navigation(to="test-runs", with_args=payload)
 
         def on_run_tests_dialog_closed(*_) -> None:
@@ -209,7 +215,8 @@ class TestSuitesPage(Page):
             try:
                 run_test_generation(selected_id, selected_set)
                 st.session_state[GENERATE_TESTS_RESULT_KEY] = {"success": True, "message": f"Test generation completed for test suite '{ts_name}'."}
-                st.cache_data.clear()
+                invalidate_cache(cache_tag("test_suite", selected_id))
+                get_test_suite_summaries.clear()
                 st.session_state.pop(GENERATE_TESTS_DIALOG_KEY, None)
                 st.session_state.pop(GENERATE_TESTS_RESULT_KEY, None)
                 st.session_state.pop(GENERATE_TESTS_LOCK_RESULT_KEY, None)
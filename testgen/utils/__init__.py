@@ -10,20 +10,22 @@ from functools import wraps
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from testgen.common.models.scores import ScoreCard
 
 import json
 from typing import Any, TypeVar
 from uuid import UUID
 
-import pandas as pd
-
 T = TypeVar("T")
 
 LOG = logging.getLogger("testgen")
 
 
 def to_int(value: float | int) -> int:
+    import pandas as pd
+
     if pd.notnull(value):
         return int(value)
     return 0
@@ -49,6 +51,8 @@ def to_dataframe(
     columns: list[str] | None = None,
     coerce_float: bool = False,
 ) -> pd.DataFrame:
+    import pandas as pd
+
     records = []
     for item in data:
         if hasattr(item, "to_dict") and callable(item.to_dict):
@@ -145,12 +149,16 @@ def score(profiling_score_: float, tests_score_: float) -> float:
 
 
 def _pandas_default(value: Any, default: T) -> T:
+    import pandas as pd
+
     if pd.isnull(value):
         return default
     return value
 
 
 def format_score_card(score_card: ScoreCard | None) -> ScoreCard:
+    import pandas as pd
+
     definition = None
     if score_card:
         definition = score_card.get("definition")
@@ -235,6 +243,8 @@ def format_score_card_issues(issues: list[dict], category: str) -> dict:
 
 
 def friendly_score(score: float) -> str:
+    import pandas as pd
+
     if not score or pd.isnull(score):
         return None
 
@@ -252,6 +262,8 @@ def friendly_score(score: float) -> str:
 
 
 def friendly_score_impact(impact: float) -> str:
+    import pandas as pd
+
     if not impact or pd.isnull(impact):
         return "-"
 
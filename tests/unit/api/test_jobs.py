@@ -129,12 +129,33 @@ def test_submit_test_generation_success(mock_je_cls):
 def test_get_job_status_success():
     job = _mock_job(status="running", started_at=datetime.now(UTC))
 
-    result = get_job_status(job)
+    result = get_job_status(job, wait=0)
 
     assert result.id == job.id
     assert result.status == "running"
 
 
+@patch(f"{MODULE}.wait_for_job_status")
+def test_get_job_status_waits_for_final_status(wait_mock):
+    job = _mock_job(status="running", started_at=datetime.now(UTC))
+    wait_mock.return_value = _mock_job(id=job.id, status="completed", completed_at=datetime.now(UTC))
+
+    result = get_job_status(job, wait=10)
+
+    wait_mock.assert_called_once_with(job.id, ANY, timeout=10)
+    assert result.status == "completed"
+
+
+@patch(f"{MODULE}.wait_for_job_status")
+def test_get_job_status_does_not_wait_for_finished_job(wait_mock):
+    job = _mock_job(status="completed", completed_at=datetime.now(UTC))
+
+    result = get_job_status(job, wait=10)
+
+    wait_mock.assert_not_called()
+    assert result.status == "completed"
+
+
 # --- cancel_job ---
 
 
@@ -164,6 +185,7 @@ def test_cancel_job_invalid_transition():
 def test_list_jobs_returns_paginated_results(mock_je_cls):
     jobs = [_mock_job(job_key="run-profile"), _mock_job(job_key="run-tests")]
     mock_je_cls.list_for_project.return_value = (jobs, 2)
+    mock_je_cls.get_queue_state.return_value = (0, 0)
 
     result = list_jobs(project_code="DEFAULT", job_key=None, status=None, page=1, limit=20)
 
@@ -176,9 +198,31 @@ def test_list_jobs_returns_paginated_results(mock_je_cls):
     assert len(result.items) == 2
 
 
+@patch(f"{MODULE}.settings")
+@patch(f"{MODULE}.JobExecution")
+def test_list_jobs_returns_queue_state(mock_je_cls, settings_mock):
+    mock_je_cls.list_for_project.return_value = ([], 0)
+    mock_je_cls.get_queue_state.return_value = (7, 3)
+    settings_mock.JOB_MAX_RUNNING = 10
+    settings_mock.JOB_MAX_RUNNING_PER_PROJECT = 0
+    settings_mock.JOB_MAX_RUNNING_PER_CONNECTION = 3
+
+    result = list_jobs(project_code="DEFAULT", job_key=None, status=None, page=1, limit=20)
+
+    mock_je_cls.get_queue_state.assert_called_once_with("DEFAULT")
+    assert result.queue.model_dump() == {
+        "pending": 7,
+        "running": 3,
+        "max_running": 10,
+        "max_running_per_project": None,
+        "max_running_per_connection": 3,
+    }
+
+
 @patch(f"{MODULE}.JobExecution")
 def test_list_jobs_passes_filters(mock_je_cls):
     mock_je_cls.list_for_project.return_value = ([], 0)
+    mock_je_cls.get_queue_state.return_value = (0, 0)
 
     result = list_jobs(project_code="DEFAULT", job_key="run-profile", status="completed", page=2, limit=10)
 
@@ -192,6 +236,7 @@ def test_list_jobs_passes_filters(mock_je_cls):
 @patch(f"{MODULE}.JobExecution")
 def test_list_jobs_empty_project(mock_je_cls):
     mock_je_cls.list_for_project.return_value = ([], 0)
+    mock_je_cls.get_queue_state.return_value = (0, 0)
 
     result = list_jobs(project_code="EMPTY", job_key=None, status=None, page=1, limit=20)
 
@@ -215,6 +260,7 @@ def _client_with_overrides() -> TestClient:
 @patch(f"{MODULE}.JobExecution")
 def test_list_jobs_rejects_unknown_status(mock_je_cls, _mock_perm):
     mock_je_cls.list_for_project.return_value = ([], 0)
+    mock_je_cls.get_queue_state.return_value = (0, 0)
     client = TestClient(_client_with_overrides())
 
     resp = client.get("/api/v1/projects/DEFAULT/jobs?status=BOGUS")
@@ -229,6 +275,7 @@ def test_list_jobs_rejects_unknown_status(mock_je_cls, _mock_perm):
 @patch(f"{MODULE}.JobExecution")
 def test_list_jobs_accepts_valid_status(mock_je_cls, _mock_perm):
     mock_je_cls.list_for_project.return_value = ([], 0)
+    mock_je_cls.get_queue_state.return_value = (0, 0)
     client = TestClient(_client_with_overrides())
 
     resp = client.get("/api/v1/projects/DEFAULT/jobs?status=completed")
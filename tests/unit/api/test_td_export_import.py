@@ -952,11 +952,15 @@ class Test_import_endpoint_strict:
             items=[],
         )
 
-        with patch(f"{ENDPOINT_MODULE}.test_definition_service") as mock_service:
+        with (
+            patch(f"{ENDPOINT_MODULE}.test_definition_service") as mock_service,
+            patch(f"{ENDPOINT_MODULE}.notify_cache_invalidation") as mock_notify,
+        ):
             mock_service.import_definitions.return_value = mock_result
             result = import_test_definitions(body=request, test_suite=ts)
 
         assert result.summary.created == 1
+        mock_notify.assert_called_once_with(f"test_suite:{ts.id}")
 
 
 # --- Schema: TestDefinitionExport ---
@@ -0,0 +1,26 @@
+import pytest
+
+from testgen.commands.queries.contingency_query import ContingencySQL, ContingencyTable
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    "flavor, quote",
+    [
+        ("postgresql", '"'),
+        ("snowflake", '"'),
+        ("mssql", '"'),
+        ("bigquery", "`"),
+        ("databricks", "`"),
+    ],
+)
+def test_get_contingency_counts_quotes_identifiers_for_flavor(flavor, quote):
+    table = ContingencyTable(schema_name="sales", table_name="orders", contingency_columns="status,region")
+
+    query, _ = ContingencySQL(flavor).get_contingency_counts(table)
+
+    columns = f"{quote}status{quote},{quote}region{quote}"
+    assert f"SELECT {columns}, COUNT(*) as freq_ct" in query
+    assert f"FROM {quote}sales{quote}.{quote}orders{quote}" in query
+    assert f"GROUP BY {columns};" in query
@@ -4,8 +4,11 @@ from uuid import uuid4
 import pytest
 
 from testgen.commands.queries.execute_tests_query import (
+    RESULT_COLUMNS,
     TestExecutionDef,
     build_cat_expressions,
+    build_test_result,
+    get_result_status,
     group_cat_tests,
     parse_cat_results,
 )
@@ -359,3 +362,112 @@ def test_parse_result_code_negative_one():
     rows = parse_cat_results(results, test_defs, uuid4(), uuid4(),
                               datetime.now(UTC), _make_input_params_fn())
     assert rows[0][10] == "-1"
+
+
+def test_parse_computes_result_columns():
+    table_groups_id = uuid4()
+    td = _make_td(
+        severity="Fail",
+        test_description="Row count",
+        export_to_observability="Y",
+        measure_uom="Row count",
+        impact_dimension="Completeness",
+        table_groups_id=table_groups_id,
+        auto_gen=True,
+        threshold_value="100",
+        lower_tolerance=None,
+        upper_tolerance=None,
+    )
+    results = [{"query_index": 0, "result_measures": "42|", "result_codes": "0,"}]
+
+    rows = parse_cat_results(results, [[td]], uuid4(), uuid4(),
+                              datetime.now(UTC), _make_input_params_fn())
+    row = dict(zip(RESULT_COLUMNS, rows[0], strict=True))
+    assert row["result_status"] == "Failed"
+    assert row["result_message"] == "Row count: 42, Threshold: 100"
+    assert row["result_signal"] == "42"
+    assert row["threshold_value"] == "100"
+    assert row["severity"] == "Fail"
+    assert row["test_description"] == "Row count"
+    assert row["observability_status"] == "Queued"
+    assert row["table_groups_id"] == table_groups_id
+    assert row["auto_gen"] is True
+    assert row["impact_dimension"] == "Completeness"
+
+
+# --- build_test_result ---
+
+
+@pytest.mark.parametrize(
+    "result_status, result_code, severity, expected",
+    [
+        ("Error", None, "Fail", "Error"),
+        (None, 0, "Log", "Log"),
+        (None, -1, "Fail", "Log"),
+        (None, 1, "Fail", "Passed"),
+        (None, 0, "Warning", "Warning"),
+        (None, 0, "Fail", "Failed"),
+        (None, 0, None, "Warning"),
+        (None, None, "Fail", None),
+    ],
+)
+def test_get_result_status(result_status, result_code, severity, expected):
+    assert get_result_status(result_status, result_code, severity) == expected
+
+
+def test_build_keeps_query_values():
+    td = _make_td(run_type="QUERY", measure_uom="Errors", threshold_value="5", export_to_observability="N")
+    row = dict(zip(RESULT_COLUMNS, build_test_result(td, {
+        "test_definition_id": str(td.id),
+        "skip_errors": 2,
+        "result_code": 1,
+        "result_message": "3 error(s) identified",
+        "result_measure": 3,
+        "result_signal": "3|abc",
+        "threshold_value": "2",
+    }), strict=True))
+
+    assert row["result_status"] == "Passed"
+    assert row["result_message"] == "3 error(s) identified"
+    assert row["result_signal"] == "3|abc"
+    assert row["threshold_value"] == "2"
+    assert row["observability_status"] == "Ignore"
+
+
+def test_build_message_from_measure():
+    td = _make_td(measure_uom="Errors", threshold_value=None, lower_tolerance="1", upper_tolerance=None)
+    row = dict(zip(RESULT_COLUMNS, build_test_result(td, {
+        "skip_errors": 2,
+        "result_code": "0",
+        "result_message": "",
+        "result_measure": 3.5,
+        "result_signal": None,
+    }), strict=True))
+
+    # Matches the text stored for the measure, and no separator before the ignored errors
+    assert row["result_message"] == "Errors: 3.5, Lower Bound: 1Errors Ignored: 2"
+    assert row["result_signal"] == "3.5"
+    assert row["result_status"] == "Warning"
+
+
+def test_build_no_message_without_measure():
+    td = _make_td(measure_uom="Errors")
+    row = dict(zip(RESULT_COLUMNS, build_test_result(td, {
+        "result_code": 1,
+        "result_measure": float("nan"),
+    }), strict=True))
+
+    assert row["result_message"] is None
+    assert row["result_signal"] is None
+
+
+def test_build_error_result():
+    td = _make_td(severity="Fail", measure_uom="Errors")
+    row = dict(zip(RESULT_COLUMNS, build_test_result(td, {
+        "result_status": "Error",
+        "result_message": "Column not found",
+    }), strict=True))
+
+    assert row["result_status"] == "Error"
+    assert row["result_message"] == "Column not found"
+    assert row["severity"] == "Fail"
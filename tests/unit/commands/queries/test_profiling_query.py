@@ -1,8 +1,25 @@
+import dataclasses
+from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
-
-from testgen.commands.queries.profiling_query import ProfilingSQL, calculate_sampling_params
+import yaml
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+import testgen
+from testgen.commands.queries.profiling_query import (
+    MAX_BATCH_SELECT_ITEMS,
+    HygieneIssueType,
+    ProfilingSQL,
+    TableSampling,
+    calculate_sampling_params,
+    group_profiling_queries,
+    split_batch_results,
+    split_profiling_query,
+)
+from testgen.commands.queries.refresh_data_chars_query import ColumnChars
 
 pytestmark = pytest.mark.unit
 
@@ -12,6 +29,7 @@ pytestmark = pytest.mark.unit
 
 def _make_profiling_sql(profile_flag_pii=False, profile_flag_cdes=False):
     connection = MagicMock()
+    connection.sql_flavor = "postgresql"
     table_group = MagicMock()
     table_group.profile_flag_pii = profile_flag_pii
     table_group.profile_flag_cdes = profile_flag_cdes
@@ -163,3 +181,306 @@ def test_sampling_decimal_string_percent():
     result = calculate_sampling_params("orders", 10000, "15.5", min_sample=100)
     assert result is not None
     assert result.sample_count == 1550
+
+
+# --- group_profiling_queries ---
+
+
+BATCH_FLAVORS = ["postgresql", "snowflake", "mssql", "redshift", "redshift_spectrum", "databricks", "bigquery", "sap_hana"]
+
+
+def _make_column(table_name="orders", column_name="amount"):
+    return ColumnChars(schema_name="public", table_name=table_name, column_name=column_name)
+
+
+def _make_query(table_name="orders", column_name="amount"):
+    return (
+        f'WITH target_table AS (\n  SELECT * FROM "public"."{table_name}"\n)\n'
+        f"SELECT\n  '{column_name}' AS column_name,\n  COUNT(\"{column_name}\") AS value_ct\n  FROM target_table\n"
+    )
+
+
+def _make_batch_profiling_sql(flavor, max_query_chars=100000):
+    connection = MagicMock(sql_flavor=flavor, max_query_chars=max_query_chars, connection_id=1)
+    table_group = MagicMock(project_code="DEFAULT", id="tg-1", table_group_schema="public")
+    profiling_run = MagicMock(id="run-1", profiling_starttime=datetime(2026, 1, 1))
+    return ProfilingSQL(connection, table_group, profiling_run)
+
+
+def test_group_profiling_queries_selects_table_columns_together():
+    column_queries = [
+        (_make_column(column_name=name), _make_query(column_name=name))
+        for name in ("id", "amount", "status")
+    ]
+
+    batches = group_profiling_queries(column_queries, max_query_chars=10000)
+
+    assert batches == [(
+        'WITH target_table AS (\n  SELECT * FROM "public"."orders"\n)\n'
+        "SELECT\n"
+        "  'id' AS col0__column_name,\n"
+        '  COUNT("id") AS col0__value_ct,\n'
+        "  'amount' AS col1__column_name,\n"
+        '  COUNT("amount") AS col1__value_ct,\n'
+        "  'status' AS col2__column_name,\n"
+        '  COUNT("status") AS col2__value_ct\n'
+        "  FROM target_table",
+        [column for column, _ in column_queries],
+    )]
+
+
+def test_group_profiling_queries_separates_tables():
+    column_queries = [
+        (_make_column("orders", "id"), _make_query("orders", "id")),
+        (_make_column("customers", "id"), _make_query("customers", "id")),
+        (_make_column("orders", "amount"), _make_query("orders", "amount")),
+    ]
+
+    batches = group_profiling_queries(column_queries, max_query_chars=10000)
+
+    assert [[(c.table_name, c.column_name) for c in columns] for _, columns in batches] == [
+        [("orders", "id"), ("orders", "amount")],
+        [("customers", "id")],
+    ]
+    assert '"customers"' not in batches[0][0]
+
+
+def test_group_profiling_queries_respects_max_chars():
+    column_queries = [
+        (_make_column(column_name=f"col_{i}"), _make_query(column_name=f"col_{i}"))
+        for i in range(5)
+    ]
+
+    batches = group_profiling_queries(column_queries, max_query_chars=250)
+
+    assert len(batches) > 1
+    assert sum(len(columns) for _, columns in batches) == 5
+    for query, columns in batches:
+        assert len(query) <= 250 or len(columns) == 1
+        assert query.startswith("WITH target_table AS")
+        # Aliases restart with each batch
+        assert "col0__column_name" in query
+
+
+def test_group_profiling_queries_oversized_query_gets_own_batch():
+    column_queries = [(_make_column(column_name=name), _make_query(column_name=name)) for name in ("a", "b")]
+
+    batches = group_profiling_queries(column_queries, max_query_chars=10)
+
+    assert [[c.column_name for c in columns] for _, columns in batches] == [["a"], ["b"]]
+
+
+def test_group_profiling_queries_qualifies_joined_subqueries():
+    def make_query(column_name):
+        return (
+            'WITH target_table AS (\n  SELECT * FROM "public"."orders"\n)\n'
+            f"SELECT\n  MIN(pct_50) AS percentile_50,\n  'pct_50' AS label\n  FROM target_table\n"
+            f'  , (SELECT PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY "{column_name}") AS pct_50\n'
+            f'        FROM "public"."orders" LIMIT 1) pctile\n'
+        )
+
+    column_queries = [(_make_column(column_name=name), make_query(name)) for name in ("a", "b")]
+
+    [(query, _)] = group_profiling_queries(column_queries, max_query_chars=10000)
+
+    assert "MIN(pctile_0.pct_50) AS col0__percentile_50" in query
+    assert "MIN(pctile_1.pct_50) AS col1__percentile_50" in query
+    assert "'pct_50' AS col0__label" in query
+    assert query.endswith('"public"."orders" LIMIT 1) pctile_1')
+    assert query.count("LIMIT 1) pctile_0") == 1
+
+
+def test_group_profiling_queries_without_cte():
+    query = "SELECT main.column_name FROM (SELECT 'x' AS column_name FROM DUAL) main\n"
+    column_queries = [(_make_column(column_name="a"), query), (_make_column(column_name="b"), query)]
+
+    batches = group_profiling_queries(column_queries, max_query_chars=10000)
+
+    assert batches == [(query, [column_queries[0][0]]), (query, [column_queries[1][0]])]
+
+
+def test_group_profiling_queries_single():
+    column_queries = [(_make_column(column_name=name), _make_query(column_name=name)) for name in ("a", "b")]
+
+    batches = group_profiling_queries(column_queries, max_query_chars=10000, single=True)
+
+    assert batches == [(column_queries[0][1], [column_queries[0][0]]), (column_queries[1][1], [column_queries[1][0]])]
+
+
+@pytest.mark.parametrize("flavor", BATCH_FLAVORS)
+@pytest.mark.parametrize("general_type", ["A", "N", "D", "B", "X"])
+@pytest.mark.parametrize("sampled", [False, True])
+def test_split_profiling_query_selects_result_columns(flavor, general_type, sampled):
+    sql = _make_batch_profiling_sql(flavor)
+    column = ColumnChars(schema_name="public", table_name="orders", column_name="c", general_type=general_type)
+    table_sampling = TableSampling(table_name="orders", sample_count=10, sample_ratio=2, sample_percent=50)
+
+    query, _ = sql.run_column_profiling(column, table_sampling if sampled else None)
+    column_query = split_profiling_query(query)
+
+    assert [alias for _, alias in column_query.select_items] == list(ProfilingSQL.result_columns)
+
+
+def test_split_profiling_query_without_target_table():
+    sql = _make_batch_profiling_sql("oracle")
+    column = ColumnChars(schema_name="public", table_name="orders", column_name="c", general_type="N")
+
+    query, _ = sql.run_column_profiling(column)
+
+    assert split_profiling_query(query) is None
+
+
+@pytest.mark.parametrize("flavor", BATCH_FLAVORS)
+def test_aggregate_column_profiling_renders_flavor_templates(flavor):
+    sql = _make_batch_profiling_sql(flavor)
+    data_chars = [
+        ColumnChars(schema_name="public", table_name="orders", column_name="id", general_type="N"),
+        ColumnChars(schema_name="public", table_name="orders", column_name="amount", general_type="N"),
+        ColumnChars(schema_name="public", table_name="orders", column_name="status", general_type="A"),
+        ColumnChars(schema_name="public", table_name="orders", column_name="created", general_type="D"),
+    ]
+
+    queries, columns = sql.aggregate_column_profiling(data_chars, {})
+
+    assert len(queries) == 1
+    assert columns == [data_chars]
+    query = queries[0][0]
+    assert query.count("WITH target_table AS") == 1
+    assert "UNION ALL" not in query
+    assert query.count("\n  FROM target_table\n  , ") == 1
+    for index in range(len(data_chars)):
+        assert f"AS col{index}__record_ct" in query
+    assert "MIN(pctile_0.pct_25)" in query
+    assert "MIN(pctile_1.pct_25)" in query
+    assert "pctile_2" not in query
+
+
+def test_aggregate_column_profiling_caps_select_items():
+    sql = _make_batch_profiling_sql("postgresql", max_query_chars=10**7)
+    data_chars = [
+        ColumnChars(schema_name="public", table_name="orders", column_name=f"c{index}", general_type="B")
+        for index in range(60)
+    ]
+
+    _, columns = sql.aggregate_column_profiling(data_chars, {})
+
+    columns_per_batch = MAX_BATCH_SELECT_ITEMS // len(ProfilingSQL.result_columns)
+    assert [len(batch) for batch in columns] == [columns_per_batch, columns_per_batch, 60 - 2 * columns_per_batch]
+
+
+def test_split_batch_results():
+    batch_results = [
+        {"col0__column_name": "id", "col0__value_ct": 10, "col1__column_name": "status", "col1__value_ct": 8},
+        {"column_name": "created", "value_ct": 5},
+    ]
+
+    assert split_batch_results(batch_results) == [
+        {"column_name": "id", "value_ct": 10},
+        {"column_name": "status", "value_ct": 8},
+        {"column_name": "created", "value_ct": 5},
+    ]
+
+
+def test_get_batch_profiling_results_orders_result_columns():
+    sql = _make_batch_profiling_sql("postgresql")
+
+    [result] = sql.get_batch_profiling_results([{"col0__value_ct": 10, "col0__column_name": "id"}])
+
+    assert len(result) == len(ProfilingSQL.result_columns)
+    assert result[ProfilingSQL.result_columns.index("column_name")] == "id"
+    assert result[ProfilingSQL.result_columns.index("value_ct")] == 10
+    assert result[ProfilingSQL.result_columns.index("record_ct")] is None
+
+
+# --- ProfilingSQL hygiene issue detection ---
+
+
+def _load_hygiene_issue_types() -> list[HygieneIssueType]:
+    issue_types = []
+    for path in sorted((Path(testgen.__file__).parent / "template" / "dbsetup_anomaly_types").glob("*.yaml")):
+        item = yaml.safe_load(path.read_text(encoding="utf-8"))["profile_anomaly_types"]
+        issue_types.append(HygieneIssueType(**{field.name: item[field.name] for field in dataclasses.fields(HygieneIssueType)}))
+    return issue_types
+
+
+def _bind_names(query: str) -> set[str]:
+    return set(text(query).compile(dialect=postgresql.dialect()).params)
+
+
+def test_detect_column_hygiene_issues_screens_all_column_types_at_once():
+    sql = ProfilingSQL(MagicMock(sql_flavor="postgresql"), MagicMock(), MagicMock())
+    issue_types = _load_hygiene_issue_types()
+    column_types = [issue_type for issue_type in issue_types if issue_type.data_object == "Column"]
+
+    query, params = sql.detect_column_hygiene_issues(issue_types)
+
+    assert query.count("INSERT INTO profile_anomaly_results") == 1
+    assert query.count("UNION ALL") == len(column_types) - 1
+    for index, issue_type in enumerate(column_types):
+        assert f"WHERE ({issue_type.anomaly_criteria})" in query
+        assert params[f"ANOMALY_ID_{index}"] == issue_type.id
+    assert {f"ANOMALY_ID_{index}" for index in range(len(column_types))} | {"PROFILE_RUN_ID"} == _bind_names(query)
+
+
+def test_detect_column_hygiene_issues_without_column_types():
+    sql = ProfilingSQL(MagicMock(sql_flavor="postgresql"), MagicMock(), MagicMock())
+    issue_types = [issue_type for issue_type in _load_hygiene_issue_types() if issue_type.data_object != "Column"]
+
+    assert sql.detect_column_hygiene_issues(issue_types) is None
+    assert all(sql.detect_hygiene_issue(issue_type) for issue_type in issue_types)
+
+
+def test_update_hygiene_issues_prevalence_scores_all_types_at_once():
+    sql = ProfilingSQL(MagicMock(sql_flavor="postgresql"), MagicMock(), MagicMock())
+    issue_types = _load_hygiene_issue_types()
+    scored_types = [issue_type for issue_type in issue_types if issue_type.dq_score_prevalence_formula]
+
+    query, params = sql.update_hygiene_issues_prevalence(issue_types)
+
+    assert query.count("UPDATE profile_anomaly_results") == 1
+    for index, issue_type in enumerate(scored_types):
+        assert f"WHEN :ANOMALY_ID_{index} THEN ({issue_type.dq_score_prevalence_formula}) * :RISK_{index}" in query
+        assert params[f"RISK_{index}"] == issue_type.dq_score_risk_factor
+    assert _bind_names(query) == {
+        *(f"ANOMALY_ID_{index}" for index in range(len(scored_types))),
+        *(f"RISK_{index}" for index in range(len(scored_types))),
+        "PROFILE_RUN_ID",
+    }
+    assert sql.update_hygiene_issues_prevalence([]) is None
+
+
+# --- ProfilingSQL.get_frequency_analysis_queries ---
+
+
+def _profiling_result(column_name, **overrides):
+    return {
+        "schema_name": "public",
+        "table_name": "orders",
+        "column_name": column_name,
+        "general_type": "A",
+        "distinct_value_ct": 5,
+        "max_length": 10,
+        **overrides,
+    }
+
+
+def test_frequency_analysis_queries_for_qualifying_columns():
+    sql = ProfilingSQL(MagicMock(sql_flavor="postgresql"), MagicMock(table_group_schema="public"), MagicMock())
+    results = [
+        _profiling_result("status"),
+        _profiling_result("edge_low", distinct_value_ct=2),
+        _profiling_result("edge_high", distinct_value_ct=70, max_length=70),
+        _profiling_result("amount", general_type="N"),
+        _profiling_result("single", distinct_value_ct=1),
+        _profiling_result("many", distinct_value_ct=71),
+        _profiling_result("long", max_length=71),
+        _profiling_result("no_length", max_length=None),
+        _profiling_result("freqd", top_freq_values="| a | 1"),
+    ]
+
+    queries = sql.get_frequency_analysis_queries(results)
+
+    assert len(queries) == 3
+    for query, column_name in zip(queries, ("status", "edge_low", "edge_high"), strict=True):
+        assert f'"{column_name}"' in query[0]
+        assert '"public"."orders"' in query[0]
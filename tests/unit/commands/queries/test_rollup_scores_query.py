@@ -0,0 +1,50 @@
+import re
+
+import pytest
+
+from testgen.commands.queries.rollup_scores_query import RollupScoresSQL
+from testgen.common.read_file import read_template_sql_file
+
+pytestmark = pytest.mark.unit
+
+RUN_ID = "6f1b4e0c-56a3-4d0e-9d3a-0f6f7c1a5f11"
+TABLE_GROUP_ID = "0d5d5c39-2e4e-4b8e-8f69-3c8e1c7a9a20"
+
+FACT_TABLES = {
+    "score_profiling_column_facts",
+    "score_profiling_dimension_facts",
+    "score_test_column_facts",
+    "score_test_dimension_facts",
+}
+
+
+def _fact_tables(query: str, statement: str) -> set[str]:
+    return set(re.findall(rf"{statement}\s+(score_\w+_facts)", query))
+
+
+def test_profiling_rollup_refreshes_run_facts():
+    queries = RollupScoresSQL(RUN_ID, TABLE_GROUP_ID).rollup_profiling_scores()
+    query, params = queries[0]
+
+    expected = {"score_profiling_column_facts", "score_profiling_dimension_facts"}
+    assert _fact_tables(query, "DELETE FROM") == expected
+    assert _fact_tables(query, "INSERT INTO") == expected
+    assert params["RUN_ID"] == RUN_ID
+
+
+def test_test_rollup_refreshes_run_facts():
+    queries = RollupScoresSQL(RUN_ID, TABLE_GROUP_ID).rollup_test_scores(update_prevalence=True)
+    query, params = queries[1]
+
+    expected = {"score_test_column_facts", "score_test_dimension_facts"}
+    assert _fact_tables(query, "DELETE FROM") == expected
+    assert _fact_tables(query, "INSERT INTO") == expected
+    assert params["RUN_ID"] == RUN_ID
+
+
+def test_scoring_views_read_from_facts():
+    views = read_template_sql_file("060_create_standard_views.sql", "dbsetup")
+    schema = read_template_sql_file("030_initialize_new_schema_structure.sql", "dbsetup")
+
+    assert _fact_tables(views, "FROM") == FACT_TABLES
+    assert _fact_tables(schema, "CREATE TABLE") == FACT_TABLES
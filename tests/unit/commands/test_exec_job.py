@@ -144,6 +144,14 @@ def test_job_dispatch_has_all_job_keys():
     assert "recalculate-project-scores" in JOB_DISPATCH
 
 
+def test_job_dispatch_imports_handlers_on_call():
+    with patch("testgen.commands.run_score_update.run_score_update", return_value="ok") as handler_mock:
+        assert JOB_DISPATCH["run-score-update"](parent_job_id="job-1") == "ok"
+
+    handler_mock.assert_called_once_with(parent_job_id="job-1")
+    assert JOB_DISPATCH["run-score-update"].__name__ == "run_score_update"
+
+
 def test_exec_job_fires_final_callbacks_on_success(mock_session):
     job = _make_job_exec(job_key="run-tests")
     job.mark_running.return_value = True
@@ -4,7 +4,7 @@ from uuid import uuid4
 import pytest
 
 from testgen.commands.job_runner import submit_and_wait
-from testgen.common.models.job_execution import JobExecution, JobStatus
+from testgen.common.models.job_execution import FINAL_STATUSES, JobExecution, JobStatus
 
 pytestmark = pytest.mark.unit
 
@@ -38,7 +38,7 @@ def test_submit_and_wait_creates_job(mock_session):
 
     with (
         patch.object(JobExecution, "submit", return_value=job) as submit_mock,
-        patch.object(JobExecution, "get", return_value=job),
+        patch(f"{JOB_RUNNER_MODULE}.wait_for_job_status", return_value=job) as wait_mock,
     ):
         submit_and_wait("run-tests", {"test_suite_id": "suite-123"}, "DEFAULT", no_wait=False)
 
@@ -48,6 +48,7 @@ def test_submit_and_wait_creates_job(mock_session):
         source="cli",
         project_code="DEFAULT",
     )
+    wait_mock.assert_called_once_with(job.id, FINAL_STATUSES)
 
 
 def test_submit_and_wait_no_wait_returns_immediately(mock_session):
@@ -70,8 +71,19 @@ def test_submit_and_wait_exits_on_error(mock_session):
 
     with (
         patch.object(JobExecution, "submit", return_value=job),
-        patch.object(JobExecution, "get", return_value=job),
-        patch(f"{JOB_RUNNER_MODULE}.time.sleep"),
+        patch(f"{JOB_RUNNER_MODULE}.wait_for_job_status", return_value=job),
+        pytest.raises(SystemExit, match="1"),
+    ):
+        submit_and_wait("run-tests", {"test_suite_id": "suite-123"}, "DEFAULT", no_wait=False)
+
+
+def test_submit_and_wait_exits_when_job_not_found(mock_session):
+    job = _make_job_exec()
+    mock_session.flush = Mock()
+
+    with (
+        patch.object(JobExecution, "submit", return_value=job),
+        patch(f"{JOB_RUNNER_MODULE}.wait_for_job_status", return_value=None),
         pytest.raises(SystemExit, match="1"),
     ):
         submit_and_wait("run-tests", {"test_suite_id": "suite-123"}, "DEFAULT", no_wait=False)
@@ -1,9 +1,18 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
 import pytest
+import requests
 
 from testgen.commands.run_observability_exporter import (
+    PAYLOAD_MAX_ITEMS,
+    RETRY_ATTEMPTS,
     _get_input_parameters,
     _get_processed_profiling_table_set,
-    calculate_chunk_size,
+    chunk_test_outcomes,
+    post_event,
 )
 
 pytestmark = pytest.mark.unit
@@ -24,21 +33,116 @@ def test_outcome():
     }
 
 
+@pytest.fixture()
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.requests = []
+    server.fail_keys = {}
+    server.lock = threading.Lock()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with patch("testgen.commands.run_observability_exporter.RETRY_BACKOFF", 0):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        key = self.headers["Idempotency-Key"]
+        with self.server.lock:
+            self.server.requests.append((key, body))
+            failures = self.server.fail_keys.get(key, 0)
+            if failures:
+                self.server.fail_keys[key] = failures - 1
+        self.send_response(500 if failures else 200)
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
 @pytest.mark.parametrize(
     "test_outcomes_length",
     [1, 100, 10000],
 )
-def test_calculate_chunk_size(test_outcome, test_outcomes_length):
-    # test configuration
-    test_outcomes = []
-    for _i in range(test_outcomes_length):
-        test_outcomes.append(test_outcome)
+def test_chunk_test_outcomes(test_outcome, test_outcomes_length):
+    test_outcomes = [test_outcome] * test_outcomes_length
+    result_ids = [str(index) for index in range(test_outcomes_length)]
+
+    chunks = list(chunk_test_outcomes({"dataset_key": "key"}, test_outcomes, result_ids, max_size=20000))
+
+    for chunk in chunks:
+        body = json.loads(chunk.body)
+        assert len(chunk.body) <= 20000
+        assert 0 < len(body["test_outcomes"]) <= PAYLOAD_MAX_ITEMS
+        assert body["test_outcomes"][0] == test_outcome
+        assert body["dataset_key"] == "key"
+    assert [result_id for chunk in chunks for result_id in chunk.result_ids] == result_ids
+    assert len({chunk.idempotency_key for chunk in chunks}) == len(chunks)
+
+
+def test_chunk_test_outcomes_max_items(test_outcome):
+    chunks = list(chunk_test_outcomes({}, [test_outcome] * 1200, max_size=10**9))
+
+    assert [len(json.loads(chunk.body)["test_outcomes"]) for chunk in chunks] == [500, 500, 200]
+
+
+def test_chunk_test_outcomes_oversized_outcome(test_outcome):
+    chunks = list(chunk_test_outcomes({}, [test_outcome] * 3, max_size=100))
+
+    assert len(chunks) == 3
+
+
+def test_post_event_retries_failed_chunks(stub_server, test_outcome):
+    test_outcomes = [{**test_outcome, "name": str(index)} for index in range(1000)]
+    result_ids = [str(index) for index in range(1000)]
+    chunks = list(chunk_test_outcomes({}, test_outcomes, result_ids))
+    stub_server.fail_keys = {chunks[1].idempotency_key: 2}
+    sent = []
+
+    qty = post_event(
+        "test-outcomes",
+        {},
+        f"http://127.0.0.1:{stub_server.server_port}/api",
+        "key",
+        test_outcomes,
+        result_ids=result_ids,
+        on_chunk_sent=sent.append,
+    )
+
+    assert qty == 1000
+    assert len(chunks) > 2
+    assert len(stub_server.requests) == len(chunks) + 2
+    assert [key for key, _ in stub_server.requests].count(chunks[1].idempotency_key) == 3
+    assert sorted(result_id for chunk in sent for result_id in chunk.result_ids) == sorted(result_ids)
+
+
+def test_post_event_stops_after_failed_chunk(stub_server, test_outcome):
+    test_outcomes = [{**test_outcome, "name": str(index)} for index in range(1000)]
+    result_ids = [str(index) for index in range(1000)]
+    chunks = list(chunk_test_outcomes({}, test_outcomes, result_ids))
+    stub_server.fail_keys = {chunks[0].idempotency_key: RETRY_ATTEMPTS}
+    sent = []
 
-    # test run
-    chunk_size = calculate_chunk_size(test_outcomes)
+    with (
+        patch("testgen.commands.run_observability_exporter.settings.OBSERVABILITY_EXPORT_MAX_IN_FLIGHT", 1),
+        pytest.raises(requests.HTTPError, match="status code: 500"),
+    ):
+        post_event(
+            "test-outcomes",
+            {},
+            f"http://127.0.0.1:{stub_server.server_port}/api",
+            "key",
+            test_outcomes,
+            result_ids=result_ids,
+            on_chunk_sent=sent.append,
+        )
 
-    # test assertions
-    assert 100 < chunk_size < 500
+    assert sent == []
+    assert {key for key, _ in stub_server.requests} == {chunks[0].idempotency_key}
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+import pytest
+
+from testgen.commands.run_pairwise_contingency_check import ContingencyCounts, run_pairwise_contingency_check
+
+pytestmark = pytest.mark.unit
+
+# Grouped counts of (status, region, tier): status "closed" always goes with region "east"
+GROUPED_COUNTS = [
+    {"status": "closed", "region": "east", "tier": "gold", "freq_ct": 300},
+    {"status": "closed", "region": "east", "tier": "silver", "freq_ct": 200},
+    {"status": "open", "region": "east", "tier": "gold", "freq_ct": 100},
+    {"status": "open", "region": "west", "tier": "silver", "freq_ct": 350},
+    {"status": "open", "region": None, "tier": "gold", "freq_ct": 20},
+    {"status": None, "region": "west", "tier": "bronze", "freq_ct": 10},
+]
+
+
+def _get_rules(chunks: list[list[dict]], threshold_ratio: float = 0.95) -> list[tuple]:
+    counts = ContingencyCounts(["status", "region", "tier"])
+    for chunk in chunks:
+        counts.add(chunk)
+    rules = counts.get_rules(threshold_ratio)
+    return sorted(rules.itertuples(index=False, name=None))
+
+
+def test_get_rules():
+    assert _get_rules([GROUPED_COUNTS]) == [
+        ("region", "west", "status", "open", 350, 360, 470, 0.9722),
+        ("region", "west", "tier", "silver", 350, 360, 550, 0.9722),
+        ("status", "closed", "region", "east", 500, 500, 600, 1.0),
+        ("tier", "gold", "region", "east", 400, 420, 600, 0.9524),
+    ]
+
+
+def test_get_rules_is_independent_of_chunks():
+    chunks = [GROUPED_COUNTS[index:index + 2] for index in range(0, len(GROUPED_COUNTS), 2)]
+
+    assert _get_rules(chunks) == _get_rules([GROUPED_COUNTS])
+
+
+def test_get_rules_skips_infrequent_values():
+    rules = _get_rules([GROUPED_COUNTS], threshold_ratio=0.5)
+
+    # "bronze" always goes with "west" but only occurs in 10 of 980 rows, below the minimum of 49 (5%)
+    assert len(rules) == 12
+    assert not [rule for rule in rules if "bronze" in (rule[1], rule[3])]
+
+
+@patch("testgen.commands.run_pairwise_contingency_check.write_to_app_db")
+@patch("testgen.commands.run_pairwise_contingency_check.stream_dict_from_db")
+@patch("testgen.commands.run_pairwise_contingency_check.fetch_dict_from_db")
+def test_run_pairwise_contingency_check(fetch_dict, stream_dict, write_to_app_db):
+    fetch_dict.return_value = [
+        {"schema_name": "sales", "table_name": "orders", "contingency_columns": "status,region,tier"},
+        {"schema_name": "sales", "table_name": "broken", "contingency_columns": "a,b"},
+        {"schema_name": "sales", "table_name": "single", "contingency_columns": "a"},
+    ]
+    stream_dict.side_effect = [iter([GROUPED_COUNTS]), RuntimeError("Table not found")]
+
+    assert run_pairwise_contingency_check("run-1", 95, "postgresql") == 4
+
+    assert stream_dict.call_count == 2
+    write_to_app_db.assert_called_once()
+    rows, column_names, table_name = write_to_app_db.call_args.args
+    assert table_name == "profile_pair_rules"
+    assert dict(zip(column_names, rows[0], strict=True))["profile_run_id"] == "run-1"
+    assert {(row[3], row[4]) for row in rows} == {("status", "closed"), ("region", "west"), ("tier", "gold")}
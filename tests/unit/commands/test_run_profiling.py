@@ -0,0 +1,175 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from testgen.commands.queries.profiling_query import split_batch_results
+from testgen.commands.queries.refresh_data_chars_query import ColumnChars
+from testgen.commands.run_profiling import _run_column_profiling
+
+pytestmark = pytest.mark.unit
+
+MODULE = "testgen.commands.run_profiling"
+DB_MODULE = "testgen.common.database.database_service"
+
+
+def _make_connection(fail_queries=()):
+    def execute(query, _params):
+        if str(query) in fail_queries:
+            raise ValueError(f"Failed: {query}")
+        result = MagicMock()
+        result.mappings().fetchall.return_value = [{"query": str(query)}]
+        result.keys.return_value = ["query"]
+        return result
+
+    connection = MagicMock()
+    connection.__enter__.return_value = connection
+    connection.execute.side_effect = execute
+    return connection
+
+
+def _make_sql_generator():
+    sql_generator = MagicMock()
+    sql_generator.table_group.profile_use_sampling = False
+    sql_generator.connection.max_threads = 2
+    sql_generator.profiling_results_table = "profile_results"
+    sql_generator.frequency_staging_table = "stg_frequency"
+    sql_generator.run_column_profiling.side_effect = lambda column, _sampling: (f"SELECT {column.column_name}", None)
+    sql_generator.get_frequency_analysis_queries.side_effect = lambda rows: [(f"{rows[0]['query']} FREQ", None)]
+    return sql_generator
+
+
+@pytest.fixture
+def profiling_db():
+    """Runs the query pipeline on fake target connections, returning the rows written by table."""
+    written: dict[str, list[dict]] = {}
+    connection = _make_connection()
+
+    def copy(_connection, data, _columns, table_name):
+        written.setdefault(table_name, []).extend(data)
+
+    with (
+        patch(f"{DB_MODULE}._init_db_connection", side_effect=lambda *_, **__: connection),
+        patch(f"{DB_MODULE}._copy_to_app_db", side_effect=copy),
+        patch(f"{MODULE}.get_current_session"),
+        patch(f"{MODULE}.execute_db_queries") as execute_mock,
+        patch(f"{MODULE}.write_to_app_db") as write_mock,
+    ):
+        yield connection, written, execute_mock, write_mock
+
+
+def _columns(*names):
+    return [ColumnChars(schema_name="sales", table_name="orders", column_name=name) for name in names]
+
+
+@patch(f"{MODULE}.settings.PROFILING_BATCH_COLUMNS", False)
+def test_frequency_follow_up_error_keeps_profiling_results(profiling_db):
+    _, written, execute_mock, _ = profiling_db
+    sql_generator = _make_sql_generator()
+    sql_generator.get_frequency_analysis_queries.side_effect = ValueError("Bad frequency query")
+
+    _run_column_profiling(sql_generator, _columns("id", "status"))
+
+    assert sorted(row["query"] for row in written["profile_results"]) == ["SELECT id", "SELECT status"]
+    assert "stg_frequency" not in written
+    sql_generator.profiling_run.set_progress.assert_any_call("col_profiling", "Completed", error=None)
+    sql_generator.profiling_run.set_progress.assert_called_with(
+        "freq_analysis", "Warning", error="Error encountered. Bad frequency query",
+    )
+    execute_mock.assert_not_called()
+
+
+@patch(f"{MODULE}.settings.PROFILING_BATCH_COLUMNS", False)
+def test_frequency_write_error_keeps_profiling_results(profiling_db):
+    _, written, execute_mock, _ = profiling_db
+    sql_generator = _make_sql_generator()
+
+    with patch(f"{DB_MODULE}._copy_to_app_db") as copy_mock:
+        def copy(_connection, data, _columns, table_name):
+            if table_name == "stg_frequency":
+                raise RuntimeError("COPY failed")
+            written.setdefault(table_name, []).extend(data)
+
+        copy_mock.side_effect = copy
+        _run_column_profiling(sql_generator, _columns("id", "status"))
+
+    assert len(written["profile_results"]) == 2
+    sql_generator.profiling_run.set_progress.assert_called_with(
+        "freq_analysis", "Warning", error="Error encountered. Error writing results. COPY failed",
+    )
+    execute_mock.assert_not_called()
+
+
+def _make_batching_sql_generator():
+    sql_generator = _make_sql_generator()
+
+    def aggregate_column_profiling(data_chars, _sampling_params, single=False):
+        if single:
+            return [(f"SELECT {column.column_name}", None) for column in data_chars], [[column] for column in data_chars]
+        return [("SELECT batch", None)], [list(data_chars)]
+
+    sql_generator.aggregate_column_profiling.side_effect = aggregate_column_profiling
+    sql_generator.get_batch_profiling_results.side_effect = split_batch_results
+    sql_generator.get_batch_frequency_analysis_queries.side_effect = lambda rows: [
+        (f"{row['query']} FREQ", None) for row in split_batch_results(rows)
+    ]
+    return sql_generator
+
+
+def _make_batch_connection(fail_batch=False):
+    def execute(query, _params):
+        if str(query) == "SELECT batch":
+            if fail_batch:
+                raise ValueError("Failed: batch")
+            row = {"col0__query": "SELECT id", "col1__query": "SELECT status"}
+        else:
+            row = {"query": str(query)}
+        result = MagicMock()
+        result.mappings().fetchall.return_value = [row]
+        result.keys.return_value = list(row)
+        return result
+
+    return execute
+
+
+@patch(f"{MODULE}.settings.PROFILING_BATCH_COLUMNS", True)
+def test_batch_results_are_split_per_column(profiling_db):
+    connection, written, _, write_mock = profiling_db
+    connection.execute.side_effect = _make_batch_connection()
+    sql_generator = _make_batching_sql_generator()
+
+    _run_column_profiling(sql_generator, _columns("id", "status"))
+
+    sql_generator.aggregate_column_profiling.assert_called_once()
+    assert sorted(row["query"] for row in written["profile_results"]) == ["SELECT id", "SELECT status"]
+    assert sorted(row["query"] for row in written["stg_frequency"]) == ["SELECT id FREQ", "SELECT status FREQ"]
+    write_mock.assert_not_called()
+    sql_generator.profiling_run.set_progress.assert_any_call("col_profiling", "Completed", error=None)
+
+
+@patch(f"{MODULE}.settings.PROFILING_BATCH_COLUMNS", True)
+def test_failed_batch_is_rerun_per_column(profiling_db):
+    connection, written, _, write_mock = profiling_db
+    connection.execute.side_effect = _make_batch_connection(fail_batch=True)
+    sql_generator = _make_batching_sql_generator()
+
+    _run_column_profiling(sql_generator, _columns("id", "status"))
+
+    assert [call.kwargs.get("single", False) for call in sql_generator.aggregate_column_profiling.call_args_list] == [
+        False,
+        True,
+    ]
+    assert sorted(row["query"] for row in written["profile_results"]) == ["SELECT id", "SELECT status"]
+    assert sorted(row["query"] for row in written["stg_frequency"]) == ["SELECT id FREQ", "SELECT status FREQ"]
+    write_mock.assert_not_called()
+    sql_generator.profiling_run.set_progress.assert_any_call("col_profiling", "Completed", error=None)
+
+
+@patch(f"{MODULE}.settings.PROFILING_BATCH_COLUMNS", False)
+def test_batching_disabled_runs_one_query_per_column(profiling_db):
+    _, written, _, _ = profiling_db
+    sql_generator = _make_batching_sql_generator()
+
+    _run_column_profiling(sql_generator, _columns("id", "status"))
+
+    sql_generator.aggregate_column_profiling.assert_not_called()
+    assert sorted(row["query"] for row in written["profile_results"]) == ["SELECT id", "SELECT status"]
@@ -0,0 +1,117 @@
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from testgen.commands.run_refresh_data_chars import _get_row_count_source, run_data_chars_refresh
+from testgen.common.models.connection import Connection
+from testgen.common.models.table_group import TableGroup
+
+pytestmark = pytest.mark.unit
+
+
+def _table_group(strategy: str, change_pct: int | None = 10) -> TableGroup:
+    return TableGroup(
+        table_group_schema="public",
+        row_count_strategy=strategy,
+        row_count_change_pct=change_pct,
+    )
+
+
+@pytest.mark.parametrize(
+    "strategy, approx, previous, basis, expected",
+    [
+        ("exact", 1000, 990, 1000, "count"),
+        (None, 1000, 990, 1000, "count"),
+        ("estimate", 1000, None, None, "estimate"),
+        ("estimate", None, None, None, "count"),
+        ("estimate_change", None, 990, 1000, "count"),
+        ("estimate_change", 1000, None, None, "count"),
+        ("estimate_change", 1000, 990, None, "count"),
+        ("estimate_change", 1050, 990, 1000, "previous"),
+        ("estimate_change", 1100, 990, 1000, "previous"),
+        ("estimate_change", 1101, 990, 1000, "count"),
+        ("estimate_change", 899, 990, 1000, "count"),
+        ("estimate_change", 0, 0, 0, "previous"),
+        ("estimate_change", 5, 0, 0, "count"),
+    ],
+)
+def test_row_count_source(strategy, approx, previous, basis, expected):
+    assert _get_row_count_source(_table_group(strategy), approx, previous, basis) == expected
+
+
+def test_row_count_source_change_pct():
+    assert _get_row_count_source(_table_group("estimate_change", 50), 1400, 990, 1000) == "previous"
+    assert _get_row_count_source(_table_group("estimate_change", 0), 1001, 990, 1000) == "count"
+
+
+def _refresh(table_group: TableGroup, ddf: list[dict], previous: list[dict], counts: list[dict]):
+    def fetch_dict(query, _params, use_target_db=False):
+        return ddf if use_target_db else previous
+
+    with (
+        patch("testgen.commands.run_refresh_data_chars.fetch_dict_from_db", side_effect=fetch_dict),
+        patch(
+            "testgen.commands.run_refresh_data_chars.fetch_from_db_threaded",
+            return_value=(counts, ["table_name", "row_count"], {}),
+        ) as fetch_threaded,
+        patch("testgen.commands.run_refresh_data_chars.write_data_chars") as write_mock,
+    ):
+        data_chars = run_data_chars_refresh(
+            Connection(sql_flavor="postgresql", max_threads=2, max_query_chars=10000), table_group, datetime(2026, 1, 1),
+        )
+    return data_chars, fetch_threaded, write_mock
+
+
+DDF = [
+    {"schema_name": "public", "table_name": "facts", "column_name": "id", "approx_record_ct": 1_000_000},
+    {"schema_name": "public", "table_name": "facts", "column_name": "amount", "approx_record_ct": 1_000_000},
+    {"schema_name": "public", "table_name": "dims", "column_name": "id", "approx_record_ct": 200},
+    {"schema_name": "public", "table_name": "views", "column_name": "id", "approx_record_ct": None},
+]
+
+
+def test_refresh_exact_counts_all_tables():
+    counts = [{"table_name": "facts", "row_count": 1_000_123}, {"table_name": "dims", "row_count": 205}, {"table_name": "views", "row_count": 7}]
+    data_chars, fetch_threaded, write_mock = _refresh(_table_group("exact"), DDF, [], counts)
+
+    query = " ".join(query for query, _ in fetch_threaded.call_args.args[0])
+    assert all(f'"{table}"' in query for table in ("facts", "dims", "views"))
+    assert {column.table_name: column.record_ct for column in data_chars} == {"facts": 1_000_123, "dims": 205, "views": 7}
+    assert {column.table_name: column.approx_record_ct_at_count for column in data_chars} == {"facts": 1_000_000, "dims": 200, "views": None}
+    write_mock.assert_called_once()
+
+
+def test_refresh_estimate_counts_only_tables_without_estimate():
+    data_chars, fetch_threaded, _ = _refresh(_table_group("estimate"), DDF, [], [{"table_name": "views", "row_count": 7}])
+
+    query = " ".join(query for query, _ in fetch_threaded.call_args.args[0])
+    assert '"views"' in query
+    assert '"facts"' not in query
+    assert {column.table_name: column.record_ct for column in data_chars} == {"facts": None, "dims": None, "views": 7}
+    assert {column.table_name: column.row_count for column in data_chars} == {"facts": 1_000_000, "dims": 200, "views": 7}
+
+
+def test_refresh_estimate_change_reuses_previous_counts():
+    previous = [
+        {"table_name": "facts", "record_ct": 1_000_050, "approx_record_ct_at_count": 990_000},
+        {"table_name": "dims", "record_ct": 100, "approx_record_ct_at_count": 100},
+        {"table_name": "views", "record_ct": 7, "approx_record_ct_at_count": None},
+    ]
+    data_chars, fetch_threaded, _ = _refresh(
+        _table_group("estimate_change"), DDF, previous,
+        [{"table_name": "dims", "row_count": 203}, {"table_name": "views", "row_count": 8}],
+    )
+
+    query = " ".join(query for query, _ in fetch_threaded.call_args.args[0])
+    assert '"facts"' not in query
+    assert {column.table_name: column.record_ct for column in data_chars} == {"facts": 1_000_050, "dims": 203, "views": 8}
+    assert {column.table_name: column.approx_record_ct_at_count for column in data_chars} == {"facts": 990_000, "dims": 200, "views": None}
+
+
+def test_refresh_skips_count_queries_when_estimates_are_current():
+    ddf = [row for row in DDF if row["approx_record_ct"] is not None]
+    _, fetch_threaded, write_mock = _refresh(_table_group("estimate"), ddf, [], [])
+
+    fetch_threaded.assert_not_called()
+    write_mock.assert_called_once()
@@ -1,8 +1,11 @@
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 
-from testgen.commands.run_refresh_score_cards_results import _score_card_to_results
+from testgen.commands.run_refresh_score_cards_results import _score_card_to_results, run_refresh_score_cards_results
+from testgen.common.models.scores import ScoreDefinition, ScoreDefinitionCriteria
+from testgen.common.models.table_group import TableGroup
 
 pytestmark = pytest.mark.unit
 
@@ -80,3 +83,144 @@ def test_none_score_values():
     results = _score_card_to_results(card)
     for result in results:
         assert result.score is None
+
+
+def _definition(name: str, filters: list[dict], group_by_field: bool = True) -> ScoreDefinition:
+    return ScoreDefinition(
+        id=uuid4(),
+        project_code="test_project",
+        name=name,
+        criteria=ScoreDefinitionCriteria.from_filters(filters, group_by_field=group_by_field),
+    )
+
+
+@pytest.mark.parametrize(
+    "filters, group_by_field, expected",
+    [
+        ([], True, None),
+        ([{"field": "table_groups_name", "value": "sales"}], True, {"sales"}),
+        ([{"field": "data_source", "value": "erp"}], True, None),
+        (
+            [{"field": "table_groups_name", "value": "sales"}, {"field": "table_groups_name", "value": "hr"}],
+            True,
+            {"sales", "hr"},
+        ),
+        (
+            [{"field": "table_groups_name", "value": "sales"}, {"field": "data_source", "value": "erp"}],
+            True,
+            {"sales"},
+        ),
+        (
+            [{"field": "table_groups_name", "value": "sales", "others": [{"field": "table_name", "value": "orders"}]}],
+            False,
+            {"sales"},
+        ),
+        (
+            [
+                {"field": "table_groups_name", "value": "sales", "others": [{"field": "table_name", "value": "orders"}]},
+                {"field": "table_groups_name", "value": "hr", "others": [{"field": "table_name", "value": "people"}]},
+            ],
+            False,
+            {"sales", "hr"},
+        ),
+        (
+            [
+                {"field": "table_groups_name", "value": "sales", "others": [{"field": "table_name", "value": "orders"}]},
+                {"field": "table_name", "value": "people"},
+            ],
+            False,
+            None,
+        ),
+        (
+            [{"field": "table_groups_name", "value": "sales", "others": [{"field": "table_groups_name", "value": "hr"}]}],
+            False,
+            set(),
+        ),
+    ],
+)
+def test_criteria_table_groups_names(filters, group_by_field, expected):
+    criteria = ScoreDefinitionCriteria.from_filters(filters, group_by_field=group_by_field)
+    assert criteria.get_table_groups_names() == expected
+
+
+def test_depends_on_table_group():
+    assert _definition("sales", [{"field": "table_groups_name", "value": "sales"}]).depends_on_table_group("sales")
+    assert not _definition("sales", [{"field": "table_groups_name", "value": "sales"}]).depends_on_table_group("hr")
+    assert _definition("erp", [{"field": "data_source", "value": "erp"}]).depends_on_table_group("hr")
+
+
+def _run_refresh(definitions: list[ScoreDefinition], **kwargs) -> list[str]:
+    refreshed = []
+
+    def refresh(definition, *_args):
+        refreshed.append(definition.name)
+        return []
+
+    table_group = TableGroup(id=uuid4(), table_groups_name="sales")
+    with (
+        patch("testgen.commands.run_refresh_score_cards_results.database_session"),
+        patch("testgen.commands.run_refresh_score_cards_results.get_current_session", return_value=object()),
+        patch.object(ScoreDefinition, "all", return_value=definitions),
+        patch.object(TableGroup, "get", return_value=table_group),
+        patch("testgen.commands.run_refresh_score_cards_results._refresh_score_card", side_effect=refresh),
+        patch("testgen.commands.run_refresh_score_cards_results.send_score_drop_notifications") as send_mock,
+    ):
+        run_refresh_score_cards_results(project_code="test_project", **kwargs)
+    send_mock.assert_called_once()
+    return refreshed
+
+
+DEFINITIONS = [
+    _definition("sales", [{"field": "table_groups_name", "value": "sales"}]),
+    _definition("hr", [{"field": "table_groups_name", "value": "hr"}]),
+    _definition("erp", [{"field": "data_source", "value": "erp"}]),
+]
+
+
+def test_refresh_all_definitions_in_project():
+    assert _run_refresh(DEFINITIONS) == ["sales", "hr", "erp"]
+
+
+def test_refresh_only_definitions_affected_by_table_group():
+    assert _run_refresh(DEFINITIONS, table_group_id=str(uuid4())) == ["sales", "erp"]
+
+
+def test_refresh_continues_after_definition_error():
+    refreshed = []
+
+    def refresh(definition, *_args):
+        if definition.name == "sales":
+            raise ValueError("boom")
+        refreshed.append(definition.name)
+        return []
+
+    with (
+        patch("testgen.commands.run_refresh_score_cards_results.database_session"),
+        patch("testgen.commands.run_refresh_score_cards_results.get_current_session", return_value=object()),
+        patch.object(ScoreDefinition, "all", return_value=DEFINITIONS),
+        patch("testgen.commands.run_refresh_score_cards_results._refresh_score_card", side_effect=refresh),
+        patch("testgen.commands.run_refresh_score_cards_results.send_score_drop_notifications"),
+    ):
+        run_refresh_score_cards_results(project_code="test_project")
+    assert refreshed == ["hr", "erp"]
+
+
+def test_refresh_definitions_concurrently_in_own_sessions():
+    sessions = []
+    with (
+        patch("testgen.commands.run_refresh_score_cards_results.database_session") as session_mock,
+        patch("testgen.commands.run_refresh_score_cards_results.get_current_session", return_value=None),
+        patch("testgen.commands.run_refresh_score_cards_results.settings.SCORE_REFRESH_MAX_THREADS", 2),
+        patch.object(ScoreDefinition, "all", return_value=DEFINITIONS),
+        patch.object(ScoreDefinition, "get", side_effect=lambda id_: next(d for d in DEFINITIONS if str(d.id) == id_)),
+        patch(
+            "testgen.commands.run_refresh_score_cards_results._refresh_score_card",
+            side_effect=lambda definition, *_: [(definition, "score", 0.9, 0.8)],
+        ),
+        patch("testgen.commands.run_refresh_score_cards_results.send_score_drop_notifications") as send_mock,
+    ):
+        session_mock.side_effect = lambda: sessions.append(1) or session_mock.return_value
+        run_refresh_score_cards_results(project_code="test_project")
+
+    assert len(sessions) == 1 + len(DEFINITIONS)
+    assert [data[0].name for data in send_mock.call_args.args[0]] == ["sales", "hr", "erp"]
@@ -1,5 +1,5 @@
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
@@ -8,6 +8,7 @@ from scipy import stats
 from testgen.commands.test_thresholds_prediction import (
     T_DISTRIBUTION_THRESHOLD,
     Z_SCORE_MAP,
+    TestThresholdsPrediction,
     compute_sarimax_threshold,
 )
 from testgen.common.models.test_suite import PredictSensitivity
@@ -28,7 +29,7 @@ def _make_forecast(mean_values: list[float], se_values: list[float]) -> pd.DataF
     return pd.DataFrame({"mean": mean_values, "se": se_values}, index=dates)
 
 
-MOCK_TARGET = "testgen.commands.test_thresholds_prediction.get_sarimax_forecast"
+MOCK_TARGET = "testgen.commands.test_thresholds_prediction.get_sarimax_forecast_with_state"
 
 
 # --- min_lookback guard ---
@@ -36,7 +37,7 @@ MOCK_TARGET = "testgen.commands.test_thresholds_prediction.get_sarimax_forecast"
 
 def test_below_min_lookback_returns_none():
     history = _make_history(3)
-    lower, upper, prediction = compute_sarimax_threshold(history, PredictSensitivity.medium, min_lookback=5)
+    lower, upper, prediction, _ = compute_sarimax_threshold(history, PredictSensitivity.medium, min_lookback=5)
     assert lower is None
     assert upper is None
     assert prediction is None
@@ -48,10 +49,10 @@ def test_below_min_lookback_returns_none():
 @patch(MOCK_TARGET)
 def test_medium_sensitivity_large_sample(mock_forecast):
     forecast = _make_forecast([100.0, 105.0], [10.0, 12.0])
-    mock_forecast.return_value = forecast
+    mock_forecast.return_value = (forecast, None)
     history = _make_history(T_DISTRIBUTION_THRESHOLD)
 
-    lower, upper, forecast_json = compute_sarimax_threshold(history, PredictSensitivity.medium)
+    lower, upper, forecast_json, _ = compute_sarimax_threshold(history, PredictSensitivity.medium)
 
     # medium: lower z=-2.5, upper z=2.5, large sample uses z directly
     assert lower == pytest.approx(100.0 + (-2.5 * 10.0))
@@ -64,10 +65,10 @@ def test_medium_sensitivity_large_sample(mock_forecast):
 @patch(MOCK_TARGET)
 def test_high_sensitivity_large_sample(mock_forecast):
     forecast = _make_forecast([100.0], [10.0])
-    mock_forecast.return_value = forecast
+    mock_forecast.return_value = (forecast, None)
     history = _make_history(T_DISTRIBUTION_THRESHOLD)
 
-    lower, upper, _ = compute_sarimax_threshold(history, PredictSensitivity.high)
+    lower, upper, _, _ = compute_sarimax_threshold(history, PredictSensitivity.high)
 
     # high: lower z=-2.0, upper z=2.0
     assert lower == pytest.approx(80.0)
@@ -77,10 +78,10 @@ def test_high_sensitivity_large_sample(mock_forecast):
 @patch(MOCK_TARGET)
 def test_low_sensitivity_large_sample(mock_forecast):
     forecast = _make_forecast([100.0], [10.0])
-    mock_forecast.return_value = forecast
+    mock_forecast.return_value = (forecast, None)
     history = _make_history(T_DISTRIBUTION_THRESHOLD)
 
-    lower, upper, _ = compute_sarimax_threshold(history, PredictSensitivity.low)
+    lower, upper, _, _ = compute_sarimax_threshold(history, PredictSensitivity.low)
 
     # low: lower z=-3.0, upper z=3.0
     assert lower == pytest.approx(70.0)
@@ -95,11 +96,11 @@ def test_small_sample_uses_t_distribution(mock_forecast):
     """With fewer than T_DISTRIBUTION_THRESHOLD points, z-scores should be
     widened via t-distribution to account for estimation uncertainty."""
     forecast = _make_forecast([100.0], [10.0])
-    mock_forecast.return_value = forecast
+    mock_forecast.return_value = (forecast, None)
     n = 10
     history = _make_history(n)
 
-    lower, upper, _ = compute_sarimax_threshold(history, PredictSensitivity.medium)
+    lower, upper, _, _ = compute_sarimax_threshold(history, PredictSensitivity.medium)
 
     # t-distribution multiplier for medium sensitivity (z=-2.5 / z=2.5)
     lower_percentile = stats.norm.cdf(-2.5)
@@ -121,10 +122,10 @@ def test_small_sample_uses_t_distribution(mock_forecast):
 @patch(MOCK_TARGET)
 def test_nan_mean_returns_none(mock_forecast):
     forecast = _make_forecast([float("nan")], [10.0])
-    mock_forecast.return_value = forecast
+    mock_forecast.return_value = (forecast, None)
     history = _make_history(T_DISTRIBUTION_THRESHOLD)
 
-    lower, upper, forecast_json = compute_sarimax_threshold(history, PredictSensitivity.medium)
+    lower, upper, forecast_json, _ = compute_sarimax_threshold(history, PredictSensitivity.medium)
 
     assert lower is None
     assert upper is None
@@ -134,10 +135,10 @@ def test_nan_mean_returns_none(mock_forecast):
 @patch(MOCK_TARGET)
 def test_nan_se_returns_none(mock_forecast):
     forecast = _make_forecast([100.0], [float("nan")])
-    mock_forecast.return_value = forecast
+    mock_forecast.return_value = (forecast, None)
     history = _make_history(T_DISTRIBUTION_THRESHOLD)
 
-    lower, upper, forecast_json = compute_sarimax_threshold(history, PredictSensitivity.medium)
+    lower, upper, forecast_json, _ = compute_sarimax_threshold(history, PredictSensitivity.medium)
 
     assert lower is None
     assert upper is None
@@ -151,7 +152,7 @@ def test_nan_se_returns_none(mock_forecast):
 def test_not_enough_data_returns_none(mock_forecast):
     history = _make_history(T_DISTRIBUTION_THRESHOLD)
 
-    lower, upper, forecast_json = compute_sarimax_threshold(history, PredictSensitivity.medium)
+    lower, upper, forecast_json, _ = compute_sarimax_threshold(history, PredictSensitivity.medium)
 
     assert lower is None
     assert upper is None
@@ -165,10 +166,10 @@ def test_not_enough_data_returns_none(mock_forecast):
 def test_uses_first_forecast_date(mock_forecast):
     """Tolerances should be computed from the first row of the forecast."""
     forecast = _make_forecast([100.0, 200.0], [10.0, 50.0])
-    mock_forecast.return_value = forecast
+    mock_forecast.return_value = (forecast, None)
     history = _make_history(T_DISTRIBUTION_THRESHOLD)
 
-    lower, upper, _ = compute_sarimax_threshold(history, PredictSensitivity.medium)
+    lower, upper, _, _ = compute_sarimax_threshold(history, PredictSensitivity.medium)
 
     # Should use first row (mean=100, se=10), not second (mean=200, se=50)
     assert lower == pytest.approx(100.0 + (-2.5 * 10.0))
@@ -188,7 +189,7 @@ def test_z_score_map_covers_all_sensitivities():
 @patch(MOCK_TARGET)
 def test_all_z_score_columns_added_to_forecast(mock_forecast):
     forecast = _make_forecast([100.0], [10.0])
-    mock_forecast.return_value = forecast
+    mock_forecast.return_value = (forecast, None)
     history = _make_history(T_DISTRIBUTION_THRESHOLD)
 
     compute_sarimax_threshold(history, PredictSensitivity.medium)
@@ -196,3 +197,68 @@ def test_all_z_score_columns_added_to_forecast(mock_forecast):
     for key in Z_SCORE_MAP:
         col = f"{key[0]}|{key[1].value}"
         assert col in forecast.columns
+
+
+# --- TestThresholdsPrediction.run ---
+
+
+def _make_test_results() -> list[dict]:
+    rows = []
+    for def_index, test_type in enumerate(["Volume_Trend", "Metric_Trend", "Volume_Trend", "Metric_Trend"]):
+        for day in range(30):
+            rows.append({
+                "test_definition_id": f"td-{def_index}",
+                "test_type": test_type,
+                "test_time": pd.Timestamp("2025-01-01") + pd.Timedelta(days=day),
+                "result_signal": 1000.0 + def_index * 100 + (day % 7) * 10 + day,
+            })
+    return rows
+
+
+def _run_prediction(max_workers: int, model_states: list[dict] | None = None) -> list[list]:
+    test_suite = MagicMock(
+        id="suite-1",
+        predict_sensitivity=PredictSensitivity.medium,
+        predict_min_lookback=5,
+        predict_exclude_weekends=False,
+        holiday_codes_list=None,
+    )
+    with (
+        patch("testgen.commands.test_thresholds_prediction.JobSchedule"),
+        patch("testgen.commands.test_thresholds_prediction.with_database_session", lambda fn: fn),
+        patch(
+            "testgen.commands.test_thresholds_prediction.fetch_dict_from_db",
+            side_effect=[_make_test_results(), model_states or []],
+        ),
+        patch("testgen.commands.test_thresholds_prediction.write_to_app_db") as write_mock,
+        patch("testgen.commands.test_thresholds_prediction.execute_db_queries"),
+        patch("testgen.settings.PREDICTION_MAX_WORKERS", max_workers),
+    ):
+        prediction = TestThresholdsPrediction.__new__(TestThresholdsPrediction)
+        prediction.test_suite = test_suite
+        prediction.run_date = pd.Timestamp("2025-02-01")
+        prediction.tz = None
+        prediction.run()
+
+    return write_mock.call_args.args[0]
+
+
+def test_run_process_pool_matches_serial():
+    serial_results = _run_prediction(max_workers=1)
+    parallel_results = _run_prediction(max_workers=2)
+
+    assert [row[1] for row in serial_results] == ["td-0", "td-1", "td-2", "td-3"]
+    assert parallel_results == serial_results
+
+
+def test_run_stages_model_states():
+    first_results = _run_prediction(max_workers=1)
+    assert all(row[-1] is not None for row in first_results)
+
+    # The saved states already cover the whole history, so the models are refit instead of updated
+    saved_states = [
+        {"test_definition_id": row[1], "model_state": json.loads(row[-1])}
+        for row in first_results
+    ]
+    second_results = _run_prediction(max_workers=1, model_states=saved_states)
+    assert [row[:-1] for row in second_results] == [row[:-1] for row in first_results]
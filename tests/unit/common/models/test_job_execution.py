@@ -1,9 +1,20 @@
+import threading
+import time
+from datetime import UTC, datetime
 from unittest.mock import MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
 
-from testgen.common.models.job_execution import JobExecution
+from testgen.common.models import job_execution
+from testgen.common.models.job_execution import (
+    FINAL_STATUSES,
+    JOB_EXECUTIONS_CHANNEL,
+    JobExecution,
+    JobExecutionListener,
+    _select_fair,
+    wait_for_job_status,
+)
 
 pytestmark = pytest.mark.unit
 
@@ -69,14 +80,47 @@ def test_submit_does_not_commit(mock_session):
     mock_session.commit.assert_not_called()
 
 
+def test_submit_resolves_connection(mock_session):
+    mock_session.scalar.return_value = 42
+
+    result = JobExecution.submit(
+        job_key="run-profile",
+        kwargs={"table_group_id": "abc-123"},
+        source="ui",
+        project_code="DEFAULT",
+    )
+
+    assert result.connection_id == 42
+    assert mock_session.scalar.call_args.args[1] == {"id": "abc-123"}
+
+
+def _claim_results(mock_session, cancel_requested, pending, active_counts=()):
+    mock_session.scalars.side_effect = [
+        Mock(all=Mock(return_value=cancel_requested)),
+        Mock(all=Mock(return_value=pending)),
+    ]
+    mock_session.execute.return_value.all.return_value = list(active_counts)
+
+
+def _pending(project_code="DEFAULT", connection_id=1, minute=0):
+    return JobExecution(
+        id=uuid4(),
+        status="pending",
+        job_key="run-tests",
+        project_code=project_code,
+        connection_id=connection_id,
+        created_at=datetime(2026, 1, 1, 0, minute, tzinfo=UTC),
+    )
+
+
 def test_claim_actionable_claims_pending_rows(mock_session):
-    row1 = JobExecution(id=uuid4(), status="pending", job_key="run-profile")
-    row2 = JobExecution(id=uuid4(), status="pending", job_key="run-tests")
-    mock_session.scalars.return_value.all.return_value = [row1, row2]
+    row1 = _pending(minute=1)
+    row2 = _pending(minute=2)
+    _claim_results(mock_session, [], [row1, row2])
 
     result = JobExecution.claim_actionable(limit=5)
 
-    assert len(result) == 2
+    assert result == [row1, row2]
     assert row1.status == "claimed"
     assert row2.status == "claimed"
     assert row1.claimed_at is not None
@@ -84,9 +128,9 @@ def test_claim_actionable_claims_pending_rows(mock_session):
 
 
 def test_claim_actionable_passes_through_cancel_requested(mock_session):
-    pending = JobExecution(id=uuid4(), status="pending", job_key="run-profile")
+    pending = _pending()
     cancel = JobExecution(id=uuid4(), status="cancel_requested", job_key="run-tests")
-    mock_session.scalars.return_value.all.return_value = [pending, cancel]
+    _claim_results(mock_session, [cancel], [pending])
 
     result = JobExecution.claim_actionable(limit=5)
 
@@ -95,10 +139,19 @@ def test_claim_actionable_passes_through_cancel_requested(mock_session):
     assert cancel.status == "cancel_requested"
 
 
+def test_claim_actionable_respects_limits(mock_session):
+    rows = [_pending(minute=minute) for minute in range(3)]
+    _claim_results(mock_session, [], rows, [("DEFAULT", 1, 1)])
+
+    with patch(f"{MODULE}.settings.JOB_MAX_RUNNING_PER_CONNECTION", 2):
+        result = JobExecution.claim_actionable(limit=5)
+
+    assert result == rows[:1]
+    assert rows[1].status == "pending"
+
+
 def test_claim_actionable_does_not_commit(mock_session):
-    mock_session.scalars.return_value.all.return_value = [
-        JobExecution(id=uuid4(), status="pending", job_key="run-profile")
-    ]
+    _claim_results(mock_session, [], [_pending()])
 
     JobExecution.claim_actionable(limit=5)
 
@@ -106,13 +159,57 @@ def test_claim_actionable_does_not_commit(mock_session):
 
 
 def test_claim_actionable_empty(mock_session):
-    mock_session.scalars.return_value.all.return_value = []
+    _claim_results(mock_session, [], [])
 
     result = JobExecution.claim_actionable(limit=5)
 
     assert result == []
 
 
+def _select(candidates, active_counts=(), limit=10, max_running=0, max_running_per_project=0, max_running_per_connection=0):
+    return _select_fair(
+        candidates, list(active_counts), limit, max_running, max_running_per_project, max_running_per_connection,
+    )
+
+
+def test_select_fair_alternates_projects():
+    first = [_pending("A", minute=minute) for minute in range(3)]
+    second = [_pending("B", minute=minute + 10) for minute in range(2)]
+
+    selected = _select([*first, *second], limit=4)
+
+    assert selected == [first[0], second[0], first[1], second[1]]
+
+
+def test_select_fair_favors_projects_with_fewer_active_jobs():
+    first = _pending("A", minute=0)
+    second = _pending("B", minute=5)
+
+    selected = _select([first, second], active_counts=[("A", 1, 2)], limit=1)
+
+    assert selected == [second]
+
+
+def test_select_fair_limits_per_connection():
+    busy = [_pending("A", connection_id=1, minute=minute) for minute in range(3)]
+    other = _pending("A", connection_id=2, minute=10)
+    no_connection = _pending("A", connection_id=None, minute=20)
+
+    selected = _select([*busy, other, no_connection], active_counts=[("B", 1, 1)], max_running_per_connection=2)
+
+    assert selected == [busy[0], other, no_connection]
+
+
+def test_select_fair_limits_per_project_and_overall():
+    first = [_pending("A", minute=minute) for minute in range(3)]
+    second = [_pending("B", minute=minute + 10) for minute in range(3)]
+
+    assert _select([*first, *second], max_running_per_project=1) == [first[0], second[0]]
+    assert _select([*first, *second], active_counts=[("C", None, 2)], max_running=5) == [
+        first[0], second[0], first[1],
+    ]
+
+
 def test_get_by_id(mock_session):
     job_id = uuid4()
     expected = JobExecution(id=job_id, job_key="run-profile")
@@ -185,3 +282,159 @@ def test_request_cancel_terminal_state_returns_false(mock_session):
 
     assert job.request_cancel() is False
     assert job.status == "completed"
+
+
+# --- Notifications ---
+
+
+def _wait_for_listener_stop():
+    deadline = time.monotonic() + 5
+    while job_execution._waiters_thread is not None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job_execution._waiters_thread is None
+
+
+@pytest.fixture
+def listener_mock():
+    notifications = []
+
+    def wait(timeout):
+        time.sleep(min(timeout, 0.01))
+        return notifications.pop(0) if notifications else []
+
+    with (
+        patch(f"{MODULE}.JobExecutionListener") as mock,
+        patch(f"{MODULE}.WAITERS_CHECK_INTERVAL", 0.01),
+    ):
+        mock.return_value.listen.return_value = False
+        mock.return_value.wait.side_effect = wait
+        mock.return_value.notifications = notifications
+        yield mock.return_value
+        _wait_for_listener_stop()
+
+
+@pytest.fixture
+def read_statuses(mock_session):
+    """Statuses returned by the successive reads of the waited job execution."""
+    job_id = uuid4()
+
+    def set_statuses(*statuses):
+        mock_session.get.side_effect = [JobExecution(id=job_id, status=status) for status in statuses]
+        return job_id
+
+    with patch(f"{MODULE}.database_session"):
+        yield set_statuses
+
+
+def test_listener_returns_notifications():
+    connection = MagicMock()
+    connection.dbapi_connection.notifies = []
+    job_id = uuid4()
+
+    def receive(*_args):
+        connection.dbapi_connection.notifies.append(Mock(payload=f'{{"id": "{job_id}", "status": "claimed"}}'))
+
+    with (
+        patch("testgen.common.notification_listener.models.engine") as engine_mock,
+        patch("testgen.common.notification_listener.select_module.select", side_effect=receive) as select_mock,
+    ):
+        engine_mock.raw_connection.return_value = connection
+        listener = JobExecutionListener()
+
+        assert listener.wait(timeout=5) == [(job_id, "claimed")]
+
+    connection.detach.assert_called_once()
+    cursor = connection.dbapi_connection.cursor.return_value.__enter__.return_value
+    cursor.execute.assert_called_once_with(f'LISTEN "{JOB_EXECUTIONS_CHANNEL}"')
+    select_mock.assert_called_once()
+    assert listener.listen() is False
+
+
+def test_listener_stops_listening_on_error():
+    connection = MagicMock()
+    connection.dbapi_connection.notifies = []
+    connection.dbapi_connection.poll.side_effect = OSError("connection lost")
+
+    with (
+        patch("testgen.common.notification_listener.models.engine") as engine_mock,
+        patch("testgen.common.notification_listener.select_module.select"),
+    ):
+        engine_mock.raw_connection.return_value = connection
+        listener = JobExecutionListener()
+
+        with pytest.raises(OSError):
+            listener.wait(timeout=5)
+
+    connection.dbapi_connection.close.assert_called_once()
+    assert listener._connection is None
+
+
+def test_wait_for_job_status_returns_final_job(read_statuses, listener_mock):
+    job_id = read_statuses("completed")
+
+    job = wait_for_job_status(job_id, FINAL_STATUSES)
+
+    assert job.status == "completed"
+    assert job_execution._waiters == {}
+    _wait_for_listener_stop()
+    listener_mock.close.assert_called_once()
+
+
+def test_wait_for_job_status_wakes_on_notification(read_statuses, listener_mock):
+    job_id = read_statuses("running", "completed")
+    listener_mock.notifications.extend([[(uuid4(), "claimed")], *[[(job_id, "completed")]] * 100])
+
+    with patch(f"{MODULE}.settings.JOB_POLL_INTERVAL", 60):
+        job = wait_for_job_status(job_id, FINAL_STATUSES, timeout=30)
+
+    assert job.status == "completed"
+
+
+def test_wait_for_job_status_polls_without_notifications(read_statuses, listener_mock):
+    job_id = read_statuses("running", "completed")
+    listener_mock.listen.side_effect = OSError("connection refused")
+
+    with patch(f"{MODULE}.settings.JOB_POLL_INTERVAL", 0.01):
+        job = wait_for_job_status(job_id, FINAL_STATUSES)
+
+    assert job.status == "completed"
+
+
+def test_wait_for_job_status_timeout(read_statuses, listener_mock):
+    job_id = read_statuses("running", "running")
+
+    job = wait_for_job_status(job_id, FINAL_STATUSES, timeout=0.05)
+
+    assert job.status == "running"
+
+
+def test_wait_for_job_status_shares_one_listener(mock_session, listener_mock):
+    job_ids = [uuid4() for _ in range(5)]
+    waiting = threading.Barrier(len(job_ids) + 1)
+    completed = set()
+
+    def get(_model, job_id, **_kwargs):
+        status = "completed" if job_id in completed else "running"
+        return JobExecution(id=job_id, status=status)
+
+    def wait(job_id):
+        waiting.wait()
+        results.append(wait_for_job_status(job_id, FINAL_STATUSES, timeout=30))
+
+    mock_session.get.side_effect = get
+    results = []
+    threads = [threading.Thread(target=wait, args=(job_id,)) for job_id in job_ids]
+    with patch(f"{MODULE}.database_session"), patch(f"{MODULE}.settings.JOB_POLL_INTERVAL", 60):
+        for thread in threads:
+            thread.start()
+        waiting.wait()
+        time.sleep(0.05)
+        completed.update(job_ids)
+        listener_mock.notifications.extend([(job_id, "completed") for job_id in job_ids] for _ in range(100))
+        for thread in threads:
+            thread.join(timeout=10)
+
+    assert [job.status for job in results] == ["completed"] * len(job_ids)
+    _wait_for_listener_stop()
+    job_execution.JobExecutionListener.assert_called_once()
+    listener_mock.close.assert_called_once()
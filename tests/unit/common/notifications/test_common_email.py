@@ -1,8 +1,9 @@
+import smtplib
 from unittest.mock import ANY, call, patch
 
 import pytest
 
-from testgen.common.notifications.base import BaseEmailTemplate, EmailTemplateException
+from testgen.common.notifications.base import BaseEmailTemplate, EmailTemplateException, smtp_session
 
 pytestmark = pytest.mark.unit
 
@@ -68,3 +69,42 @@ def test_settings_validation(missing, template, def_settings, send_args):
     setattr(def_settings, missing, None)
     with pytest.raises(EmailTemplateException, match="Invalid or insufficient email/SMTP settings"):
         template.send(*send_args)
+
+
+def test_templates_compiled_once_per_class(def_settings):
+    with patch("pybars.Compiler") as compiler_mock:
+        BaseEmailTemplate._compiled_templates.pop(TestEmailTemplate, None)
+        first = TestEmailTemplate()
+        second = TestEmailTemplate()
+
+    assert compiler_mock.call_count == 1
+    assert first.compiled_body is second.compiled_body
+    BaseEmailTemplate._compiled_templates.pop(TestEmailTemplate, None)
+
+
+def test_smtp_session_reuses_connection(smtp_mock, template, send_args, def_settings):
+    with smtp_session():
+        template.send(*send_args)
+        template.send(["other@data.kitchen"], send_args[1])
+
+    smtp_mock.assert_called_once_with("smtp-endpoint", 333, context=ANY)
+    smtp_mock.return_value.login.assert_called_once_with("smtp-user", "smtp-pass")
+    assert smtp_mock.return_value.sendmail.call_count == 2
+    smtp_mock.return_value.quit.assert_called_once()
+
+
+def test_smtp_session_reconnects_when_disconnected(smtp_mock, template, send_args, def_settings):
+    smtp_mock.return_value.sendmail.side_effect = [{}, smtplib.SMTPServerDisconnected(), {}]
+    with smtp_session():
+        template.send(*send_args)
+        template.send(*send_args)
+
+    assert smtp_mock.call_count == 2
+    assert smtp_mock.return_value.sendmail.call_count == 3
+
+
+def test_smtp_session_not_opened_without_emails(smtp_mock):
+    with smtp_session():
+        pass
+
+    smtp_mock.assert_not_called()
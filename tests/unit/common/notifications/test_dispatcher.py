@@ -0,0 +1,59 @@
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from testgen.common.notifications.base import _current_smtp_session
+from testgen.common.notifications.dispatcher import NotificationDispatcher
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def dispatcher():
+    with patch("testgen.common.notifications.dispatcher.atexit"):
+        yield NotificationDispatcher()
+
+
+def test_submit_runs_in_background(dispatcher):
+    threads = []
+    dispatcher.submit(lambda: threads.append(threading.current_thread()))
+
+    assert dispatcher.drain(timeout=5)
+    assert threads and threads[0] is not threading.current_thread()
+
+
+def test_batch_shares_smtp_session(dispatcher):
+    release = threading.Event()
+    sessions = []
+
+    dispatcher.submit(release.wait, 5)
+    for _ in range(3):
+        dispatcher.submit(lambda: sessions.append(_current_smtp_session.value))
+    release.set()
+
+    assert dispatcher.drain(timeout=5)
+    assert len(sessions) == 3
+    assert sessions[1] is sessions[0] and sessions[2] is sessions[0]
+
+
+def test_failing_notification_does_not_stop_queue(dispatcher):
+    calls = []
+
+    def fail():
+        raise ValueError("boom")
+
+    dispatcher.submit(fail)
+    dispatcher.submit(calls.append, "sent")
+
+    assert dispatcher.drain(timeout=5)
+    assert calls == ["sent"]
+
+
+def test_drain_times_out(dispatcher):
+    release = threading.Event()
+    dispatcher.submit(release.wait, 5)
+
+    assert not dispatcher.drain(timeout=0.05)
+    release.set()
+    assert dispatcher.drain(timeout=5)
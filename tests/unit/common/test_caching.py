@@ -0,0 +1,55 @@
+from typing import ClassVar
+
+import pytest
+
+from testgen.common.caching import cache_data
+
+pytestmark = pytest.mark.unit
+
+
+class CachedModel:
+    calls: ClassVar[list[int]] = []
+
+    @classmethod
+    @cache_data(show_spinner=False)
+    def get(cls, identifier: int) -> tuple:
+        cls.calls.append(identifier)
+        return cls.__name__, identifier
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    CachedModel.get.clear()
+    CachedModel.calls.clear()
+    yield
+    CachedModel.get.clear()
+
+
+def test_cached_classmethod():
+    assert CachedModel.get(1) == ("CachedModel", 1)
+    assert CachedModel.get(1) == ("CachedModel", 1)
+    assert CachedModel.get(2) == ("CachedModel", 2)
+
+    assert CachedModel.calls == [1, 2]
+
+
+def test_clear_cached_classmethod():
+    CachedModel.get(1)
+    CachedModel.get.clear()
+    CachedModel.get(1)
+
+    assert CachedModel.calls == [1, 1]
+
+
+def test_cached_function():
+    calls: ClassVar[list[int]] = []
+
+    @cache_data(show_spinner=False)
+    def square(value: int) -> int:
+        calls.append(value)
+        return value * value
+
+    assert square(3) == 9
+    assert square(3) == 9
+    assert calls == [3]
+    assert square.__name__ == "square"
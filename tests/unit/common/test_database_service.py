@@ -0,0 +1,554 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import yaml
+from sqlalchemy import create_engine, text
+
+import testgen
+from testgen.common.database.database_service import (
+    TEMPLATE_CONDITIONAL_PATTERN,
+    TEMPLATE_SLOT_PATTERN,
+    StreamStage,
+    TargetEngineCache,
+    _replace_params_in_order,
+    add_session_setup_listener,
+    apply_params,
+    compile_template,
+    compile_template_file,
+    fetch_from_db_threaded,
+    process_conditionals,
+    stream_from_db_threaded,
+    stream_pipeline_from_db_threaded,
+)
+from testgen.common.read_file import replace_templated_functions
+
+pytestmark = pytest.mark.unit
+
+
+def _make_connection(fail_queries=()):
+    def execute(query, _params):
+        if str(query) in fail_queries:
+            raise ValueError(f"Failed: {query}")
+        value = int(str(query).split()[-1])
+        result = MagicMock()
+        result.rowcount = 2
+        result.mappings().fetchall.return_value = [{"value": value}, {"value": value * 10}]
+        result.keys.return_value = ["value"]
+        return result
+
+    connection = MagicMock()
+    connection.__enter__.return_value = connection
+    connection.execute.side_effect = execute
+    return connection
+
+
+@pytest.fixture
+def copy_mock():
+    with patch("testgen.common.database.database_service._copy_to_app_db") as mock:
+        yield mock
+
+
+def _stream(queries, fail_queries=(), **kwargs):
+    connection = _make_connection(fail_queries)
+    with patch("testgen.common.database.database_service._init_db_connection", return_value=connection):
+        return stream_from_db_threaded(queries, "target_table", **kwargs)
+
+
+def test_stream_writes_all_rows(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 6)]
+
+    count, columns, errors = _stream(queries, max_threads=3)
+
+    assert count == 10
+    assert columns == ["value"]
+    assert errors == {}
+    written = [row["value"] for call in copy_mock.call_args_list for row in call.args[1]]
+    assert sorted(written) == [1, 2, 3, 4, 5, 10, 20, 30, 40, 50]
+    assert all(call.args[2] == ["value"] and call.args[3] == "target_table" for call in copy_mock.call_args_list)
+
+
+def test_stream_writes_in_chunks(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 6)]
+
+    # Chunks are snapshots of the buffer at copy time
+    chunk_sizes = []
+    copy_mock.side_effect = lambda _conn, data, _cols, _table: chunk_sizes.append(len(data))
+
+    count, _, _ = _stream(queries, chunk_size=4)
+
+    assert count == 10
+    assert chunk_sizes == [4, 4, 2]
+
+
+def test_stream_collects_errors(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 4)]
+
+    count, _, errors = _stream(queries, fail_queries=("SELECT 2",))
+
+    assert count == 4
+    assert list(errors) == [1]
+    assert "Failed" in errors[1]
+
+
+def test_stream_no_rows_does_not_write(copy_mock):
+    queries = [("SELECT 1", None)]
+
+    count, _, errors = _stream(queries, fail_queries=("SELECT 1",))
+
+    assert count == 0
+    assert 0 in errors
+    copy_mock.assert_not_called()
+
+
+def test_stream_applies_transform_and_column_names(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 3)]
+
+    count, _, _ = _stream(
+        queries,
+        column_names=["doubled"],
+        transform=lambda rows: [[row["value"] * 2] for row in rows],
+    )
+
+    assert count == 4
+    call = copy_mock.call_args
+    assert call.args[2] == ["doubled"]
+    assert sorted(row[0] for row in call.args[1]) == [2, 4, 20, 40]
+
+
+def test_stream_reports_progress(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 4)]
+    progress_calls = []
+
+    _stream(queries, progress_callback=lambda progress: progress_calls.append(dict(progress)))
+
+    assert [call["processed"] for call in progress_calls] == [1, 2, 3]
+    assert all(call["total"] == 3 for call in progress_calls)
+    assert sorted(progress_calls[-1]["indexes"]) == [0, 1, 2]
+
+
+def test_stream_write_error_does_not_hang(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 30)]
+    copy_mock.side_effect = RuntimeError("COPY failed")
+
+    with pytest.raises(RuntimeError, match="COPY failed"):
+        _stream(queries, max_threads=2, chunk_size=1)
+
+
+def _stream_pipeline(queries, stages, fail_queries=(), **kwargs):
+    connection = _make_connection(fail_queries)
+    with patch("testgen.common.database.database_service._init_db_connection", return_value=connection):
+        results = stream_pipeline_from_db_threaded(queries, stages, **kwargs)
+    return results, [str(call.args[0]) for call in connection.execute.call_args_list]
+
+
+def _follow_up(rows):
+    # One follow-up query per source query, for its first row
+    return [(f"SELECT {rows[0]['value'] + 100}", None)] if rows[0]["value"] < 100 else []
+
+
+def test_pipeline_writes_each_stage_to_its_table(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 4)]
+
+    results, _ = _stream_pipeline(
+        queries,
+        [StreamStage("first_table", follow_up=_follow_up), StreamStage("second_table")],
+        max_threads=2,
+    )
+
+    assert [(result.query_count, result.written_count, result.errors) for result in results] == [(3, 6, {}), (3, 6, {})]
+    written = {}
+    for call in copy_mock.call_args_list:
+        written.setdefault(call.args[3], []).extend(row["value"] for row in call.args[1])
+    assert sorted(written["first_table"]) == [1, 2, 3, 10, 20, 30]
+    assert sorted(written["second_table"]) == [101, 102, 103, 1010, 1020, 1030]
+
+
+def test_pipeline_runs_follow_ups_first(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 4)]
+
+    _, executed = _stream_pipeline(
+        queries,
+        [StreamStage("first_table", follow_up=_follow_up), StreamStage("second_table")],
+        max_threads=1,
+    )
+
+    assert executed == ["SELECT 1", "SELECT 101", "SELECT 2", "SELECT 102", "SELECT 3", "SELECT 103"]
+
+
+def test_pipeline_skips_follow_ups_for_errors(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 4)]
+    progress_calls = []
+
+    results, executed = _stream_pipeline(
+        queries,
+        [
+            StreamStage("first_table", follow_up=_follow_up),
+            StreamStage("second_table", progress_callback=lambda progress: progress_calls.append(dict(progress))),
+        ],
+        fail_queries=("SELECT 2", "SELECT 103"),
+    )
+
+    assert "SELECT 102" not in executed
+    assert list(results[0].errors) == [1]
+    assert results[1].query_count == 2
+    assert list(results[1].errors.values()) == ["Failed: SELECT 103"]
+    assert [call["processed"] for call in progress_calls] == [1, 2]
+    assert progress_calls[-1]["errors"] == 1
+
+
+def test_pipeline_contains_follow_up_errors_to_next_stage(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 4)]
+
+    def follow_up(rows):
+        if rows[0]["value"] == 2:
+            raise ValueError("Bad follow-up")
+        return _follow_up(rows)
+
+    results, executed = _stream_pipeline(
+        queries,
+        [StreamStage("first_table", follow_up=follow_up), StreamStage("second_table")],
+    )
+
+    assert "SELECT 102" not in executed
+    assert (results[0].written_count, results[0].errors) == (6, {})
+    assert results[1].query_count == 3
+    assert list(results[1].errors.values()) == ["Bad follow-up"]
+    assert results[1].written_count == 4
+
+
+def test_pipeline_contains_write_errors_to_their_stage(copy_mock):
+    queries = [(f"SELECT {i}", None) for i in range(1, 4)]
+
+    def copy(_connection, _data, _columns, table_name):
+        if table_name == "second_table":
+            raise RuntimeError("COPY failed")
+
+    copy_mock.side_effect = copy
+
+    results, executed = _stream_pipeline(
+        queries,
+        [StreamStage("first_table", follow_up=_follow_up), StreamStage("second_table")],
+        max_threads=2,
+        chunk_size=2,
+    )
+
+    assert len(executed) == 6
+    assert (results[0].written_count, results[0].write_error) == (6, None)
+    assert results[1].written_count == 0
+    assert results[1].write_error == "COPY failed"
+    # Once the stage failed, its results are no longer written
+    assert [call.args[3] for call in copy_mock.call_args_list].count("second_table") == 1
+
+
+def test_threaded_fetch_reuses_one_connection_per_thread():
+    connections = []
+
+    def init_connection(_use_target_db):
+        connections.append(_make_connection())
+        return connections[-1]
+
+    queries = [(f"SELECT {i}", None) for i in range(1, 21)]
+    with patch("testgen.common.database.database_service._init_db_connection", side_effect=init_connection):
+        rows, _, errors = fetch_from_db_threaded(queries, use_target_db=True, max_threads=3)
+
+    assert len(rows) == 40
+    assert errors == {}
+    assert 1 <= len(connections) <= 3
+    assert sum(connection.execute.call_count for connection in connections) == 20
+    assert all(connection.close.called for connection in connections)
+
+
+def test_threaded_fetch_replaces_connection_after_error():
+    connections = []
+
+    def init_connection(_use_target_db):
+        connections.append(_make_connection(fail_queries=("SELECT 1",)))
+        return connections[-1]
+
+    queries = [(f"SELECT {i}", None) for i in range(1, 4)]
+    with patch("testgen.common.database.database_service._init_db_connection", side_effect=init_connection):
+        rows, _, errors = fetch_from_db_threaded(queries, max_threads=1)
+
+    assert list(errors) == [0]
+    assert len(rows) == 4
+    assert len(connections) == 2
+    assert connections[0].close.called
+
+
+def test_session_setup_runs_on_connect():
+    engine = create_engine("sqlite://")
+    flavor_service = MagicMock()
+    flavor_service.get_pre_connection_queries.return_value = [
+        ("PRAGMA foreign_keys = ON", None),
+        ("NOT VALID SQL", None),
+    ]
+
+    add_session_setup_listener(engine, flavor_service, MagicMock())
+
+    with engine.connect() as connection:
+        assert connection.execute(text("PRAGMA foreign_keys")).scalar() == 1
+    flavor_service.get_pre_connection_queries.assert_called_once()
+
+
+@pytest.fixture
+def engine_factory():
+    with patch("testgen.common.database.database_service._create_interactive_target_engine") as mock:
+        mock.side_effect = lambda _params: MagicMock()
+        yield mock
+
+
+def _use(cache: TargetEngineCache, connection_id: int, **params):
+    with cache.connect({"connection_id": connection_id, "sql_flavor": "postgresql", **params}):
+        pass
+
+
+def test_engine_cache_reuses_engine(engine_factory):
+    cache = TargetEngineCache()
+
+    _use(cache, 1)
+    _use(cache, 1)
+
+    assert engine_factory.call_count == 1
+    engine_factory.return_value.dispose.assert_not_called()
+
+
+def test_engine_cache_keys_on_params(engine_factory):
+    cache = TargetEngineCache()
+
+    _use(cache, 1, project_host="a")
+    _use(cache, 1, project_host="b")
+
+    assert engine_factory.call_count == 2
+
+
+def test_engine_cache_evicts_least_recently_used(engine_factory):
+    engines = []
+    engine_factory.side_effect = lambda _params: engines.append(MagicMock()) or engines[-1]
+    cache = TargetEngineCache()
+
+    with patch("testgen.settings.TARGET_ENGINE_CACHE_SIZE", 2):
+        _use(cache, 1)
+        _use(cache, 2)
+        _use(cache, 1)
+        _use(cache, 3)
+
+    assert not engines[0].dispose.called
+    assert engines[1].dispose.called
+    assert not engines[2].dispose.called
+
+
+def test_engine_cache_disposes_idle_engines(engine_factory):
+    engines = []
+    engine_factory.side_effect = lambda _params: engines.append(MagicMock()) or engines[-1]
+    cache = TargetEngineCache()
+
+    with (
+        patch("testgen.settings.TARGET_ENGINE_IDLE_TIMEOUT", 60),
+        patch("testgen.common.database.database_service.time.monotonic", side_effect=[0, 50, 100]),
+    ):
+        _use(cache, 1)
+        _use(cache, 2)
+        _use(cache, 2)
+
+    assert engines[0].dispose.called
+    assert not engines[1].dispose.called
+
+
+def test_engine_cache_invalidate(engine_factory):
+    engines = []
+    engine_factory.side_effect = lambda _params: engines.append(MagicMock()) or engines[-1]
+    cache = TargetEngineCache()
+
+    _use(cache, 1)
+    _use(cache, 2)
+    cache.invalidate(1)
+    _use(cache, 1)
+
+    assert engines[0].dispose.called
+    assert not engines[1].dispose.called
+    assert len(engines) == 3
+
+
+def test_engine_cache_disabled(engine_factory):
+    cache = TargetEngineCache()
+
+    with patch("testgen.settings.TARGET_ENGINE_CACHE_SIZE", 0):
+        _use(cache, 1)
+        _use(cache, 1)
+
+    assert engine_factory.call_count == 2
+
+
+TEMPLATE_PATH = Path(testgen.__file__).parent / "template"
+
+
+def _render_original(template: str, params: dict, conditions: dict | None = None, flavor: str | None = None) -> str:
+    if conditions is not None:
+        template = process_conditionals(template, conditions)
+    query = _replace_params_in_order(template, params)
+    return replace_templated_functions(query, flavor) if flavor else query
+
+
+def _get_flavored_queries() -> list[tuple[str, str]]:
+    """Test type measures and lookup queries using templated functions, with their flavor."""
+    queries = []
+    for path in sorted(TEMPLATE_PATH.glob("dbsetup_*/*.yaml")):
+        for definitions in yaml.safe_load(path.read_text(encoding="utf-8")).values():
+            for key in ("cat_test_conditions", "target_data_lookups"):
+                for definition in definitions.get(key) or []:
+                    queries.extend(
+                        (definition["sql_flavor"], query)
+                        for query in (definition.get("measure"), definition.get("lookup_query"))
+                        if query and "<%" in query
+                    )
+    return queries
+
+
+@pytest.mark.parametrize(
+    "template_file",
+    sorted(
+        path for path in TEMPLATE_PATH.rglob("*.sql")
+        if TEMPLATE_SLOT_PATTERN.search(path.read_text(encoding="utf-8"))
+    ),
+    ids=lambda path: f"{path.parent.name}/{path.name}",
+)
+def test_compiled_template_matches_original(template_file):
+    template = template_file.read_text(encoding="utf-8").strip()
+    params = {name: f"value_{name.lower()}" for name in TEMPLATE_SLOT_PATTERN.findall(template)}
+    params["UNUSED"] = None
+    variables = {
+        match.group(2)
+        for line in template.splitlines()
+        if (match := TEMPLATE_CONDITIONAL_PATTERN.match(line)) and match.group(2)
+    }
+
+    compiled = compile_template(template)
+
+    assert compiled.render(params) == _render_original(template, params)
+    for value in (True, False):
+        conditions = dict.fromkeys(variables, value)
+        assert compiled.render(params, conditions=conditions) == _render_original(template, params, conditions)
+
+    if "flavors" in template_file.parts:
+        flavor = template_file.parts[template_file.parts.index("flavors") + 1]
+        conditions = dict.fromkeys(variables, True)
+        expected = _render_original(template, params, conditions, flavor)
+        assert compiled.render(params, conditions=conditions, flavor=flavor) == expected
+
+
+@pytest.mark.parametrize("flavor, template", _get_flavored_queries())
+def test_compiled_template_functions_match_original(flavor, template):
+    params = {name: f"value_{name.lower()}" for name in TEMPLATE_SLOT_PATTERN.findall(template)}
+
+    with patch(
+        "testgen.common.database.database_service.replace_templated_functions",
+        side_effect=replace_templated_functions,
+    ) as replace_mock:
+        assert compile_template(template).render(params, flavor=flavor) == _render_original(template, params, flavor=flavor)
+    # Rendered in a single pass
+    replace_mock.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "template, params",
+    [
+        # Values with semicolons are split into more arguments
+        ("<%DATEDIFF_DAY;{A};{B}%>", {"A": "x;y", "B": "z"}),
+        # Empty arguments are not matched as a call, which then extends to the next one
+        ("<%DATEDIFF_DAY;{A}%> AND <%DATEDIFF_DAY;c;d%>", {"A": ""}),
+        # Arguments are not matched across lines
+        ("<%DATEDIFF_DAY;{A};b%>", {"A": "x\ny"}),
+        # Values forming the call delimiters, alone or with the surrounding text
+        ("<%DATEDIFF_DAY;{A};b%>", {"A": "a;c%>"}),
+        ("<{A}DATEDIFF_DAY;a;b%>", {"A": "%"}),
+        ("<%DATEDIFF_DAY;a;b{A}", {"A": "%>"}),
+        ("SELECT {A}", {"A": "<%DATEDIFF_DAY;a;b%>"}),
+        # Function names that are parameters
+        ("<%{F};a;b%>", {"F": "DATEDIFF_DAY"}),
+        # Values substituted again by the parameters after them
+        ("<%DATEDIFF_DAY;{A};{B}%>", {"A": "{B}", "B": "b"}),
+    ],
+)
+def test_compiled_template_functions_edge_cases(template, params):
+    expected = _render_original(template, params, flavor="postgresql")
+    assert compile_template(template).render(params, flavor="postgresql") == expected
+
+
+def test_compiled_template_function_missing_arguments():
+    with pytest.raises(ValueError, match="Templated function call missing required arguments: <%DATEDIFF_DAY;x%>"):
+        compile_template("SELECT <%DATEDIFF_DAY;{A}%>").render({"A": "x"}, flavor="postgresql")
+
+
+@pytest.mark.parametrize(
+    "template, params",
+    [
+        # Values are substituted again by the parameters after them
+        ("SELECT {A} FROM {B}", {"A": "{B}", "B": "table"}),
+        ("SELECT {A} FROM {B}", {"B": "{A}", "A": "column"}),
+        # Substituted values joined with the surrounding braces
+        ("SELECT '{{A}}'", {"A": "B", "B": "column"}),
+        ("SELECT '{x{A}{A}}'", {"A": "B", "xBB": "column"}),
+        # Regex quantifiers are not parameters
+        ("WHERE {COL} ~ '[0-9]{1,5}' AND x{2}", {"COL": "c", "2": "two"}),
+        # Parameter names that are not word characters
+        ("SELECT {A-B}", {"A-B": 1}),
+        ("SELECT {A}, {NONE}, {MISSING}", {"A": 1.5, "NONE": None}),
+    ],
+)
+def test_compiled_template_edge_cases(template, params):
+    assert compile_template(template).render(params) == _replace_params_in_order(template, params)
+
+
+def test_compiled_template_conditionals():
+    template = "SELECT 1\n-- TG-IF flag\n, {A}\n-- TG-ELSE\n, {B}\n-- TG-ENDIF\nFROM t"
+    compiled = compile_template(template)
+
+    for flag in (True, False, None):
+        conditions = {"flag": flag}
+        expected = _render_original(template, {"A": "a", "B": "b"}, conditions)
+        assert compiled.render({"A": "a", "B": "b"}, conditions=conditions) == expected
+    assert compiled.render({"A": "a"}) == template.replace("{A}", "a")
+
+
+
+def test_apply_params_matches_compiled_template():
+    template = "SELECT {A}\n-- TG-IF flag\n, {B}\n-- TG-ENDIF\nFROM {C}"
+
+    for flag in (True, False):
+        params = {"A": "a", "B": "{C}", "C": "t", "flag": flag}
+        assert apply_params(template, params) == compile_template(template).render(params, conditions=params)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "-- TG-IF a\nx\n-- TG-IF b\ny\n-- TG-ENDIF\n-- TG-ENDIF",
+        "-- TG-ELSE\nx",
+        "-- TG-IF a\nx",
+        "-- TG-IF\nx\n-- TG-ENDIF",
+    ],
+)
+def test_compiled_template_conditional_misuse(template):
+    with pytest.raises(ValueError, match="Template conditional misused"):
+        compile_template(template).render({}, conditions={})
+
+
+def test_compile_template_file_is_cached_by_path():
+    with patch("testgen.common.database.database_service.read_template_sql_file", return_value="SELECT {A}") as read_mock:
+        compile_template_file.cache_clear()
+        try:
+            compiled = compile_template_file("query.sql", "profiling")
+
+            assert compile_template_file("query.sql", "profiling") is compiled
+            assert compile_template_file("query.sql", "execution") is not compiled
+            assert read_mock.call_count == 2
+        finally:
+            compile_template_file.cache_clear()
+
+
+def test_compile_template_cache_is_bounded():
+    template = "SELECT {A} FROM {B}"
+
+    assert compile_template(template) is compile_template(template)
+    assert compile_template.cache_info().maxsize is not None
@@ -0,0 +1,40 @@
+import re
+from unittest.mock import patch
+
+import pytest
+
+from testgen.common.monitor_snapshot_service import (
+    SNAPSHOT_COLUMNS,
+    has_monitor_table_snapshots,
+    refresh_monitor_table_snapshots,
+)
+
+pytestmark = pytest.mark.unit
+
+MODULE = "testgen.common.monitor_snapshot_service"
+TEST_SUITE_ID = "2b9c0d1e-7a3f-4c55-9d5e-0c1f2a3b4c5d"
+
+
+@patch(f"{MODULE}.get_current_session")
+def test_refresh_replaces_snapshots_of_suite(mock_session):
+    refresh_monitor_table_snapshots(TEST_SUITE_ID)
+
+    session = mock_session.return_value
+    statement, params = session.execute.call_args.args
+    query = statement.text
+    assert params == {"test_suite_id": TEST_SUITE_ID}
+    assert set(statement._bindparams) == {"test_suite_id"}
+    assert "DELETE FROM monitor_table_snapshots" in query
+    session.commit.assert_called_once()
+
+    insert_columns = re.search(r"INSERT INTO monitor_table_snapshots \(([^)]*)\)", query).group(1).split(", ")
+    select_list = query[query.rindex("SELECT"):query.rindex("FROM monitor_tables")]
+    assert insert_columns == ["test_suite_id", "table_groups_id", "table_name", *SNAPSHOT_COLUMNS]
+    assert select_list.count(",") == len(insert_columns) - 1
+
+
+@patch(f"{MODULE}.get_current_session")
+def test_has_monitor_table_snapshots(mock_session):
+    mock_session.return_value.execute.return_value.scalar.return_value = False
+
+    assert has_monitor_table_snapshots(TEST_SUITE_ID) is False
@@ -3,11 +3,13 @@ from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
+from sqlalchemy.exc import DatabaseError, OperationalError, ProgrammingError
 
 from testgen.common.pii_masking import PII_REDACTED
 from testgen.common.source_data_service import (
     LookupData,
     SourceDataResult,
+    _build_limited_query,
     _build_query_custom,
     _build_query_standard,
     _generate_recency_lookup_query,
@@ -117,11 +119,9 @@ class Test_build_test_result_query:
 # ---------------------------------------------------------------------------
 
 class Test_build_query_standard:
-    @patch(f"{MODULE}.replace_templated_functions", side_effect=lambda q, _f: q)
-    @patch(f"{MODULE}.replace_params", side_effect=lambda q, _p: q)
     @patch(f"{MODULE}.TestDefinition.get", return_value=_FakeTestDefinition())
     @patch(f"{MODULE}._get_lookup_data")
-    def test_returns_query_when_lookup_and_td_exist(self, mock_lookup, mock_td, _mock_replace, _mock_templated):
+    def test_returns_query_when_lookup_and_td_exist(self, mock_lookup, mock_td):
         mock_lookup.return_value = LookupData(
             lookup_query="SELECT {COLUMN_NAME} FROM {TABLE_NAME}",
             sql_flavor="postgresql",
@@ -141,27 +141,25 @@ class Test_build_query_standard:
         _mock_lookup.return_value = LookupData(lookup_query="SELECT 1", sql_flavor="postgresql")
         assert _build_query_standard(_standard_issue_data(), limit=500) is None
 
-    @patch(f"{MODULE}.replace_templated_functions", side_effect=lambda q, _f: q)
-    @patch(f"{MODULE}.replace_params")
+    @patch(f"{MODULE}.compile_template")
     @patch(f"{MODULE}.TestDefinition.get")
     @patch(f"{MODULE}._get_lookup_data")
-    def test_tolerance_null_handling(self, mock_lookup, mock_td, mock_replace, _mock_templated):
+    def test_tolerance_null_handling(self, mock_lookup, mock_td, mock_compile):
         mock_lookup.return_value = LookupData(lookup_query="SELECT 1", sql_flavor="postgresql")
         mock_td.return_value = _FakeTestDefinition(lower_tolerance=None, upper_tolerance="")
         _build_query_standard(_standard_issue_data(), limit=500)
-        params = mock_replace.call_args[0][1]
+        params = mock_compile.return_value.render.call_args[0][0]
         assert params["LOWER_TOLERANCE"] == "NULL"
         assert params["UPPER_TOLERANCE"] == "NULL"
 
-    @patch(f"{MODULE}.replace_templated_functions", side_effect=lambda q, _f: q)
-    @patch(f"{MODULE}.replace_params")
+    @patch(f"{MODULE}.compile_template")
     @patch(f"{MODULE}.TestDefinition.get")
     @patch(f"{MODULE}._get_lookup_data")
-    def test_subset_condition_defaults(self, mock_lookup, mock_td, mock_replace, _mock_templated):
+    def test_subset_condition_defaults(self, mock_lookup, mock_td, mock_compile):
         mock_lookup.return_value = LookupData(lookup_query="SELECT 1", sql_flavor="postgresql")
         mock_td.return_value = _FakeTestDefinition(subset_condition=None)
         _build_query_standard(_standard_issue_data(), limit=500)
-        params = mock_replace.call_args[0][1]
+        params = mock_compile.return_value.render.call_args[0][0]
         assert params["SUBSET_CONDITION"] == "1=1"
         assert params["MATCH_SUBSET_CONDITION"] == "1=1"
 
@@ -294,6 +292,7 @@ class Test_fetch_test_result_source_data:
     def test_masks_redactable_columns_for_custom(
         self, _mock_td, _mock_build, _mock_conn, mock_fetch, mock_mask, mock_custom_lookup, mock_mask_pii,
     ):
+        _mock_conn.return_value.sql_flavor = "postgresql"
         mock_fetch.return_value = _MOCK_ROWS
         mock_custom_lookup.return_value = LookupData(
             lookup_query="SELECT 1", lookup_redactable_columns="ssn, email",
@@ -304,6 +303,67 @@ class Test_fetch_test_result_source_data:
         redactable = mock_mask_pii.call_args[0][1]
         assert redactable == {"ssn", "email"}
 
+    @patch(f"{MODULE}.fetch_from_target_db")
+    @patch(f"{MODULE}.Connection.get_by_table_group")
+    @patch(f"{MODULE}._build_query_custom", return_value="SELECT * FROM demo.orders WHERE amount < 0;")
+    @patch(f"{MODULE}.TestDefinition.get", return_value=_FakeTestDefinition())
+    def test_pushes_limit_down_for_custom(self, _mock_td, _mock_build, mock_conn, mock_fetch):
+        mock_conn.return_value.sql_flavor = "postgresql"
+        mock_fetch.return_value = _MOCK_ROWS
+        result = fetch_test_result_source_data(_custom_issue_data(), limit=100)
+        assert result.status == "OK"
+        assert result.query == "SELECT * FROM demo.orders WHERE amount < 0;"
+        mock_fetch.assert_called_once()
+        query = mock_fetch.call_args.args[1]
+        assert query.startswith("SELECT * FROM (\nSELECT * FROM demo.orders WHERE amount < 0\n) AS lookup LIMIT 100")
+        assert mock_fetch.call_args.kwargs["limit"] == 100
+
+    @patch(f"{MODULE}.fetch_from_target_db")
+    @patch(f"{MODULE}.Connection.get_by_table_group")
+    @patch(f"{MODULE}._build_query_custom", return_value="WITH t AS (SELECT 1 AS a) SELECT * FROM t")
+    @patch(f"{MODULE}.TestDefinition.get", return_value=_FakeTestDefinition())
+    def test_custom_falls_back_to_unwrapped_query(self, _mock_td, _mock_build, mock_conn, mock_fetch):
+        mock_conn.return_value.sql_flavor = "mssql"
+        syntax_error = ProgrammingError("SELECT", None, Exception("Incorrect syntax near the keyword 'WITH'"))
+        mock_fetch.side_effect = [syntax_error, _MOCK_ROWS]
+        result = fetch_test_result_source_data(_custom_issue_data(), limit=100)
+        assert result.status == "OK"
+        assert mock_fetch.call_args_list[0].args[1].startswith("SELECT TOP 100 * FROM (")
+        assert mock_fetch.call_args_list[1].args[1] == "WITH t AS (SELECT 1 AS a) SELECT * FROM t"
+        assert mock_fetch.call_args_list[1].kwargs["limit"] == 100
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            OperationalError("SELECT", None, Exception("canceling statement due to statement timeout")),
+            ProgrammingError("SELECT", None, MagicMock(pgcode="42501")),
+            DatabaseError("SELECT", None, Exception("server closed the connection"), connection_invalidated=True),
+            TimeoutError("timed out"),
+        ],
+    )
+    @patch(f"{MODULE}.fetch_from_target_db")
+    @patch(f"{MODULE}.Connection.get_by_table_group")
+    @patch(f"{MODULE}._build_query_custom", return_value="SELECT * FROM demo.orders")
+    @patch(f"{MODULE}.TestDefinition.get", return_value=_FakeTestDefinition())
+    def test_custom_does_not_fall_back_on_run_errors(self, _mock_td, _mock_build, mock_conn, mock_fetch, error):
+        mock_conn.return_value.sql_flavor = "postgresql"
+        mock_fetch.side_effect = [error, _MOCK_ROWS]
+        result = fetch_test_result_source_data(_custom_issue_data(), limit=100)
+        assert result.status == "ERR"
+        mock_fetch.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "sql_flavor, expected",
+    [
+        ("postgresql", "SELECT * FROM (\nSELECT a FROM t -- note\n) AS lookup LIMIT 10"),
+        ("mssql", "SELECT TOP 10 * FROM (\nSELECT a FROM t -- note\n) AS lookup"),
+        ("oracle", "SELECT * FROM (\nSELECT a FROM t -- note\n) lookup FETCH FIRST 10 ROWS ONLY"),
+    ],
+)
+def test_build_limited_query(sql_flavor, expected):
+    assert _build_limited_query("  SELECT a FROM t -- note\n", sql_flavor, 10) == expected
+
 
 # ---------------------------------------------------------------------------
 # fetch_hygiene_source_data
@@ -410,9 +470,8 @@ class Test_mask_lookup_pii:
 # ---------------------------------------------------------------------------
 
 class Test_build_hygiene_query:
-    @patch(f"{MODULE}.replace_templated_functions", side_effect=lambda q, _f: q)
     @patch(f"{MODULE}._get_lookup_data")
-    def test_returns_parameterized_query(self, mock_lookup, _mock_templated):
+    def test_returns_parameterized_query(self, mock_lookup):
         mock_lookup.return_value = LookupData(
             lookup_query="SELECT {COLUMN_NAME} FROM {TARGET_SCHEMA}.{TABLE_NAME} LIMIT {LIMIT}",
             sql_flavor="postgresql",
@@ -427,10 +486,9 @@ class Test_build_hygiene_query:
     def test_returns_none_when_no_lookup(self, _mock_lookup):
         assert build_hygiene_query(_hygiene_issue_data()) is None
 
-    @patch(f"{MODULE}.replace_templated_functions", side_effect=lambda q, _f: q)
     @patch(f"{MODULE}._generate_recency_lookup_query", return_value="SELECT recency")
     @patch(f"{MODULE}._get_lookup_data")
-    def test_uses_generated_query_for_created_in_ui(self, mock_lookup, mock_recency, _mock_templated):
+    def test_uses_generated_query_for_created_in_ui(self, mock_lookup, mock_recency):
         mock_lookup.return_value = LookupData(lookup_query="created_in_ui", sql_flavor="postgresql")
         result = build_hygiene_query(_hygiene_issue_data(anomaly_id="1019"))
         assert result is not None
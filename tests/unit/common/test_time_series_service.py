@@ -15,7 +15,12 @@ from testgen.common.freshness_service import (
     next_business_day_start,
 )
 from testgen.common.models.test_suite import PredictSensitivity
-from testgen.common.time_series_service import NotEnoughData, get_sarimax_forecast
+from testgen.common.time_series_service import (
+    NotEnoughData,
+    SarimaxModelState,
+    get_sarimax_forecast,
+    get_sarimax_forecast_with_state,
+)
 
 from .conftest import _make_freshness_history
 
@@ -634,3 +639,86 @@ class Test_GetSarimaxForecast_TimezoneExog:
         forecast_with_tz = get_sarimax_forecast(history, num_forecast=3, exclude_weekends=False, tz="America/New_York")
 
         pd.testing.assert_frame_equal(forecast_no_tz, forecast_with_tz)
+
+
+class Test_GetSarimaxForecast_ModelState:
+    @staticmethod
+    def _make_history(n_days: int, outlier: float | None = None) -> pd.DataFrame:
+        dates = pd.date_range("2026-01-05", periods=n_days, freq="1D")
+        values = 100 + np.cumsum(np.random.default_rng(7).normal(0, 3, n_days))
+        if outlier is not None:
+            values[-1] += outlier
+        return pd.DataFrame({"result_signal": values}, index=dates)
+
+    def _fit_initial(self, **kwargs) -> SarimaxModelState:
+        _, state = get_sarimax_forecast_with_state(self._make_history(40), num_forecast=3, **kwargs)
+        assert state is not None
+        assert state.num_updates == 0
+        return state
+
+    def test_incremental_update_matches_filtering_full_history(self):
+        from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+        state = self._fit_initial()
+        history = self._make_history(43)
+
+        forecast, new_state = get_sarimax_forecast_with_state(
+            history, num_forecast=3, model_state=state, refit_interval=20,
+        )
+
+        assert new_state.num_updates == 3
+        assert new_state.params == state.params
+        assert new_state.last_index == history.index[-1].isoformat()
+
+        exog = pd.DataFrame({"is_excluded": 0}, index=history.index)
+        expected_model = SARIMAX(
+            history["result_signal"], exog=exog, order=(1, 1, 1),
+            enforce_stationarity=False, enforce_invertibility=False,
+        ).filter(np.array(state.params))
+        forecast_exog = pd.DataFrame({"is_excluded": 0}, index=forecast.index)
+        expected = expected_model.get_forecast(steps=3, exog=forecast_exog).predicted_mean
+        np.testing.assert_allclose(forecast["mean"].values, expected.values)
+
+    def test_refit_after_interval(self):
+        state = self._fit_initial()
+
+        _, new_state = get_sarimax_forecast_with_state(
+            self._make_history(43), num_forecast=3, model_state=state, refit_interval=2,
+        )
+
+        assert new_state.num_updates == 0
+
+    def test_refit_on_drift(self):
+        state = self._fit_initial()
+
+        _, new_state = get_sarimax_forecast_with_state(
+            self._make_history(41, outlier=500), num_forecast=3, model_state=state, refit_interval=20,
+        )
+
+        assert new_state.num_updates == 0
+
+    def test_refit_when_exog_settings_change(self):
+        state = self._fit_initial()
+
+        _, new_state = get_sarimax_forecast_with_state(
+            self._make_history(41), num_forecast=3, exclude_weekends=True, model_state=state, refit_interval=20,
+        )
+
+        assert new_state.num_updates == 0
+
+    def test_refit_when_history_does_not_match_state(self):
+        state = self._fit_initial()
+        state.last_value += 1
+
+        _, new_state = get_sarimax_forecast_with_state(
+            self._make_history(41), num_forecast=3, model_state=state, refit_interval=20,
+        )
+
+        assert new_state.num_updates == 0
+
+    def test_state_round_trip(self):
+        state = self._fit_initial()
+
+        assert SarimaxModelState.from_dict(state.to_json()) == state
+        assert SarimaxModelState.from_dict({"params": []}) is None
+        assert SarimaxModelState.from_dict(None) is None
@@ -712,6 +712,22 @@ def disposition_perms():
         yield perms
 
 
+@pytest.fixture
+def score_rollup_mock():
+    run_id, table_group_id = uuid4(), uuid4()
+    with (
+        patch("testgen.mcp.tools.hygiene_issues.get_current_session") as session_mock,
+        patch("testgen.mcp.tools.hygiene_issues.run_profile_rollup_scoring_queries") as mock,
+        patch("testgen.mcp.tools.hygiene_issues.notify_cache_invalidation") as notify_mock,
+    ):
+        mock.session = session_mock.return_value
+        mock.notify = notify_mock
+        mock.session.execute.return_value.one.return_value = (run_id, "demo", table_group_id, run_id)
+        mock.run_id = run_id
+        mock.table_group_id = table_group_id
+        yield mock
+
+
 def test_update_hygiene_issue_invalid_uuid(db_session_mock, disposition_perms):
     from testgen.mcp.tools.hygiene_issues import update_hygiene_issue
 
@@ -727,7 +743,7 @@ def test_update_hygiene_issue_invalid_disposition(db_session_mock, disposition_p
 
 
 @patch.object(HygieneIssue, "update_disposition")
-def test_update_hygiene_issue_muted_maps_to_inactive(mock_update, db_session_mock, disposition_perms):
+def test_update_hygiene_issue_muted_maps_to_inactive(mock_update, db_session_mock, disposition_perms, score_rollup_mock):
     from testgen.mcp.tools.hygiene_issues import update_hygiene_issue
 
     mock_update.return_value = True
@@ -738,7 +754,7 @@ def test_update_hygiene_issue_muted_maps_to_inactive(mock_update, db_session_moc
 
 
 @patch.object(HygieneIssue, "update_disposition")
-def test_update_hygiene_issue_returns_success_markdown(mock_update, db_session_mock, disposition_perms):
+def test_update_hygiene_issue_returns_success_markdown(mock_update, db_session_mock, disposition_perms, score_rollup_mock):
     from testgen.mcp.tools.hygiene_issues import update_hygiene_issue
 
     mock_update.return_value = True
@@ -763,7 +779,7 @@ def test_update_hygiene_issue_not_updated_collapses_to_not_accessible(
 
 @patch.object(HygieneIssue, "update_disposition")
 def test_update_hygiene_issue_passes_project_scope_clause(
-    mock_update, db_session_mock, disposition_perms,
+    mock_update, db_session_mock, disposition_perms, score_rollup_mock,
 ):
     from testgen.mcp.tools.hygiene_issues import update_hygiene_issue
 
@@ -776,6 +792,49 @@ def test_update_hygiene_issue_passes_project_scope_clause(
     assert "profile_anomaly_results.project_code IN" in sql
 
 
+@patch.object(HygieneIssue, "update_disposition")
+def test_update_hygiene_issue_rolls_up_profiling_scores(
+    mock_update, db_session_mock, disposition_perms, score_rollup_mock,
+):
+    from testgen.mcp.tools.hygiene_issues import update_hygiene_issue
+
+    mock_update.return_value = True
+    update_hygiene_issue(issue_id=str(uuid4()), disposition="Dismissed")
+
+    score_rollup_mock.session.commit.assert_called_once()
+    score_rollup_mock.assert_called_once_with(
+        "demo", str(score_rollup_mock.run_id), str(score_rollup_mock.table_group_id),
+    )
+    score_rollup_mock.notify.assert_called_once_with(f"profiling_run:{score_rollup_mock.run_id}")
+
+
+@patch.object(HygieneIssue, "update_disposition")
+def test_update_hygiene_issue_rolls_up_older_run_without_table_group(
+    mock_update, db_session_mock, disposition_perms, score_rollup_mock,
+):
+    from testgen.mcp.tools.hygiene_issues import update_hygiene_issue
+
+    mock_update.return_value = True
+    run_id, table_group_id = uuid4(), uuid4()
+    score_rollup_mock.session.execute.return_value.one.return_value = (run_id, "demo", table_group_id, uuid4())
+    update_hygiene_issue(issue_id=str(uuid4()), disposition="Confirmed")
+
+    score_rollup_mock.assert_called_once_with("demo", str(run_id), None)
+
+
+@patch.object(HygieneIssue, "update_disposition")
+def test_update_hygiene_issue_not_updated_skips_rollup(
+    mock_update, db_session_mock, disposition_perms, score_rollup_mock,
+):
+    from testgen.mcp.tools.hygiene_issues import update_hygiene_issue
+
+    mock_update.return_value = False
+    with pytest.raises(MCPResourceNotAccessible):
+        update_hygiene_issue(issue_id=str(uuid4()), disposition="Confirmed")
+
+    score_rollup_mock.assert_not_called()
+
+
 def test_update_hygiene_issue_uses_disposition_permission():
     """Pin the permission name. Silent downgrade to 'view' would be a write-side leak."""
     import testgen.mcp.tools.hygiene_issues as mod
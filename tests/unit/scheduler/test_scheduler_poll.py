@@ -148,13 +148,12 @@ def test_proc_wrapper_exception(scheduler_instance, job_exec, mock_session):
 def test_poll_loop_claims_and_dispatches(scheduler_instance, job_exec, mock_session):
     call_count = 0
 
-    def stopping_side_effect(timeout):
+    def stopping_side_effect():
         nonlocal call_count
         call_count += 1
         return call_count > 1
 
-    scheduler_instance._stopping = Mock()
-    scheduler_instance._stopping.wait.side_effect = stopping_side_effect
+    scheduler_instance._wait_for_jobs = Mock(side_effect=stopping_side_effect)
 
     with (
         patch.object(JobExecution, "claim_actionable", return_value=[job_exec]) as claim_mock,
@@ -169,13 +168,12 @@ def test_poll_loop_claims_and_dispatches(scheduler_instance, job_exec, mock_sess
 def test_poll_loop_handles_claim_error(scheduler_instance, mock_session):
     call_count = 0
 
-    def stopping_side_effect(timeout):
+    def stopping_side_effect():
         nonlocal call_count
         call_count += 1
         return call_count > 1
 
-    scheduler_instance._stopping = Mock()
-    scheduler_instance._stopping.wait.side_effect = stopping_side_effect
+    scheduler_instance._wait_for_jobs = Mock(side_effect=stopping_side_effect)
 
     with patch.object(JobExecution, "claim_actionable", side_effect=RuntimeError("db down")):
         scheduler_instance._poll_loop()
@@ -190,7 +188,7 @@ def test_poll_loop_skips_wait_when_batch_full(scheduler_instance, mock_session):
     # Track the interleaving of waits and claims
     call_log = []
 
-    def stopping_side_effect(timeout):
+    def stopping_side_effect():
         call_log.append("wait")
         # Stop after we've seen both claims
         return len([c for c in call_log if c == "claim"]) >= 2
@@ -201,8 +199,7 @@ def test_poll_loop_skips_wait_when_batch_full(scheduler_instance, mock_session):
             return full_batch
         return partial_batch
 
-    scheduler_instance._stopping = Mock()
-    scheduler_instance._stopping.wait.side_effect = stopping_side_effect
+    scheduler_instance._wait_for_jobs = Mock(side_effect=stopping_side_effect)
 
     with (
         patch.object(JobExecution, "claim_actionable", side_effect=claim_side_effect),
@@ -228,13 +225,12 @@ def test_poll_loop_routes_cancel_requested(scheduler_instance, mock_session):
 
     call_count = 0
 
-    def stopping_side_effect(timeout):
+    def stopping_side_effect():
         nonlocal call_count
         call_count += 1
         return call_count > 1
 
-    scheduler_instance._stopping = Mock()
-    scheduler_instance._stopping.wait.side_effect = stopping_side_effect
+    scheduler_instance._wait_for_jobs = Mock(side_effect=stopping_side_effect)
 
     with (
         patch.object(JobExecution, "claim_actionable", return_value=[cancel_job]),
@@ -271,3 +267,60 @@ def test_start_job_submits_execution(scheduler_instance, mock_session):
     assert added.source == "scheduler"
     assert added.job_schedule_id == schedule_id
     mock_session.commit.assert_called_once()
+
+
+def test_wait_for_jobs_returns_on_notification(scheduler_instance):
+    scheduler_instance._poll_interval = 60
+    scheduler_instance._jobs_notified.set()
+
+    assert scheduler_instance._wait_for_jobs() is False
+    assert not scheduler_instance._jobs_notified.is_set()
+
+
+def test_wait_for_jobs_returns_on_shutdown(scheduler_instance):
+    scheduler_instance._poll_interval = 60
+    scheduler_instance.shutdown()
+
+    assert scheduler_instance._wait_for_jobs() is True
+
+
+def test_listen_loop_wakes_poll_loop_on_actionable_notifications(scheduler_instance):
+    notifications = iter([
+        [(uuid4(), JobStatus.RUNNING)],
+        [(uuid4(), JobStatus.PENDING)],
+    ])
+    wakeups = []
+
+    def wait_side_effect(timeout):
+        wakeups.append(scheduler_instance._jobs_notified.is_set())
+        scheduler_instance._jobs_notified.clear()
+        try:
+            return next(notifications)
+        except StopIteration:
+            scheduler_instance._stopping.set()
+            return []
+
+    with patch(f"{SCHEDULER_MODULE}.JobExecutionListener") as listener_cls:
+        listener = listener_cls.return_value
+        listener.listen.side_effect = [True, False, False]
+        listener.wait.side_effect = wait_side_effect
+        scheduler_instance._listen_loop()
+
+    # Woken up when listening starts, then only by the pending job
+    assert wakeups == [True, False, True]
+    listener.close.assert_called_once()
+
+
+def test_listen_loop_polls_when_notifications_unavailable(scheduler_instance):
+    def stopping_side_effect(timeout):
+        scheduler_instance._stopping.set()
+
+    with (
+        patch(f"{SCHEDULER_MODULE}.JobExecutionListener") as listener_cls,
+        patch.object(scheduler_instance._stopping, "wait", side_effect=stopping_side_effect) as stopping_wait_mock,
+    ):
+        listener_cls.return_value.listen.side_effect = RuntimeError("db down")
+        scheduler_instance._listen_loop()
+
+    stopping_wait_mock.assert_called_once()
+    assert scheduler_instance._jobs_notified.is_set()
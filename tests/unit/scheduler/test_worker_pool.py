@@ -0,0 +1,219 @@
+import multiprocessing
+import threading
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from testgen.common.caching import cache_data
+from testgen.scheduler.cli_scheduler import CliScheduler
+from testgen.scheduler.worker_pool import WorkerPool, _serve_jobs
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def serve_jobs():
+    connection, child_connection = multiprocessing.Pipe()
+
+    def start(max_jobs=0, max_memory_mb=0):
+        thread = threading.Thread(target=_serve_jobs, args=(child_connection, max_jobs, max_memory_mb))
+        thread.start()
+        return thread
+
+    yield connection, start
+    connection.close()
+
+
+@pytest.fixture
+def exec_job_mock():
+    with patch("testgen.commands.exec_job.exec_job") as mock:
+        yield mock
+
+
+@pytest.fixture
+def worker_mock():
+    with patch("testgen.scheduler.worker_pool._Worker") as mock:
+        mock.side_effect = lambda *_: MagicMock(wait_result=MagicMock(return_value=(0, True)))
+        yield mock
+
+
+def test_serve_jobs_runs_jobs_until_unrecoverable_error(serve_jobs, exec_job_mock):
+    connection, start = serve_jobs
+    exec_job_mock.side_effect = [None, SystemExit(1)]
+    thread = start()
+
+    connection.send("job-1")
+    assert connection.recv() == (0, True)
+    connection.send("job-2")
+    assert connection.recv() == (1, False)
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert [call.args for call in exec_job_mock.call_args_list] == [("job-1",), ("job-2",)]
+
+
+def test_serve_jobs_retires_after_max_jobs(serve_jobs, exec_job_mock):
+    connection, start = serve_jobs
+    thread = start(max_jobs=2)
+
+    connection.send("job-1")
+    assert connection.recv() == (0, True)
+    connection.send("job-2")
+    assert connection.recv() == (0, False)
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_serve_jobs_retires_on_memory_growth(serve_jobs, exec_job_mock):
+    connection, start = serve_jobs
+    with patch("testgen.scheduler.worker_pool.psutil.Process") as process_mock:
+        process_mock.return_value.memory_info.return_value.rss = 2048 * 1024 * 1024
+        thread = start(max_memory_mb=1024)
+
+        connection.send("job-1")
+        assert connection.recv() == (0, False)
+
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_serve_jobs_stops_on_request(serve_jobs, exec_job_mock):
+    connection, start = serve_jobs
+    thread = start()
+
+    connection.send(None)
+
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    exec_job_mock.assert_not_called()
+
+
+def test_serve_jobs_clears_cached_lookups_between_jobs(serve_jobs, exec_job_mock):
+    connection, start = serve_jobs
+    stored_names = {"table_group": "before"}
+
+    @cache_data(show_spinner=False)
+    def get_name(key):
+        return stored_names[key]
+
+    seen_names = []
+    exec_job_mock.side_effect = lambda _: seen_names.append(get_name("table_group"))
+    thread = start()
+
+    connection.send("job-1")
+    assert connection.recv() == (0, True)
+    stored_names["table_group"] = "after"
+    connection.send("job-2")
+    assert connection.recv() == (0, True)
+    connection.send(None)
+
+    thread.join(timeout=5)
+    assert seen_names == ["before", "after"]
+
+
+def test_serve_jobs_drains_notifications_before_exiting(serve_jobs, exec_job_mock):
+    connection, start = serve_jobs
+    with patch("testgen.common.notifications.dispatcher.notification_dispatcher") as dispatcher_mock:
+        thread = start(max_jobs=1)
+
+        connection.send("job-1")
+        assert connection.recv() == (0, False)
+
+        thread.join(timeout=5)
+    assert not thread.is_alive()
+    dispatcher_mock.drain_before_exit.assert_called_once()
+
+
+def test_pool_reuses_idle_workers(worker_mock):
+    pool = WorkerPool(size=1, max_jobs=0, max_memory_mb=0)
+    assert worker_mock.call_count == 1
+
+    job_exec_id = uuid4()
+    job = pool.submit(job_exec_id)
+    worker = job._worker
+    worker.run.assert_called_once_with(job_exec_id)
+    assert job.wait() == 0
+
+    assert pool.submit(uuid4())._worker is worker
+    assert worker_mock.call_count == 1
+
+
+def test_pool_starts_extra_workers_when_busy(worker_mock):
+    pool = WorkerPool(size=1, max_jobs=0, max_memory_mb=0)
+
+    first_job = pool.submit(uuid4())
+    second_job = pool.submit(uuid4())
+    assert worker_mock.call_count == 2
+    assert first_job._worker is not second_job._worker
+
+    first_job.wait()
+    second_job.wait()
+
+    # Only the workers that fit in the pool are kept
+    second_job._worker.stop.assert_called_once()
+    first_job._worker.stop.assert_not_called()
+
+
+def test_pool_replaces_retired_workers(worker_mock):
+    pool = WorkerPool(size=1, max_jobs=0, max_memory_mb=0)
+
+    job = pool.submit(uuid4())
+    job._worker.wait_result.return_value = (1, False)
+    assert job.wait() == 1
+
+    job._worker.stop.assert_called_once()
+    assert worker_mock.call_count == 2
+    assert pool.submit(uuid4())._worker is not job._worker
+
+
+def test_terminated_job_worker_is_not_reused(worker_mock):
+    pool = WorkerPool(size=1, max_jobs=0, max_memory_mb=0)
+
+    job = pool.submit(uuid4())
+    job.terminate()
+    job._worker.terminate.assert_called_once()
+    job._worker.wait_result.return_value = (-15, False)
+    assert job.wait() == -15
+
+    job._worker.stop.assert_called_once()
+    # The job is finished, terminating it again must not affect the worker's next job
+    job.terminate()
+    job.send_signal(2)
+    job._worker.terminate.assert_called_once()
+    job._worker.send_signal.assert_not_called()
+
+
+def test_close_stops_idle_workers(worker_mock):
+    pool = WorkerPool(size=2, max_jobs=0, max_memory_mb=0)
+    job = pool.submit(uuid4())
+    idle_worker = pool._idle[0]
+
+    pool.close()
+    idle_worker.stop.assert_called_once()
+    job._worker.stop.assert_not_called()
+
+    job.wait()
+    job._worker.stop.assert_called_once()
+    assert worker_mock.call_count == 2
+
+
+@patch("testgen.scheduler.cli_scheduler.settings.JOB_WORKER_POOL_SIZE", 2)
+def test_dispatch_uses_worker_pool():
+    with (
+        patch("testgen.scheduler.cli_scheduler.threading.Timer"),
+        patch("testgen.scheduler.cli_scheduler.WorkerPool") as pool_mock,
+        patch("testgen.scheduler.cli_scheduler.subprocess.Popen") as popen_mock,
+        patch("testgen.scheduler.cli_scheduler.threading.Thread") as thread_mock,
+        patch.dict("testgen.scheduler.cli_scheduler.JOB_DISPATCH", {"test-job": MagicMock()}),
+    ):
+        scheduler = CliScheduler()
+        job_exec = MagicMock(job_key="test-job")
+
+        scheduler._dispatch(job_exec)
+
+    assert pool_mock.call_args.kwargs["size"] == 2
+    pool_mock.return_value.submit.assert_called_once_with(job_exec.id)
+    popen_mock.assert_not_called()
+    assert thread_mock.call_args.kwargs["args"] == (pool_mock.return_value.submit.return_value, job_exec)
@@ -0,0 +1,121 @@
+import contextlib
+import io
+import threading
+from unittest.mock import patch
+from zipfile import ZipFile
+
+import pytest
+
+from testgen.ui.pdf import bulk_report
+from testgen.ui.pdf.bulk_report import IssueReport, render_report, zip_issue_reports
+from testgen.ui.pdf.style import report_timezone
+
+pytestmark = pytest.mark.unit
+
+MODULE = "testgen.ui.pdf.bulk_report"
+
+
+def _reports(count: int) -> list[IssueReport]:
+    return [
+        IssueReport(f"report_{index}.pdf", "hygiene" if index % 2 else "test", {"id": str(index)}, mask_pii=True)
+        for index in range(count)
+    ]
+
+
+def _fetch_report_data(issue_data, mask_pii=False):
+    return {"sample_data_tuple": ("NA", f"lookup {issue_data['id']}", None, None)}
+
+
+def _create_report(filename, issue_data, mask_pii=False, **report_data):
+    with open(filename, "w") as file:
+        file.write(f"{issue_data['id']}|{mask_pii}|{report_data['sample_data_tuple'][1]}|{report_timezone.get()}")
+
+
+@pytest.fixture
+def report_modules():
+    with (
+        patch(f"{MODULE}.database_session", contextlib.nullcontext),
+        patch(f"{MODULE}.settings.ISSUE_REPORT_MAX_WORKERS", 1),
+        patch(f"{MODULE}.st.session_state", {"browser_timezone": "America/New_York"}),
+        patch("testgen.ui.pdf.hygiene_issue_report.fetch_report_data", side_effect=_fetch_report_data) as hygiene_fetch,
+        patch("testgen.ui.pdf.test_result_report.fetch_report_data", side_effect=_fetch_report_data) as test_fetch,
+        patch("testgen.ui.pdf.hygiene_issue_report.create_report", side_effect=_create_report),
+        patch("testgen.ui.pdf.test_result_report.create_report", side_effect=_create_report),
+    ):
+        yield hygiene_fetch, test_fetch
+
+
+def test_zip_issue_reports_contains_every_report(report_modules):
+    hygiene_fetch, test_fetch = report_modules
+    reports = _reports(5)
+
+    file_name, file_type, content = zip_issue_reports(lambda _: None, "reports.zip", reports)
+
+    assert (file_name, file_type) == ("reports.zip", "application/zip")
+    with ZipFile(io.BytesIO(content)) as zip_file:
+        assert sorted(zip_file.namelist()) == [report.file_name for report in reports]
+        assert zip_file.read("report_3.pdf").decode() == "3|True|lookup 3|America/New_York"
+    assert hygiene_fetch.call_count == 2
+    assert test_fetch.call_count == 3
+
+
+def test_zip_issue_reports_reports_progress_per_file(report_modules):
+    updates = []
+
+    zip_issue_reports(updates.append, "reports.zip", _reports(4))
+
+    assert len(updates) == 8
+    assert updates == sorted(updates)
+    assert updates[-1] == pytest.approx(1.0)
+
+
+def test_zip_issue_reports_prefetches_concurrently(report_modules):
+    hygiene_fetch, test_fetch = report_modules
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _fetch(issue_data, mask_pii=False):
+        barrier.wait()
+        return _fetch_report_data(issue_data, mask_pii)
+
+    hygiene_fetch.side_effect = test_fetch.side_effect = _fetch
+    with patch(f"{MODULE}.settings.PROJECT_CONNECTION_MAX_THREADS", 2):
+        _, _, content = zip_issue_reports(lambda _: None, "reports.zip", _reports(2))
+
+    with ZipFile(io.BytesIO(content)) as zip_file:
+        assert len(zip_file.namelist()) == 2
+
+
+def test_zip_issue_reports_raises_render_errors(report_modules):
+    with (
+        patch("testgen.ui.pdf.test_result_report.create_report", side_effect=ValueError("boom")),
+        pytest.raises(ValueError, match="boom"),
+    ):
+        zip_issue_reports(lambda _: None, "reports.zip", _reports(3))
+
+
+def test_render_report_restores_timezone(tmp_path):
+    with patch("testgen.ui.pdf.hygiene_issue_report.create_report", side_effect=_create_report):
+        render_report(
+            IssueReport("report.pdf", "hygiene", {"id": "1"}),
+            str(tmp_path / "report.pdf"),
+            _fetch_report_data({"id": "1"}),
+            "Europe/Paris",
+        )
+
+    assert (tmp_path / "report.pdf").read_text() == "1|False|lookup 1|Europe/Paris"
+    assert report_timezone.get() is None
+
+
+def test_render_executor_uses_processes_for_several_reports():
+    with patch(f"{MODULE}.settings.ISSUE_REPORT_MAX_WORKERS", 4), patch(f"{MODULE}.os.cpu_count", return_value=8):
+        with bulk_report._get_render_executor(3) as executor:
+            assert executor._max_workers == 3
+            assert type(executor).__name__ == "ProcessPoolExecutor"
+        with bulk_report._get_render_executor(1) as executor:
+            assert type(executor).__name__ == "ThreadPoolExecutor"
+
+
+def test_render_executor_is_bounded_by_cpu_count():
+    with patch(f"{MODULE}.settings.ISSUE_REPORT_MAX_WORKERS", 4), patch(f"{MODULE}.os.cpu_count", return_value=1):
+        with bulk_report._get_render_executor(3) as executor:
+            assert type(executor).__name__ == "ThreadPoolExecutor"
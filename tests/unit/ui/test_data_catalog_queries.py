@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+import pytest
+
+from testgen.ui.queries.data_catalog_queries import CatalogFilters, get_catalog_columns, get_catalog_tables
+
+pytestmark = pytest.mark.unit
+
+TABLE_GROUP_ID = "0d5d5c39-2e4e-4b8e-8f69-3c8e1c7a9a20"
+TABLE_ID = "6f1b4e0c-56a3-4d0e-9d3a-0f6f7c1a5f11"
+
+
+@pytest.fixture
+def fetch_all():
+    get_catalog_tables.clear()
+    get_catalog_columns.clear()
+    with patch("testgen.ui.queries.data_catalog_queries.fetch_all_from_db") as mock:
+        yield mock
+
+
+def _tables(count: int) -> list[dict]:
+    return [{"table_id": f"table_{index}", "cursor_name": f"t{index}", "cursor_id": str(index)} for index in range(count)]
+
+
+def test_filters_from_dict_defaults():
+    filters = CatalogFilters.from_dict(None)
+
+    assert filters == CatalogFilters()
+    assert filters.get_table_condition() == "TRUE"
+    assert filters.get_column_condition() == "c.excluded_data_element IS NOT TRUE"
+    assert filters.get_params() == {}
+
+
+def test_filters_from_dict_searches_both_when_neither_selected():
+    filters = CatalogFilters.from_dict({"search": "  cust ", "search_tables": False, "search_columns": False})
+
+    assert filters.search == "cust"
+    assert filters.search_tables and filters.search_columns
+
+
+def test_filters_from_dict_ignores_unknown_and_empty_tags():
+    filters = CatalogFilters.from_dict({"tags": {"data_source": "crm", "stakeholder_group": "", "bogus": "x"}})
+
+    assert filters.tags == (("data_source", "crm"),)
+    assert filters.get_params() == {"tag_data_source": "crm"}
+    assert filters.to_dict()["tags"] == {"data_source": "crm"}
+
+
+def test_filters_conditions():
+    filters = CatalogFilters(
+        search="cust",
+        search_tables=False,
+        critical_data_element=True,
+        pii_flag=True,
+        show_excluded=True,
+        tags=(("data_source", "crm"),),
+    )
+
+    table_condition = filters.get_table_condition()
+    assert table_condition.startswith("FALSE AND t.critical_data_element IS TRUE")
+    assert "t.data_source = :tag_data_source" in table_condition
+
+    column_condition = filters.get_column_condition()
+    assert "POSITION(LOWER(:search) IN LOWER(c.column_name)) > 0" in column_condition
+    assert "COALESCE(c.pii_flag, '') <> ''" in column_condition
+    assert "COALESCE(c.data_source, t.data_source) = :tag_data_source" in column_condition
+    assert "excluded_data_element" not in column_condition
+    assert filters.get_params() == {"search": "cust", "tag_data_source": "crm"}
+
+
+def test_get_catalog_tables_first_page(fetch_all):
+    fetch_all.return_value = _tables(3)
+
+    tables, has_more = get_catalog_tables(TABLE_GROUP_ID, CatalogFilters(), limit=2)
+
+    assert [table["table_id"] for table in tables] == ["table_0", "table_1"]
+    assert has_more is True
+    query, params = fetch_all.call_args.args
+    assert params == {"table_group_id": TABLE_GROUP_ID, "limit": 3}
+    assert ":after_name" not in query
+
+
+def test_get_catalog_tables_next_page(fetch_all):
+    fetch_all.return_value = _tables(1)
+
+    tables, has_more = get_catalog_tables(TABLE_GROUP_ID, CatalogFilters(search="cust"), after=("t1", "1"), limit=2)
+
+    assert len(tables) == 1
+    assert has_more is False
+    query, params = fetch_all.call_args.args
+    assert "(LOWER(t.table_name), t.table_id) > (:after_name, CAST(:after_id AS UUID))" in query
+    assert params["after_name"] == "t1"
+    assert params["after_id"] == "1"
+    assert params["search"] == "cust"
+
+
+def test_get_catalog_tables_invalid_table_group(fetch_all):
+    assert get_catalog_tables("invalid", CatalogFilters()) == ([], False)
+    fetch_all.assert_not_called()
+
+
+def test_get_catalog_columns(fetch_all):
+    fetch_all.return_value = [{"column_id": "column_1"}]
+
+    columns = get_catalog_columns(TABLE_ID, CatalogFilters(show_excluded=True))
+
+    assert columns == [{"column_id": "column_1"}]
+    query, params = fetch_all.call_args.args
+    assert "WHERE c.table_id = :table_id" in query
+    assert params == {"table_id": TABLE_ID}
@@ -86,3 +86,12 @@ def test_update_project_raises_on_duplicate_name(mock_session):
     ):
         mock_project_cls.select_where.return_value = [MagicMock(project_name="Other Project")]
         page.update_project("proj", {"name": "Other Project", "use_dq_score_weights": True})
+
+
+def test_update_project_invalidates_cached_project_results(mock_session):
+    page = _make_page()
+
+    with patch(f"{MODULE}.JobExecution"), patch(f"{MODULE}.invalidate_cache") as mock_invalidate:
+        page.update_project("proj", {"name": "My Project", "use_dq_score_weights": True})
+
+    mock_invalidate.assert_called_once_with("project:proj")
@@ -0,0 +1,153 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import pandas as pd
+import pytest
+
+from testgen.common.cache_invalidation import CACHE_INVALIDATIONS_CHANNEL, CacheInvalidationListener
+from testgen.ui.services.query_cache import TaggedCache, cache_tag, invalidate_cache, tagged_cache_data
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def cache():
+    cache = TaggedCache(max_entries=3, ttl=60)
+    with patch("testgen.ui.services.query_cache._tagged_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def run_final_mock():
+    with patch("testgen.ui.services.query_cache._is_run_final", return_value=True) as mock:
+        yield mock
+
+
+def test_invalidate_drops_only_tagged_entries(cache):
+    cache.set("a", 1, {"test_run:1"})
+    cache.set("b", 2, {"test_run:2", "test_suite:1"})
+
+    cache.invalidate("test_run:1")
+
+    assert cache.get("a") == (False, None)
+    assert cache.get("b") == (True, 2)
+
+
+def test_expired_entries_are_dropped(cache):
+    with patch("testgen.ui.services.query_cache.time.monotonic", return_value=100):
+        cache.set("a", 1, set())
+    with patch("testgen.ui.services.query_cache.time.monotonic", return_value=161):
+        assert cache.get("a") == (False, None)
+
+
+def test_least_recently_used_entries_are_evicted(cache):
+    for key in ["a", "b", "c"]:
+        cache.set(key, key, set())
+    cache.get("a")
+
+    cache.set("d", "d", set())
+
+    assert cache.get("b") == (False, None)
+    assert all(cache.get(key)[0] for key in ["a", "c", "d"])
+
+
+def test_value_read_before_invalidation_is_not_stored(cache):
+    generation = cache.generation
+    cache.invalidate("test_run:1")
+
+    cache.set("a", 1, {"test_run:1"}, generation)
+
+    assert cache.get("a") == (False, None)
+
+
+def test_tagged_cache_data(cache, run_final_mock):
+    calls = []
+
+    @tagged_cache_data(test_run="run_id", test_suite=lambda arguments: arguments["suite_id"])
+    def cached_query(run_id: str, suite_id: str = "suite", table_name: str | None = None) -> pd.DataFrame:
+        calls.append((run_id, table_name))
+        return pd.DataFrame({"run_id": [run_id]})
+
+    first = cached_query("run-1")
+    first.loc[0, "run_id"] = "modified"
+    assert cached_query("run-1", table_name=None)["run_id"][0] == "run-1"
+    cached_query("run-2")
+    assert len(calls) == 2
+
+    invalidate_cache(cache_tag("test_run", "run-1"))
+    cached_query("run-1")
+    cached_query("run-2")
+    assert len(calls) == 3
+
+    invalidate_cache(cache_tag("test_suite", "suite"))
+    cached_query("run-2")
+    assert len(calls) == 4
+
+    cached_query.clear()
+    cached_query("run-2")
+    assert len(calls) == 5
+
+
+def test_tagged_cache_data_skips_runs_in_progress(cache, run_final_mock):
+    calls = []
+
+    @tagged_cache_data(test_run="run_id")
+    def cached_query(run_id: str) -> list[str]:
+        calls.append(run_id)
+        return [run_id]
+
+    run_final_mock.return_value = False
+    cached_query("run-1")
+    cached_query("run-1")
+    assert len(calls) == 2
+    run_final_mock.assert_called_with("test_run", "run-1")
+
+    run_final_mock.return_value = True
+    cached_query("run-1")
+    cached_query("run-1")
+    assert len(calls) == 3
+
+
+def test_invalidation_listener_returns_notified_tags():
+    connection = MagicMock()
+    connection.dbapi_connection.notifies = []
+
+    def receive(*_args):
+        connection.dbapi_connection.notifies.append(Mock(payload="test_run:1,test_suite:2"))
+
+    with (
+        patch("testgen.common.notification_listener.models.engine") as engine_mock,
+        patch("testgen.common.notification_listener.select_module.select", side_effect=receive),
+    ):
+        engine_mock.raw_connection.return_value = connection
+        listener = CacheInvalidationListener()
+
+        assert listener.wait(timeout=5) == ["test_run:1", "test_suite:2"]
+
+    cursor = connection.dbapi_connection.cursor.return_value.__enter__.return_value
+    cursor.execute.assert_called_once_with(f'LISTEN "{CACHE_INVALIDATIONS_CHANNEL}"')
+
+
+def test_test_run_results_are_tagged_by_table_group(cache, run_final_mock):
+    from testgen.ui.queries.test_result_queries import cache_test_run_results
+
+    calls = []
+
+    @cache_test_run_results
+    def cached_query(run_id: str) -> list[str]:
+        calls.append(run_id)
+        return [run_id]
+
+    run = Mock(test_suite_id="suite", table_groups_id="group", project_code="proj")
+    with patch("testgen.ui.queries.test_result_queries.TestRun.get_minimal", return_value=run):
+        cached_query("run-1")
+        invalidate_cache(cache_tag("table_group", "other"))
+        cached_query("run-1")
+        assert len(calls) == 1
+
+        invalidate_cache(cache_tag("table_group", "group"))
+        cached_query("run-1")
+        assert len(calls) == 2
+
+        invalidate_cache(cache_tag("project", "proj"))
+        cached_query("run-1")
+        assert len(calls) == 3